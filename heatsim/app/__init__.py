@@ -1,5 +1,6 @@
 """Flask application factory."""
 
+import multiprocessing
 import os
 
 # Force offscreen rendering for VTK/PyVista before any imports
@@ -37,6 +38,7 @@ def create_app(config_name="default"):
     app = Flask(__name__)
     config_obj = config[config_name]
     app.config.from_object(config_obj)
+    app.config["CONFIG_NAME"] = config_name  # Job queue workers build their own app
 
     # Use NullPool for SQLite to avoid cross-thread connection sharing issues
     # (gunicorn threads + background job_queue worker thread)
@@ -45,9 +47,12 @@ def create_app(config_name="default"):
     app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"poolclass": NullPool}
 
     # Configure PostgreSQL binds for materials database (Phase 2)
-    # Falls back to SQLite in development if PostgreSQL not configured
+    # Falls back to SQLite in development if PostgreSQL not configured.
+    # Binds set by the config class (testing: in-memory) are kept.
     postgres_password = os.environ.get("POSTGRES_PASSWORD", "")
-    if postgres_password:
+    if app.config.get("SQLALCHEMY_BINDS"):
+        pass
+    elif postgres_password:
         postgres_uri = config_obj().POSTGRES_URI
         app.config["SQLALCHEMY_BINDS"] = {"materials": postgres_uri}
     else:
@@ -123,24 +128,54 @@ def create_app(config_name="default"):
             mat_engine = db.engines.get("materials")
             if mat_engine:
                 inspector = sa.inspect(mat_engine)
-                if "steel_compositions" in inspector.get_table_names():
-                    cols = [c["name"] for c in inspector.get_columns("steel_compositions")]
-                    if "hollomon_jaffe_c" not in cols:
+                tables = inspector.get_table_names()
+                blob = "BYTEA" if mat_engine.dialect.name == "postgresql" else "BLOB"
+                for table, column, ddl in (
+                    ("steel_compositions", "hollomon_jaffe_c", "FLOAT DEFAULT 20.0"),
+                    ("simulations", "queued_at", "TIMESTAMP"),
+                    ("weld_projects", "queued_at", "TIMESTAMP"),
+                    ("job_leases", "wait_seconds", "FLOAT"),
+                    ("simulation_results", "series_data", blob),
+                    ("simulation_results", "plot_spec", "TEXT"),
+                    ("simulation_results", "plot_key", "VARCHAR(64)"),
+                    ("simulation_results", "plot_failed_at", "TIMESTAMP"),
+                    ("ttt_parameters", "params_version", "VARCHAR(32)"),
+                    ("ttt_curves", "params_key", "VARCHAR(64)"),
+                    ("simulations", "batch_id", "INTEGER"),
+                    ("simulations", "batch_value", "FLOAT"),
+                    ("simulations", "config_hash", "VARCHAR(64)"),
+                    ("simulations", "duplicate_of_id", "INTEGER"),
+                    ("simulation_snapshots", "cache_key", "VARCHAR(64)"),
+                    ("simulation_snapshots", "reused_from_id", "INTEGER"),
+                    ("measured_data", "series_data", blob),
+                    ("measured_data", "time_offset", "FLOAT"),
+                    ("measured_data", "offset_snapshot_id", "INTEGER"),
+                ):
+                    if table not in tables:
+                        continue
+                    cols = [c["name"] for c in inspector.get_columns(table)]
+                    if column not in cols:
                         with mat_engine.connect() as conn:
-                            conn.execute(
-                                sa.text(
-                                    "ALTER TABLE steel_compositions ADD COLUMN hollomon_jaffe_c FLOAT DEFAULT 20.0"
-                                )
-                            )
+                            conn.execute(sa.text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+                            conn.commit()
+
+                # Parameter sets added before params_version need a token
+                # (as migration 008 assigns) or they are never cached
+                if "ttt_parameters" in tables:
+                    from .models.ttt_parameters import backfill_params_versions
+
+                    with mat_engine.connect() as conn:
+                        if backfill_params_versions(conn):
                             conn.commit()
         except Exception:
             pass  # Non-critical — column may already exist
 
         # Reset any simulations stuck in 'running' status (from worker crashes/timeouts)
-        # Leave 'queued' jobs as-is so the worker re-picks them up
+        # Leave 'queued' jobs as-is so the worker re-picks them up. Job queue worker
+        # processes also build an app; they must not touch their siblings' jobs.
         try:
             mat_engine = db.engines.get("materials")
-            if mat_engine:
+            if mat_engine and multiprocessing.parent_process() is None:
                 with mat_engine.connect() as conn:
                     result = conn.execute(
                         sa.text(
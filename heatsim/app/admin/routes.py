@@ -28,8 +28,18 @@ def dashboard():
 
     recent_activity = AuditLog.query.order_by(AuditLog.timestamp.desc()).limit(10).all()
 
+    from app.services import result_cache
+    from app.services.job_queue import get_queue_metrics, get_queue_status
+
+    queue_status = get_queue_status()
+    queue_metrics = get_queue_metrics()
+    cache_stats = result_cache.cache_stats()
+
     return render_template(
         "admin/dashboard.html",
+        queue_status=queue_status,
+        queue_metrics=queue_metrics,
+        cache_stats=cache_stats,
         user_count=user_count,
         sim_count=sim_count,
         grade_count=grade_count,
@@ -755,6 +755,9 @@ def grade_history(id):
         "phase_diagram": "Phase Diagram",
         "composition": "Composition",
         "phase_property": "Phase Property",
+        "ttt_parameters": "TTT Parameters",
+        "jmak_parameters": "JMAK Parameters",
+        "martensite_parameters": "Martensite Parameters",
     }
 
     return render_template(
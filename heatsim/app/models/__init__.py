@@ -17,6 +17,7 @@ from .audit_log import (
     ACTION_UPLOAD_DATA,
     AuditLog,
 )
+from .job_queue import JobLease, JobWorker
 from .material import (
     DATA_SOURCE_STANDARD,
     DATA_SOURCE_SUBSEATEC,
@@ -49,6 +50,9 @@ from .measured_data import MeasuredData
 from .permission import UserPermission
 from .session import UserSession
 from .simulation import (
+    BATCH_KIND_RUN,
+    BATCH_KIND_SWEEP,
+    BATCH_KINDS,
     DEFAULT_HTC,
     GEOMETRY_CYLINDER,
     GEOMETRY_PLATE,
@@ -64,16 +68,22 @@ from .simulation import (
     STATUS_RUNNING,
     STATUSES,
     HeatTreatmentTemplate,
+    RenderedPlot,
     Simulation,
+    SimulationBatch,
     SimulationResult,
 )
-from .snapshot import SimulationSnapshot
+from .snapshot import ResultCacheEntry, SimulationSnapshot
 from .system_setting import SystemSetting
 from .ttt_parameters import (
     B_MODEL_ARRHENIUS,
     B_MODEL_GAUSSIAN,
     B_MODEL_POLYNOMIAL,
     B_MODEL_TYPES,
+    CALIBRATION_COMPLETED,
+    CALIBRATION_FAILED,
+    CALIBRATION_QUEUED,
+    CALIBRATION_RUNNING,
     CURVE_POS_FIFTY,
     CURVE_POS_FINISH,
     CURVE_POS_START,
@@ -85,6 +95,7 @@ from .ttt_parameters import (
     TTT_SOURCE_EMPIRICAL,
     TTT_SOURCE_LITERATURE,
     TTT_SOURCES,
+    CalibrationJob,
     JMAKParameters,
     MartensiteParameters,
     TTTCalibrationData,
@@ -152,6 +163,8 @@ __all__ = [
     # Simulation models (PostgreSQL)
     "Simulation",
     "SimulationResult",
+    "SimulationBatch",
+    "RenderedPlot",
     "HeatTreatmentTemplate",
     "STATUS_DRAFT",
     "STATUS_READY",
@@ -167,6 +180,9 @@ __all__ = [
     "PROCESS_TYPES",
     "PROCESS_LABELS",
     "DEFAULT_HTC",
+    "BATCH_KIND_RUN",
+    "BATCH_KIND_SWEEP",
+    "BATCH_KINDS",
     # Weld project models (PostgreSQL - Phase 4)
     "WeldProject",
     "WeldString",
@@ -192,12 +208,17 @@ __all__ = [
     "MeasuredData",
     # Snapshot versioning
     "SimulationSnapshot",
+    "ResultCacheEntry",
+    # Job queue
+    "JobWorker",
+    "JobLease",
     # TTT/CCT parameters (PostgreSQL)
     "TTTParameters",
     "JMAKParameters",
     "MartensiteParameters",
     "TTTCalibrationData",
     "TTTCurve",
+    "CalibrationJob",
     "TTT_SOURCE_LITERATURE",
     "TTT_SOURCE_CALIBRATED",
     "TTT_SOURCE_EMPIRICAL",
@@ -213,6 +234,10 @@ __all__ = [
     "CURVE_POS_FIFTY",
     "CURVE_POS_FINISH",
     "CURVE_POSITIONS",
+    "CALIBRATION_QUEUED",
+    "CALIBRATION_RUNNING",
+    "CALIBRATION_COMPLETED",
+    "CALIBRATION_FAILED",
     # Material change log
     "MaterialChangeLog",
     # System settings
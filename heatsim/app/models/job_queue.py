@@ -0,0 +1,98 @@
+"""Job queue bookkeeping: worker processes and job leases."""
+
+from datetime import datetime
+
+from app.extensions import db
+
+# Priority lanes: short jobs are claimed before long ones
+LANE_FAST = "fast"
+LANE_SLOW = "slow"
+LANES = (LANE_FAST, LANE_SLOW)
+
+# Job kinds (what resource a job needs) used for concurrency limits
+KIND_HEAT_TREATMENT = "heat_treatment"
+KIND_COMSOL = "comsol"
+KIND_GOLDAK = "goldak"
+KIND_CALIBRATION = "calibration"
+
+KIND_LANES = {
+    KIND_HEAT_TREATMENT: LANE_FAST,
+    KIND_COMSOL: LANE_SLOW,
+    KIND_GOLDAK: LANE_SLOW,
+    KIND_CALIBRATION: LANE_FAST,
+}
+
+# Worker states
+WORKER_IDLE = "idle"
+WORKER_BUSY = "busy"
+WORKER_STOPPED = "stopped"
+WORKER_LOST = "lost"
+
+# Lease outcomes (None while the lease is held)
+LEASE_RELEASED = "released"
+LEASE_ORPHANED = "orphaned"
+
+
+class JobWorker(db.Model):
+    """One queue worker (process or thread) and what it is doing."""
+
+    __tablename__ = "job_workers"
+    __bind_key__ = "materials"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.Text, nullable=False, unique=True)
+    pid = db.Column(db.Integer)
+    lanes = db.Column(db.Text)  # Comma-separated lanes this worker serves
+    state = db.Column(db.Text, default=WORKER_IDLE)
+
+    # Current job
+    job_type = db.Column(db.Text)
+    job_id = db.Column(db.Integer)
+    job_started_at = db.Column(db.DateTime)
+
+    jobs_completed = db.Column(db.Integer, default=0)
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @property
+    def lane_list(self) -> list[str]:
+        return [lane for lane in (self.lanes or "").split(",") if lane]
+
+    def __repr__(self):
+        return f"<JobWorker {self.name} {self.state}>"
+
+
+class JobLease(db.Model):
+    """Claim of a queued job by a worker.
+
+    A lease is held (``released_at`` is None) while the job runs and kept
+    alive by the worker's heartbeat. Leases of job kinds with a concurrency
+    limit occupy one of ``limit`` numbered slots; the unique (kind, slot)
+    constraint makes taking a slot atomic across worker processes.
+    """
+
+    __tablename__ = "job_leases"
+    __bind_key__ = "materials"
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.Text, nullable=False)  # 'simulation', 'weld' or 'calibration'
+    job_id = db.Column(db.Integer, nullable=False)
+    kind = db.Column(db.Text, nullable=False)
+    lane = db.Column(db.Text, nullable=False)
+    slot = db.Column(db.Integer)  # None for unlimited kinds and released leases
+    worker_name = db.Column(db.Text, nullable=False)
+
+    claimed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    wait_seconds = db.Column(db.Float)  # Submit-to-start latency (queued_at -> claimed_at)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow)
+    released_at = db.Column(db.DateTime)
+    outcome = db.Column(db.Text)
+
+    __table_args__ = (
+        db.UniqueConstraint("kind", "slot", name="uq_job_lease_kind_slot"),
+        db.Index("ix_job_leases_job", "job_type", "job_id"),
+        db.Index("ix_job_leases_active", "released_at"),
+    )
+
+    def __repr__(self):
+        return f"<JobLease {self.job_type}#{self.job_id} by {self.worker_name}>"
@@ -15,7 +15,8 @@ class MaterialChangeLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     entity_type = db.Column(
         db.Text, nullable=False
-    )  # steel_grade, material_property, phase_diagram, composition, phase_property
+    )  # steel_grade, material_property, phase_diagram, composition, phase_property,
+    # ttt_parameters, jmak_parameters, martensite_parameters
     entity_id = db.Column(db.Integer, nullable=False)
     steel_grade_id = db.Column(db.Integer, nullable=False)  # Denormalized
     action = db.Column(db.Text, nullable=False)  # create, update, delete
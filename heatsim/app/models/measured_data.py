@@ -3,9 +3,16 @@
 import json
 from datetime import datetime
 
+import numpy as np
+
 from app import db
 
 
+def _as_list(values) -> list[float]:
+    """Sequence or numpy array as a JSON-serialisable list."""
+    return np.asarray(values, dtype=float).tolist()
+
+
 class MeasuredData(db.Model):
     """Measured thermocouple data from heat treatment logging.
 
@@ -44,6 +51,13 @@ class MeasuredData(db.Model):
     # Statistics per channel (JSON: {TC1: {min, max, avg}, ...})
     statistics_json = db.Column(db.Text)
 
+    # Resampled, smoothed series and dT/dt per channel (npz blob, written by
+    # app.services.measured_series) and the cross-correlation time offset of
+    # the first channel against the full-cycle result of offset_snapshot_id
+    series_data = db.Column(db.LargeBinary)
+    time_offset = db.Column(db.Float)
+    offset_snapshot_id = db.Column(db.Integer)
+
     # Timestamps
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -75,7 +89,7 @@ class MeasuredData(db.Model):
     @times.setter
     def times(self, times: list[float]):
         """Set time array."""
-        self.times_json = json.dumps(times)
+        self.times_json = json.dumps(_as_list(times))
 
     @property
     def channels(self) -> dict[str, list[float]]:
@@ -87,7 +101,7 @@ class MeasuredData(db.Model):
     @channels.setter
     def channels(self, channels: dict[str, list[float]]):
         """Set channel data from dict."""
-        self.channels_json = json.dumps(channels)
+        self.channels_json = json.dumps({ch: _as_list(v) for ch, v in channels.items()})
 
     @property
     def channel_times(self) -> dict[str, list[float]]:
@@ -103,7 +117,7 @@ class MeasuredData(db.Model):
     @channel_times.setter
     def channel_times(self, channel_times: dict[str, list[float]]):
         """Set per-channel times from dict."""
-        self.channel_times_json = json.dumps(channel_times)
+        self.channel_times_json = json.dumps({ch: _as_list(v) for ch, v in channel_times.items()})
 
     def get_channel_times(self, channel: str) -> list[float]:
         """Get times array for a specific channel."""
@@ -128,12 +142,16 @@ class MeasuredData(db.Model):
     @property
     def available_channels(self) -> list[str]:
         """Get list of available channel names."""
+        # Labels are set for every channel at upload; avoids decoding the data
+        labels = self.channel_labels_dict
+        if labels:
+            return list(labels.keys())
         return list(self.channels.keys())
 
     @property
     def num_channels(self) -> int:
         """Get number of channels."""
-        return len(self.channels)
+        return len(self.available_channels)
 
     @property
     def num_points(self) -> int:
@@ -4,9 +4,13 @@ Uses the 'materials' bind key to store in PostgreSQL alongside material data.
 Supports multi-phase heat treatment: heating, transfer, quenching, tempering.
 """
 
+import hashlib
+import io
 import json
 from datetime import datetime
 
+import numpy as np
+
 from app.extensions import db
 
 # Status constants
@@ -26,6 +30,12 @@ STATUSES = [
     STATUS_FAILED,
 ]
 
+# Simulation batch kinds
+BATCH_KIND_RUN = "batch"  # Simulations selected for a batch run
+BATCH_KIND_SWEEP = "sweep"  # Clones of one simulation varying one parameter
+
+BATCH_KINDS = [BATCH_KIND_RUN, BATCH_KIND_SWEEP]
+
 # Geometry type constants
 GEOMETRY_CYLINDER = "cylinder"
 GEOMETRY_PLATE = "plate"
@@ -237,12 +247,20 @@ class Simulation(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    queued_at = db.Column(db.DateTime)  # Last submission to the job queue
     started_at = db.Column(db.DateTime)
     completed_at = db.Column(db.DateTime)
 
     # Error message if failed
     error_message = db.Column(db.Text)
 
+    # Batch membership: the group, the swept parameter's value, the input
+    # hash at submission and the member whose run this one reuses
+    batch_id = db.Column(db.Integer, db.ForeignKey("simulation_batches.id"))
+    batch_value = db.Column(db.Float)
+    config_hash = db.Column(db.String(64))
+    duplicate_of_id = db.Column(db.Integer, db.ForeignKey("simulations.id"))
+
     # Relationships
     steel_grade = db.relationship("SteelGrade", backref="simulations")
     results = db.relationship(
@@ -252,6 +270,8 @@ class Simulation(db.Model):
     __table_args__ = (
         db.Index("ix_simulations_user", "user_id"),
         db.Index("ix_simulations_status", "status"),
+        db.Index("ix_simulations_batch", "batch_id"),
+        db.Index("ix_simulations_duplicate_of", "duplicate_of_id"),
     )
 
     @property
@@ -466,10 +486,145 @@ class Simulation(db.Model):
             },
         }
 
+    def compute_config_hash(self) -> str:
+        """SHA-256 of everything the solver reads from this simulation.
+
+        Two simulations with the same hash produce the same results as long
+        as the steel grade's data is unchanged.
+        """
+        config = {
+            "steel_grade_id": self.steel_grade_id,
+            "geometry_type": self.geometry_type,
+            "geometry": self.geometry_dict,
+            "cad_file_path": self.cad_file_path,
+            "cad_equivalent_type": self.cad_equivalent_type,
+            "cad_analysis": self.cad_analysis_dict,
+            "process_type": self.process_type,
+            "initial_temperature": self.initial_temperature,
+            "ambient_temperature": self.ambient_temperature,
+            "heat_treatment": self.ht_config,
+            "boundary_conditions": self.bc_dict,
+            "solver": self.solver_dict,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
     def __repr__(self) -> str:
         return f"<Simulation {self.id}: {self.name}>"
 
 
+# Member name prefix of per-position temperature series in a series blob
+SERIES_POSITION_PREFIX = "pos_"
+
+# Downsampled levels stored with long series: level k holds at most
+# SERIES_LOD_POINTS * SERIES_LOD_FACTOR**k samples and is only kept while it
+# is at least SERIES_LOD_FACTOR times smaller than the full series
+SERIES_LOD_POINTS = 2000
+SERIES_LOD_FACTOR = 4
+
+
+def minmax_indices(series, max_points: int) -> np.ndarray:
+    """Indices that keep the shape of one or more series in max_points samples.
+
+    The series are split into equal index buckets; every bucket keeps the
+    positions of the minimum and maximum of each series, plus the first and
+    last sample. Peaks that stride decimation would step over are kept.
+
+    Parameters
+    ----------
+    series : array-like
+        One series (n,) or several sharing an axis (n_series, n)
+    max_points : int
+        Upper bound on the number of indices returned
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique indices into the series
+    """
+    ys = np.atleast_2d(np.asarray(series, dtype=float))
+    n = ys.shape[1]
+    if n <= max_points:
+        return np.arange(n)
+    n_buckets = max(1, (max_points - 2) // 2)
+    while True:
+        width = -(-n // n_buckets)
+        padded = np.pad(ys, ((0, 0), (0, n_buckets * width - n)), mode="edge")
+        blocks = padded.reshape(len(ys), n_buckets, width)
+        offsets = np.arange(n_buckets) * width
+        picks = np.concatenate(
+            [
+                (blocks.argmin(axis=2) + offsets).ravel(),
+                (blocks.argmax(axis=2) + offsets).ravel(),
+                [0, n - 1],
+            ]
+        )
+        keep = np.unique(np.minimum(picks, n - 1))
+        if len(keep) <= max_points or n_buckets == 1:
+            return keep
+        # Several series peak in different places: use fewer, wider buckets
+        n_buckets = max(1, n_buckets * max_points // len(keep))
+
+
+def _series_levels(times: np.ndarray, members: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Downsampled levels of a series blob, named ``lod<k>_<member>``."""
+    n = len(times)
+    if not members or any(m.ndim != 1 or len(m) != n for m in members.values()):
+        return {}
+    stacked = np.vstack(list(members.values()))
+    levels = {}
+    points = SERIES_LOD_POINTS
+    level = 0
+    while points * SERIES_LOD_FACTOR <= n:
+        keep = minmax_indices(stacked, points)
+        levels[f"lod{level}_time"] = times[keep]
+        for name, member in members.items():
+            levels[f"lod{level}_{name}"] = member[keep]
+        points *= SERIES_LOD_FACTOR
+        level += 1
+    return levels
+
+
+def pack_series(times, values=None, positions: dict[str, np.ndarray] | None = None) -> bytes:
+    """Encode result time series as a compressed npz blob.
+
+    Times are kept as float64 (long runs need sub-second resolution at
+    hours); temperatures and other values are stored as float32. Series
+    longer than SERIES_LOD_FACTOR * SERIES_LOD_POINTS also get min/max
+    downsampled levels (see `minmax_indices`) for interactive plots.
+
+    Parameters
+    ----------
+    times : array-like
+        Time axis (or x axis, e.g. temperature for cooling-rate rows)
+    values : array-like, optional
+        Primary series, e.g. center temperature
+    positions : dict, optional
+        Additional series per monitoring position {name: array}
+
+    Returns
+    -------
+    bytes
+        npz archive with members ``time``, ``value``, ``pos_<name>`` and
+        the levels ``lod<k>_time``, ``lod<k>_value``, ``lod<k>_pos_<name>``
+    """
+    arrays = {"time": np.asarray(times, dtype=np.float64)}
+    if values is not None:
+        arrays["value"] = np.asarray(values, dtype=np.float32)
+    for name, series in (positions or {}).items():
+        arrays[SERIES_POSITION_PREFIX + name] = np.asarray(series, dtype=np.float32)
+    members = {name: array for name, array in arrays.items() if name != "time"}
+    arrays.update(_series_levels(arrays["time"], members))
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def unpack_series(blob: bytes) -> dict[str, np.ndarray]:
+    """Decode every member of a series blob written by `pack_series`."""
+    with np.load(io.BytesIO(blob)) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
 class SimulationResult(db.Model):
     """Simulation result data.
 
@@ -493,10 +648,13 @@ class SimulationResult(db.Model):
     # Location identifier: 'center', 'surface', 'quarter', 'all'
     location = db.Column(db.Text)
 
-    # Time-series data (JSON arrays)
+    # Time-series data (JSON arrays, rows written before series_data)
     time_data = db.Column(db.Text)
     value_data = db.Column(db.Text)
 
+    # Time-series data as a compressed npz blob (see pack_series)
+    series_data = db.Column(db.LargeBinary)
+
     # Summary statistics
     cooling_rate_max = db.Column(db.Float)
     cooling_rate_800_500 = db.Column(db.Float)
@@ -511,33 +669,226 @@ class SimulationResult(db.Model):
     # Stored plot image (PNG bytes)
     plot_image = db.Column(db.LargeBinary)
 
+    # Deferred plot: JSON spec rendered on demand by app.services.plot_renderer,
+    # and its content key into rendered_plots
+    plot_spec = db.Column(db.Text)
+    plot_key = db.Column(db.String(64), index=True)
+    # Last failed render of the deferred plot; pre-rendering backs off from it
+    plot_failed_at = db.Column(db.DateTime)
+
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (db.Index("ix_simulation_results_sim", "simulation_id"),)
 
-    @property
-    def time_array(self) -> list:
-        """Parse time data JSON to list."""
+    def _series_cache(self) -> dict:
+        """Decoded series_data members, reset whenever the blob changes.
+
+        The npz archive is opened once; each member is decompressed the
+        first time it is read.
+        """
+        cache = self.__dict__.get("_series_decoded")
+        if cache is None or cache["blob"] is not self.series_data:
+            cache = {"blob": self.series_data, "archive": None, "members": {}}
+            self.__dict__["_series_decoded"] = cache
+        if cache["archive"] is None:
+            cache["archive"] = np.load(io.BytesIO(self.series_data))
+        return cache
+
+    def _series_member(self, name: str) -> np.ndarray | None:
+        """One member of series_data, or None if the row has no such series."""
+        if not self.series_data:
+            return None
+        cache = self._series_cache()
+        if name not in cache["members"]:
+            archive = cache["archive"]
+            cache["members"][name] = archive[name] if name in archive.files else None
+        return cache["members"][name]
+
+    @staticmethod
+    def _parse_json_list(text: str | None) -> list:
         try:
-            return json.loads(self.time_data) if self.time_data else []
+            return json.loads(text) if text else []
         except json.JSONDecodeError:
             return []
 
+    @property
+    def time_series(self) -> np.ndarray:
+        """Time data as a float array (from series_data or legacy JSON)."""
+        if self.series_data:
+            times = self._series_member("time")
+        else:
+            times = self._parse_json_list(self.time_data)
+        return np.asarray(times if times is not None else [], dtype=float)
+
+    @property
+    def value_series(self) -> np.ndarray:
+        """Value data as a float array (from series_data or legacy JSON)."""
+        if self.series_data:
+            values = self._series_member("value")
+        else:
+            values = self._parse_json_list(self.value_data)
+        return np.asarray(values if values is not None else [], dtype=float)
+
+    @property
+    def position_series(self) -> dict[str, np.ndarray]:
+        """Temperature series per monitoring position {position: float array}.
+
+        Empty when only a single (value) series was stored.
+        """
+        if self.series_data:
+            prefix = SERIES_POSITION_PREFIX
+            return {
+                name[len(prefix) :]: np.asarray(self._series_member(name), dtype=float)
+                for name in self._series_cache()["archive"].files
+                if name.startswith(prefix)
+            }
+        data = self.data_dict
+        return {
+            key: np.asarray(data[key], dtype=float)
+            for key in data.get("positions") or []
+            if data.get(key)
+        }
+
+    def _level_prefixes(self) -> list[str]:
+        """Member prefixes from the full series ("") to the coarsest level (lod0)."""
+        levels = []
+        if self.series_data:
+            files = self._series_cache()["archive"].files
+            while f"lod{len(levels)}_time" in files:
+                levels.append(f"lod{len(levels)}_")
+        return [""] + levels[::-1]
+
+    def _level_times(self, prefix: str) -> np.ndarray:
+        if not prefix:
+            return self.time_series
+        return np.asarray(self._series_member(prefix + "time"), dtype=float)
+
+    def _level_arrays(
+        self, prefix: str, start: int = 0, stop: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None, dict[str, np.ndarray]]:
+        """(times, values or None, {position: values}) of one level, sliced."""
+        window = slice(start, stop)
+        if not prefix:
+            values = self.value_series
+            return (
+                self.time_series[window],
+                values[window] if len(values) else None,
+                {key: series[window] for key, series in self.position_series.items()},
+            )
+        pos_prefix = prefix + SERIES_POSITION_PREFIX
+        values = self._series_member(prefix + "value")
+        return (
+            np.asarray(self._series_member(prefix + "time")[window], dtype=float),
+            np.asarray(values[window], dtype=float) if values is not None else None,
+            {
+                name[len(pos_prefix) :]: np.asarray(self._series_member(name)[window], dtype=float)
+                for name in self._series_cache()["archive"].files
+                if name.startswith(pos_prefix)
+            },
+        )
+
+    def series_level(
+        self, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray | None, dict[str, np.ndarray]] | None:
+        """Finest stored downsampled level with at most max_points samples.
+
+        Returns
+        -------
+        tuple or None
+            (times, values or None, {position: values}) as float arrays, or
+            None if the row has no level that small (short or legacy rows)
+        """
+        for prefix in self._level_prefixes()[1:]:
+            if len(self._level_times(prefix)) <= max_points:
+                return self._level_arrays(prefix)
+        return None
+
+    def series_window(
+        self, t_min: float, t_max: float, max_points: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None, dict[str, np.ndarray]]:
+        """Samples of the time window [t_min, t_max].
+
+        The window is located by binary search in the sorted time array of
+        each level, from the full series to the coarsest min/max level; the
+        first level with at most max_points samples in the window is
+        returned, so a narrow window comes at full resolution. The sample
+        just outside each end is included so lines reach the window edges.
+
+        Parameters
+        ----------
+        t_min, t_max : float
+            Window bounds, in the units of the stored times
+        max_points : int, optional
+            Sample budget; None always returns the full series
+
+        Returns
+        -------
+        tuple
+            (times, values or None, {position: values}) as float arrays;
+            the coarsest level's window if none fits max_points
+        """
+        prefixes = self._level_prefixes()
+        if max_points is None:
+            prefixes = prefixes[:1]
+        for prefix in prefixes:
+            times = self._level_times(prefix)
+            start = max(int(np.searchsorted(times, t_min, side="left")) - 1, 0)
+            stop = min(int(np.searchsorted(times, t_max, side="right")) + 1, len(times))
+            if max_points is None or stop - start <= max_points:
+                break
+        return self._level_arrays(prefix, start, stop)
+
+    @property
+    def center_series(self) -> np.ndarray:
+        """Center temperature: the stored center position, else the value series."""
+        center = self.position_series.get("center")
+        return center if center is not None else self.value_series
+
+    @property
+    def time_array(self) -> list:
+        """Time data as a list."""
+        if self.series_data:
+            return self.time_series.tolist()
+        return self._parse_json_list(self.time_data)
+
     @property
     def value_array(self) -> list:
-        """Parse value data JSON to list."""
-        try:
-            return json.loads(self.value_data) if self.value_data else []
-        except json.JSONDecodeError:
-            return []
+        """Value data as a list."""
+        if self.series_data:
+            return self.value_series.tolist()
+        return self._parse_json_list(self.value_data)
+
+    def set_series(
+        self, times, values=None, positions: dict[str, np.ndarray] | None = None
+    ) -> None:
+        """Store time series as a compressed binary blob.
+
+        Parameters
+        ----------
+        times : array-like
+            Time axis
+        values : array-like, optional
+            Primary series (e.g. center temperature)
+        positions : dict, optional
+            Series per monitoring position {position: array}
+        """
+        self.series_data = pack_series(times, values, positions)
+        self.time_data = None
+        self.value_data = None
 
     def set_time_data(self, data: list) -> None:
         """Set time data from list."""
-        self.time_data = json.dumps(data)
+        if self.series_data:
+            self.set_series(data, self._series_member("value"), self.position_series)
+        else:
+            self.time_data = json.dumps(data)
 
     def set_value_data(self, data: list) -> None:
         """Set value data from list."""
-        self.value_data = json.dumps(data)
+        if self.series_data:
+            self.set_series(self.time_series, data, self.position_series)
+        else:
+            self.value_data = json.dumps(data)
 
     @property
     def phases_dict(self) -> dict:
@@ -563,10 +914,18 @@ class SimulationResult(db.Model):
         """Set result data from dict."""
         self.result_data = json.dumps(data)
 
+    @property
+    def plot_spec_dict(self) -> dict:
+        """Parse deferred plot spec JSON to dict."""
+        try:
+            return json.loads(self.plot_spec) if self.plot_spec else {}
+        except json.JSONDecodeError:
+            return {}
+
     @property
     def has_plot(self) -> bool:
-        """Check if plot image is stored."""
-        return self.plot_image is not None
+        """Check if a plot image is stored or can be rendered on demand."""
+        return self.plot_image is not None or self.plot_key is not None
 
     @property
     def result_label(self) -> str:
@@ -586,6 +945,24 @@ class SimulationResult(db.Model):
         return f"<SimulationResult {self.id}: {self.result_type} at {self.location}>"
 
 
+class RenderedPlot(db.Model):
+    """PNG of a deferred result plot, stored once per content key.
+
+    The key is the SHA-256 of the plot spec and the series it plots, so
+    identical results share one image.
+    """
+
+    __tablename__ = "rendered_plots"
+    __bind_key__ = "materials"
+
+    key = db.Column(db.String(64), primary_key=True)
+    image = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<RenderedPlot {self.key[:12]}>"
+
+
 class HeatTreatmentTemplate(db.Model):
     """Reusable heat treatment configuration template.
 
@@ -727,3 +1104,57 @@ class HeatTreatmentTemplate(db.Model):
 
     def __repr__(self) -> str:
         return f"<HeatTreatmentTemplate {self.id}: {self.name}>"
+
+
+class SimulationBatch(db.Model):
+    """Group of simulations submitted together (batch run or parameter sweep).
+
+    Members run as ordinary simulation jobs; members with identical inputs
+    are solved once (see app.services.batch_runner).
+    """
+
+    __tablename__ = "simulation_batches"
+    __bind_key__ = "materials"
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.Text, nullable=False)
+    user_id = db.Column(db.Integer)
+    kind = db.Column(db.Text, nullable=False, default=BATCH_KIND_RUN)
+
+    # Swept parameter path (e.g. 'quenching.media_temperature') of a sweep
+    parameter = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    queued_at = db.Column(db.DateTime)  # Last submission to the job queue
+
+    members = db.relationship(
+        "Simulation",
+        backref="batch",
+        lazy="dynamic",
+        order_by="Simulation.id",
+    )
+
+    __table_args__ = (db.Index("ix_simulation_batches_user", "user_id"),)
+
+    @property
+    def status_counts(self) -> dict[str, int]:
+        """Number of members in each status."""
+        counts = dict.fromkeys(STATUSES, 0)
+        for (status,) in self.members.with_entities(Simulation.status):
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    @property
+    def status(self) -> str:
+        """Aggregate status: running while any member is queued or running."""
+        counts = self.status_counts
+        if counts[STATUS_QUEUED] or counts[STATUS_RUNNING]:
+            return STATUS_RUNNING
+        if counts[STATUS_FAILED]:
+            return STATUS_FAILED
+        if counts[STATUS_COMPLETED] and counts[STATUS_COMPLETED] == sum(counts.values()):
+            return STATUS_COMPLETED
+        return STATUS_READY
+
+    def __repr__(self) -> str:
+        return f"<SimulationBatch {self.id}: {self.name}>"
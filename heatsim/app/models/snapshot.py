@@ -49,6 +49,11 @@ class SimulationSnapshot(db.Model):
     predicted_hardness_surface = db.Column(db.Float)
     predicted_hardness_center = db.Column(db.Float)
 
+    # Result cache: hash of the inputs, and the snapshot whose results were
+    # copied instead of solving (None if this run solved)
+    cache_key = db.Column(db.String(64))
+    reused_from_id = db.Column(db.Integer)
+
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -65,6 +70,7 @@ class SimulationSnapshot(db.Model):
     __table_args__ = (
         db.UniqueConstraint("simulation_id", "version", name="uq_sim_version"),
         db.Index("ix_snapshots_simulation", "simulation_id"),
+        db.Index("ix_snapshots_cache_key", "cache_key"),
     )
 
     @property
@@ -128,3 +134,26 @@ class SimulationSnapshot(db.Model):
 
     def __repr__(self):
         return f"<SimulationSnapshot sim={self.simulation_id} v{self.version}>"
+
+
+class ResultCacheEntry(db.Model):
+    """Completed snapshot whose results serve every run with the same inputs.
+
+    The key is SimulationSnapshot.cache_key (see app.services.result_cache).
+    snapshot_id has no foreign key: deleting a simulation leaves its entries
+    behind, and they are dropped on their next lookup or eviction.
+    """
+
+    __tablename__ = "result_cache_entries"
+    __bind_key__ = "materials"
+
+    key = db.Column(db.String(64), primary_key=True)
+    snapshot_id = db.Column(db.Integer, nullable=False)
+    hits = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (db.Index("ix_result_cache_last_used", "last_used_at"),)
+
+    def __repr__(self):
+        return f"<ResultCacheEntry {self.key[:12]} -> snapshot {self.snapshot_id}>"
@@ -1,11 +1,13 @@
 """TTT/CCT transformation parameter models - PostgreSQL database.
 
 Models for storing JMAK kinetics parameters, martensite transformation
-parameters, calibration data from dilatometry, and cached TTT/CCT curves.
+parameters, calibration data from dilatometry, queued calibrations and
+cached TTT/CCT curves.
 Uses SQLAlchemy binds to connect to the materials database.
 """
 
 import json
+import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -38,6 +40,50 @@ CURVE_POS_FINISH = "finish"
 
 CURVE_POSITIONS = [CURVE_POS_START, CURVE_POS_FIFTY, CURVE_POS_FINISH]
 
+# Calibration job statuses
+CALIBRATION_QUEUED = "queued"
+CALIBRATION_RUNNING = "running"
+CALIBRATION_COMPLETED = "completed"
+CALIBRATION_FAILED = "failed"
+
+
+def new_params_version() -> str:
+    """Fresh TTTParameters.params_version token."""
+    return uuid.uuid4().hex
+
+
+def backfill_params_versions(connection) -> int:
+    """Give TTT parameter sets stored without a params_version a token.
+
+    Rows from before params_version would otherwise never be cached
+    (compiled models, diagrams, result cache keys). Does not commit.
+
+    Parameters
+    ----------
+    connection : sqlalchemy.engine.Connection
+        Connection to the materials database
+
+    Returns
+    -------
+    int
+        Number of rows given a token
+    """
+    ids = (
+        connection.execute(db.text("SELECT id FROM ttt_parameters WHERE params_version IS NULL"))
+        .scalars()
+        .all()
+    )
+    for row_id in ids:
+        # Guarded so workers starting together do not overwrite each other
+        connection.execute(
+            db.text(
+                "UPDATE ttt_parameters SET params_version = :version "
+                "WHERE id = :id AND params_version IS NULL"
+            ),
+            {"version": new_params_version(), "id": row_id},
+        )
+    return len(ids)
+
 
 class TTTParameters(db.Model):
     """Master TTT parameter set for a steel grade.
@@ -70,6 +116,9 @@ class TTTParameters(db.Model):
         Source: 'literature', 'calibrated', 'empirical'
     notes : str
         Optional notes about the data
+    params_version : str
+        Random token replaced on every logged change to this parameter set
+        or its JMAK / martensite parameters; keys cached compiled models
     """
 
     __tablename__ = "ttt_parameters"
@@ -96,6 +145,7 @@ class TTTParameters(db.Model):
     notes = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    params_version = db.Column(db.String(32), default=new_params_version)
 
     # Relationships
     steel_grade = db.relationship(
@@ -318,6 +368,86 @@ class TTTCalibrationData(db.Model):
         )
 
 
+class CalibrationJob(db.Model):
+    """Queued calibration of one phase's JMAK parameters from CCT test data.
+
+    Run by a job queue worker (job type 'calibration'); the calibration
+    page polls its progress.
+
+    Attributes
+    ----------
+    id : int
+        Primary key
+    ttt_parameters_id : int
+        Foreign key to ttt_parameters
+    phase : str
+        Phase being calibrated
+    data_points : str
+        JSON list of {'cooling_rate', 'start_temperature', ...} dicts
+    status : str
+        'queued', 'running', 'completed' or 'failed'
+    progress_percent : float
+        Share of the optimizer's generation budget used (0-100)
+    progress_message : str
+        Current generation and best error
+    result : str
+        JSON {'n_value', 'b_model_type', 'b_parameters'} once completed
+    error_message : str
+        Failure reason
+    """
+
+    __tablename__ = "calibration_jobs"
+    __bind_key__ = "materials"
+
+    id = db.Column(db.Integer, primary_key=True)
+    ttt_parameters_id = db.Column(db.Integer, db.ForeignKey("ttt_parameters.id"), nullable=False)
+    user_id = db.Column(db.Integer)
+    phase = db.Column(db.Text, nullable=False)
+    data_points = db.Column(db.Text, nullable=False)
+
+    status = db.Column(db.Text, default=CALIBRATION_QUEUED)
+    progress_percent = db.Column(db.Float, default=0.0)
+    progress_message = db.Column(db.Text)
+    result = db.Column(db.Text)
+    error_message = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    queued_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    completed_at = db.Column(db.DateTime)
+
+    ttt_parameters = db.relationship(
+        "TTTParameters",
+        backref=db.backref("calibration_jobs", lazy="dynamic", cascade="all, delete-orphan"),
+    )
+
+    __table_args__ = (db.Index("ix_calibration_jobs_status", "status"),)
+
+    @property
+    def name(self) -> str:
+        """Label shown in the job queue."""
+        return f"Calibrate {self.phase}"
+
+    @property
+    def data_points_list(self) -> list[dict]:
+        """Parse data_points JSON."""
+        try:
+            return json.loads(self.data_points) if self.data_points else []
+        except json.JSONDecodeError:
+            return []
+
+    @property
+    def result_dict(self) -> dict:
+        """Parse result JSON."""
+        try:
+            return json.loads(self.result) if self.result else {}
+        except json.JSONDecodeError:
+            return {}
+
+    def __repr__(self) -> str:
+        return f"<CalibrationJob {self.id} {self.phase} {self.status}>"
+
+
 class TTTCurve(db.Model):
     """Cached generated TTT or CCT curve data.
 
@@ -340,6 +470,9 @@ class TTTCurve(db.Model):
         JSON array of [time, temperature] pairs
     cooling_rate : float
         For CCT curves, the cooling rate this curve corresponds to (K/s)
+    params_key : str
+        Hash of the generator version and the parameter version the curve
+        was generated from; rows with another key are stale
     """
 
     __tablename__ = "ttt_curves"
@@ -353,6 +486,7 @@ class TTTCurve(db.Model):
     curve_position = db.Column(db.Text, nullable=False)  # start, fifty, finish
     data_points = db.Column(db.Text)  # JSON array of [time, temperature]
     cooling_rate = db.Column(db.Float)  # For CCT curves only
+    params_key = db.Column(db.String(64), index=True)
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
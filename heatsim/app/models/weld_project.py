@@ -129,6 +129,7 @@ class WeldProject(db.Model):
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, onupdate=datetime.utcnow)
+    queued_at = db.Column(db.DateTime)  # Last submission to the job queue
     started_at = db.Column(db.DateTime)
     completed_at = db.Column(db.DateTime)
 
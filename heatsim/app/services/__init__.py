@@ -21,6 +21,7 @@ from .geometry import Cylinder, HollowCylinder, Plate, Ring, create_geometry
 from .hardness_predictor import HardnessPredictor, HardnessResult, predict_hardness_profile
 from .haz_predictor import HAZPredictor, HAZResult
 from .heat_solver import (
+    BatchHeatSolver,
     HeatSolver,
     MultiPhaseHeatSolver,
     PhaseConfig,
@@ -36,7 +37,13 @@ from .material_change_tracker import MaterialChangeTracker
 from .optimization_service import OptimizationResult, OptimizationService
 from .phase_tracker import PhaseResult, PhaseTracker
 from .preheat_calculator import PreheatCalculator, PreheatResult
-from .property_evaluator import PropertyEvaluator, PropertyPlotter, evaluate_property
+from .property_evaluator import (
+    CompiledProperty,
+    PropertyEvaluator,
+    PropertyPlotter,
+    compile_property,
+    evaluate_property,
+)
 from .report_generator import (
     SimulationPDFReportGenerator,
     SimulationReportGenerator,
@@ -59,6 +66,8 @@ __all__ = [
     "PropertyEvaluator",
     "PropertyPlotter",
     "evaluate_property",
+    "CompiledProperty",
+    "compile_property",
     "ExcelImporter",
     "seed_standard_grades",
     "seed_standard_compositions",
@@ -81,6 +90,7 @@ __all__ = [
     # Phase 3 services - Solver
     "HeatSolver",
     "MultiPhaseHeatSolver",
+    "BatchHeatSolver",
     "SolverConfig",
     "SolverResult",
     "PhaseConfig",
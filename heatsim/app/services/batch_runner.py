@@ -0,0 +1,173 @@
+"""Batch runs and parameter sweeps through the job queue.
+
+A batch run or sweep is a SimulationBatch whose members are queued as
+ordinary simulation jobs, so they fan out over all queue workers instead
+of running inside the submitting request. Members are grouped by
+``Simulation.compute_config_hash()`` at submission: the first member of
+each group is queued normally, the others wait (``duplicate_of_id`` set,
+skipped by the queue) and receive a copy of its results when it finishes
+(``settle_duplicates``, called by the job queue after every simulation job).
+"""
+
+import logging
+from datetime import datetime
+
+from app.extensions import db
+from app.models.simulation import (
+    BATCH_KIND_RUN,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_READY,
+    Simulation,
+    SimulationBatch,
+)
+from app.services import result_cache
+
+logger = logging.getLogger(__name__)
+
+# Statuses from which a member can be (re)submitted
+SUBMITTABLE_STATUSES = (STATUS_READY, STATUS_COMPLETED, STATUS_FAILED)
+
+
+def create_batch(
+    name: str, user_id: int, kind: str = BATCH_KIND_RUN, parameter: str | None = None
+) -> SimulationBatch:
+    """Create an empty batch (flushed, has ID; does not commit)."""
+    batch = SimulationBatch(name=name, user_id=user_id, kind=kind, parameter=parameter)
+    db.session.add(batch)
+    db.session.flush()
+    return batch
+
+
+def submit_batch(batch: SimulationBatch, sims: list[Simulation]) -> int:
+    """Queue simulations as members of a batch (does not commit).
+
+    Simulations not in a submittable status are skipped. Of submitted
+    members with the same configuration hash only the first is run.
+
+    Returns
+    -------
+    int
+        Number of simulations queued (including waiting duplicates)
+    """
+    db.session.flush()  # Members created in this session need their IDs
+    now = datetime.utcnow()
+    runs_by_hash: dict[str, Simulation] = {}
+    queued = 0
+    for sim in sims:
+        if sim.status not in SUBMITTABLE_STATUSES:
+            continue
+        sim.batch_id = batch.id
+        sim.config_hash = sim.compute_config_hash()
+        run = runs_by_hash.setdefault(sim.config_hash, sim)
+        sim.duplicate_of_id = run.id if run is not sim else None
+        sim.status = STATUS_QUEUED
+        sim.queued_at = now
+        sim.error_message = None
+        queued += 1
+
+    batch.queued_at = now
+    db.session.flush()
+    return queued
+
+
+def settle_duplicates(simulation_id: int) -> int:
+    """Finish the members waiting on a simulation once it has finished.
+
+    Completed: each duplicate gets its own snapshot with a copy of the
+    result rows. Failed: duplicates fail with the same error. Still
+    queued or running (e.g. requeued after a worker died): nothing to do.
+
+    Returns
+    -------
+    int
+        Number of duplicates finished
+    """
+    sim = db.session.get(Simulation, simulation_id)
+    if sim is None or sim.status not in (STATUS_COMPLETED, STATUS_FAILED):
+        return 0
+    waiting = Simulation.query.filter_by(duplicate_of_id=sim.id, status=STATUS_QUEUED).all()
+    if not waiting:
+        return 0
+
+    source = sim.snapshots.filter_by(status="completed").first()
+    now = datetime.utcnow()
+    for dup in waiting:
+        dup.started_at = sim.started_at
+        dup.completed_at = now
+        if sim.status == STATUS_COMPLETED and source is not None:
+            result_cache.copy_results(source, dup)
+            dup.status = STATUS_COMPLETED
+        else:
+            dup.status = STATUS_FAILED
+            dup.error_message = sim.error_message or f"Run of {sim.name} failed"
+    db.session.commit()
+    logger.info("Settled %d duplicate(s) of simulation #%d", len(waiting), sim.id)
+    return len(waiting)
+
+
+def detach_duplicates(sim: Simulation) -> None:
+    """Hand a member's duplicates over before it leaves the queue or is deleted.
+
+    The first duplicate still waiting on it is run instead and the other
+    waiting ones wait on that; finished duplicates stop referring to it.
+    Does not commit.
+    """
+    duplicates = (
+        Simulation.query.filter_by(duplicate_of_id=sim.id).order_by(Simulation.id.asc()).all()
+    )
+    run = None
+    for dup in duplicates:
+        if dup.status != STATUS_QUEUED:
+            dup.duplicate_of_id = None
+        elif run is None:
+            run = dup
+            dup.duplicate_of_id = None
+        else:
+            dup.duplicate_of_id = run.id
+    db.session.flush()
+
+
+def batch_summary(batch: SimulationBatch) -> dict:
+    """Aggregate progress and per-member results of a batch.
+
+    Returns dict with:
+        status, total, finished, percent, counts: {status: n},
+        members: [{id, name, status, value, duplicate_of, t_800_500,
+                   hardness_surface, hardness_center, error_message}, ...]
+    """
+    members = batch.members.all()
+    counts: dict[str, int] = {}
+    rows = []
+    for sim in members:
+        counts[sim.status] = counts.get(sim.status, 0) + 1
+        snapshot = (
+            sim.snapshots.filter_by(status="completed").first()
+            if sim.status == STATUS_COMPLETED
+            else None
+        )
+        rows.append(
+            {
+                "id": sim.id,
+                "name": sim.name,
+                "status": sim.status,
+                "value": sim.batch_value,
+                "duplicate_of": sim.duplicate_of_id,
+                "t_800_500": snapshot.t_800_500 if snapshot else None,
+                "hardness_surface": snapshot.predicted_hardness_surface if snapshot else None,
+                "hardness_center": snapshot.predicted_hardness_center if snapshot else None,
+                "error_message": sim.error_message,
+            }
+        )
+
+    total = len(members)
+    finished = counts.get(STATUS_COMPLETED, 0) + counts.get(STATUS_FAILED, 0)
+    return {
+        "status": batch.status,
+        "total": total,
+        "finished": finished,
+        "percent": round(100.0 * finished / total, 1) if total else 0.0,
+        "counts": counts,
+        "members": rows,
+    }
@@ -0,0 +1,171 @@
+"""Batched reduced-resolution runs of simulation variants.
+
+Sensitivity analysis, process optimization and sweep exports all solve many
+copies of one simulation that differ in a few parameters (quench HTC,
+media temperature, part size, hold time, ...). Instead of building and
+running one MultiPhaseHeatSolver per variant, `solve_variants` groups the
+variants by coordinate system and advances each group with a single
+BatchHeatSolver. Inputs are plain dataclasses (no ORM objects), so batches
+can also be shipped to worker processes.
+"""
+
+import copy
+import logging
+from dataclasses import dataclass
+
+from app.services.geometry import create_geometry
+from app.services.heat_solver import (
+    DEFAULT_CONDUCTIVITY,
+    DEFAULT_SPECIFIC_HEAT,
+    BatchHeatSolver,
+    SolverConfig,
+    SolverResult,
+)
+from app.services.property_evaluator import CompiledProperty, compile_property
+
+logger = logging.getLogger(__name__)
+
+# Reduced resolution used for screening runs (sensitivity, optimization, sweeps)
+SCREENING_NODES = 31
+
+
+@dataclass
+class SimulationVariant:
+    """Geometry and heat treatment of one variant of a simulation.
+
+    Parameters
+    ----------
+    geometry_type : str
+        Geometry type for create_geometry (CAD already resolved to its equivalent)
+    geometry_config : dict
+        Geometry parameters
+    ht_config : dict
+        Heat treatment configuration
+    """
+
+    geometry_type: str
+    geometry_config: dict
+    ht_config: dict
+
+    @classmethod
+    def from_simulation(cls, sim) -> "SimulationVariant":
+        """Variant with a simulation's own configs (CAD uses its equivalent geometry)."""
+        geom_type = sim.geometry_type
+        geom_config = copy.deepcopy(sim.geometry_dict or {})
+        if geom_type == "cad":
+            geom_type = sim.cad_equivalent_type or "cylinder"
+            geom_config = copy.deepcopy(sim.cad_equivalent_geometry_dict or geom_config)
+        return cls(geom_type, geom_config, copy.deepcopy(sim.ht_config or {}))
+
+    @property
+    def initial_temperature(self) -> float:
+        """Start temperature: ambient when heated, else the austenitizing temperature."""
+        heating_cfg = self.ht_config.get("heating", {})
+        if heating_cfg.get("enabled", False):
+            return heating_cfg.get("initial_temperature", 25.0)
+        return heating_cfg.get("target_temperature", 850.0)
+
+
+@dataclass
+class MaterialSnapshot:
+    """ORM-free, picklable thermal properties of a steel grade.
+
+    Lets variant batches be solved away from the database session, e.g. in
+    worker processes.
+
+    Parameters
+    ----------
+    conductivity : CompiledProperty
+        Thermal conductivity k(T) in W/(m·K)
+    specific_heat : CompiledProperty
+        Specific heat Cp(T) in J/(kg·K)
+    density : float
+        Density in kg/m³
+    emissivity : float
+        Surface emissivity
+    """
+
+    conductivity: CompiledProperty
+    specific_heat: CompiledProperty
+    density: float = 7850.0
+    emissivity: float = 0.85
+
+    @classmethod
+    def from_grade(cls, grade) -> "MaterialSnapshot":
+        """Snapshot the solver inputs of a SteelGrade."""
+        rho_prop = grade.get_property("density")
+        emiss_prop = grade.get_property("emissivity")
+        return cls(
+            conductivity=compile_property(
+                grade.get_property("thermal_conductivity"), DEFAULT_CONDUCTIVITY
+            ),
+            specific_heat=compile_property(
+                grade.get_property("specific_heat"), DEFAULT_SPECIFIC_HEAT
+            ),
+            density=rho_prop.data_dict.get("value", 7850) if rho_prop else 7850,
+            emissivity=emiss_prop.data_dict.get("value", 0.85) if emiss_prop else 0.85,
+        )
+
+
+def solve_variants(
+    material: MaterialSnapshot,
+    variants: list[SimulationVariant],
+    solver_dict: dict | None = None,
+    max_nodes: int = SCREENING_NODES,
+) -> list[SolverResult | None]:
+    """Solve simulation variants of one material in batches.
+
+    Parameters
+    ----------
+    material : MaterialSnapshot
+        Material shared by all variants
+    variants : list of SimulationVariant
+        Variants to solve
+    solver_dict : dict, optional
+        Solver settings of the base simulation
+    max_nodes : int
+        Node count cap for the reduced-resolution runs
+
+    Returns
+    -------
+    list
+        SolverResult per variant in input order; None where the variant's
+        geometry was invalid or its batch failed
+    """
+    results: list[SolverResult | None] = [None] * len(variants)
+    if not variants:
+        return results
+
+    solver_dict = dict(solver_dict or {})
+    solver_dict["n_nodes"] = min(solver_dict.get("n_nodes", max_nodes), max_nodes)
+    solver_config = SolverConfig.from_dict(solver_dict)
+
+    # Variants can only share a batch when they use the same coordinate system
+    groups: dict[str, list[tuple[int, object]]] = {}
+    for i, variant in enumerate(variants):
+        try:
+            geometry = create_geometry(variant.geometry_type, variant.geometry_config)
+        except Exception as e:
+            logger.error(f"Invalid geometry for variant {i}: {e}")
+            continue
+        groups.setdefault(type(geometry).__name__, []).append((i, geometry))
+
+    for members in groups.values():
+        indices = [i for i, _ in members]
+        try:
+            batch = BatchHeatSolver([g for _, g in members], config=solver_config)
+            batch.set_material(
+                material.conductivity,
+                material.specific_heat,
+                material.density,
+                material.emissivity,
+            )
+            batch.configure_from_ht_configs([variants[i].ht_config for i in indices])
+            solved = batch.solve([variants[i].initial_temperature for i in indices])
+        except Exception as e:
+            logger.error(f"Batch of {len(indices)} variants failed: {e}")
+            continue
+        for i, result in zip(indices, solved, strict=True):
+            results[i] = result
+
+    return results
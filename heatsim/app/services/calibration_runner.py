@@ -0,0 +1,118 @@
+"""JMAK calibration runner for background job execution.
+
+CCT calibrations run differential evolution for up to a few hundred
+generations, so the calibration route queues a CalibrationJob instead of
+fitting inside the request. A worker runs it here, reporting the share of
+the generation budget used as progress and stopping early once the best
+error stops improving (``CALIBRATION_PATIENCE`` generations).
+"""
+
+import json
+import logging
+from datetime import datetime
+
+from flask import current_app
+
+from app.extensions import db
+from app.models.ttt_parameters import (
+    CALIBRATION_COMPLETED,
+    CALIBRATION_FAILED,
+    CalibrationJob,
+    JMAKParameters,
+    TTTCurve,
+)
+from app.services.material_change_tracker import MaterialChangeTracker
+
+logger = logging.getLogger(__name__)
+
+# Generations without a 0.1% improvement of the best error before stopping
+CALIBRATION_PATIENCE = 25
+
+# Minimum progress step (percent) between progress commits
+_PROGRESS_STEP = 2.0
+
+
+def apply_calibration(ttt, phase: str, n_value: float, model_type: str, b_params: dict) -> None:
+    """Store calibrated JMAK parameters of a phase (does not commit).
+
+    Creates the phase's JMAKParameters if needed, marks the parameter set
+    calibrated and logs both changes, which invalidates cached models and
+    diagrams of the grade.
+    """
+    grade_id = ttt.steel_grade_id
+    jmak = ttt.jmak_parameters.filter_by(phase=phase).first()
+    created = jmak is None
+    if created:
+        jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=phase)
+
+    field_values = {
+        "n_value": n_value,
+        "b_model_type": model_type,
+        "b_parameters": json.dumps(b_params),
+    }
+    if model_type == "gaussian":
+        field_values["nose_temperature"] = b_params.get("t_nose")
+    MaterialChangeTracker.apply_tracked(
+        "jmak_parameters", jmak, grade_id, field_values, created=created
+    )
+    MaterialChangeTracker.apply_tracked(
+        "ttt_parameters", ttt, grade_id, {"data_source": "calibrated"}
+    )
+
+    # Invalidate cached curves
+    TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
+
+
+def run_calibration(job_id: int) -> None:
+    """Execute a queued CCT calibration.
+
+    Called from a queue worker with an app context already pushed.
+    """
+    from app.services.phase_transformation.diagram_cache import warm_diagrams
+    from app.services.phase_transformation.parameter_calibration import calibrate_from_cct
+
+    job = db.session.get(CalibrationJob, job_id)
+    if job is None:
+        logger.error("Calibration job %d not found", job_id)
+        return
+
+    reported = [0.0]
+
+    def progress(fraction, best_error):
+        percent = 100.0 * fraction
+        if percent - reported[0] >= _PROGRESS_STEP:
+            reported[0] = percent
+            job.progress_percent = percent
+            job.progress_message = f"Best start temperature error {best_error:.4g} K²"
+            db.session.commit()
+
+    try:
+        job.progress_message = "Calibrating..."
+        db.session.commit()
+
+        n_value, model_type, b_params = calibrate_from_cct(
+            job.data_points_list,
+            workers=current_app.config.get("CALIBRATION_WORKERS", 1),
+            progress_callback=progress,
+            patience=current_app.config.get("CALIBRATION_PATIENCE", CALIBRATION_PATIENCE),
+        )
+
+        apply_calibration(job.ttt_parameters, job.phase, n_value, model_type, b_params)
+        job.result = json.dumps(
+            {"n_value": n_value, "b_model_type": model_type, "b_parameters": b_params}
+        )
+        job.status = CALIBRATION_COMPLETED
+        job.completed_at = datetime.utcnow()
+        job.progress_percent = 100.0
+        job.progress_message = f"Calibrated {job.phase}: n={n_value:.2f}, model={model_type}"
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        job.status = CALIBRATION_FAILED
+        job.error_message = str(e)
+        job.completed_at = datetime.utcnow()
+        job.progress_message = None
+        db.session.commit()
+        raise
+
+    warm_diagrams(job.ttt_parameters.steel_grade_id)
@@ -13,6 +13,7 @@ References:
     - Steven, W. & Haynes, A.G. (1956) JISI, 183, 349-359.
 """
 
+import functools
 import math
 
 import numpy as np
@@ -156,43 +157,33 @@ class CCTCurvePredictor:
         Returns:
             List of [time, temperature] pairs sorted by temperature descending.
         """
-        points = []
         n_points = 25
-
-        # Upper branch (above nose)
-        if temp_range_above > 5:
-            temps_above = np.linspace(nose_temp, nose_temp + temp_range_above, n_points)
-            for T in temps_above:
-                dT = T - nose_temp
+        temps = []
+        times = []
+        # Upper branch (above nose), then lower branch (below nose)
+        for sign, temp_range in ((1.0, temp_range_above), (-1.0, temp_range_below)):
+            if temp_range > 5:
+                branch = np.linspace(nose_temp, nose_temp + sign * temp_range, n_points)
+                dT = np.abs(branch - nose_temp)
                 # Time increases quadratically away from nose
-                time = base_time_nose * (
-                    1.0 + spread_factor * (dT / temp_range_above) ** 2 * (temp_range_above / 50.0)
-                )
-                points.append([float(time), float(T)])
-
-        # Lower branch (below nose)
-        if temp_range_below > 5:
-            temps_below = np.linspace(nose_temp, nose_temp - temp_range_below, n_points)
-            for T in temps_below:
-                dT = nose_temp - T
-                time = base_time_nose * (
-                    1.0 + spread_factor * (dT / temp_range_below) ** 2 * (temp_range_below / 50.0)
+                times.append(
+                    base_time_nose
+                    * (1.0 + spread_factor * (dT / temp_range) ** 2 * (temp_range / 50.0))
                 )
-                points.append([float(time), float(T)])
+                temps.append(branch)
+        if not temps:
+            return []
+        temps = np.concatenate(temps)
+        times = np.concatenate(times)
 
         # Sort by temperature descending (high temp to low temp)
-        points.sort(key=lambda p: -p[1])
-
-        # Remove duplicate temperatures
-        seen = set()
-        unique = []
-        for p in points:
-            t_rounded = round(p[1], 1)
-            if t_rounded not in seen:
-                seen.add(t_rounded)
-                unique.append(p)
+        order = np.argsort(-temps, kind="stable")
+        temps, times = temps[order], times[order]
 
-        return unique
+        # Remove duplicate temperatures, keeping the first of each
+        _, first = np.unique(np.round(temps, 1), return_index=True)
+        first.sort()
+        return np.column_stack([times[first], temps[first]]).tolist()
 
     def predict(self):
         """Predict CCT curves for all applicable phases.
@@ -341,13 +332,36 @@ def predict_cct_curves(composition, transformation_temps=None):
     Returns:
         Dict with CCT curves in the format expected by
         create_cct_overlay_plot(), or None if prediction fails.
+        Predictions are memoized per composition and temperatures; each
+        call returns new lists.
     """
     if not composition or not composition.get("C"):
         return None
 
     try:
-        predictor = CCTCurvePredictor(composition, transformation_temps)
-        curves = predictor.predict()
-        return curves if curves else None
+        curves = _predict_cached(
+            tuple(sorted(composition.items())),
+            tuple(sorted((transformation_temps or {}).items())),
+        )
     except Exception:
         return None
+    if not curves:
+        return None
+    # Fresh lists per call: callers may modify the curves they get
+    return {
+        phase: {position: points.tolist() for position, points in phase_curves.items()}
+        for phase, phase_curves in curves.items()
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _predict_cached(composition_items, temps_items):
+    """Predicted curves per (composition, transformation temperatures) as arrays."""
+    curves = CCTCurvePredictor(dict(composition_items), dict(temps_items)).predict()
+    return {
+        phase: {
+            position: np.array(points, dtype=float).reshape(-1, 2)
+            for position, points in phase_curves.items()
+        }
+        for phase, phase_curves in curves.items()
+    }
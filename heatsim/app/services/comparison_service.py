@@ -2,6 +2,9 @@
 
 Computes RMS error, peak temperature difference, R-squared correlation,
 phase-by-phase metrics, and time offset detection via cross-correlation.
+Measured data is read from its preprocessed series (see measured_series);
+the time offset of a dataset is stored with the snapshot it was detected
+against and reused until the simulation is rerun.
 """
 
 import logging
@@ -9,6 +12,9 @@ from dataclasses import dataclass, field
 
 import numpy as np
 
+from app.extensions import db
+from app.services.measured_series import channel_series
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +54,7 @@ class ComparisonService:
         sim_temps: np.ndarray,
         meas_times: np.ndarray,
         meas_temps: np.ndarray,
+        time_offset: float | None = None,
     ) -> ComparisonMetrics:
         """Compare simulation and measured temperature histories.
 
@@ -63,6 +70,8 @@ class ComparisonService:
             Measured time array (seconds)
         meas_temps : np.ndarray
             Measured temperature array (degC)
+        time_offset : float, optional
+            Known time offset (s); detected by cross-correlation if omitted
 
         Returns
         -------
@@ -96,7 +105,10 @@ class ComparisonService:
         r_squared = float(1 - ss_res / ss_tot) if ss_tot > 0 else 0.0
 
         # Time offset via cross-correlation
-        time_offset = ComparisonService._detect_time_offset(common_times, sim_interp, meas_interp)
+        if time_offset is None:
+            time_offset = ComparisonService._detect_time_offset(
+                common_times, sim_interp, meas_interp
+            )
 
         # Rating
         if rms_error < ComparisonService.GOOD_THRESHOLD:
@@ -126,6 +138,51 @@ class ComparisonService:
         best_lag_idx = np.argmax(cross_corr)
         return float(lags[best_lag_idx])
 
+    @staticmethod
+    def _first_channel(measured) -> dict[str, np.ndarray] | None:
+        series = channel_series(measured)
+        return next(iter(series.values()), None)
+
+    @staticmethod
+    def _stored_offset(measured, result) -> float | None:
+        if result.snapshot_id is None or measured.offset_snapshot_id != result.snapshot_id:
+            return None
+        return measured.time_offset
+
+    @staticmethod
+    def _store_offset(measured, result, time_offset: float) -> None:
+        if result.snapshot_id is None:
+            return
+        measured.time_offset = time_offset
+        measured.offset_snapshot_id = result.snapshot_id
+        db.session.commit()
+
+    @staticmethod
+    def measured_offset(measured, full_result) -> float | None:
+        """Time offset of a dataset's first channel against a full-cycle result.
+
+        Detected by cross-correlation on first use for the result's
+        snapshot, then stored on the dataset (commits).
+
+        Returns
+        -------
+        float or None
+            Offset in seconds, None if the series do not overlap
+        """
+        stored = ComparisonService._stored_offset(measured, full_result)
+        if stored is not None:
+            return stored
+        channel = ComparisonService._first_channel(measured)
+        if channel is None:
+            return None
+        metrics = ComparisonService.compare(
+            full_result.time_series, full_result.value_series, channel["time"], channel["temp"]
+        )
+        if metrics.rating == "unknown":
+            return None
+        ComparisonService._store_offset(measured, full_result, metrics.time_offset)
+        return metrics.time_offset
+
     @staticmethod
     def compare_simulation(simulation) -> ComparisonMetrics | None:
         """Compare a simulation against its measured data.
@@ -148,8 +205,8 @@ class ComparisonService:
             if not full_result:
                 return None
 
-            sim_times = np.array(full_result.time_array)
-            sim_temps = np.array(full_result.value_array)
+            sim_times = full_result.time_series
+            sim_temps = full_result.value_series
             if len(sim_times) < 2:
                 return None
 
@@ -160,16 +217,17 @@ class ComparisonService:
 
             # Use first measured dataset, first channel
             md = measured_list[0]
-            channels = md.channels
-            if not channels:
+            channel = ComparisonService._first_channel(md)
+            if channel is None:
                 return None
 
-            first_channel = list(channels.keys())[0]
-            meas_temps = np.array(channels[first_channel])
-            meas_times = np.array(md.get_channel_times(first_channel))
-
-            # Overall comparison
-            overall = ComparisonService.compare(sim_times, sim_temps, meas_times, meas_temps)
+            # Overall comparison (offset detected once per snapshot)
+            stored_offset = ComparisonService._stored_offset(md, full_result)
+            overall = ComparisonService.compare(
+                sim_times, sim_temps, channel["time"], channel["temp"], stored_offset
+            )
+            if stored_offset is None and overall.rating != "unknown":
+                ComparisonService._store_offset(md, full_result, overall.time_offset)
 
             # Per-phase comparison
             step_phases = {
@@ -182,26 +240,22 @@ class ComparisonService:
                 if step not in step_phases:
                     continue
 
-                phase_ch = md_item.channels
-                if not phase_ch:
+                phase_channel = ComparisonService._first_channel(md_item)
+                if phase_channel is None:
                     continue
 
-                ch_name = list(phase_ch.keys())[0]
-                ph_temps = np.array(phase_ch[ch_name])
-                ph_times = np.array(md_item.get_channel_times(ch_name))
-
                 # Get matching simulation phase result
                 phase_result = simulation.results.filter_by(phase=step).first()
                 if not phase_result:
                     continue
 
-                ph_sim_times = np.array(phase_result.time_array)
-                ph_sim_temps = np.array(phase_result.value_array)
+                ph_sim_times = phase_result.time_series
+                ph_sim_temps = phase_result.value_series
                 if len(ph_sim_times) < 2:
                     continue
 
                 ph_metrics = ComparisonService.compare(
-                    ph_sim_times, ph_sim_temps, ph_times, ph_temps
+                    ph_sim_times, ph_sim_temps, phase_channel["time"], phase_channel["temp"]
                 )
                 overall.phase_metrics[step] = {
                     "rms": ph_metrics.rms_error,
@@ -224,15 +224,10 @@ class HeatTreatmentResultsExtractor:
             phase="full",
             location="center",
         )
-        result.set_time_data(combined_times.tolist())
-        result.set_value_data(combined_center.tolist())
-
         # Multi-position data
-        multi_pos = {"positions": ["center"]}
-        multi_pos["center"] = combined_center.tolist()
+        positions = {"center": combined_center}
         if combined_surface is not None:
-            multi_pos["positions"].append("surface")
-            multi_pos["surface"] = combined_surface.tolist()
+            positions["surface"] = combined_surface
 
         # Add one_third / two_thirds from probe data if available
         for key in ("one_third", "two_thirds"):
@@ -243,11 +238,10 @@ class HeatTreatmentResultsExtractor:
                     all_vals.extend(vals)
             if all_vals and len(all_vals) >= len(combined_center):
                 # Trim to match combined length
-                all_vals = all_vals[: len(combined_center)]
-                multi_pos["positions"].append(key)
-                multi_pos[key] = all_vals
+                positions[key] = all_vals[: len(combined_center)]
 
-        result.set_data(multi_pos)
+        result.set_series(combined_times, combined_center, positions)
+        result.set_data({"positions": list(positions)})
 
         # Calculate t8/5
         t85 = solver_results.get("summary", {}).get("t_800_500")
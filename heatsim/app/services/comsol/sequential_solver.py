@@ -407,13 +407,16 @@ class MockSequentialSolver(SequentialSolver):
 
         duration = string.simulation_duration
 
-        for loc_name, y_m in positions.items():
-            times, temps = solver.thermal_cycle_at_point(
-                y=y_m, z=0.0, duration=duration, n_points=200
-            )
+        # All positions in one vectorized evaluation
+        y_positions = np.array(list(positions.values()))
+        times, position_temps = solver.thermal_cycles(
+            y=y_positions, z=0.0, duration=duration, n_points=200
+        )
+        position_t85 = solver.t8_5(y_positions, z=0.0)
 
+        for loc_name, temps, t85 in zip(positions, position_temps, position_t85, strict=True):
             peak_temp = float(np.max(temps))
-            t_800_500 = solver.t8_5_at_point(y_m, z=0.0)
+            t_800_500 = None if np.isnan(t85) else float(t85)
 
             # Cooling rate
             dt = np.diff(times)
@@ -453,9 +456,7 @@ class MockSequentialSolver(SequentialSolver):
             results.append(cycle_result)
 
         # Create a single cooling rate result (from centerline)
-        times_cl, temps_cl = solver.thermal_cycle_at_point(
-            y=0.001, z=0.0, duration=duration, n_points=200
-        )
+        times_cl, temps_cl = times, position_temps[0]
         dt_cl = np.diff(times_cl)
         dt_cl[dt_cl == 0] = 1e-6
         cr_cl = -np.diff(temps_cl) / dt_cl
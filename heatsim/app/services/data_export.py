@@ -24,8 +24,8 @@ class DataExporter:
         if not cycle:
             return ""
 
-        times = cycle.time_array
-        data = cycle.data_dict  # {center: [...], one_third: [...], ...}
+        times = cycle.time_series.tolist()
+        series = {k: v.tolist() for k, v in cycle.position_series.items()}
 
         positions = ["center", "one_third", "two_thirds", "surface"]
         header = ["time_s"] + [f"{p}_C" for p in positions]
@@ -34,11 +34,11 @@ class DataExporter:
         writer = csv.writer(buf)
         writer.writerow(header)
 
-        # value_array holds center temps; data_dict may have multi-position
-        center = data.get("center", cycle.value_array)
-        one_third = data.get("one_third", [])
-        two_thirds = data.get("two_thirds", [])
-        surface = data.get("surface", [])
+        # value_array holds center temps; position_series may have multi-position
+        center = series.get("center", cycle.value_array)
+        one_third = series.get("one_third", [])
+        two_thirds = series.get("two_thirds", [])
+        surface = series.get("surface", [])
 
         for i, t in enumerate(times):
             row = [f"{t:.3f}"]
@@ -102,14 +102,14 @@ class DataExporter:
                 cell.font = bold
                 cell.fill = header_fill
 
-            times = cycle.time_array
-            data = cycle.data_dict
-            center = data.get("center", cycle.value_array)
+            times = cycle.time_series.tolist()
+            series = {k: v.tolist() for k, v in cycle.position_series.items()}
+            center = series.get("center", cycle.value_array)
             cols = [
                 center,
-                data.get("one_third", []),
-                data.get("two_thirds", []),
-                data.get("surface", []),
+                series.get("one_third", []),
+                series.get("two_thirds", []),
+                series.get("surface", []),
             ]
             for i, t in enumerate(times):
                 ws_temp.cell(i + 2, 1, round(t, 3))
@@ -221,6 +221,7 @@ class DataExporter:
         One row per measured dataset linked to the simulation.
         """
         from app.services.comparison_service import ComparisonService
+        from app.services.measured_series import channel_series
 
         measured_list = sim.measured_data.all()
         if not measured_list:
@@ -230,8 +231,8 @@ class DataExporter:
         if not cycle:
             return ""
 
-        sim_times = np.array(cycle.time_array)
-        sim_temps = np.array(cycle.data_dict.get("center", cycle.value_array))
+        sim_times = cycle.time_series
+        sim_temps = cycle.center_series
 
         buf = io.StringIO()
         writer = csv.writer(buf)
@@ -250,12 +251,10 @@ class DataExporter:
 
         for md in measured_list:
             # Use first channel for comparison
-            ch_names = md.available_channels
-            if not ch_names:
+            fields = next(iter(channel_series(md).values()), None)
+            if fields is None:
                 continue
-            ch = ch_names[0]
-            meas_times = np.array(md.get_channel_times(ch))
-            meas_temps = np.array(md.get_channel_data(ch))
+            meas_times, meas_temps = fields["time"], fields["temp"]
             if len(meas_times) < 2 or len(meas_temps) < 2:
                 continue
 
@@ -276,12 +275,19 @@ class DataExporter:
         return buf.getvalue()
 
     @staticmethod
-    def export_sweep_summary_csv(sim_ids: list[int]) -> str:
+    def export_sweep_summary_csv(sim_ids: list[int], estimate_missing: bool = False) -> str:
         """Export summary table for a parameter sweep (multiple simulations).
 
         Columns: sim_name, steel_grade, geometry, quench_media, t8_5_s,
-                 hardness_HV, martensite_pct.
+                 hardness_HV, martensite_pct, t8_5_source.
+
+        With estimate_missing, simulations without stored results get a
+        reduced-resolution t8/5 estimate; they are solved together in
+        batches (one per steel grade and solver setting).
         """
+        sims = [sim for sim in (Simulation.query.get(sid) for sid in sim_ids) if sim]
+        estimates = DataExporter._estimate_t8_5(sims) if estimate_missing else {}
+
         buf = io.StringIO()
         writer = csv.writer(buf)
         writer.writerow(
@@ -293,16 +299,19 @@ class DataExporter:
                 "t8_5_s",
                 "hardness_HV",
                 "martensite_pct",
+                "t8_5_source",
             ]
         )
 
-        for sid in sim_ids:
-            sim = Simulation.query.get(sid)
-            if not sim:
-                continue
-
+        for sim in sims:
             cycle = sim.results.filter_by(result_type="full_cycle").first()
-            t85 = cycle.t_800_500 if cycle else None
+            t85 = cycle.t_800_500 if cycle else estimates.get(sim.id)
+            if cycle:
+                t85_source = "simulated"
+            elif sim.id in estimates:
+                t85_source = "estimated"
+            else:
+                t85_source = ""
 
             hardness_result = sim.results.filter_by(result_type="hardness_prediction").first()
             hv = hardness_result.data_dict.get("surface_HV") if hardness_result else None
@@ -328,7 +337,37 @@ class DataExporter:
                     f"{t85:.2f}" if t85 else "",
                     f"{hv:.1f}" if hv else "",
                     f"{martensite:.4f}" if martensite is not None else "",
+                    t85_source,
                 ]
             )
 
         return buf.getvalue()
+
+    @staticmethod
+    def _estimate_t8_5(sims: list[Simulation]) -> dict[int, float]:
+        """Batch-solve simulations that have no stored full-cycle result.
+
+        Returns {simulation id: t8/5 in seconds} for the runs that produced
+        a t8/5; simulations are batched per steel grade and solver setting.
+        """
+        from app.services.batch_simulation import (
+            MaterialSnapshot,
+            SimulationVariant,
+            solve_variants,
+        )
+
+        groups: dict[tuple, list[Simulation]] = {}
+        for sim in sims:
+            if sim.results.filter_by(result_type="full_cycle").first():
+                continue
+            groups.setdefault((sim.steel_grade_id, sim.solver_config), []).append(sim)
+
+        estimates = {}
+        for members in groups.values():
+            variants = [SimulationVariant.from_simulation(sim) for sim in members]
+            material = MaterialSnapshot.from_grade(members[0].steel_grade)
+            results = solve_variants(material, variants, members[0].solver_dict)
+            for sim, result in zip(members, results, strict=True):
+                if result is not None and result.t8_5 is not None:
+                    estimates[sim.id] = result.t8_5
+        return estimates
@@ -12,20 +12,11 @@ but uses the 2D Goldak cross-section solver.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import numpy as np
 
-from .goldak_solver import (
-    DEFAULT_CONDUCTIVITY,
-    DEFAULT_CONVECTION_HTC,
-    DEFAULT_DENSITY,
-    DEFAULT_EMISSIVITY,
-    DEFAULT_SPECIFIC_HEAT,
-    STEFAN_BOLTZMANN,
-    GoldakSolver,
-    GoldakSolverConfig,
-)
+from .goldak_solver import GoldakSolver, GoldakSolverConfig
 from .rosenthal_solver import RosenthalSolver
 
 logger = logging.getLogger(__name__)
@@ -112,10 +103,17 @@ class GoldakMultiPassSolver:
 
     @classmethod
     def with_preset(
-        cls, project, preset: str = "medium", compare: bool = True
+        cls,
+        project,
+        preset: str = "medium",
+        compare: bool = True,
+        temperature_dependent: bool = False,
     ) -> "GoldakMultiPassSolver":
         """Create solver with a named resolution preset."""
-        config = GRID_PRESETS.get(preset, GRID_PRESETS["medium"])
+        config = replace(
+            GRID_PRESETS.get(preset, GRID_PRESETS["medium"]),
+            temperature_dependent=temperature_dependent,
+        )
         return cls(project, config=config, compare_with_rosenthal=compare)
 
     def run(self, progress_callback=None) -> MultiPassResult:
@@ -199,8 +197,7 @@ class GoldakMultiPassSolver:
 
                 current_field, cooling_time = self._apply_interpass_cooling(
                     current_field,
-                    solver.y,
-                    solver.z,
+                    solver,
                     target_temp=target_temp,
                     max_time=interpass_time_limit,
                 )
@@ -267,25 +264,27 @@ class GoldakMultiPassSolver:
             convergence_tol=self.config.convergence_tol,
             max_iterations=self.config.max_iterations,
             output_interval=self.config.output_interval,
+            temperature_dependent=self.config.temperature_dependent,
         )
         return cfg
 
     def _apply_interpass_cooling(
         self,
         field: np.ndarray,
-        y: np.ndarray,
-        z: np.ndarray,
+        solver: GoldakSolver,
         target_temp: float,
         max_time: float = 600.0,
     ) -> tuple:
-        """Cool field via natural convection + radiation until max temp <= target.
+        """Cool field via convection + radiation until max temp <= target.
 
-        Uses simple explicit time-stepping with no heat source.
+        Uses the pass solver's implicit ADI steps with no heat source
+        (`GoldakSolver.cool`), so steps grow well beyond the explicit
+        stability limit.
 
         Parameters
         ----------
         field : np.ndarray (nz, ny)
-        y, z : coordinate arrays
+        solver : GoldakSolver of the pass just welded
         target_temp : float (°C)
         max_time : float (s)
 
@@ -293,75 +292,7 @@ class GoldakMultiPassSolver:
         -------
         (cooled_field, cooling_time)
         """
-        nz, ny = field.shape
-        dy = y[1] - y[0]
-        dz = z[1] - z[0]
-        T = field.copy()
-
-        # Use larger time step for cooling (no source term, smoother)
-        dt_cool = 0.5
-        k = DEFAULT_CONDUCTIVITY
-        rho = DEFAULT_DENSITY
-        Cp = DEFAULT_SPECIFIC_HEAT
-        alpha = k / (rho * Cp)
-
-        # Stability limit for explicit scheme
-        max_dt = 0.25 / (alpha * (1 / dy**2 + 1 / dz**2))
-        dt_cool = min(dt_cool, max_dt * 0.9)
-
-        t = 0.0
-        while t < max_time:
-            if np.max(T) <= target_temp:
-                break
-
-            # Explicit diffusion step
-            T_new = T.copy()
-
-            # Interior points
-            for j in range(1, nz - 1):
-                for i in range(1, ny - 1):
-                    laplacian = (
-                        alpha
-                        * dt_cool
-                        * (
-                            (T[j, i - 1] - 2 * T[j, i] + T[j, i + 1]) / dy**2
-                            + (T[j - 1, i] - 2 * T[j, i] + T[j + 1, i]) / dz**2
-                        )
-                    )
-                    T_new[j, i] = T[j, i] + laplacian
-
-            # BCs: convection + radiation on surfaces
-            T_amb = 20.0
-            for i in range(ny):
-                # Top surface (z=0)
-                h = DEFAULT_CONVECTION_HTC + DEFAULT_EMISSIVITY * STEFAN_BOLTZMANN * (
-                    (T[0, i] + 273.15) ** 2 + (T_amb + 273.15) ** 2
-                ) * ((T[0, i] + 273.15) + (T_amb + 273.15))
-                q_loss = h * (T[0, i] - T_amb)
-                T_new[0, i] = T[0, i] - dt_cool * 2 * q_loss / (rho * Cp * dz)
-                # Diffusion from interior
-                if nz > 1:
-                    T_new[0, i] += alpha * dt_cool * 2 * (T[1, i] - T[0, i]) / dz**2
-
-            # Bottom: adiabatic (already handled by no flux)
-            if nz > 1:
-                T_new[-1, :] = T[-1, :] + alpha * dt_cool * 2 * (T[-2, :] - T[-1, :]) / dz**2
-
-            # Left/right edges: convection
-            for j in range(nz):
-                for side_idx in [0, ny - 1]:
-                    h = DEFAULT_CONVECTION_HTC
-                    q_loss = h * (T[j, side_idx] - T_amb)
-                    T_new[j, side_idx] -= dt_cool * 2 * q_loss / (rho * Cp * dy)
-                    neighbor = 1 if side_idx == 0 else ny - 2
-                    T_new[j, side_idx] += (
-                        alpha * dt_cool * 2 * (T[j, neighbor] - T[j, side_idx]) / dy**2
-                    )
-
-            T = np.maximum(T_new, T_amb)  # Don't go below ambient
-            t += dt_cool
-
-        return T, t
+        return solver.cool(field, target_temp, max_time=max_time)
 
     def _compare_with_rosenthal(self, project, string, goldak_result, solver) -> dict:
         """Run Rosenthal for same string and compare with Goldak result."""
@@ -384,21 +315,24 @@ class GoldakMultiPassSolver:
             compare_distances = [0.002, 0.005, 0.010]  # 2, 5, 10 mm
             ros_t85 = []
             goldak_t85 = []
-            for d in compare_distances:
-                ros_val = ros.t8_5_at_point(d, z=0.0)
-                ros_t85.append(ros_val)
+            ros_t85_values = ros.t8_5(np.array(compare_distances), z=0.0)
+            for d, ros_val in zip(compare_distances, ros_t85_values, strict=True):
+                ros_t85.append(None if np.isnan(ros_val) else float(ros_val))
 
                 iy = np.argmin(np.abs(y_coords - d))
                 gval = goldak_result.t8_5_map[0, iy]
                 goldak_t85.append(float(gval) if gval > 0 else None)
 
             # HAZ width comparison
-            ros_haz_widths = {}
-            for zone, temp in [("fusion", 1500), ("cghaz", 1100), ("fghaz", 900), ("ichaz", 727)]:
-                ros_haz_widths[zone] = ros.haz_boundary_distance(temp, z=0.0) * 1000  # mm
+            zone_temps = [("fusion", 1500), ("cghaz", 1100), ("fghaz", 900), ("ichaz", 727)]
+            ros_widths = ros.haz_boundary_distances([temp for _, temp in zone_temps], z=0.0)
+            ros_haz_widths = {
+                zone: float(width) * 1000  # mm
+                for (zone, _), width in zip(zone_temps, ros_widths, strict=True)
+            }
 
             goldak_haz = {}
-            for zone, temp in [("fusion", 1500), ("cghaz", 1100), ("fghaz", 900), ("ichaz", 727)]:
+            for zone, temp in zone_temps:
                 idx = np.where(goldak_peak < temp)[0]
                 if len(idx) > 0 and idx[0] > 0:
                     goldak_haz[zone] = float(distances_mm[idx[0]])
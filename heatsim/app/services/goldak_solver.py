@@ -24,6 +24,7 @@ from dataclasses import dataclass
 import numpy as np
 from scipy.linalg import solve_banded
 
+from .property_evaluator import CompiledProperty, compile_property, evaluate_scalar
 from .rosenthal_solver import (
     ARC_EFFICIENCIES,
     DEFAULT_CONDUCTIVITY,
@@ -41,6 +42,16 @@ DEFAULT_CONVECTION_HTC = 15.0  # W/(m²·K) — natural convection in air
 # Solidus temperature cap
 SOLIDUS_TEMP = 1500.0
 
+# Interpass cooling (GoldakSolver.cool): fully implicit ADI steps (s) growing
+# while the field maximum drops by at most COOLING_MAX_DROP (K) per step,
+# shop air ambient (°C)
+COOLING_INITIAL_DT = 0.5
+COOLING_MIN_DT = 0.01
+COOLING_MAX_DT = 30.0
+COOLING_DT_GROWTH = 1.5
+COOLING_MAX_DROP = 10.0
+COOLING_AMBIENT = 20.0
+
 
 @dataclass
 class GoldakParams:
@@ -130,6 +141,9 @@ class GoldakSolverConfig:
         Max nonlinear iterations per time step
     output_interval : int
         Store snapshot every N steps
+    temperature_dependent : bool
+        Use the k(T) and Cp(T) curves attached with `GoldakSolver.set_material`
+        instead of the constant params.k and params.Cp
     """
 
     ny: int = 41
@@ -140,6 +154,7 @@ class GoldakSolverConfig:
     convergence_tol: float = 1.0
     max_iterations: int = 20
     output_interval: int = 20
+    temperature_dependent: bool = False
 
 
 # Probe point definitions (name -> (y_fraction_of_half_width, z_fraction_of_thickness))
@@ -171,7 +186,8 @@ class GoldakResult:
     probe_thermal_cycles : dict
         {name: {'times': list, 'temps': list}}
     t8_5_map : np.ndarray
-        t8/5 cooling time at each point (s), 0 if not applicable, shape (nz, ny)
+        t8/5 cooling time at each point (s) from interpolated 800 °C and 500 °C
+        crossing times, 0 if not applicable, shape (nz, ny)
     weld_pool_boundary : dict
         {'y_mm': list, 'z_mm': list} solidus isotherm
     fusion_zone_area_mm2 : float
@@ -226,6 +242,88 @@ class GoldakResult:
         return float(val) if val > 0 else None
 
 
+class _ThermalCycleTracker:
+    """Running peak temperature, t8/5 crossings and probe histories.
+
+    Updated in place after every time step with preallocated buffers; only
+    nodes hot enough to cross a level are inspected. The first cooling
+    crossing of 800 °C and of 500 °C at each node is timed by linear
+    interpolation between the two steps that bracket it.
+
+    Parameters
+    ----------
+    T : np.ndarray, shape (nz, ny)
+        Initial temperature field
+    probe_indices : dict
+        {name: (iz, iy)} grid indices of the probe points
+    n_samples : int
+        Number of probe samples to preallocate (including the initial one)
+    """
+
+    LEVELS = (800.0, 500.0)
+
+    def __init__(self, T: np.ndarray, probe_indices: dict, n_samples: int):
+        self.peak = T.copy()
+        self.crossing_times = np.full((len(self.LEVELS), *T.shape), -1.0)
+        self._pending = np.ones((len(self.LEVELS), *T.shape), dtype=bool)
+        self._hot = np.empty(T.shape, dtype=bool)
+
+        self.probe_names = list(probe_indices)
+        self._probe_iz = np.array([iz for iz, _ in probe_indices.values()], dtype=int)
+        self._probe_iy = np.array([iy for _, iy in probe_indices.values()], dtype=int)
+        self.probe_times = np.empty(n_samples)
+        self.probe_temps = np.empty((len(self.probe_names), n_samples))
+        self.n_samples = 0
+        self.record_probes(T, 0.0)
+
+    def update(self, T_prev: np.ndarray, T: np.ndarray, t_prev: float, t: float) -> None:
+        """Fold the step from (t_prev, T_prev) to (t, T) into the running state."""
+        np.maximum(self.peak, T, out=self.peak)
+
+        # Only nodes at or above the lowest level before the step can cool
+        # through a level, so the crossing tests run on that (small) subset
+        np.greater_equal(T_prev, self.LEVELS[-1], out=self._hot)
+        idx = np.flatnonzero(self._hot)
+        if idx.size == 0:
+            return
+        T_a = T_prev.ravel()[idx]
+        T_b = T.ravel()[idx]
+        for level, times, pending in zip(
+            self.LEVELS, self.crossing_times, self._pending, strict=True
+        ):
+            # Cooling through the level during this step: T_prev >= level > T
+            cross = (T_a >= level) & (T_b < level) & pending.ravel()[idx]
+            if not cross.any():
+                continue
+            nodes = idx[cross]
+            T_c = T_a[cross]
+            times.ravel()[nodes] = t_prev + (t - t_prev) * (T_c - level) / (T_c - T_b[cross])
+            pending.ravel()[nodes] = False
+
+    def record_probes(self, T: np.ndarray, t: float) -> None:
+        """Append one probe sample."""
+        self.probe_times[self.n_samples] = t
+        self.probe_temps[:, self.n_samples] = T[self._probe_iz, self._probe_iy]
+        self.n_samples += 1
+
+    def t8_5_map(self) -> np.ndarray:
+        """t8/5 at each node (s), 0 where the node did not cool through both levels."""
+        t800, t500 = self.crossing_times
+        t8_5 = np.zeros_like(t800)
+        valid = (t800 >= 0) & (t500 > t800)
+        t8_5[valid] = t500[valid] - t800[valid]
+        return t8_5
+
+    def probe_cycles(self) -> dict:
+        """{name: {'times': list, 'temps': list}} of the recorded samples."""
+        n = self.n_samples
+        times = self.probe_times[:n].tolist()
+        return {
+            name: {"times": times, "temps": self.probe_temps[i, :n].tolist()}
+            for i, name in enumerate(self.probe_names)
+        }
+
+
 class GoldakSolver:
     """2D cross-section FD solver with Goldak double-ellipsoid heat source.
 
@@ -266,6 +364,16 @@ class GoldakSolver:
             params.a_r * params.b * params.c * pi_sqrt_pi
         )
 
+        # Property curves for the temperature-dependent mode
+        self._k_func: CompiledProperty | None = None
+        self._cp_func: CompiledProperty | None = None
+
+        # ADI work buffers, allocated on the first time step
+        self._ab_y: np.ndarray | None = None
+        self._rhs_y: np.ndarray | None = None
+        self._ab_z: np.ndarray | None = None
+        self._rhs_z: np.ndarray | None = None
+
     @classmethod
     def from_weld_project(
         cls,
@@ -294,31 +402,22 @@ class GoldakSolver:
         v = travel_speed_mm_s / 1000.0
         Q = eta * heat_input_kj_mm * travel_speed_mm_s * 1000.0
 
-        # Material properties
+        # Material properties — in constant-property mode the k and Cp
+        # curves are averaged over the weld thermal cycle
+        T0 = project.preheat_temperature or 20.0
         k = DEFAULT_CONDUCTIVITY
         rho = DEFAULT_DENSITY
         Cp = DEFAULT_SPECIFIC_HEAT
+        k_func = cp_func = None
 
         if project.steel_grade:
             grade = project.steel_grade
-            try:
-                k_val = grade.get_property("thermal_conductivity")
-                if k_val:
-                    k = float(k_val)
-            except (AttributeError, TypeError):
-                pass
-            try:
-                rho_val = grade.get_property("density")
-                if rho_val:
-                    rho = float(rho_val)
-            except (AttributeError, TypeError):
-                pass
-            try:
-                cp_val = grade.get_property("specific_heat")
-                if cp_val:
-                    Cp = float(cp_val)
-            except (AttributeError, TypeError):
-                pass
+            cycle_temps = np.linspace(T0, SOLIDUS_TEMP, 64)
+            k_func = compile_property(grade.get_property("thermal_conductivity"), k)
+            cp_func = compile_property(grade.get_property("specific_heat"), Cp)
+            k = float(np.mean(k_func(cycle_temps)))
+            Cp = float(np.mean(cp_func(cycle_temps)))
+            rho = evaluate_scalar(grade.get_property("density"), rho, temperature=20.0)
 
         # Estimate pool geometry
         pool = estimate_pool_params(heat_input_kj_mm, process_type)
@@ -327,8 +426,6 @@ class GoldakSolver:
         a_f = a_f_override if a_f_override else pool["a_f"]
         a_r = a_r_override if a_r_override else pool["a_r"]
 
-        T0 = project.preheat_temperature or 20.0
-
         params = GoldakParams(
             Q=Q,
             v=v,
@@ -344,7 +441,37 @@ class GoldakSolver:
             plate_thickness=0.020,
             plate_half_width=0.030,
         )
-        return cls(params, config)
+        solver = cls(params, config)
+        if k_func is not None:
+            solver.set_material(k_func, cp_func)
+        return solver
+
+    def set_material(self, k_property, cp_property) -> None:
+        """Attach k(T) and Cp(T) curves for the temperature-dependent mode.
+
+        The curves are only used when ``config.temperature_dependent`` is
+        set; params.k and params.Cp stay the constant-mode values.
+
+        Parameters
+        ----------
+        k_property : MaterialProperty, CompiledProperty or None
+            Thermal conductivity in W/(m·K)
+        cp_property : MaterialProperty, CompiledProperty or None
+            Specific heat in J/(kg·K), including any latent heat peak
+        """
+        self._k_func = compile_property(k_property, self.params.k)
+        self._cp_func = compile_property(cp_property, self.params.Cp)
+
+    def _get_properties(self, T: np.ndarray) -> tuple[float | np.ndarray, float | np.ndarray]:
+        """Conductivity and specific heat for a temperature field.
+
+        Returns the constant params.k and params.Cp unless the
+        temperature-dependent mode is enabled and curves are attached, in
+        which case both curves are evaluated over the whole field at once.
+        """
+        if self.config.temperature_dependent and self._k_func is not None:
+            return self._k_func(T), self._cp_func(T)
+        return self.params.k, self.params.Cp
 
     def _goldak_source_2d(self, t: float) -> np.ndarray:
         """Compute 2D volumetric heat source q(y,z) at time t.
@@ -411,171 +538,151 @@ class GoldakSolver:
         # Full 2D source = q_line * yz_envelope
         return q_line * self._yz_envelope
 
-    def _solve_tridiag(
-        self, lower: np.ndarray, main: np.ndarray, upper: np.ndarray, rhs: np.ndarray
+    def _ensure_buffers(self, nz: int, ny: int) -> None:
+        """Allocate the stacked banded matrices and RHS buffers of both sweeps."""
+        if self._ab_y is None or self._ab_y.shape[1:] != (nz, ny):
+            self._ab_y = np.zeros((3, nz, ny))
+            self._rhs_y = np.zeros((nz, ny))
+            self._ab_z = np.zeros((3, ny, nz))
+            self._rhs_z = np.zeros((ny, nz))
+
+    def _implicit_sweep(
+        self,
+        T: np.ndarray,
+        src: np.ndarray,
+        Fo: float | np.ndarray,
+        Bi_first: np.ndarray,
+        Bi_last: np.ndarray | None,
+        ab: np.ndarray,
+        rhs: np.ndarray,
+        theta: float | None = None,
+        T_amb: float | None = None,
     ) -> np.ndarray:
-        """Solve tridiagonal system using scipy's banded solver.
+        """Solve one directional sub-step along the last axis for all lines at once.
+
+        The m tridiagonal systems are written side by side into one
+        (3, m * n) banded matrix with zero coupling between lines and solved
+        with a single ``solve_banded``.
 
         Parameters
         ----------
-        lower, main, upper : 1D arrays of length n
-            lower[0] and upper[-1] are unused
-        rhs : 1D array of length n
-        """
-        n = len(main)
-        ab = np.zeros((3, n))
-        ab[0, 1:] = upper[:-1]  # superdiagonal
-        ab[1, :] = main  # diagonal
-        ab[2, :-1] = lower[1:]  # subdiagonal
-        return solve_banded((1, 1), ab, rhs)
-
-    def _build_y_system(
-        self,
-        T_row: np.ndarray,
-        T_new_row: np.ndarray,
-        q_row: np.ndarray,
-        k_arr: np.ndarray,
-        alpha_arr: np.ndarray,
-        dt_half: float,
-        theta: float,
-    ) -> tuple[np.ndarray, ...]:
-        """Build tridiagonal system for one row (fixed z) in y-direction.
-
-        Returns (lower, main, upper, rhs) arrays of length ny.
-        """
-        ny = len(T_row)
-        dy = self.dy
-        Fo = alpha_arr * dt_half / dy**2
+        T : np.ndarray, shape (m, n)
+            Temperature at the start of the sub-step, one line per row
+        src : np.ndarray, shape (m, n)
+            Source temperature increment over the sub-step (°C)
+        Fo : float or np.ndarray
+            Fourier number of the sub-step, scalar or broadcastable to (m, n)
+        Bi_first : np.ndarray, shape (m,)
+            Biot number of the convective/radiative surface at node 0
+        Bi_last : np.ndarray, shape (m,), or None
+            Biot number at the last node; None for an adiabatic boundary
+        ab : np.ndarray, shape (3, m, n)
+            Banded matrix work buffer (overwritten)
+        rhs : np.ndarray, shape (m, n)
+            Right-hand side work buffer (overwritten)
+        theta : float, optional
+            Implicitness (0.5 = Crank-Nicolson, 1.0 = fully implicit),
+            default config.theta
+        T_amb : float, optional
+            Ambient temperature of the surface heat transfer (°C), default
+            params.T0
 
-        lower = np.zeros(ny)
-        main = np.zeros(ny)
-        upper = np.zeros(ny)
-        rhs = np.zeros(ny)
+        Returns
+        -------
+        np.ndarray, shape (m, n)
+            Temperature at the end of the sub-step
+        """
+        theta = self.config.theta if theta is None else theta
+        T_amb = self.params.T0 if T_amb is None else T_amb
+        m, n = T.shape
+        Fo = np.broadcast_to(Fo, (m, n))
 
         # Interior nodes
-        for i in range(1, ny - 1):
-            Fo_i = Fo[i]
-            main[i] = 1.0 + 2.0 * theta * Fo_i
-            lower[i] = -theta * Fo_i
-            upper[i] = -theta * Fo_i
-            rhs[i] = (
-                T_row[i]
-                + (1.0 - theta) * Fo_i * (T_row[i - 1] - 2 * T_row[i] + T_row[i + 1])
-                + dt_half * q_row[i] / (self.params.rho * self.params.Cp)
-            )
-
-        # Left boundary (y = -y_max): convection + radiation
-        h_eff_l = self._linearized_htc(T_new_row[0])
-        Bi_l = h_eff_l * dy / k_arr[0]
-        Fo_l = Fo[0]
-        main[0] = 1.0 + theta * (2.0 * Fo_l + 2.0 * Fo_l * Bi_l)
-        upper[0] = -2.0 * theta * Fo_l
-        rhs[0] = (
-            T_row[0]
-            + (1.0 - theta)
-            * (2.0 * Fo_l * (T_row[1] - T_row[0]) + 2.0 * Fo_l * Bi_l * (self.params.T0 - T_row[0]))
-            + 2.0 * theta * Fo_l * Bi_l * self.params.T0
-            + dt_half * q_row[0] / (self.params.rho * self.params.Cp)
+        Fo_i = Fo[:, 1:-1]
+        ab[1, :, 1:-1] = 1.0 + 2.0 * theta * Fo_i
+        ab[2, :, :-2] = -theta * Fo_i
+        ab[0, :, 2:] = -theta * Fo_i
+        rhs[:, 1:-1] = (
+            T[:, 1:-1]
+            + (1.0 - theta) * Fo_i * (T[:, :-2] - 2 * T[:, 1:-1] + T[:, 2:])
+            + src[:, 1:-1]
         )
 
-        # Right boundary (y = +y_max): convection + radiation
-        h_eff_r = self._linearized_htc(T_new_row[-1])
-        Bi_r = h_eff_r * dy / k_arr[-1]
-        Fo_r = Fo[-1]
-        main[-1] = 1.0 + theta * (2.0 * Fo_r + 2.0 * Fo_r * Bi_r)
-        lower[-1] = -2.0 * theta * Fo_r
-        rhs[-1] = (
-            T_row[-1]
+        # First node: convection + radiation (y = -y_max, or top surface z = 0)
+        Fo_0 = Fo[:, 0]
+        ab[1, :, 0] = 1.0 + theta * (2.0 * Fo_0 + 2.0 * Fo_0 * Bi_first)
+        ab[0, :, 1] = -2.0 * theta * Fo_0
+        rhs[:, 0] = (
+            T[:, 0]
             + (1.0 - theta)
-            * (
-                2.0 * Fo_r * (T_row[-2] - T_row[-1])
-                + 2.0 * Fo_r * Bi_r * (self.params.T0 - T_row[-1])
-            )
-            + 2.0 * theta * Fo_r * Bi_r * self.params.T0
-            + dt_half * q_row[-1] / (self.params.rho * self.params.Cp)
+            * (2.0 * Fo_0 * (T[:, 1] - T[:, 0]) + 2.0 * Fo_0 * Bi_first * (T_amb - T[:, 0]))
+            + 2.0 * theta * Fo_0 * Bi_first * T_amb
+            + src[:, 0]
         )
 
-        return lower, main, upper, rhs
-
-    def _build_z_system(
-        self,
-        T_col: np.ndarray,
-        T_new_col: np.ndarray,
-        q_col: np.ndarray,
-        k_arr: np.ndarray,
-        alpha_arr: np.ndarray,
-        dt_half: float,
-        theta: float,
-    ) -> tuple[np.ndarray, ...]:
-        """Build tridiagonal system for one column (fixed y) in z-direction.
-
-        Returns (lower, main, upper, rhs) arrays of length nz.
-        """
-        nz = len(T_col)
-        dz = self.dz
-        Fo = alpha_arr * dt_half / dz**2
-
-        lower = np.zeros(nz)
-        main = np.zeros(nz)
-        upper = np.zeros(nz)
-        rhs = np.zeros(nz)
-
-        # Interior nodes
-        for i in range(1, nz - 1):
-            Fo_i = Fo[i]
-            main[i] = 1.0 + 2.0 * theta * Fo_i
-            lower[i] = -theta * Fo_i
-            upper[i] = -theta * Fo_i
-            rhs[i] = (
-                T_col[i]
-                + (1.0 - theta) * Fo_i * (T_col[i - 1] - 2 * T_col[i] + T_col[i + 1])
-                + dt_half * q_col[i] / (self.params.rho * self.params.Cp)
+        # Last node: convection + radiation (y = +y_max) or adiabatic (z = z_max)
+        Fo_n = Fo[:, -1]
+        ab[2, :, -2] = -2.0 * theta * Fo_n
+        if Bi_last is None:
+            ab[1, :, -1] = 1.0 + 2.0 * theta * Fo_n
+            rhs[:, -1] = T[:, -1] + 2.0 * (1.0 - theta) * Fo_n * (T[:, -2] - T[:, -1]) + src[:, -1]
+        else:
+            ab[1, :, -1] = 1.0 + theta * (2.0 * Fo_n + 2.0 * Fo_n * Bi_last)
+            rhs[:, -1] = (
+                T[:, -1]
+                + (1.0 - theta)
+                * (2.0 * Fo_n * (T[:, -2] - T[:, -1]) + 2.0 * Fo_n * Bi_last * (T_amb - T[:, -1]))
+                + 2.0 * theta * Fo_n * Bi_last * T_amb
+                + src[:, -1]
             )
 
-        # Top surface (z=0): convection + radiation to air
-        h_eff_top = self._linearized_htc(T_new_col[0])
-        Bi_top = h_eff_top * dz / k_arr[0]
-        Fo_top = Fo[0]
-        main[0] = 1.0 + theta * (2.0 * Fo_top + 2.0 * Fo_top * Bi_top)
-        upper[0] = -2.0 * theta * Fo_top
-        rhs[0] = (
-            T_col[0]
-            + (1.0 - theta)
-            * (
-                2.0 * Fo_top * (T_col[1] - T_col[0])
-                + 2.0 * Fo_top * Bi_top * (self.params.T0 - T_col[0])
-            )
-            + 2.0 * theta * Fo_top * Bi_top * self.params.T0
-            + dt_half * q_col[0] / (self.params.rho * self.params.Cp)
-        )
+        # Decouple neighbouring lines (LAPACK may have overwritten these)
+        ab[0, :, 0] = 0.0
+        ab[2, :, -1] = 0.0
 
-        # Bottom (z=z_max): adiabatic (symmetry or thick plate)
-        Fo_bot = Fo[-1]
-        main[-1] = 1.0 + 2.0 * theta * Fo_bot
-        lower[-1] = -2.0 * theta * Fo_bot
-        rhs[-1] = (
-            T_col[-1]
-            + 2.0 * (1.0 - theta) * Fo_bot * (T_col[-2] - T_col[-1])
-            + dt_half * q_col[-1] / (self.params.rho * self.params.Cp)
-        )
+        return solve_banded(
+            (1, 1),
+            ab.reshape(3, m * n),
+            rhs.reshape(m * n),
+            overwrite_ab=True,
+            check_finite=False,
+        ).reshape(m, n)
 
-        return lower, main, upper, rhs
+    def _linearized_htc(
+        self, T_surface: float | np.ndarray, T_amb: float | None = None
+    ) -> float | np.ndarray:
+        """Linearized effective HTC (convection + radiation), elementwise.
 
-    def _linearized_htc(self, T_surface: float) -> float:
-        """Linearized effective HTC (convection + radiation)."""
+        The ambient defaults to the preheat temperature params.T0.
+        """
         p = self.params
-        T_s = T_surface + 273.15  # K
-        T_amb = p.T0 + 273.15
-        h_rad = 0.0
-        if T_s > 0 and T_amb > 0:
-            h_rad = p.emissivity * STEFAN_BOLTZMANN * (T_s**2 + T_amb**2) * (T_s + T_amb)
-        return p.h_conv + h_rad
-
-    def _time_step_adi(self, T: np.ndarray, q_source: np.ndarray) -> np.ndarray:
+        T_s = np.asarray(T_surface) + 273.15  # K
+        T_amb = (p.T0 if T_amb is None else T_amb) + 273.15
+        if T_amb <= 0:
+            return p.h_conv + np.zeros_like(T_s)
+        h_rad = p.emissivity * STEFAN_BOLTZMANN * (T_s**2 + T_amb**2) * (T_s + T_amb)
+        return p.h_conv + np.where(T_s > 0, h_rad, 0.0)
+
+    def _time_step_adi(
+        self,
+        T: np.ndarray,
+        q_source: np.ndarray,
+        dt: float | None = None,
+        theta: float | None = None,
+        T_amb: float | None = None,
+    ) -> np.ndarray:
         """Advance temperature field by one full time step using ADI.
 
-        Half-step 1: implicit in y, explicit z contribution in source
-        Half-step 2: implicit in z, explicit y contribution
+        Sweep 1: implicit in y for all rows (fixed z) at once
+        Sweep 2: implicit in z for all columns (fixed y) at once
+
+        The sweeps are operator-split: each solves one-dimensional diffusion
+        over the whole step dt, so together they advance the field by dt in
+        both directions. The source is shared between them, half each.
+        Surface heat transfer coefficients are linearized about the field at
+        the start of each sweep. In temperature-dependent mode k and Cp
+        are lagged: evaluated once at the field at the start of the step and
+        used by both sweeps, so each direction stays one tridiagonal solve.
 
         Parameters
         ----------
@@ -583,6 +690,12 @@ class GoldakSolver:
             Current temperature field
         q_source : np.ndarray, shape (nz, ny)
             Volumetric heat source (W/m³)
+        dt : float, optional
+            Step length (s), default config.dt
+        theta : float, optional
+            Implicitness of both sweeps, default config.theta
+        T_amb : float, optional
+            Ambient temperature (°C), default params.T0
 
         Returns
         -------
@@ -590,41 +703,114 @@ class GoldakSolver:
             Updated temperature field
         """
         p = self.params
-        dt = self.config.dt
-        theta = self.config.theta
-        dt_half = dt / 2.0
+        dt = self.config.dt if dt is None else dt
+        theta = self.config.theta if theta is None else theta
+        T_amb = p.T0 if T_amb is None else T_amb
         nz, ny = T.shape
+        self._ensure_buffers(nz, ny)
+
+        # Properties lagged at the start of the step (scalars in constant mode)
+        k, cp = self._get_properties(T)
+        rho_cp = p.rho * cp
+        alpha = k / rho_cp
+        Fo_y = alpha * (dt / self.dy**2)
+        Fo_z = alpha * (dt / self.dz**2)
+        src = q_source * (0.5 * dt / rho_cp)
+        k_y = np.broadcast_to(k, T.shape)
+
+        # --- Sweep 1: implicit in y (lines are rows of T) ---
+        T_y = self._implicit_sweep(
+            T,
+            src,
+            Fo_y,
+            self._linearized_htc(T[:, 0], T_amb) * self.dy / k_y[:, 0],
+            self._linearized_htc(T[:, -1], T_amb) * self.dy / k_y[:, -1],
+            self._ab_y,
+            self._rhs_y,
+            theta,
+            T_amb,
+        )
 
-        # Use constant properties for stability (temperature-dependent later)
-        k_const = p.k
-        alpha_const = p.alpha
-
-        # --- Half-step 1: implicit in y ---
-        T_half = np.copy(T)
-        k_arr_y = np.full(ny, k_const)
-        alpha_arr_y = np.full(ny, alpha_const)
-
-        for j in range(nz):
-            lower, main, upper, rhs = self._build_y_system(
-                T[j, :], T_half[j, :], q_source[j, :], k_arr_y, alpha_arr_y, dt_half, theta
-            )
-            T_half[j, :] = self._solve_tridiag(lower, main, upper, rhs)
+        # --- Sweep 2: implicit in z (lines are columns of T_y) ---
+        T_new = self._implicit_sweep(
+            T_y.T,
+            src.T,
+            np.transpose(Fo_z),
+            self._linearized_htc(T_y[0, :], T_amb) * self.dz / k_y[0, :],
+            None,
+            self._ab_z,
+            self._rhs_z,
+            theta,
+            T_amb,
+        ).T
 
-        # --- Half-step 2: implicit in z ---
-        T_new = np.copy(T_half)
-        k_arr_z = np.full(nz, k_const)
-        alpha_arr_z = np.full(nz, alpha_const)
+        # Cap at solidus
+        return np.minimum(T_new, SOLIDUS_TEMP, order="C")
 
-        for i in range(ny):
-            lower, main, upper, rhs = self._build_z_system(
-                T_half[:, i], T_new[:, i], q_source[:, i], k_arr_z, alpha_arr_z, dt_half, theta
-            )
-            T_new[:, i] = self._solve_tridiag(lower, main, upper, rhs)
+    def cool(
+        self,
+        T: np.ndarray,
+        target_temp: float,
+        max_time: float = 600.0,
+        T_amb: float = COOLING_AMBIENT,
+    ) -> tuple[np.ndarray, float]:
+        """Cool a field without heat source until its maximum reaches target_temp.
+
+        Uses the ADI step fully implicit (theta = 1), which is
+        unconditionally stable and does not overshoot at long steps. The
+        step is halved while it cools the maximum by more than
+        COOLING_MAX_DROP, and otherwise grows by COOLING_DT_GROWTH up to
+        COOLING_MAX_DT, so it stays short while conduction out of the bead
+        is fast and long once the plate cools slowly. The step that would
+        cool past the target is repeated, shortened to the interpolated
+        crossing.
 
-        # Cap at solidus
-        T_new = np.minimum(T_new, SOLIDUS_TEMP)
+        Parameters
+        ----------
+        T : np.ndarray, shape (nz, ny)
+            Temperature field after the pass
+        target_temp : float
+            Interpass temperature (°C) the field maximum must reach
+        max_time : float
+            Longest cooling time (s)
+        T_amb : float
+            Ambient temperature of the surface heat transfer (°C)
 
-        return T_new
+        Returns
+        -------
+        (cooled_field, cooling_time)
+        """
+        no_source = np.zeros_like(T)
+
+        def step(T, dt):
+            return self._time_step_adi(T, no_source, dt=dt, theta=1.0, T_amb=T_amb)
+
+        T_max = float(np.max(T))
+        dt = COOLING_INITIAL_DT
+        t = 0.0
+
+        while t < max_time and T_max > target_temp:
+            dt = min(dt, max_time - t)
+            T_new = step(T, dt)
+            T_new_max = float(np.max(T_new))
+            if T_max - T_new_max > COOLING_MAX_DROP and dt > COOLING_MIN_DT:
+                dt = max(dt / 2.0, COOLING_MIN_DT)
+                continue
+
+            landed = T_new_max < target_temp < T_max
+            if landed:
+                # Shorten the step to end at the target temperature
+                dt *= (T_max - target_temp) / (T_max - T_new_max)
+                T_new = step(T, dt)
+                T_new_max = float(np.max(T_new))
+
+            T, T_max = T_new, T_new_max
+            t += dt
+            if landed:
+                break
+            dt = min(dt * COOLING_DT_GROWTH, COOLING_MAX_DT)
+
+        return T, t
 
     def solve(
         self, initial_field: np.ndarray | None = None, progress_callback=None
@@ -658,13 +844,10 @@ class GoldakSolver:
         n_snapshots = n_steps // cfg.output_interval + 1
         stored_fields = np.zeros((n_snapshots, nz, ny))
         stored_times = np.zeros(n_snapshots)
-        stored_fields[0] = T.copy()
+        stored_fields[0] = T
         stored_times[0] = 0.0
         snap_idx = 1
 
-        # Peak temperature tracking
-        peak_map = T.copy()
-
         # Probe thermal cycle tracking
         probe_indices = {}
         for name, (y_abs, z_frac) in PROBE_POINTS.items():
@@ -674,21 +857,10 @@ class GoldakSolver:
             else:
                 iz = nz - 1
             probe_indices[name] = (iz, iy)
+        probe_every = max(1, cfg.output_interval // 4)
 
-        probe_times = {name: [] for name in PROBE_POINTS}
-        probe_temps = {name: [] for name in PROBE_POINTS}
-
-        # Record initial probe values
-        for name, (iz, iy) in probe_indices.items():
-            probe_times[name].append(0.0)
-            probe_temps[name].append(float(T[iz, iy]))
-
-        # Time history for t8/5 calculation
-        # Store full time series at each grid point (memory: nz*ny*n_steps floats)
-        # Too much memory for large grids. Instead, track crossing times.
-        t800_map = np.full((nz, ny), -1.0)  # time of 800°C crossing (cooling)
-        t500_map = np.full((nz, ny), -1.0)  # time of 500°C crossing (cooling)
-        was_above_800 = T > 800  # bool array
+        # Peak temperature, t8/5 crossing times and probe histories
+        tracker = _ThermalCycleTracker(T, probe_indices, n_steps // probe_every + 1)
 
         wall_start = time_module.time()
 
@@ -699,30 +871,18 @@ class GoldakSolver:
             # Compute heat source at this time
             q_source = self._goldak_source_2d(t)
 
-            # ADI time step
-            T_old = T.copy()
+            # ADI time step (returns a new field, so T_prev needs no copy)
+            T_prev = T
             T = self._time_step_adi(T, q_source)
+            tracker.update(T_prev, T, t - cfg.dt, t)
 
-            # Update peak temperature
-            peak_map = np.maximum(peak_map, T)
-
-            # Track t8/5 crossing times
-            # Cooling: was above 800 in previous step, now below
-            cooling_800 = (T_old >= 800) & (T < 800)
-            t800_map = np.where(cooling_800 & (t800_map < 0), t, t800_map)
-
-            cooling_500 = (T_old >= 500) & (T < 500)
-            t500_map = np.where(cooling_500 & (t500_map < 0), t, t500_map)
-
-            # Record probe values (every step for thermal cycle accuracy)
-            if step % max(1, cfg.output_interval // 4) == 0:
-                for name, (iz, iy) in probe_indices.items():
-                    probe_times[name].append(float(t))
-                    probe_temps[name].append(float(T[iz, iy]))
+            # Record probe values (several per snapshot for thermal cycle accuracy)
+            if step % probe_every == 0:
+                tracker.record_probes(T, t)
 
             # Store snapshot
             if step % cfg.output_interval == 0 and snap_idx < n_snapshots:
-                stored_fields[snap_idx] = T.copy()
+                stored_fields[snap_idx] = T
                 stored_times[snap_idx] = t
                 snap_idx += 1
 
@@ -735,10 +895,8 @@ class GoldakSolver:
         stored_fields = stored_fields[:snap_idx]
         stored_times = stored_times[:snap_idx]
 
-        # Compute t8/5 map
-        t8_5_map = np.zeros((nz, ny))
-        valid = (t800_map > 0) & (t500_map > 0) & (t500_map > t800_map)
-        t8_5_map[valid] = t500_map[valid] - t800_map[valid]
+        peak_map = tracker.peak
+        t8_5_map = tracker.t8_5_map()
 
         # Extract weld pool boundary (solidus isotherm from peak temp map)
         pool_boundary = self._extract_pool_boundary(peak_map)
@@ -747,13 +905,7 @@ class GoldakSolver:
         cell_area = self.dy * self.dz * 1e6  # mm²
         fz_area = float(np.sum(peak_map >= SOLIDUS_TEMP) * cell_area)
 
-        # Build probe thermal cycles dict
-        probe_cycles = {}
-        for name in PROBE_POINTS:
-            probe_cycles[name] = {
-                "times": probe_times[name],
-                "temps": probe_temps[name],
-            }
+        probe_cycles = tracker.probe_cycles()
 
         # Goldak params summary
         params_dict = {
@@ -779,6 +931,7 @@ class GoldakSolver:
             "total_time": cfg.total_time,
             "n_steps": n_steps,
             "n_snapshots": snap_idx,
+            "temperature_dependent": bool(cfg.temperature_dependent and self._k_func is not None),
             "wall_time_s": round(wall_time, 2),
         }
 
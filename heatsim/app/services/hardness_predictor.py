@@ -27,6 +27,119 @@ POSITION_LABELS = {
 
 POSITION_KEYS = ["center", "one_third", "two_thirds", "surface"]
 
+# Case hardening depth limit, ISO 2639 / ISO 18203 (550 HV)
+CASE_DEPTH_LIMIT_HV = 550.0
+
+# Effective hardening depth limit as a fraction of the surface hardness
+# (ISO 3754 uses 0.8 x the minimum surface hardness)
+EFFECTIVE_DEPTH_RATIO = 0.8
+
+
+def _position_indices(n_positions: int) -> dict[str, int]:
+    """Solver node index of each of the 4 reported radial positions."""
+    return {
+        "center": 0,
+        "one_third": n_positions // 3,
+        "two_thirds": 2 * n_positions // 3,
+        "surface": n_positions - 1,
+    }
+
+
+@dataclass
+class HardnessProfile:
+    """Hardness and microstructure at every solver node, center to surface.
+
+    Arrays are float32, one value per node, ordered like the solver
+    positions (index 0 at the center, last index at the surface).
+
+    Attributes
+    ----------
+    positions_mm : np.ndarray
+        Distance of each node from the center in mm
+    t8_5 : np.ndarray
+        t8/5 cooling time in seconds
+    phase_fractions : dict
+        Phase fractions {phase: np.ndarray}
+    hardness_hv : np.ndarray
+        Vickers hardness
+    hardness_hrc : np.ndarray
+        Rockwell C hardness, NaN where HV is below the HRC range
+    uts_mpa : np.ndarray
+        Estimated ultimate tensile strength
+    ys_mpa : np.ndarray
+        Estimated yield strength
+    """
+
+    positions_mm: np.ndarray
+    t8_5: np.ndarray
+    phase_fractions: dict[str, np.ndarray]
+    hardness_hv: np.ndarray
+    hardness_hrc: np.ndarray
+    uts_mpa: np.ndarray
+    ys_mpa: np.ndarray
+
+    @property
+    def depth_mm(self) -> np.ndarray:
+        """Depth of each node below the surface in mm."""
+        return self.positions_mm[-1] - self.positions_mm
+
+    def hardening_depth(self, limit_hv: float) -> float:
+        """Depth below the surface at which hardness first drops below a limit.
+
+        Walks inward from the surface and interpolates linearly between the
+        two nodes that bracket the limit.
+
+        Parameters
+        ----------
+        limit_hv : float
+            Limiting hardness in HV
+
+        Returns
+        -------
+        float
+            Hardening depth in mm; 0 if the surface is already softer than
+            the limit, the full section depth if it never drops below it
+        """
+        hv = self.hardness_hv[::-1].astype(float)
+        depth = self.depth_mm[::-1].astype(float)
+        below = np.flatnonzero(hv < limit_hv)
+        if len(below) == 0:
+            return float(depth[-1])
+        k = below[0]
+        if k == 0:
+            return 0.0
+        frac = (hv[k - 1] - limit_hv) / (hv[k - 1] - hv[k])
+        return float(depth[k - 1] + frac * (depth[k] - depth[k - 1]))
+
+    @property
+    def case_depth_mm(self) -> float:
+        """Case hardening depth to 550 HV."""
+        return self.hardening_depth(CASE_DEPTH_LIMIT_HV)
+
+    @property
+    def effective_hardening_depth_mm(self) -> float:
+        """Depth to 80% of the surface hardness."""
+        return self.hardening_depth(EFFECTIVE_DEPTH_RATIO * float(self.hardness_hv[-1]))
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for storage, rounded to display precision."""
+        hrc = np.round(self.hardness_hrc.astype(float), 1)
+        return {
+            "positions_mm": np.round(self.positions_mm.astype(float), 3).tolist(),
+            "t8_5": np.round(self.t8_5.astype(float), 2).tolist(),
+            "phase_fractions": {
+                phase: np.round(values.astype(float), 4).tolist()
+                for phase, values in self.phase_fractions.items()
+            },
+            "hardness_hv": np.round(self.hardness_hv.astype(float), 1).tolist(),
+            "hardness_hrc": [None if np.isnan(v) else v for v in hrc.tolist()],
+            "uts_mpa": np.round(self.uts_mpa.astype(float)).tolist(),
+            "ys_mpa": np.round(self.ys_mpa.astype(float)).tolist(),
+            "case_depth_mm": round(self.case_depth_mm, 3),
+            "case_depth_limit_hv": CASE_DEPTH_LIMIT_HV,
+            "effective_hardening_depth_mm": round(self.effective_hardening_depth_mm, 3),
+        }
+
 
 @dataclass
 class HardnessResult:
@@ -48,6 +161,8 @@ class HardnessResult:
         Grossmann DI in inches
     composition : dict
         Steel composition used for prediction
+    profile : HardnessProfile, optional
+        Values at every solver node, set in profile mode
     """
 
     hardness_hv: dict[str, float] = field(default_factory=dict)
@@ -68,10 +183,12 @@ class HardnessResult:
     hollomon_jaffe_parameter: float = 0.0
     tempering_temperature: float = 0.0
     tempering_time: float = 0.0
+    # Full-resolution profile (profile mode only)
+    profile: HardnessProfile | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
-        return {
+        data = {
             "hardness_hv": self.hardness_hv,
             "hardness_hrc": self.hardness_hrc,
             "t8_5_values": self.t8_5_values,
@@ -89,6 +206,9 @@ class HardnessResult:
             "tempering_temperature": self.tempering_temperature,
             "tempering_time": self.tempering_time,
         }
+        if self.profile is not None:
+            data["profile"] = self.profile.to_dict()
+        return data
 
 
 class HardnessPredictor:
@@ -111,19 +231,19 @@ class HardnessPredictor:
         self.carbon_equivalent = composition.carbon_equivalent_iiw
         self.ideal_diameter = composition.ideal_diameter_di
 
-    def _martensite_hardness(self, vr: float = 100.0) -> float:
+    def _martensite_hardness(self, vr: float | np.ndarray = 100.0) -> float | np.ndarray:
         """Calculate martensite hardness using Maynier equation.
 
         HV_M = 127 + 949*C + 27*Si + 11*Mn + 8*Ni + 16*Cr + 21*log10(Vr)
 
         Parameters
         ----------
-        vr : float
+        vr : float or np.ndarray
             Cooling rate in K/s (default 100 K/s)
 
         Returns
         -------
-        float
+        float or np.ndarray
             Martensite hardness in HV
         """
         C = self.comp["C"]
@@ -133,13 +253,13 @@ class HardnessPredictor:
         Cr = self.comp["Cr"]
 
         # Clamp cooling rate to avoid log of zero
-        vr = max(vr, 0.1)
+        vr = np.maximum(vr, 0.1)
 
-        hv = 127 + 949 * C + 27 * Si + 11 * Mn + 8 * Ni + 16 * Cr + 21 * math.log10(vr)
+        hv = 127 + 949 * C + 27 * Si + 11 * Mn + 8 * Ni + 16 * Cr + 21 * np.log10(vr)
 
-        return max(hv, 100.0)  # Minimum reasonable hardness
+        return np.maximum(hv, 100.0)  # Minimum reasonable hardness
 
-    def _bainite_hardness(self, t8_5: float) -> float:
+    def _bainite_hardness(self, t8_5: float | np.ndarray) -> float | np.ndarray:
         """Calculate bainite hardness using Maynier equation.
 
         HV_B = -109 + 1.7C + 75*C + 19*Si + 4*Mn + 1.1*Ni + 8*Cr + 21*Mo
@@ -150,12 +270,12 @@ class HardnessPredictor:
 
         Parameters
         ----------
-        t8_5 : float
+        t8_5 : float or np.ndarray
             Cooling time 800-500 degC in seconds
 
         Returns
         -------
-        float
+        float or np.ndarray
             Bainite hardness in HV
         """
         C = self.comp["C"]
@@ -166,7 +286,7 @@ class HardnessPredictor:
         Mo = self.comp["Mo"]
 
         # Clamp t8/5 to reasonable range
-        t8_5 = max(t8_5, 0.1)
+        t8_5 = np.maximum(t8_5, 0.1)
 
         # Simplified Maynier bainite equation
         hv = (
@@ -178,15 +298,15 @@ class HardnessPredictor:
             + 1.1 * Ni
             + 8 * Cr
             + 21 * Mo
-            + 18.1 * math.log10(t8_5) * (72 * C + 13 * Si + 5 * Mn + 3 * Ni + 2 * Cr + 6 * Mo)
+            + 18.1 * np.log10(t8_5) * (72 * C + 13 * Si + 5 * Mn + 3 * Ni + 2 * Cr + 6 * Mo)
         )
 
         # More practical simplified form
-        hv = 200 + 500 * C + 30 * Si + 20 * Mn + 10 * Ni + 30 * Cr + 50 * Mo - 5 * math.log10(t8_5)
+        hv = 200 + 500 * C + 30 * Si + 20 * Mn + 10 * Ni + 30 * Cr + 50 * Mo - 5 * np.log10(t8_5)
 
-        return max(hv, 150.0)
+        return np.maximum(hv, 150.0)
 
-    def _ferrite_pearlite_hardness(self, t8_5: float) -> float:
+    def _ferrite_pearlite_hardness(self, t8_5: float | np.ndarray) -> float | np.ndarray:
         """Calculate ferrite+pearlite hardness using Maynier equation.
 
         HV_FP = 42 + 223*C + 53*Si + 30*Mn + 12.6*Ni + 7*Cr + 19*Mo
@@ -194,12 +314,12 @@ class HardnessPredictor:
 
         Parameters
         ----------
-        t8_5 : float
+        t8_5 : float or np.ndarray
             Cooling time 800-500 degC in seconds
 
         Returns
         -------
-        float
+        float or np.ndarray
             Ferrite+pearlite hardness in HV
         """
         C = self.comp["C"]
@@ -211,7 +331,7 @@ class HardnessPredictor:
         V = self.comp["V"]
 
         # Clamp t8/5 to reasonable range
-        t8_5 = max(t8_5, 0.1)
+        t8_5 = np.maximum(t8_5, 0.1)
 
         # Convert t8/5 to cooling rate (300 K / t8_5 seconds)
         vr = 300.0 / t8_5
@@ -224,31 +344,34 @@ class HardnessPredictor:
             + 12.6 * Ni
             + 7 * Cr
             + 19 * Mo
-            + (10 - 19 * Si + 4 * Ni + 8 * Cr + 130 * V) * math.log10(vr)
+            + (10 - 19 * Si + 4 * Ni + 8 * Cr + 130 * V) * np.log10(vr)
         )
 
-        return max(hv, 100.0)
+        return np.maximum(hv, 100.0)
 
-    def predict_hardness(self, phase_fractions: dict[str, float], t8_5: float) -> float:
-        """Predict composite hardness at a single position.
+    def predict_hardness(
+        self, phase_fractions: dict[str, float], t8_5: float | np.ndarray
+    ) -> float | np.ndarray:
+        """Predict composite hardness at a single position or along a profile.
 
         Uses rule of mixtures to combine phase-specific hardness values
-        weighted by phase fractions.
+        weighted by phase fractions. Fractions and t8/5 may be arrays of
+        the same shape to evaluate every position at once.
 
         Parameters
         ----------
         phase_fractions : dict
             Phase fractions {martensite, bainite, ferrite, pearlite, retained_austenite}
-        t8_5 : float
+        t8_5 : float or np.ndarray
             Cooling time 800-500 degC in seconds
 
         Returns
         -------
-        float
+        float or np.ndarray
             Composite hardness in HV
         """
         # Calculate cooling rate for martensite equation
-        vr = 300.0 / max(t8_5, 0.1)
+        vr = 300.0 / np.maximum(t8_5, 0.1)
 
         # Calculate phase-specific hardness
         hv_m = self._martensite_hardness(vr)
@@ -268,7 +391,7 @@ class HardnessPredictor:
             f_m * hv_m + f_b * hv_b + (f_f + f_p) * hv_fp + f_ra * 200.0
         )  # Retained austenite ~200 HV
 
-        return max(hv_composite, 100.0)
+        return np.maximum(hv_composite, 100.0)
 
     def predict_uts(self, hv: float) -> float:
         """Estimate ultimate tensile strength from Vickers hardness.
@@ -306,14 +429,30 @@ class HardnessPredictor:
         float
             Estimated yield strength in MPa
         """
-        f_m = phase_fractions.get("martensite", 0.0)
-        f_b = phase_fractions.get("bainite", 0.0)
-        if f_m > 0.5:
-            ratio = 0.90
-        elif f_b > 0.3:
-            ratio = 0.85
-        else:
-            ratio = 0.70
+        return float(self.predict_ys_field(uts, phase_fractions))
+
+    def predict_ys_field(
+        self, uts: np.ndarray, phase_fractions: dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Estimate yield strength at every position of a profile.
+
+        Array form of `predict_ys`; fractions are arrays shaped like `uts`.
+
+        Parameters
+        ----------
+        uts : np.ndarray
+            Ultimate tensile strength in MPa per position
+        phase_fractions : dict
+            Phase fractions {phase: np.ndarray}
+
+        Returns
+        -------
+        np.ndarray
+            Estimated yield strength in MPa per position
+        """
+        f_m = np.asarray(phase_fractions.get("martensite", 0.0))
+        f_b = np.asarray(phase_fractions.get("bainite", 0.0))
+        ratio = np.where(f_m > 0.5, 0.90, np.where(f_b > 0.3, 0.85, 0.70))
         return ratio * uts
 
     def predict_elongation(self, phase_fractions: dict[str, float]) -> float:
@@ -445,6 +584,25 @@ class HardnessPredictor:
         """
         if hv < 200:
             return None
+        return float(self.hv_to_hrc_field(hv))
+
+    def hv_to_hrc_field(self, hv: np.ndarray) -> np.ndarray:
+        """Convert Vickers hardness to Rockwell C at every position.
+
+        Array form of `hv_to_hrc`; positions below ~200 HV, where HRC is
+        not defined, are NaN.
+
+        Parameters
+        ----------
+        hv : np.ndarray
+            Vickers hardness
+
+        Returns
+        -------
+        np.ndarray
+            Rockwell C hardness, NaN where HV is too low
+        """
+        hv = np.asarray(hv, dtype=float)
 
         # ASTM E140 polynomial approximation
         # Based on standard conversion tables:
@@ -454,7 +612,18 @@ class HardnessPredictor:
         # Fit: HRC = -0.0001*HV^2 + 0.1755*HV - 8.48
         hrc = -0.0001 * hv * hv + 0.1755 * hv - 8.48
 
-        return max(min(hrc, 68.0), 20.0)  # HRC valid range ~20-68
+        hrc = np.clip(hrc, 20.0, 68.0)  # HRC valid range ~20-68
+        return np.where(hv < 200, np.nan, hrc)
+
+
+# Assumed microstructure when phase prediction fails
+_DEFAULT_PHASES = {
+    "martensite": 0.0,
+    "bainite": 0.0,
+    "ferrite": 0.5,
+    "pearlite": 0.5,
+    "retained_austenite": 0.0,
+}
 
 
 def predict_hardness_profile(
@@ -463,10 +632,14 @@ def predict_hardness_profile(
     times: np.ndarray,
     phase_tracker,
     t8_5_values: dict[str, float] | None = None,
+    positions: np.ndarray | None = None,
 ) -> HardnessResult:
     """Predict hardness at 4 radial positions.
 
-    Convenience function for simulation integration.
+    Convenience function for simulation integration. Given the solver node
+    positions, runs in profile mode: t8/5, phases and properties are
+    evaluated at every node in one vectorized pass, the 4 positions are
+    read from that profile and the profile is kept on the result.
 
     Parameters
     ----------
@@ -476,10 +649,15 @@ def predict_hardness_profile(
         Temperature field [time, position]
     times : np.ndarray
         Time array in seconds
-    phase_tracker : PhaseTracker
-        Phase tracker instance for phase prediction
+    phase_tracker : PhaseTracker or PhasePredictor
+        Phase model for phase prediction; one with ``predict_phases_field``
+        (PhaseTracker, or PhasePredictor for the JMAK/Scheil field engine)
+        predicts all nodes at once in profile mode
     t8_5_values : dict, optional
         Pre-calculated t8/5 at each position. If None, calculated from temperatures.
+    positions : np.ndarray, optional
+        Node positions in meters from the center, one per temperature
+        column. Enables profile mode.
 
     Returns
     -------
@@ -496,15 +674,15 @@ def predict_hardness_profile(
         composition=composition.to_dict(),
     )
 
+    if positions is not None:
+        return _predict_profile_mode(
+            predictor, result, temperatures, times, phase_tracker, t8_5_values, positions
+        )
+
     n_positions = temperatures.shape[1]
 
     # Calculate indices for the 4 positions
-    indices = {
-        "center": 0,
-        "one_third": n_positions // 3,
-        "two_thirds": 2 * n_positions // 3,
-        "surface": n_positions - 1,
-    }
+    indices = _position_indices(n_positions)
 
     for pos_key, idx in indices.items():
         # Get temperature at this position
@@ -522,13 +700,7 @@ def predict_hardness_profile(
         phases = phase_tracker.predict_phases(times, temp_at_pos, t8_5)
         if phases is None:
             # Default to ferrite-pearlite if phase prediction fails
-            phase_dict = {
-                "martensite": 0.0,
-                "bainite": 0.0,
-                "ferrite": 0.5,
-                "pearlite": 0.5,
-                "retained_austenite": 0.0,
-            }
+            phase_dict = dict(_DEFAULT_PHASES)
         else:
             phase_dict = phases.to_dict()
         result.phase_fractions[pos_key] = phase_dict
@@ -551,6 +723,63 @@ def predict_hardness_profile(
     return result
 
 
+def _predict_profile_mode(
+    predictor: HardnessPredictor,
+    result: HardnessResult,
+    temperatures: np.ndarray,
+    times: np.ndarray,
+    phase_tracker,
+    t8_5_values: dict[str, float] | None,
+    positions: np.ndarray,
+) -> HardnessResult:
+    """Evaluate every node at once and fill the 4-position result from it."""
+    temperatures = np.asarray(temperatures, dtype=float)
+    indices = _position_indices(temperatures.shape[1])
+
+    t8_5 = _calculate_t8_5_field(times, temperatures)
+    for pos_key, idx in indices.items():
+        if t8_5_values and pos_key in t8_5_values:
+            t8_5[idx] = t8_5_values[pos_key]
+
+    if hasattr(phase_tracker, "predict_phases_field"):
+        phases = phase_tracker.predict_phases_field(times, temperatures, t8_5)
+    else:
+        # Trackers without an array form: one call per node
+        columns = []
+        for j in range(temperatures.shape[1]):
+            node_phases = phase_tracker.predict_phases(times, temperatures[:, j], t8_5[j])
+            columns.append(_DEFAULT_PHASES if node_phases is None else node_phases.to_dict())
+        phases = {phase: np.array([c[phase] for c in columns]) for phase in columns[0]}
+
+    hv = predictor.predict_hardness(phases, t8_5)
+    hrc = predictor.hv_to_hrc_field(hv)
+    uts = predictor.predict_uts(hv)
+    ys = predictor.predict_ys_field(uts, phases)
+    elongation = predictor.predict_elongation(phases)
+
+    for pos_key, idx in indices.items():
+        phase_dict = {phase: float(values[idx]) for phase, values in phases.items()}
+        result.t8_5_values[pos_key] = float(t8_5[idx])
+        result.phase_fractions[pos_key] = phase_dict
+        result.hardness_hv[pos_key] = round(float(hv[idx]), 1)
+        result.hardness_hrc[pos_key] = None if np.isnan(hrc[idx]) else round(float(hrc[idx]), 1)
+        result.uts_mpa[pos_key] = round(float(uts[idx]), 0)
+        result.ys_mpa[pos_key] = round(float(ys[idx]), 0)
+        result.elongation_pct[pos_key] = round(float(elongation[idx]), 1)
+        result.toughness_rating[pos_key] = predictor.predict_toughness_rating(phase_dict)
+
+    result.profile = HardnessProfile(
+        positions_mm=(np.asarray(positions, dtype=float) * 1000.0).astype(np.float32),
+        t8_5=t8_5.astype(np.float32),
+        phase_fractions={phase: values.astype(np.float32) for phase, values in phases.items()},
+        hardness_hv=hv.astype(np.float32),
+        hardness_hrc=hrc.astype(np.float32),
+        uts_mpa=uts.astype(np.float32),
+        ys_mpa=ys.astype(np.float32),
+    )
+    return result
+
+
 def _calculate_t8_5(times: np.ndarray, temperatures: np.ndarray) -> float:
     """Calculate t8/5 cooling time from temperature history.
 
@@ -612,3 +841,66 @@ def _calculate_t8_5(times: np.ndarray, temperatures: np.ndarray) -> float:
 
     # Default moderate cooling
     return 10.0
+
+
+def _calculate_t8_5_field(times: np.ndarray, temperatures: np.ndarray) -> np.ndarray:
+    """Calculate t8/5 at every position of a temperature field.
+
+    Array form of `_calculate_t8_5`, same crossings, fallbacks and default,
+    evaluated for all columns at once.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time array in seconds, shape (n_times,)
+    temperatures : np.ndarray
+        Temperature field in Celsius, shape (n_times, n_positions)
+
+    Returns
+    -------
+    np.ndarray
+        Cooling time from 800 to 500 degC in seconds per position
+    """
+    times = np.asarray(times, dtype=float)
+    temperatures = np.asarray(temperatures, dtype=float)
+    n_positions = temperatures.shape[1] if temperatures.ndim == 2 else 0
+    t8_5 = np.full(n_positions, 10.0)
+    if len(times) < 2 or temperatures.size == 0:
+        # Not a cooling curve: a single sample cannot cross 800 or 500 degC
+        return t8_5
+
+    cols = np.arange(n_positions)
+    steps = np.arange(1, len(times))
+    prev, curr = temperatures[:-1], temperatures[1:]
+
+    # First step i whose interval crosses 800 from above (cooling)
+    cross_800 = (prev > 800) & (curr <= 800)
+    has_800 = cross_800.any(axis=0)
+    i_800 = np.argmax(cross_800, axis=0) + 1
+
+    # First 500 crossing at or after the 800 crossing step
+    cross_500 = (prev > 500) & (curr <= 500) & (steps[:, None] >= i_800[None, :])
+    has_500 = cross_500.any(axis=0)
+    i_500 = np.argmax(cross_500, axis=0) + 1
+
+    def crossing_time(i, level):
+        # Interpolated time at which the curve reaches `level` within step i
+        t_before, t_after = temperatures[i - 1, cols], temperatures[i, cols]
+        frac = (level - t_after) / np.where(t_before > t_after, t_before - t_after, 1.0)
+        return np.interp(i - frac, np.arange(len(times)), times)
+
+    found = has_800 & has_500
+    if found.any():
+        t_800 = crossing_time(i_800, 800)
+        t_500 = crossing_time(i_500, 500)
+        t8_5[found] = np.maximum(t_500 - t_800, 0.1)[found]
+
+    # Fallback: estimate from the nodes closest to 800 and 500
+    fallback = ~found & (temperatures.max(axis=0) > 800) & (temperatures.min(axis=0) < 500)
+    if fallback.any():
+        idx_800 = np.argmin(np.abs(temperatures - 800), axis=0)
+        idx_500 = np.argmin(np.abs(temperatures - 500), axis=0)
+        usable = fallback & (idx_500 > idx_800)
+        t8_5[usable] = np.maximum(times[idx_500] - times[idx_800], 0.1)[usable]
+
+    return t8_5
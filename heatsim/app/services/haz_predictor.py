@@ -7,6 +7,7 @@ from the weld line and predict:
 - t8/5 cooling times at each distance
 - Hardness traverse using Maynier equations
 - Thermal cycles at representative zone positions
+- Peak temperature, t8/5 and zone maps over a transverse (y, z) section
 
 Zone definitions (typical for C-Mn steels):
 - Fusion Zone:  T_peak > solidus (~1500 °C)
@@ -28,6 +29,18 @@ DEFAULT_CGHAZ_TEMP = 1100.0
 DEFAULT_AC3 = 900.0
 DEFAULT_AC1 = 727.0
 
+# Zone codes of HAZPredictor.predict_map
+ZONE_BASE_METAL = 0
+ZONE_ICHAZ = 1
+ZONE_FGHAZ = 2
+ZONE_CGHAZ = 3
+ZONE_FUSION = 4
+
+
+def _optional_list(values: np.ndarray) -> list[float | None]:
+    """Array to list with NaN as None."""
+    return [None if np.isnan(v) else float(v) for v in np.ravel(values)]
+
 
 @dataclass
 class HAZResult:
@@ -182,10 +195,10 @@ class HAZPredictor:
         peak_temps = self.rosenthal.peak_temperature_at_distance(distances_m, z)
 
         # 2. Find zone boundaries
-        fz_dist = self.rosenthal.haz_boundary_distance(DEFAULT_SOLIDUS, z) * 1000  # mm
-        cghaz_dist = self.rosenthal.haz_boundary_distance(DEFAULT_CGHAZ_TEMP, z) * 1000
-        fghaz_dist = self.rosenthal.haz_boundary_distance(self.ac3, z) * 1000
-        ichaz_dist = self.rosenthal.haz_boundary_distance(self.ac1, z) * 1000
+        boundaries = self.rosenthal.haz_boundary_distances(
+            [DEFAULT_SOLIDUS, DEFAULT_CGHAZ_TEMP, self.ac3, self.ac1], z
+        )
+        fz_dist, cghaz_dist, fghaz_dist, ichaz_dist = (float(d) * 1000 for d in boundaries)  # mm
 
         result.fusion_zone_width = fz_dist
         result.cghaz_width = max(0, cghaz_dist - fz_dist)
@@ -201,10 +214,7 @@ class HAZPredictor:
         }
 
         # 3. Calculate t8/5 at each distance
-        t8_5_values = []
-        for d_m in distances_m:
-            t85 = self.rosenthal.t8_5_at_point(d_m, z)
-            t8_5_values.append(t85)
+        t8_5_values = _optional_list(self.rosenthal.t8_5(distances_m, z))
 
         # 4. Calculate hardness at each distance
         hardness_values = []
@@ -263,9 +273,10 @@ class HAZPredictor:
             predictor = HardnessPredictor(self.composition)
             tracker = PhaseTracker(self.phase_diagram)
 
-            for zone_name, zone_mm in zone_positions.items():
-                d_m = zone_mm / 1000.0
-                t85 = self.rosenthal.t8_5_at_point(d_m, z)
+            zone_t85 = _optional_list(
+                self.rosenthal.t8_5(np.array(list(zone_positions.values())) / 1000.0, z)
+            )
+            for zone_name, t85 in zip(zone_positions, zone_t85, strict=True):
                 if t85 and t85 > 0:
                     phases = tracker.predict_phases(
                         np.array([0, t85]), np.array([800, 500]), t8_5=t85
@@ -285,13 +296,13 @@ class HAZPredictor:
         if ichaz_dist > 0:
             cycle_positions["base_metal"] = (ichaz_dist + 5) / 1000.0
 
-        for label, y_m in cycle_positions.items():
-            times, temps = self.rosenthal.thermal_cycle_at_point(
-                y_m, z, duration=120.0, n_points=200
-            )
+        times, temps = self.rosenthal.thermal_cycles(
+            np.array(list(cycle_positions.values())), z, duration=120.0, n_points=200
+        )
+        for label, cycle_temps in zip(cycle_positions, temps, strict=True):
             result.thermal_cycles[label] = {
                 "times": times.tolist(),
-                "temps": temps.tolist(),
+                "temps": cycle_temps.tolist(),
             }
 
         # Store results
@@ -301,3 +312,51 @@ class HAZPredictor:
         result.hardness_profile = hardness_values
 
         return result
+
+    def predict_map(
+        self,
+        max_distance_mm: float = 20.0,
+        max_depth_mm: float = 10.0,
+        ny: int = 81,
+        nz: int = 41,
+    ) -> dict:
+        """Peak temperature, t8/5 and HAZ zone over a transverse (y, z) section.
+
+        All grid points are evaluated in one vectorized pass, fast enough
+        to recompute on every change of the weld parameters.
+
+        Parameters
+        ----------
+        max_distance_mm : float
+            Half-width of the section from the weld line (mm)
+        max_depth_mm : float
+            Depth of the section below the surface (mm)
+        ny, nz : int
+            Grid points across and into the plate
+
+        Returns
+        -------
+        dict
+            'y_mm' (ny), 'z_mm' (nz), then (nz, ny) nested lists:
+            'peak_temperatures' (°C), 't8_5' (s, None below 800 °C) and
+            'zones' (ZONE_* codes)
+        """
+        y_mm = np.linspace(0.0, max_distance_mm, ny)
+        z_mm = np.linspace(0.0, max_depth_mm, nz)
+        y_m = y_mm[np.newaxis, :] / 1000.0
+        z_m = z_mm[:, np.newaxis] / 1000.0
+
+        peak_temps = self.rosenthal.peak_temperatures(y_m, z_m)
+        t8_5 = self.rosenthal.t8_5(y_m, z_m)
+
+        # Count the zone thresholds each peak reaches (the weld center is capped at solidus)
+        thresholds = np.array([self.ac1, self.ac3, DEFAULT_CGHAZ_TEMP, DEFAULT_SOLIDUS])
+        zones = (peak_temps[..., np.newaxis] >= thresholds).sum(axis=-1)
+
+        return {
+            "y_mm": y_mm.tolist(),
+            "z_mm": z_mm.tolist(),
+            "peak_temperatures": peak_temps.tolist(),
+            "t8_5": [_optional_list(row) for row in t8_5],
+            "zones": zones.tolist(),
+        }
@@ -10,6 +10,13 @@ For Cartesian coordinates (plate):
     rho * Cp * dT/dt = d/dx(k * dT/dx)
 
 Uses implicit Crank-Nicolson scheme for stability with large time steps.
+Phases can optionally use adaptive time stepping: each step is taken both
+as one full step and as two half steps (step doubling), the difference is
+used as a local error estimate, and dt shrinks through quench transients
+and end-condition crossings and grows through furnace soaks.
+
+BatchHeatSolver advances many parameter variants of the same part family
+at once (sensitivity, optimization and sweep screening runs).
 
 Supports multi-phase heat treatment:
 - Heating: Heat up to austenitizing temperature
@@ -18,14 +25,15 @@ Supports multi-phase heat treatment:
 - Tempering: Reheat to tempering temperature and cool
 """
 
+import time as time_module
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
-from scipy.sparse import diags
-from scipy.sparse.linalg import spsolve
+from scipy.linalg import solve_banded
 
 from app.services.boundary_conditions import (
+    STEFAN_BOLTZMANN,
     BoundaryCondition,
     InsulatedBoundary,
     RampingBoundaryCondition,
@@ -37,7 +45,11 @@ from app.services.boundary_conditions import (
     create_transfer_bc,
 )
 from app.services.geometry import Cylinder, GeometryBase, Ring
-from app.services.property_evaluator import PropertyEvaluator
+from app.services.property_evaluator import CompiledProperty, compile_property
+
+# Generic steel fallbacks when a grade lacks thermal properties
+DEFAULT_CONDUCTIVITY = 40.0  # W/(m·K)
+DEFAULT_SPECIFIC_HEAT = 500.0  # J/(kg·K)
 
 
 @dataclass
@@ -59,7 +71,17 @@ class SolverConfig:
     max_iterations : int
         Maximum iterations per time step
     output_interval : int
-        Store results every N time steps
+        Store results every N time steps (every output_interval * dt seconds
+        when adaptive)
+    adaptive : bool
+        Use step-doubling adaptive time stepping in solve_phase; dt is then
+        only the initial step
+    error_tol : float
+        Maximum local temperature error per adaptive step (°C)
+    dt_min : float
+        Smallest adaptive time step (s)
+    dt_max : float
+        Largest adaptive time step (s)
     """
 
     n_nodes: int = 51
@@ -69,6 +91,10 @@ class SolverConfig:
     convergence_tol: float = 1e-4
     max_iterations: int = 50
     output_interval: int = 10
+    adaptive: bool = False
+    error_tol: float = 0.5
+    dt_min: float = 1e-3
+    dt_max: float = 60.0
 
     @classmethod
     def from_dict(cls, d: dict) -> "SolverConfig":
@@ -323,6 +349,9 @@ class PhaseResult:
         Temperature at surface vs time
     t8_5 : float, optional
         Cooling time 800-500°C (if applicable)
+    solver_info : dict
+        Step statistics: n_steps, n_rejected, fixed_steps (steps a fixed
+        SolverConfig.dt run would have taken), dt_min_used, dt_max_used, wall_time_s
     """
 
     phase_name: str
@@ -334,6 +363,7 @@ class PhaseResult:
     t8_5: float | None = None
     start_time: float = 0.0
     end_time: float = 0.0
+    solver_info: dict = field(default_factory=dict)
 
 
 @dataclass
@@ -356,6 +386,9 @@ class SolverResult:
         Temperature at quarter thickness
     t8_5 : float, optional
         Cooling time from 800°C to 500°C
+    solver_info : dict, optional
+        Step-count and wall-time statistics summed over all phases,
+        including the reduction relative to fixed SolverConfig.dt stepping
     """
 
     time: np.ndarray
@@ -367,13 +400,100 @@ class SolverResult:
     t8_5: float | None = None
     cooling_rates: np.ndarray | None = None
     phase_results: list[PhaseResult] | None = None
+    solver_info: dict | None = None
+
+
+class _PhaseEndMonitor:
+    """Tracks the end condition of one phase as it is advanced.
+
+    Holds the state the end conditions need between steps (periodic surface
+    rate checks, whether a hot part has cooled towards a tempering target)
+    so the single-field and batched solvers terminate phases identically.
+
+    Parameters
+    ----------
+    phase_config : PhaseConfig
+        Phase being advanced
+    initial_field : np.ndarray
+        Temperature field at phase start
+    """
+
+    RATE_CHECK_INTERVAL = 60.0  # Check surface rate every 60 seconds
+
+    def __init__(self, phase_config: PhaseConfig, initial_field: np.ndarray):
+        self.phase = phase_config
+
+        # Track state for rate_threshold condition
+        self.rate_trigger_time: float | None = None
+        self.prev_surface_temp = initial_field[-1]
+        self.last_rate_check_time = 0.0
+
+        # Track if part has approached target from above (for tempering after incomplete quench)
+        self.has_approached_target = (
+            initial_field[0] <= phase_config.target_temperature + 50
+            if phase_config.target_temperature
+            else True
+        )
+
+    def reached(self, center_temp: float, surface_temp: float, t: float) -> bool:
+        """Return True when the phase should end at phase time t."""
+        phase = self.phase
+
+        if phase.end_condition == "equilibrium":
+            # Check if center has reached target
+            if phase.end_temperature is not None:
+                if phase.name in ("heating", "tempering"):
+                    # For tempering: if part starts hotter than target, wait until it cools first
+                    if not self.has_approached_target:
+                        if center_temp <= phase.target_temperature + 20:
+                            self.has_approached_target = True
+
+                    # Only check equilibrium after part has approached target temp
+                    if self.has_approached_target and center_temp >= phase.end_temperature:
+                        # Check if we're actually at equilibrium (surface and center within 10°C)
+                        if abs(center_temp - surface_temp) < 10:
+                            return True
+                else:
+                    # Cooling: end when center drops below threshold
+                    if center_temp <= phase.end_temperature:
+                        return True
+
+        elif phase.end_condition == "temperature":
+            if phase.end_temperature is not None:
+                if center_temp <= phase.end_temperature:
+                    return True
+
+        elif phase.end_condition == "rate_threshold":
+            # End when surface temperature change rate < threshold
+            # Check periodically to avoid noise
+            elapsed = t - self.last_rate_check_time
+            if elapsed >= self.RATE_CHECK_INTERVAL:
+                surface_rate = abs(surface_temp - self.prev_surface_temp) / elapsed * 3600  # °C/hr
+                self.prev_surface_temp = surface_temp
+                self.last_rate_check_time = t
+
+                if surface_rate < phase.rate_threshold:
+                    if self.rate_trigger_time is None:
+                        self.rate_trigger_time = t
+                    # Check if hold time has elapsed
+                    if t - self.rate_trigger_time >= phase.hold_time_after_trigger:
+                        return True
+                else:
+                    self.rate_trigger_time = None  # Reset if rate goes back up
+
+        elif phase.end_condition == "center_offset":
+            # End when center reaches target - offset
+            if center_temp >= phase.target_temperature - phase.center_offset:
+                return True
+
+        return False
 
 
 class HeatSolver:
     """1D transient heat transfer solver using finite differences.
 
-    Supports temperature-dependent material properties through
-    PropertyEvaluator integration.
+    Supports temperature-dependent material properties through compiled
+    (vectorized) PropertyEvaluator lookups.
     """
 
     def __init__(
@@ -402,9 +522,9 @@ class HeatSolver:
         self.inner_bc = inner_bc or InsulatedBoundary()
         self.config = config or SolverConfig()
 
-        # Material property evaluators
-        self._k_evaluator: PropertyEvaluator | None = None
-        self._cp_evaluator: PropertyEvaluator | None = None
+        # Material property evaluators (vectorized over the whole field)
+        self._k_func: CompiledProperty = CompiledProperty.constant(DEFAULT_CONDUCTIVITY)
+        self._cp_func: CompiledProperty = CompiledProperty.constant(DEFAULT_SPECIFIC_HEAT)
         self._rho: float = 7850.0
         self._emissivity: float = 0.85
 
@@ -412,6 +532,10 @@ class HeatSolver:
         self._is_cylindrical = isinstance(geometry, (Cylinder, Ring))
         self._has_inner_bc = isinstance(geometry, Ring)
 
+        # Banded-system work buffers, (re)allocated when the mesh size changes
+        self._ab: np.ndarray | None = None
+        self._rhs: np.ndarray | None = None
+
     def set_material(self, k_property, cp_property, density: float, emissivity: float = 0.85):
         """Set material properties from database models.
 
@@ -427,9 +551,9 @@ class HeatSolver:
             Surface emissivity
         """
         if k_property:
-            self._k_evaluator = PropertyEvaluator(k_property)
+            self._k_func = compile_property(k_property, DEFAULT_CONDUCTIVITY)
         if cp_property:
-            self._cp_evaluator = PropertyEvaluator(cp_property)
+            self._cp_func = compile_property(cp_property, DEFAULT_SPECIFIC_HEAT)
         self._rho = density
         self._emissivity = emissivity
 
@@ -447,33 +571,20 @@ class HeatSolver:
         """
         self.outer_bc = bc
 
-    def _get_properties_at_temp(self, T: float) -> tuple[float, float]:
-        """Get thermal conductivity and specific heat at temperature.
+    def _get_properties(self, T: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get thermal conductivity and specific heat over a temperature field.
 
         Parameters
         ----------
-        T : float
-            Temperature in Celsius
+        T : np.ndarray
+            Nodal temperatures in Celsius
 
         Returns
         -------
         tuple
-            (k, cp) thermal conductivity and specific heat
+            (k, cp) arrays of thermal conductivity and specific heat
         """
-        k = 40.0  # Default
-        cp = 500.0  # Default
-
-        if self._k_evaluator:
-            k_val = self._k_evaluator.evaluate(temperature=T)
-            if k_val is not None:
-                k = k_val
-
-        if self._cp_evaluator:
-            cp_val = self._cp_evaluator.evaluate(temperature=T)
-            if cp_val is not None:
-                cp = cp_val
-
-        return k, cp
+        return self._k_func(T), self._cp_func(T)
 
     def solve(
         self, initial_temp: float, progress_callback: Callable[[float], None] | None = None
@@ -607,31 +718,29 @@ class HeatSolver:
             self.outer_bc = phase_config.boundary_condition
 
         dr = mesh[1] - mesh[0] if len(mesh) > 1 else mesh[0]
-        n = len(mesh)
 
         T = initial_field.copy()
         t = 0.0
         step = 0
+        n_rejected = 0
+        dt = cfg.dt
+        dt_used_min = np.inf
+        dt_used_max = 0.0
+        wall_start = time_module.time()
 
         times = [0.0]
         temp_history = [T.copy()]
+        last_output_time = 0.0
+        output_spacing = cfg.output_interval * cfg.dt
 
         # Phase-specific termination
         max_phase_time = phase_config.duration
 
-        # Track state for rate_threshold condition
-        rate_trigger_time = None
-        prev_surface_temp = T[-1]
-        rate_check_interval = 60.0  # Check rate every 60 seconds
-        last_rate_check_time = 0.0
+        # End-condition state (rate checks, approach-from-above for tempering)
+        monitor = _PhaseEndMonitor(phase_config, T)
 
-        # Track if part has approached target from above (for tempering after incomplete quench)
-        initial_center_temp = T[0]
-        has_approached_target = (
-            initial_center_temp <= phase_config.target_temperature + 50
-            if phase_config.target_temperature
-            else True
-        )
+        # Center rate of the last accepted step (°C/s), used to approach end conditions
+        center_rate = 0.0
 
         while t < max_phase_time:
             # Update time on ramping boundary condition
@@ -639,71 +748,43 @@ class HeatSolver:
                 self.outer_bc.set_time(t)
 
             # Check end conditions
-            if phase_config.end_condition == "equilibrium":
-                # Check if center has reached target
-                if phase_config.end_temperature is not None:
-                    if phase_config.name in ("heating", "tempering"):
-                        # For tempering: if part starts hotter than target, wait until it cools first
-                        if not has_approached_target:
-                            if T[0] <= phase_config.target_temperature + 20:
-                                has_approached_target = True
-
-                        # Only check equilibrium after part has approached target temp
-                        if has_approached_target and T[0] >= phase_config.end_temperature:
-                            # Check if we're actually at equilibrium (surface and center within 10°C)
-                            if abs(T[0] - T[-1]) < 10:
-                                break
-                    else:
-                        # Cooling: end when center drops below threshold
-                        if T[0] <= phase_config.end_temperature:
-                            break
-
-            elif phase_config.end_condition == "temperature":
-                if phase_config.end_temperature is not None:
-                    if T[0] <= phase_config.end_temperature:
-                        break
-
-            elif phase_config.end_condition == "rate_threshold":
-                # End when surface temperature change rate < threshold
-                # Check periodically to avoid noise
-                if t - last_rate_check_time >= rate_check_interval:
-                    surface_rate = (
-                        abs(T[-1] - prev_surface_temp) / rate_check_interval * 3600
-                    )  # °C/hr
-                    prev_surface_temp = T[-1]
-                    last_rate_check_time = t
-
-                    if surface_rate < phase_config.rate_threshold:
-                        if rate_trigger_time is None:
-                            rate_trigger_time = t
-                        # Check if hold time has elapsed
-                        if t - rate_trigger_time >= phase_config.hold_time_after_trigger:
-                            break
-                    else:
-                        rate_trigger_time = None  # Reset if rate goes back up
-
-            elif phase_config.end_condition == "center_offset":
-                # End when center reaches target - offset
-                if T[0] >= phase_config.target_temperature - phase_config.center_offset:
-                    break
+            if monitor.reached(T[0], T[-1], t):
+                break
 
             # Advance one time step
-            T_new = self._time_step(T, mesh, dr, cfg.dt)
+            if cfg.adaptive:
+                dt = self._limit_dt_for_end_condition(
+                    T, center_rate, dt, phase_config, max_phase_time - t
+                )
+                T_new, dt_taken, dt, rejected = self._adaptive_step(T, mesh, dr, t, dt)
+                n_rejected += rejected
+            else:
+                T_new = self._time_step(T, mesh, dr, dt)
+                dt_taken = dt
+
+            center_rate = (T_new[0] - T[0]) / dt_taken
             T = T_new
-            t += cfg.dt
+            t += dt_taken
             step += 1
+            dt_used_min = min(dt_used_min, dt_taken)
+            dt_used_max = max(dt_used_max, dt_taken)
 
             # Store at interval
-            if step % cfg.output_interval == 0:
+            if cfg.adaptive:
+                store = t - last_output_time >= output_spacing * (1 - 1e-9)
+            else:
+                store = step % cfg.output_interval == 0
+            if store:
                 times.append(t)
                 temp_history.append(T.copy())
+                last_output_time = t
 
             # Progress callback
             if progress_callback:
                 progress_callback(min(t / max_phase_time, 1.0), phase_config.name)
 
         # Store final state
-        if step % cfg.output_interval != 0:
+        if times[-1] != t:
             times.append(t)
             temp_history.append(T.copy())
 
@@ -714,6 +795,16 @@ class HeatSolver:
         # Calculate t8/5 for this phase
         t8_5 = self._calculate_t8_5(times, temp_history[:, 0])
 
+        solver_info = {
+            "adaptive": cfg.adaptive,
+            "n_steps": step,
+            "n_rejected": n_rejected,
+            "fixed_steps": int(np.ceil(t / cfg.dt - 1e-9)),
+            "dt_min_used": float(dt_used_min) if step else cfg.dt,
+            "dt_max_used": float(dt_used_max) if step else cfg.dt,
+            "wall_time_s": time_module.time() - wall_start,
+        }
+
         return PhaseResult(
             phase_name=phase_config.name,
             time=times,
@@ -724,24 +815,105 @@ class HeatSolver:
             t8_5=t8_5,
             start_time=start_time,
             end_time=start_time + times[-1],
+            solver_info=solver_info,
         )
 
+    def _adaptive_step(
+        self, T: np.ndarray, r: np.ndarray, dr: float, t: float, dt: float
+    ) -> tuple[np.ndarray, float, float, int]:
+        """Take one error-controlled step by step doubling.
+
+        The step is computed once with dt and once as two dt/2 steps; their
+        difference estimates the local error of the second-order scheme.
+        Rejected steps are retried with a smaller dt.
+
+        Returns
+        -------
+        tuple
+            (T_new, dt_taken, dt_next, n_rejected)
+        """
+        cfg = self.config
+        ramping = isinstance(self.outer_bc, RampingBoundaryCondition)
+        n_rejected = 0
+
+        while True:
+            T_full = self._time_step(T, r, dr, dt)
+            T_half = self._time_step(T, r, dr, 0.5 * dt)
+            if ramping:
+                self.outer_bc.set_time(t + 0.5 * dt)
+            T_two = self._time_step(T_half, r, dr, 0.5 * dt)
+            if ramping:
+                self.outer_bc.set_time(t)
+
+            # Richardson: error of the two-half-step solution is ~|diff| / (2^2 - 1)
+            err = float(np.max(np.abs(T_two - T_full))) / 3.0
+
+            # Step-size factor for a 2nd-order method, with safety margin and limits
+            if err > 0:
+                factor = min(2.0, max(0.2, 0.9 * (cfg.error_tol / err) ** (1.0 / 3.0)))
+            else:
+                factor = 2.0
+
+            if err <= cfg.error_tol or dt <= cfg.dt_min:
+                dt_next = min(cfg.dt_max, max(cfg.dt_min, dt * factor))
+                return T_two, dt, dt_next, n_rejected
+
+            n_rejected += 1
+            dt = max(cfg.dt_min, dt * factor)
+
+    def _limit_dt_for_end_condition(
+        self,
+        T: np.ndarray,
+        center_rate: float,
+        dt: float,
+        phase_config: PhaseConfig,
+        remaining_time: float,
+    ) -> float:
+        """Cap the adaptive step so end conditions are not overshot.
+
+        The center temperature may cover at most half the remaining distance
+        to its end threshold per step, rate checks keep their 60 s cadence,
+        and the last step lands on the phase duration.
+        """
+        cfg = self.config
+        dt = min(dt, cfg.dt_max)
+
+        threshold = None
+        if phase_config.end_condition == "center_offset":
+            threshold = phase_config.target_temperature - phase_config.center_offset
+        elif phase_config.end_condition in ("equilibrium", "temperature"):
+            threshold = phase_config.end_temperature
+        elif phase_config.end_condition == "rate_threshold":
+            dt = min(dt, 60.0)
+
+        if threshold is not None and center_rate != 0.0:
+            distance = threshold - T[0]
+            # Only limit when the center is moving towards the threshold
+            if distance * center_rate > 0:
+                dt = min(dt, max(cfg.dt_min, 0.5 * distance / center_rate))
+
+        return max(min(dt, remaining_time), min(cfg.dt_min, remaining_time))
+
     def _time_step(self, T: np.ndarray, r: np.ndarray, dr: float, dt: float) -> np.ndarray:
-        """Advance solution by one time step using Crank-Nicolson."""
-        n = len(T)
+        """Advance solution by one time step using Crank-Nicolson.
+
+        The tridiagonal system is assembled in LAPACK banded form into
+        preallocated buffers and solved with ``solve_banded`` on every
+        nonlinear iteration.
+        """
         theta = self.config.theta
+        self._ensure_buffers(len(T))
 
-        T_new = T.copy()
+        T_new = T
 
         for iteration in range(self.config.max_iterations):
-            T_old_iter = T_new.copy()
+            T_old_iter = T_new
 
             # Average temperature for property evaluation
             T_avg = 0.5 * (T + T_new)
 
             # Get properties at each node
-            k = np.array([self._get_properties_at_temp(Ti)[0] for Ti in T_avg])
-            cp = np.array([self._get_properties_at_temp(Ti)[1] for Ti in T_avg])
+            k, cp = self._get_properties(T_avg)
             rho = self._rho
 
             # Thermal diffusivity
@@ -749,12 +921,12 @@ class HeatSolver:
 
             # Build system
             if self._is_cylindrical:
-                A, b = self._build_cylindrical_system(T, T_new, r, dr, dt, k, alpha, theta)
+                ab, b = self._build_cylindrical_system(T, T_new, r, dr, dt, k, alpha, theta)
             else:
-                A, b = self._build_cartesian_system(T, T_new, dr, dt, k, alpha, theta)
+                ab, b = self._build_cartesian_system(T, T_new, dr, dt, k, alpha, theta)
 
-            # Solve linear system
-            T_new = spsolve(A, b)
+            # Solve linear system (ab is rebuilt every iteration, so LAPACK may overwrite it)
+            T_new = solve_banded((1, 1), ab, b, overwrite_ab=True, check_finite=False)
 
             # Check convergence
             if np.max(np.abs(T_new - T_old_iter)) < self.config.convergence_tol:
@@ -762,6 +934,12 @@ class HeatSolver:
 
         return T_new
 
+    def _ensure_buffers(self, n: int) -> None:
+        """Allocate the banded matrix and RHS work buffers for n nodes."""
+        if self._ab is None or self._ab.shape[1] != n:
+            self._ab = np.zeros((3, n))
+            self._rhs = np.zeros(n)
+
     def _build_cylindrical_system(
         self,
         T: np.ndarray,
@@ -773,35 +951,29 @@ class HeatSolver:
         alpha: np.ndarray,
         theta: float,
     ) -> tuple:
-        """Build linear system for cylindrical coordinates."""
+        """Build linear system for cylindrical coordinates.
+
+        Returns (ab, rhs) with ab in ``solve_banded((1, 1), ...)`` layout:
+        ab[0] is the superdiagonal, ab[1] the diagonal, ab[2] the subdiagonal.
+        """
         n = len(T)
+        self._ensure_buffers(n)
+        ab = self._ab
+        rhs = self._rhs
 
         # Fourier numbers
         Fo = alpha * dt / dr**2
 
-        # Coefficient arrays
-        lower = np.zeros(n)
-        main = np.zeros(n)
-        upper = np.zeros(n)
-        rhs = np.zeros(n)
-
         # Interior nodes
-        for i in range(1, n - 1):
-            r_i = r[i]
-            Fo_i = Fo[i]
+        r_i = r[1:-1]
+        Fo_i = Fo[1:-1]
+        a_w = Fo_i * (r_i - dr / 2) / r_i
+        a_e = Fo_i * (r_i + dr / 2) / r_i
 
-            r_plus = r_i + dr / 2
-            r_minus = r_i - dr / 2
-
-            a_w = Fo_i * r_minus / r_i
-            a_e = Fo_i * r_plus / r_i
-            a_p = 1 + theta * (a_w + a_e)
-
-            lower[i] = -theta * a_w
-            main[i] = a_p
-            upper[i] = -theta * a_e
-
-            rhs[i] = T[i] + (1 - theta) * (a_w * (T[i - 1] - T[i]) + a_e * (T[i + 1] - T[i]))
+        ab[1, 1:-1] = 1 + theta * (a_w + a_e)
+        ab[2, :-2] = -theta * a_w
+        ab[0, 2:] = -theta * a_e
+        rhs[1:-1] = T[1:-1] + (1 - theta) * (a_w * (T[:-2] - T[1:-1]) + a_e * (T[2:] - T[1:-1]))
 
         # Inner boundary (r=0 or inner radius)
         if self._has_inner_bc:
@@ -814,8 +986,8 @@ class HeatSolver:
 
             a_e = Fo_0 * r_plus / r_0
 
-            main[0] = 1 + theta * (a_e + 2 * Fo_0 * Bi)
-            upper[0] = -theta * a_e
+            ab[1, 0] = 1 + theta * (a_e + 2 * Fo_0 * Bi)
+            ab[0, 1] = -theta * a_e
             rhs[0] = (
                 T[0]
                 + (1 - theta)
@@ -825,8 +997,8 @@ class HeatSolver:
         else:
             # Symmetry at r=0: use L'Hopital's rule
             Fo_0 = Fo[0]
-            main[0] = 1 + 4 * theta * Fo_0
-            upper[0] = -4 * theta * Fo_0
+            ab[1, 0] = 1 + 4 * theta * Fo_0
+            ab[0, 1] = -4 * theta * Fo_0
             rhs[0] = T[0] + 4 * (1 - theta) * Fo_0 * (T[1] - T[0])
 
         # Outer boundary: convection
@@ -839,8 +1011,8 @@ class HeatSolver:
 
         a_w = Fo_n * r_minus / r_n
 
-        main[-1] = 1 + theta * (a_w + 2 * Fo_n * Bi)
-        lower[-1] = -theta * a_w
+        ab[1, -1] = 1 + theta * (a_w + 2 * Fo_n * Bi)
+        ab[2, -2] = -theta * a_w
         rhs[-1] = (
             T[-1]
             + (1 - theta)
@@ -848,10 +1020,7 @@ class HeatSolver:
             + 2 * theta * Fo_n * Bi * self.outer_bc.ambient_temp
         )
 
-        # Build sparse matrix
-        A = diags([lower[1:], main, upper[:-1]], [-1, 0, 1], format="csr")
-
-        return A, rhs
+        return ab, rhs
 
     def _build_cartesian_system(
         self,
@@ -863,29 +1032,28 @@ class HeatSolver:
         alpha: np.ndarray,
         theta: float,
     ) -> tuple:
-        """Build linear system for Cartesian coordinates (plate)."""
+        """Build linear system for Cartesian coordinates (plate).
+
+        Returns (ab, rhs) in the same banded layout as the cylindrical system.
+        """
         n = len(T)
-        Fo = alpha * dt / dx**2
+        self._ensure_buffers(n)
+        ab = self._ab
+        rhs = self._rhs
 
-        lower = np.zeros(n)
-        main = np.zeros(n)
-        upper = np.zeros(n)
-        rhs = np.zeros(n)
+        Fo = alpha * dt / dx**2
 
         # Interior nodes
-        for i in range(1, n - 1):
-            Fo_i = Fo[i]
-
-            main[i] = 1 + 2 * theta * Fo_i
-            lower[i] = -theta * Fo_i
-            upper[i] = -theta * Fo_i
-
-            rhs[i] = T[i] + (1 - theta) * Fo_i * (T[i - 1] - 2 * T[i] + T[i + 1])
+        Fo_i = Fo[1:-1]
+        ab[1, 1:-1] = 1 + 2 * theta * Fo_i
+        ab[2, :-2] = -theta * Fo_i
+        ab[0, 2:] = -theta * Fo_i
+        rhs[1:-1] = T[1:-1] + (1 - theta) * Fo_i * (T[:-2] - 2 * T[1:-1] + T[2:])
 
         # Center (x=0): symmetry
         Fo_0 = Fo[0]
-        main[0] = 1 + 2 * theta * Fo_0
-        upper[0] = -2 * theta * Fo_0
+        ab[1, 0] = 1 + 2 * theta * Fo_0
+        ab[0, 1] = -2 * theta * Fo_0
         rhs[0] = T[0] + 2 * (1 - theta) * Fo_0 * (T[1] - T[0])
 
         # Surface: convection
@@ -893,8 +1061,8 @@ class HeatSolver:
         Bi = h_eff * dx / k[-1]
         Fo_n = Fo[-1]
 
-        main[-1] = 1 + theta * (2 * Fo_n + 2 * Fo_n * Bi)
-        lower[-1] = -2 * theta * Fo_n
+        ab[1, -1] = 1 + theta * (2 * Fo_n + 2 * Fo_n * Bi)
+        ab[2, -2] = -2 * theta * Fo_n
         rhs[-1] = (
             T[-1]
             + (1 - theta)
@@ -902,9 +1070,7 @@ class HeatSolver:
             + 2 * theta * Fo_n * Bi * self.outer_bc.ambient_temp
         )
 
-        A = diags([lower[1:], main, upper[:-1]], [-1, 0, 1], format="csr")
-
-        return A, rhs
+        return ab, rhs
 
     def _calculate_t8_5(self, times: np.ndarray, temps: np.ndarray) -> float | None:
         """Calculate cooling time from 800°C to 500°C."""
@@ -1030,9 +1196,6 @@ class MultiPhaseHeatSolver:
         # Initialize temperature field
         T = np.full(len(mesh), initial_temperature)
 
-        # Storage for combined results
-        all_times = []
-        all_temps = []
         phase_results = []
 
         current_time = 0.0
@@ -1063,6 +1226,15 @@ class MultiPhaseHeatSolver:
             T = result.temperature[-1, :]
             current_time = result.end_time
 
+        return self._combine_phase_results(mesh, phase_results)
+
+    def _combine_phase_results(
+        self, mesh: np.ndarray, phase_results: list[PhaseResult]
+    ) -> SolverResult:
+        """Concatenate phase results into one SolverResult."""
+        all_times = []
+        all_temps = []
+        for result in phase_results:
             # Append results (skip first point to avoid duplicates)
             if len(all_times) == 0:
                 all_times.extend(result.absolute_time.tolist())
@@ -1102,8 +1274,37 @@ class MultiPhaseHeatSolver:
             t8_5=t8_5,
             cooling_rates=cooling_rates,
             phase_results=phase_results,
+            solver_info=self._summarize_steps(phase_results),
         )
 
+    def _summarize_steps(self, phase_results: list[PhaseResult]) -> dict:
+        """Sum per-phase step statistics and compare against fixed-dt stepping.
+
+        The fixed-step wall time is estimated from the measured cost per
+        time-step solve (an adaptive step costs three solves).
+        """
+        infos = [pr.solver_info for pr in phase_results if pr.solver_info]
+        n_steps = sum(info["n_steps"] for info in infos)
+        n_rejected = sum(info["n_rejected"] for info in infos)
+        fixed_steps = sum(info["fixed_steps"] for info in infos)
+        wall_time = sum(info["wall_time_s"] for info in infos)
+
+        solves_per_step = 3 if self.config.adaptive else 1
+        n_solves = (n_steps + n_rejected) * solves_per_step
+        fixed_wall_time = wall_time / n_solves * fixed_steps if n_solves else wall_time
+
+        return {
+            "adaptive": self.config.adaptive,
+            "n_steps": n_steps,
+            "n_rejected": n_rejected,
+            "fixed_steps": fixed_steps,
+            "step_reduction": fixed_steps / n_steps if n_steps else 1.0,
+            "wall_time_s": round(wall_time, 3),
+            "estimated_fixed_wall_time_s": round(fixed_wall_time, 3),
+            "wall_time_reduction": fixed_wall_time / wall_time if wall_time > 0 else 1.0,
+            "phases": {pr.phase_name: pr.solver_info for pr in phase_results},
+        }
+
     def _calculate_cooling_rates(self, times: np.ndarray, temps: np.ndarray) -> np.ndarray:
         """Calculate cooling rate (dT/dt) at each time point.
 
@@ -1130,3 +1331,401 @@ class MultiPhaseHeatSolver:
         dt = np.where(dt == 0, 1e-6, dt)
 
         return dT / dt
+
+
+@dataclass
+class _VariantProgress:
+    """Per-variant bookkeeping while a BatchHeatSolver advances its phases."""
+
+    phases: list[PhaseConfig]
+    phase_index: int = -1
+    start_time: float = 0.0
+    monitor: _PhaseEndMonitor | None = None
+    outer_bc: BoundaryCondition | None = None
+    times: list = field(default_factory=list)
+    temps: list = field(default_factory=list)
+    phase_results: list[PhaseResult] = field(default_factory=list)
+
+    @property
+    def phase(self) -> PhaseConfig:
+        return self.phases[self.phase_index]
+
+
+def _bc_parameters(bc) -> tuple[float, float, float, float]:
+    """(htc, emissivity, ambient, radiation ambient) of a boundary condition."""
+    htc = getattr(bc, "htc", 0.0)
+    emissivity = getattr(bc, "emissivity", 0.0)
+    ambient = bc.ambient_temp
+    radiation_ambient = getattr(bc, "radiation_ambient", None) or ambient
+    return htc, emissivity, ambient, radiation_ambient
+
+
+def _linearized_htc(surface_temp, htc, emissivity, radiation_ambient) -> np.ndarray:
+    """Vectorized BoundaryCondition.linearized_htc over a batch of surfaces."""
+    T_surf_K = surface_temp + 273.15
+    T_amb_K = radiation_ambient + 273.15
+    h_rad = emissivity * STEFAN_BOLTZMANN * (T_surf_K**2 + T_amb_K**2) * (T_surf_K + T_amb_K)
+    return htc + h_rad
+
+
+class BatchHeatSolver:
+    """Multi-phase solver that advances many parameter variants at once.
+
+    Each variant is an ordinary MultiPhaseHeatSolver with its own geometry
+    and phase sequence (e.g. a different quench HTC, quench temperature,
+    part size or hold time). The batch holds all fields as one
+    (N, n_nodes) array and steps them together with a fixed SolverConfig.dt;
+    every nonlinear iteration evaluates properties, assembles and solves one
+    block-diagonal banded system for the whole batch. Variants drop out of
+    the batch as their last phase ends.
+
+    Variants must share the coordinate system (all cylindrical, all ring or
+    all plate), the solver configuration and the material. Adaptive time
+    stepping is not used in batches.
+    """
+
+    def __init__(self, geometries: list[GeometryBase], config: SolverConfig | None = None):
+        """Initialize batch solver.
+
+        Parameters
+        ----------
+        geometries : list of GeometryBase
+            One geometry per variant
+        config : SolverConfig, optional
+            Solver configuration shared by all variants
+        """
+        if not geometries:
+            raise ValueError("BatchHeatSolver needs at least one geometry")
+
+        self.config = config or SolverConfig()
+        self.variants = [MultiPhaseHeatSolver(g, config=self.config) for g in geometries]
+
+        first = self.variants[0].solver
+        self._is_cylindrical = first._is_cylindrical
+        self._has_inner_bc = first._has_inner_bc
+        for variant in self.variants[1:]:
+            if (variant.solver._is_cylindrical, variant.solver._has_inner_bc) != (
+                self._is_cylindrical,
+                self._has_inner_bc,
+            ):
+                raise ValueError("Batched variants must share the same coordinate system")
+
+        self._k_func: CompiledProperty = CompiledProperty.constant(DEFAULT_CONDUCTIVITY)
+        self._cp_func: CompiledProperty = CompiledProperty.constant(DEFAULT_SPECIFIC_HEAT)
+        self._rho: float = 7850.0
+
+        # Per-variant outer BC parameters (htc, emissivity, ambient, radiation ambient)
+        self._bc = np.zeros((4, len(self.variants)))
+
+        # Per-variant phase clock, step count and duration, set up by solve()
+        self._phase_time: np.ndarray | None = None
+        self._phase_steps: np.ndarray | None = None
+        self._phase_duration: np.ndarray | None = None
+
+        # Banded-system work buffers, (re)allocated when the active batch changes size
+        self._ab: np.ndarray | None = None
+        self._rhs: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.variants)
+
+    def set_material(self, k_property, cp_property, density: float, emissivity: float = 0.85):
+        """Set material properties shared by all variants."""
+        if k_property:
+            self._k_func = compile_property(k_property, DEFAULT_CONDUCTIVITY)
+        if cp_property:
+            self._cp_func = compile_property(cp_property, DEFAULT_SPECIFIC_HEAT)
+        self._rho = density
+        for variant in self.variants:
+            variant.solver._k_func = self._k_func
+            variant.solver._cp_func = self._cp_func
+            variant.solver._rho = density
+            variant.solver._emissivity = emissivity
+
+    def configure_from_ht_configs(self, ht_configs: list[dict]):
+        """Configure each variant's phases from its heat treatment config.
+
+        Parameters
+        ----------
+        ht_configs : list of dict
+            One heat treatment configuration per variant
+        """
+        if len(ht_configs) != len(self.variants):
+            raise ValueError(
+                f"Expected {len(self.variants)} heat treatment configs, got {len(ht_configs)}"
+            )
+        for variant, ht_config in zip(self.variants, ht_configs, strict=True):
+            variant.configure_from_ht_config(ht_config)
+
+    def solve(self, initial_temperatures: float | list[float] = 25.0) -> list[SolverResult]:
+        """Run all variants to the end of their phase sequences.
+
+        Parameters
+        ----------
+        initial_temperatures : float or list of float
+            Initial uniform temperature, one value for all or one per variant
+
+        Returns
+        -------
+        list of SolverResult
+            Results in variant order, each equivalent to
+            MultiPhaseHeatSolver.solve for that variant
+        """
+        cfg = self.config
+        n_var = len(self.variants)
+        wall_start = time_module.time()
+
+        meshes = np.array([v.geometry.create_mesh(cfg.n_nodes) for v in self.variants])
+        dr = (meshes[:, 1] - meshes[:, 0])[:, None]
+        T0 = np.broadcast_to(np.asarray(initial_temperatures, dtype=float), (n_var,))
+        T = np.repeat(T0[:, None], meshes.shape[1], axis=1)
+
+        # Inner BCs are fixed for the run (symmetry, or the ring's inner surface)
+        inner_bc = np.array([_bc_parameters(v.solver.inner_bc) for v in self.variants]).T
+
+        progress = [
+            _VariantProgress(phases=[p for p in v.phases if p.enabled]) for v in self.variants
+        ]
+        phase_time = self._phase_time = np.zeros(n_var)
+        phase_steps = self._phase_steps = np.zeros(n_var, dtype=int)
+        phase_duration = self._phase_duration = np.full(n_var, np.inf)
+        # Variants whose current phase only ends on duration can skip the Python-side checks
+        needs_check = np.ones(n_var, dtype=bool)
+        active = np.ones(n_var, dtype=bool)
+
+        for i in range(n_var):
+            active[i] = self._start_phase(i, progress[i], T[i], 0.0)
+            needs_check[i] = active[i] and self._needs_check(progress[i])
+
+        while True:
+            # Phase transitions (the same checks, in the same order, as solve_phase)
+            check = np.flatnonzero(active & (needs_check | (phase_time >= phase_duration)))
+            for i in check:
+                state = progress[i]
+                while True:
+                    if phase_time[i] < state.phase.duration:
+                        if isinstance(state.outer_bc, RampingBoundaryCondition):
+                            state.outer_bc.set_time(phase_time[i])
+                            self._bc[:, i] = _bc_parameters(state.outer_bc)
+                        if not state.monitor.reached(T[i, 0], T[i, -1], phase_time[i]):
+                            break
+                    end_time = self._finish_phase(i, state, T[i], phase_time[i], phase_steps[i])
+                    if not self._start_phase(i, state, T[i], end_time):
+                        active[i] = False
+                        break
+                needs_check[i] = active[i] and self._needs_check(state)
+
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+
+            T[idx] = self._time_step(T[idx], meshes[idx], dr[idx], cfg.dt, idx, inner_bc[:, idx])
+            phase_time[idx] += cfg.dt
+            phase_steps[idx] += 1
+
+            # Store at interval
+            for i in idx[phase_steps[idx] % cfg.output_interval == 0]:
+                progress[i].times.append(phase_time[i])
+                progress[i].temps.append(T[i].copy())
+
+        # Share the batch wall time across phases by step count
+        wall_time = time_module.time() - wall_start
+        total_steps = sum(
+            pr.solver_info["n_steps"] for state in progress for pr in state.phase_results
+        )
+        results = []
+        for variant, state, mesh in zip(self.variants, progress, meshes, strict=True):
+            for pr in state.phase_results:
+                share = pr.solver_info["n_steps"] / total_steps if total_steps else 1.0 / n_var
+                pr.solver_info["wall_time_s"] = wall_time * share
+            result = variant._combine_phase_results(mesh, state.phase_results)
+            result.solver_info["batch_size"] = n_var
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def _needs_check(state: _VariantProgress) -> bool:
+        """Whether the current phase ends on anything other than its duration."""
+        return state.phase.end_condition != "time" or isinstance(
+            state.outer_bc, RampingBoundaryCondition
+        )
+
+    def _start_phase(
+        self,
+        i: int,
+        state: _VariantProgress,
+        T: np.ndarray,
+        start_time: float,
+    ) -> bool:
+        """Move variant i to its next phase; False when it has none left."""
+        state.phase_index += 1
+        if state.phase_index >= len(state.phases):
+            self._phase_duration[i] = np.inf
+            return False
+
+        phase = state.phase
+        if phase.boundary_condition:
+            state.outer_bc = phase.boundary_condition
+        self._bc[:, i] = _bc_parameters(state.outer_bc)
+
+        state.start_time = start_time
+        state.monitor = _PhaseEndMonitor(phase, T)
+        state.times = [0.0]
+        state.temps = [T.copy()]
+        self._phase_time[i] = 0.0
+        self._phase_steps[i] = 0
+        self._phase_duration[i] = phase.duration
+        return True
+
+    def _finish_phase(
+        self, i: int, state: _VariantProgress, T: np.ndarray, t: float, n_steps: int
+    ) -> float:
+        """Close variant i's current phase into a PhaseResult; returns its end time."""
+        cfg = self.config
+
+        # Store final state
+        if state.times[-1] != t:
+            state.times.append(t)
+            state.temps.append(T.copy())
+
+        times = np.array(state.times)
+        temp_history = np.array(state.temps)
+        solver_info = {
+            "adaptive": False,
+            "n_steps": int(n_steps),
+            "n_rejected": 0,
+            "fixed_steps": int(np.ceil(t / cfg.dt - 1e-9)),
+            "dt_min_used": cfg.dt,
+            "dt_max_used": cfg.dt,
+            "wall_time_s": 0.0,
+        }
+        state.phase_results.append(
+            PhaseResult(
+                phase_name=state.phase.name,
+                time=times,
+                absolute_time=times + state.start_time,
+                temperature=temp_history,
+                center_temp=temp_history[:, 0],
+                surface_temp=temp_history[:, -1],
+                t8_5=self.variants[i].solver._calculate_t8_5(times, temp_history[:, 0]),
+                start_time=state.start_time,
+                end_time=state.start_time + times[-1],
+                solver_info=solver_info,
+            )
+        )
+        return state.start_time + times[-1]
+
+    def _ensure_buffers(self, m: int, n: int) -> None:
+        """Allocate the stacked banded matrix and RHS work buffers."""
+        if self._ab is None or self._ab.shape[1:] != (m, n):
+            self._ab = np.zeros((3, m, n))
+            self._rhs = np.zeros((m, n))
+
+    def _time_step(
+        self,
+        T: np.ndarray,
+        r: np.ndarray,
+        dr: np.ndarray,
+        dt: float,
+        idx: np.ndarray,
+        inner_bc: np.ndarray,
+    ) -> np.ndarray:
+        """Advance the active variants by one Crank-Nicolson step.
+
+        T and r are (m, n_nodes), dr is (m, 1). The m tridiagonal systems are
+        written side by side into one (3, m * n_nodes) banded matrix with zero
+        coupling between blocks and solved with a single ``solve_banded``.
+        """
+        theta = self.config.theta
+        m, n = T.shape
+        self._ensure_buffers(m, n)
+        ab = self._ab
+        rhs = self._rhs
+        htc, emissivity, ambient, radiation_ambient = self._bc[:, idx]
+        in_htc, in_emissivity, in_ambient, in_radiation_ambient = inner_bc
+
+        T_new = T
+
+        for iteration in range(self.config.max_iterations):
+            T_old_iter = T_new
+
+            # Properties at the average temperature, over the whole batch
+            T_avg = 0.5 * (T + T_new)
+            k = self._k_func(T_avg)
+            alpha = k / (self._rho * self._cp_func(T_avg))
+
+            # Fourier numbers
+            Fo = alpha * dt / dr**2
+
+            # Interior nodes
+            Fo_i = Fo[:, 1:-1]
+            if self._is_cylindrical:
+                r_i = r[:, 1:-1]
+                a_w = Fo_i * (r_i - dr / 2) / r_i
+                a_e = Fo_i * (r_i + dr / 2) / r_i
+            else:
+                a_w = a_e = Fo_i
+
+            ab[1, :, 1:-1] = 1 + theta * (a_w + a_e)
+            ab[2, :, :-2] = -theta * a_w
+            ab[0, :, 2:] = -theta * a_e
+            rhs[:, 1:-1] = T[:, 1:-1] + (1 - theta) * (
+                a_w * (T[:, :-2] - T[:, 1:-1]) + a_e * (T[:, 2:] - T[:, 1:-1])
+            )
+
+            # Inner boundary
+            Fo_0 = Fo[:, 0]
+            if self._has_inner_bc:
+                # Ring: convection at inner surface
+                h_eff = _linearized_htc(T_new[:, 0], in_htc, in_emissivity, in_radiation_ambient)
+                Bi = h_eff * dr[:, 0] / k[:, 0]
+                a_e = Fo_0 * (r[:, 0] + dr[:, 0] / 2) / r[:, 0]
+                ab[1, :, 0] = 1 + theta * (a_e + 2 * Fo_0 * Bi)
+                ab[0, :, 1] = -theta * a_e
+                rhs[:, 0] = (
+                    T[:, 0]
+                    + (1 - theta)
+                    * (a_e * (T[:, 1] - T[:, 0]) + 2 * Fo_0 * Bi * (in_ambient - T[:, 0]))
+                    + 2 * theta * Fo_0 * Bi * in_ambient
+                )
+            else:
+                # Symmetry: L'Hopital's rule at r=0, mirror node at x=0
+                c = 4 if self._is_cylindrical else 2
+                ab[1, :, 0] = 1 + c * theta * Fo_0
+                ab[0, :, 1] = -c * theta * Fo_0
+                rhs[:, 0] = T[:, 0] + c * (1 - theta) * Fo_0 * (T[:, 1] - T[:, 0])
+
+            # Outer boundary: convection
+            Fo_n = Fo[:, -1]
+            h_eff = _linearized_htc(T_new[:, -1], htc, emissivity, radiation_ambient)
+            Bi = h_eff * dr[:, 0] / k[:, -1]
+            if self._is_cylindrical:
+                a_w = Fo_n * (r[:, -1] - dr[:, 0] / 2) / r[:, -1]
+            else:
+                a_w = 2 * Fo_n
+            ab[1, :, -1] = 1 + theta * (a_w + 2 * Fo_n * Bi)
+            ab[2, :, -2] = -theta * a_w
+            rhs[:, -1] = (
+                T[:, -1]
+                + (1 - theta) * (a_w * (T[:, -2] - T[:, -1]) + 2 * Fo_n * Bi * (ambient - T[:, -1]))
+                + 2 * theta * Fo_n * Bi * ambient
+            )
+
+            # Decouple neighbouring variants (LAPACK may have overwritten these)
+            ab[0, :, 0] = 0.0
+            ab[2, :, -1] = 0.0
+
+            T_new = solve_banded(
+                (1, 1),
+                ab.reshape(3, m * n),
+                rhs.reshape(m * n),
+                overwrite_ab=True,
+                check_finite=False,
+            ).reshape(m, n)
+
+            # Check convergence over the whole batch
+            if np.max(np.abs(T_new - T_old_iter)) < self.config.convergence_tol:
+                break
+
+        return T_new
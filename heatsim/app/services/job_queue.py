@@ -1,21 +1,78 @@
-"""Simple DB-backed simulation job queue.
-
-A single daemon thread polls the database for queued jobs and executes
-them one at a time.  No Celery, no Redis — just a thread + DB polling.
+"""DB-backed simulation job queue with a pool of worker processes.
+
+A supervisor thread in the web process starts ``JOB_WORKERS`` worker
+processes (spawned, each with its own app and DB connections), restarts
+any that die and recovers jobs orphaned by them. No Celery, no Redis —
+workers poll the database and claim jobs atomically:
+
+- Claiming is a conditional ``UPDATE ... WHERE status = 'queued'`` in the
+  same transaction as inserting a JobLease, so two workers never run the
+  same job.
+- Jobs are sorted into priority lanes: quick 1D heat treatments and JMAK
+  calibrations (fast lane) are claimed before COMSOL and Goldak jobs (slow
+  lane), and ``JOB_FAST_WORKERS`` workers serve only the fast lane so a
+  long 3D job can never block every short one.
+- Job kinds listed in ``JOB_KIND_LIMITS`` run at most that many at a time;
+  a lease takes one of the kind's numbered slots under a unique constraint.
+- Workers heartbeat their leases. A lease not renewed within
+  ``JOB_LEASE_TIMEOUT`` belongs to a dead worker: its simulation is
+  requeued (up to MAX_JOB_ATTEMPTS runs) and other jobs are failed.
+
+Idle workers do not spin on the database: submit routes call
+``notify_job_submitted()``, which wakes them through a shared condition
+variable. Polling every ``JOB_POLL_INTERVAL`` seconds remains only as a
+fallback for jobs queued from another web process. Each lease records how
+long its job waited between submission and start (``get_queue_metrics``).
+
+Batch runs and parameter sweeps queue their members as simulation jobs;
+members that only repeat another member's configuration wait for it
+instead of being claimed (``app.services.batch_runner``).
+
+Result plots are not drawn by the jobs themselves. Before going to sleep,
+an idle worker pre-renders up to ``PLOT_PRERENDER_BATCH`` pending plots
+(the lowest-priority lane) and then looks for jobs again, so a queued
+simulation never waits behind more than one batch.
+
+With ``JOB_WORKERS = 0`` a single worker thread runs inside the web process.
 """
 
 import logging
+import multiprocessing
+import os
+import socket
 import threading
+from datetime import datetime, timedelta
 
-from flask import Flask
+import numpy as np
+import sqlalchemy as sa
+from flask import Flask, current_app
+from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
+from app.models.job_queue import (
+    KIND_CALIBRATION,
+    KIND_COMSOL,
+    KIND_GOLDAK,
+    KIND_HEAT_TREATMENT,
+    KIND_LANES,
+    LANE_FAST,
+    LANES,
+    LEASE_ORPHANED,
+    LEASE_RELEASED,
+    WORKER_BUSY,
+    WORKER_IDLE,
+    WORKER_LOST,
+    WORKER_STOPPED,
+    JobLease,
+    JobWorker,
+)
 from app.models.simulation import (
     STATUS_FAILED as SIM_FAILED,
 )
 from app.models.simulation import (
     Simulation,
 )
+from app.models.ttt_parameters import CALIBRATION_FAILED, CalibrationJob
 from app.models.weld_project import (
     STATUS_FAILED as WELD_FAILED,
 )
@@ -25,95 +82,526 @@ from app.models.weld_project import (
 
 logger = logging.getLogger(__name__)
 
-_worker_thread: threading.Thread | None = None
+_supervisor_thread: threading.Thread | None = None
 _shutdown_event = threading.Event()
+_process_shutdown = None  # multiprocessing.Event shared with worker processes
+_wakeup: "_Wakeup | None" = None  # Shared with this process's workers
+
+# Fallback poll interval in seconds (submissions normally wake workers at once)
+POLL_INTERVAL = 30.0
+
+# Lease heartbeat / supervisor check interval and default lease timeout (s)
+HEARTBEAT_INTERVAL = 10.0
+LEASE_TIMEOUT = 60.0
 
-# Poll interval in seconds
-POLL_INTERVAL = 2.0
+# Total runs allowed for a job whose worker died mid-run
+MAX_JOB_ATTEMPTS = 2
+
+# Job types that can safely start over after their worker died (weld runners
+# persist per-string progress and their mode flag, so they are failed instead)
+RESTARTABLE_JOB_TYPES = {"simulation"}
+
+_JOB_MODELS = {"simulation": Simulation, "weld": WeldProject, "calibration": CalibrationJob}
+_FAILED_STATUS = {
+    "simulation": SIM_FAILED,
+    "weld": WELD_FAILED,
+    "calibration": CALIBRATION_FAILED,
+}
+
+
+class _Wakeup:
+    """Submission counter plus condition variable shared with worker processes.
+
+    A worker reads ``seq`` before looking for work and only sleeps while it
+    is unchanged, so a job submitted between its claim query and its wait
+    is never missed.
+    """
+
+    def __init__(self, ctx):
+        self.condition = ctx.Condition()
+        self.counter = ctx.Value("q", 0, lock=False)
+
+    @property
+    def seq(self) -> int:
+        return self.counter.value
+
+    def notify(self) -> None:
+        with self.condition:
+            self.counter.value += 1
+            self.condition.notify_all()
+
+    def wait(self, seen: int, timeout: float, shutdown) -> None:
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.counter.value != seen or shutdown.is_set(), timeout=timeout
+            )
 
 
 def start_worker(app: Flask) -> None:
-    """Start the background worker thread.
+    """Start the job queue supervisor and its workers.
 
     Should be called once after the app and DB are initialized.
-    Skipped automatically in testing mode.
+    Skipped automatically in testing mode and inside worker processes.
     """
-    global _worker_thread
+    global _supervisor_thread, _wakeup
 
-    if app.config.get("TESTING"):
+    if app.config.get("TESTING") or multiprocessing.parent_process() is not None:
         return
 
-    if _worker_thread is not None and _worker_thread.is_alive():
+    if _supervisor_thread is not None and _supervisor_thread.is_alive():
         return
 
     _shutdown_event.clear()
-    _worker_thread = threading.Thread(
-        target=_worker_loop,
+    _wakeup = _Wakeup(multiprocessing.get_context("spawn"))
+    _supervisor_thread = threading.Thread(
+        target=_supervisor_loop,
         args=(app,),
-        name="job-queue-worker",
+        name="job-queue-supervisor",
         daemon=True,
     )
-    _worker_thread.start()
-    app.logger.info("Job queue worker thread started")
+    _supervisor_thread.start()
+    app.logger.info("Job queue supervisor thread started")
 
 
 def stop_worker() -> None:
-    """Signal the worker thread to stop."""
+    """Signal the supervisor and all workers to stop after their current job."""
     _shutdown_event.set()
+    if _process_shutdown is not None:
+        _process_shutdown.set()
+    if _wakeup is not None:
+        _wakeup.notify()
+
 
+def notify_job_submitted() -> None:
+    """Wake idle workers after a job was queued (call after the commit).
 
-def _worker_loop(app: Flask) -> None:
-    """Main worker loop — polls DB for queued jobs every POLL_INTERVAL seconds."""
-    # Ensure materials tables exist before polling
+    A no-op where no workers share this process's wakeup (tests, or web
+    processes without a supervisor); those jobs are found by the fallback poll.
+    """
+    if _wakeup is not None:
+        _wakeup.notify()
+
+
+def worker_lanes(n_workers: int, fast_workers: int) -> list[tuple[str, ...]]:
+    """Lanes served by each worker of a pool.
+
+    The first ``fast_workers`` workers are reserved for the fast lane; at
+    least one worker always serves every lane so slow jobs still run.
+    """
+    n_fast = max(0, min(fast_workers, n_workers - 1))
+    return [(LANE_FAST,)] * n_fast + [LANES] * (n_workers - n_fast)
+
+
+def _supervisor_loop(app: Flask) -> None:
+    """Start, watch and restart worker processes; recover orphaned jobs."""
+    global _process_shutdown
+
+    # Ensure materials tables exist before workers poll
     with app.app_context():
         db.create_all()
-        logger.info("Worker thread: database tables verified")
+        logger.info("Job queue supervisor: database tables verified")
+
+    n_workers = app.config.get("JOB_WORKERS", 2)
+    host = socket.gethostname()
+    if n_workers <= 0:
+        _worker_loop(app, f"{host}-inline", LANES, _shutdown_event, _wakeup)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    _process_shutdown = ctx.Event()
+    config_name = app.config.get("CONFIG_NAME", "default")
+    specs = [
+        (f"{host}-w{i}", lanes)
+        for i, lanes in enumerate(worker_lanes(n_workers, app.config.get("JOB_FAST_WORKERS", 1)))
+    ]
+    processes: dict[str, multiprocessing.Process] = {}
 
     while not _shutdown_event.is_set():
+        for name, lanes in specs:
+            proc = processes.get(name)
+            if proc is not None and proc.is_alive():
+                continue
+            if proc is not None:
+                logger.warning("Worker %s exited (code %s), restarting", name, proc.exitcode)
+            proc = ctx.Process(
+                target=_worker_process_main,
+                args=(config_name, name, lanes, _process_shutdown, _wakeup),
+                name=f"job-worker-{name}",
+                daemon=True,
+            )
+            proc.start()
+            processes[name] = proc
+
         try:
             with app.app_context():
-                job = _claim_next_job()
-                if job:
-                    job_type, job_id = job
-                    _execute_job(job_type, job_id)
+                if recover_orphaned_jobs():
+                    notify_job_submitted()
         except Exception:
-            logger.exception("Unexpected error in worker loop")
+            logger.exception("Orphaned job recovery failed")
+
+        _shutdown_event.wait(timeout=HEARTBEAT_INTERVAL)
+
+    _process_shutdown.set()
+    for proc in processes.values():
+        proc.join(timeout=5.0)
+
 
-        _shutdown_event.wait(timeout=POLL_INTERVAL)
+def _worker_process_main(config_name: str, worker_name: str, lanes, shutdown, wakeup) -> None:
+    """Entry point of a spawned worker process."""
+    global _wakeup
 
+    from app import create_app
 
-def _claim_next_job() -> tuple[str, int] | None:
-    """Find and claim the oldest queued job.
+    # Jobs queued from inside this worker wake its siblings too
+    _wakeup = wakeup
+    app = create_app(config_name)
+    _worker_loop(app, worker_name, tuple(lanes), shutdown, wakeup)
 
-    Returns (job_type, job_id) or None if no queued jobs.
-    job_type is 'simulation' or 'weld'.
+
+def _worker_loop(
+    app: Flask,
+    worker_name: str,
+    lanes: tuple[str, ...],
+    shutdown,
+    wakeup: _Wakeup | None = None,
+) -> None:
+    """Claim and run jobs from the given lanes until shutdown is set.
+
+    Idle workers sleep until woken by a submission, or at most
+    ``JOB_POLL_INTERVAL`` seconds.
     """
-    # Find oldest queued simulation
-    sim = Simulation.query.filter_by(status="queued").order_by(Simulation.created_at.asc()).first()
+    poll_interval = app.config.get("JOB_POLL_INTERVAL", POLL_INTERVAL)
+    prerender_batch = app.config.get("PLOT_PRERENDER_BATCH", 0)
+    with app.app_context():
+        db.create_all()
+        _register_worker(worker_name, lanes)
+    logger.info("Worker %s started (lanes: %s)", worker_name, ",".join(lanes))
+
+    heartbeat_stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=_heartbeat_loop,
+        args=(app, worker_name, heartbeat_stop),
+        name=f"job-heartbeat-{worker_name}",
+        daemon=True,
+    )
+    heartbeat.start()
 
-    # Find oldest queued weld project
-    weld = (
-        WeldProject.query.filter_by(status="queued").order_by(WeldProject.created_at.asc()).first()
+    try:
+        while not shutdown.is_set():
+            seen = wakeup.seq if wakeup is not None else 0
+            ran_job = False
+            try:
+                with app.app_context():
+                    ran_job = _process_next_job(worker_name, lanes)
+            except Exception:
+                logger.exception("Unexpected error in worker loop")
+
+            # Go straight on to the next job; only idle workers wait
+            if ran_job:
+                continue
+            if prerender_batch and _prerender_plots(app, prerender_batch):
+                continue
+            if wakeup is not None:
+                wakeup.wait(seen, poll_interval, shutdown)
+            else:
+                shutdown.wait(timeout=poll_interval)
+    finally:
+        heartbeat_stop.set()
+        with app.app_context():
+            _set_worker_state(worker_name, WORKER_STOPPED)
+
+
+def _prerender_plots(app: Flask, batch: int) -> int:
+    """Render a batch of pending result plots; returns how many were rendered."""
+    try:
+        with app.app_context():
+            from app.services.plot_renderer import render_pending_plots
+
+            return render_pending_plots(batch)
+    except Exception:
+        logger.exception("Plot pre-rendering failed")
+        return 0
+
+
+def _heartbeat_loop(app: Flask, worker_name: str, stop: threading.Event) -> None:
+    """Renew the worker's heartbeat and its held leases."""
+    while not stop.wait(timeout=HEARTBEAT_INTERVAL):
+        try:
+            with app.app_context():
+                _heartbeat(worker_name)
+        except Exception:
+            logger.exception("Heartbeat failed for worker %s", worker_name)
+
+
+def _heartbeat(worker_name: str) -> None:
+    now = datetime.utcnow()
+    JobWorker.query.filter_by(name=worker_name).update({"heartbeat_at": now})
+    JobLease.query.filter(
+        JobLease.worker_name == worker_name, JobLease.released_at.is_(None)
+    ).update({"heartbeat_at": now})
+    db.session.commit()
+
+
+def _register_worker(worker_name: str, lanes: tuple[str, ...]) -> None:
+    """Create or reset the worker's status row."""
+    worker = JobWorker.query.filter_by(name=worker_name).first()
+    if worker is None:
+        worker = JobWorker(name=worker_name)
+        db.session.add(worker)
+    now = datetime.utcnow()
+    worker.pid = os.getpid()
+    worker.lanes = ",".join(lanes)
+    worker.state = WORKER_IDLE
+    worker.job_type = worker.job_id = worker.job_started_at = None
+    worker.started_at = worker.heartbeat_at = now
+    db.session.commit()
+
+
+def _set_worker_state(
+    worker_name: str, state: str, job_type: str | None = None, job_id: int | None = None
+) -> None:
+    try:
+        worker = JobWorker.query.filter_by(name=worker_name).first()
+        if worker is None:
+            return
+        if state == WORKER_IDLE and worker.state == WORKER_BUSY:
+            worker.jobs_completed = (worker.jobs_completed or 0) + 1
+        worker.state = state
+        worker.job_type = job_type
+        worker.job_id = job_id
+        worker.job_started_at = datetime.utcnow() if job_type else None
+        worker.heartbeat_at = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("Failed to update state of worker %s", worker_name)
+
+
+def _process_next_job(worker_name: str, lanes: tuple[str, ...] = LANES) -> bool:
+    """Claim and run one job. Returns False when nothing could be claimed."""
+    job = _claim_next_job(worker_name, lanes)
+    if job is None:
+        return False
+
+    job_type, job_id = job
+    _set_worker_state(worker_name, WORKER_BUSY, job_type, job_id)
+    try:
+        _execute_job(job_type, job_id)
+    finally:
+        db.session.rollback()
+        _release_lease(job_type, job_id, worker_name)
+        _set_worker_state(worker_name, WORKER_IDLE)
+    return True
+
+
+def job_kind(job_type: str, job) -> str:
+    """Resource kind of a job (drives lane and limits)."""
+    if job_type == "calibration":
+        return KIND_CALIBRATION
+    if job_type == "weld":
+        if (job.progress_message or "").startswith("goldak:"):
+            return KIND_GOLDAK
+        return KIND_COMSOL
+    if job.solver_dict.get("solver_type", "builtin") == "comsol":
+        return KIND_COMSOL
+    return KIND_HEAT_TREATMENT
+
+
+def _queued_jobs() -> list[tuple[str, int, str, str, object]]:
+    """Queued jobs in claim order: fast lane first, then FIFO within a lane.
+
+    Returns (job_type, job_id, name, kind, job) tuples.
+    """
+    entries = []
+    for job_type, model in _JOB_MODELS.items():
+        query = model.query.filter_by(status="queued")
+        if model is Simulation:
+            # Batch duplicates get the results of the member they repeat
+            query = query.filter(Simulation.duplicate_of_id.is_(None))
+        for job in query.all():
+            entries.append((job_type, job, job_kind(job_type, job)))
+
+    entries.sort(
+        key=lambda e: (
+            LANES.index(KIND_LANES[e[2]]),
+            e[1].queued_at or e[1].created_at or datetime.min,
+            e[1].id,
+        )
     )
+    return [(job_type, job.id, job.name, kind, job) for job_type, job, kind in entries]
 
-    if sim is None and weld is None:
-        return None
 
-    # Pick the one that was queued first
-    if sim and weld:
-        # Compare by created_at (queued_at is approximated by created_at for ordering)
-        # Both are queued — pick whichever was queued earlier
-        # We use started_at as None for queued items, so fallback to id ordering
-        if sim.id < weld.id:
-            job_type, job_id = "simulation", sim.id
-        else:
-            job_type, job_id = "weld", weld.id
-    elif sim:
-        job_type, job_id = "simulation", sim.id
-    else:
-        job_type, job_id = "weld", weld.id
+def _kind_limits() -> dict[str, int]:
+    try:
+        return dict(current_app.config.get("JOB_KIND_LIMITS") or {})
+    except RuntimeError:
+        return {}
+
+
+def _free_slot(kind: str, limit: int) -> int | None:
+    """Lowest free concurrency slot for a limited kind, or None if all taken."""
+    taken = {
+        slot
+        for (slot,) in db.session.query(JobLease.slot).filter(
+            JobLease.kind == kind, JobLease.released_at.is_(None)
+        )
+    }
+    for slot in range(limit):
+        if slot not in taken:
+            return slot
+    return None
+
+
+def _claim_next_job(
+    worker_name: str = "inline", lanes: tuple[str, ...] = LANES
+) -> tuple[str, int] | None:
+    """Atomically claim the next queued job from the given lanes.
+
+    Marks the job running and records a JobLease for the worker. Jobs whose
+    kind is at its concurrency limit are skipped.
+
+    Returns (job_type, job_id) or None if nothing could be claimed.
+    job_type is a key of _JOB_MODELS ('simulation', 'weld' or 'calibration').
+    """
+    limits = _kind_limits()
+    full_kinds = set()
+
+    for job_type, job_id, _, kind, job in _queued_jobs():
+        lane = KIND_LANES[kind]
+        if lane not in lanes or kind in full_kinds:
+            continue
+
+        slot = None
+        if kind in limits:
+            slot = _free_slot(kind, limits[kind])
+            if slot is None:
+                full_kinds.add(kind)
+                continue
+
+        now = datetime.utcnow()
+        wait_seconds = (now - job.queued_at).total_seconds() if job.queued_at else None
+        try:
+            db.session.add(
+                JobLease(
+                    job_type=job_type,
+                    job_id=job_id,
+                    kind=kind,
+                    lane=lane,
+                    slot=slot,
+                    worker_name=worker_name,
+                    claimed_at=now,
+                    wait_seconds=wait_seconds,
+                    heartbeat_at=now,
+                )
+            )
+            db.session.flush()
+        except IntegrityError:
+            # Another worker took this slot first
+            db.session.rollback()
+            continue
+
+        model = _JOB_MODELS[job_type]
+        claimed = db.session.execute(
+            sa.update(model)
+            .where(model.id == job_id, model.status == "queued")
+            .values(status="running", started_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if claimed != 1:
+            # Claimed by another worker or cancelled meanwhile
+            db.session.rollback()
+            continue
+
+        db.session.commit()
+        if wait_seconds is not None:
+            logger.info(
+                "Worker %s claimed %s #%d after %.2f s in queue",
+                worker_name,
+                job_type,
+                job_id,
+                wait_seconds,
+            )
+        return (job_type, job_id)
+
+    return None
+
+
+def _release_lease(job_type: str, job_id: int, worker_name: str) -> None:
+    """Release the worker's lease on a finished job."""
+    try:
+        JobLease.query.filter_by(
+            job_type=job_type, job_id=job_id, worker_name=worker_name, released_at=None
+        ).update({"released_at": datetime.utcnow(), "slot": None, "outcome": LEASE_RELEASED})
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("Failed to release lease on %s #%d", job_type, job_id)
+
 
-    return (job_type, job_id)
+def recover_orphaned_jobs(lease_timeout: float | None = None) -> int:
+    """Recover jobs whose worker stopped heartbeating.
+
+    Expired leases are released. Their simulations go back to the queue
+    until they have been orphaned MAX_JOB_ATTEMPTS times; other jobs are
+    marked failed. Workers with an expired heartbeat are marked lost.
+
+    Returns
+    -------
+    int
+        Number of jobs requeued or failed
+    """
+    if lease_timeout is None:
+        lease_timeout = current_app.config.get("JOB_LEASE_TIMEOUT", LEASE_TIMEOUT)
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=lease_timeout)
+
+    stale = JobLease.query.filter(
+        JobLease.released_at.is_(None), JobLease.heartbeat_at < cutoff
+    ).all()
+    recovered = 0
+    failed_simulations = []
+    for lease in stale:
+        lease.released_at = now
+        lease.slot = None
+        lease.outcome = LEASE_ORPHANED
+        db.session.flush()
+
+        job = db.session.get(_JOB_MODELS[lease.job_type], lease.job_id)
+        if job is None or job.status != "running":
+            continue
+
+        attempts = JobLease.query.filter_by(
+            job_type=lease.job_type, job_id=lease.job_id, outcome=LEASE_ORPHANED
+        ).count()
+        if lease.job_type in RESTARTABLE_JOB_TYPES and attempts < MAX_JOB_ATTEMPTS:
+            job.status = "queued"
+            job.queued_at = now
+            logger.warning(
+                "Requeued %s #%d orphaned by worker %s",
+                lease.job_type,
+                lease.job_id,
+                lease.worker_name,
+            )
+        else:
+            job.status = _FAILED_STATUS[lease.job_type]
+            job.error_message = f"Worker {lease.worker_name} stopped while running this job"
+            logger.warning(
+                "Failed %s #%d orphaned by worker %s",
+                lease.job_type,
+                lease.job_id,
+                lease.worker_name,
+            )
+            if lease.job_type == "simulation":
+                failed_simulations.append(lease.job_id)
+        recovered += 1
+
+    JobWorker.query.filter(
+        JobWorker.state.in_([WORKER_IDLE, WORKER_BUSY]), JobWorker.heartbeat_at < cutoff
+    ).update({"state": WORKER_LOST}, synchronize_session=False)
+    db.session.commit()
+    for simulation_id in failed_simulations:
+        _settle_duplicates(simulation_id)
+    return recovered
 
 
 def _execute_job(job_type: str, job_id: int) -> None:
@@ -129,89 +617,186 @@ def _execute_job(job_type: str, job_id: int) -> None:
             from app.services.weld_runner import run_weld_simulation
 
             run_weld_simulation(job_id)
+        elif job_type == "calibration":
+            from app.services.calibration_runner import run_calibration
+
+            run_calibration(job_id)
         else:
             logger.error("Unknown job type: %s", job_type)
     except Exception as exc:
         logger.exception("Job %s #%d failed with uncaught exception", job_type, job_id)
         _mark_failed(job_type, job_id, str(exc))
 
+    if job_type == "simulation":
+        _settle_duplicates(job_id)
+
+
+def _settle_duplicates(simulation_id: int) -> None:
+    """Finish batch members waiting on a simulation that has finished."""
+    try:
+        from app.services.batch_runner import settle_duplicates
+
+        settle_duplicates(simulation_id)
+    except Exception:
+        db.session.rollback()
+        logger.exception("Settling duplicates of simulation #%d failed", simulation_id)
+
 
 def _mark_failed(job_type: str, job_id: int, message: str | None = None) -> None:
     """Safety net: mark a job as failed if an uncaught exception occurs."""
     error_message = (message or "Unexpected worker error")[:500]
     try:
-        if job_type == "simulation":
-            sim = db.session.get(Simulation, job_id)
-            if sim and sim.status in ("queued", "running"):
-                sim.status = SIM_FAILED
-                sim.error_message = error_message
-                db.session.commit()
-        elif job_type == "weld":
-            proj = db.session.get(WeldProject, job_id)
-            if proj and proj.status in ("queued", "running"):
-                proj.status = WELD_FAILED
-                proj.error_message = error_message
-                db.session.commit()
+        model = _JOB_MODELS.get(job_type)
+        job = db.session.get(model, job_id) if model is not None else None
+        if job and job.status in ("queued", "running"):
+            job.status = _FAILED_STATUS[job_type]
+            job.error_message = error_message
+            db.session.commit()
     except Exception:
         logger.exception("Failed to mark job as failed: %s #%d", job_type, job_id)
 
 
+def _worker_status(lease_timeout: float) -> list[dict]:
+    now = datetime.utcnow()
+    workers = []
+    for w in JobWorker.query.order_by(JobWorker.name.asc()).all():
+        age = (now - w.heartbeat_at).total_seconds() if w.heartbeat_at else None
+        workers.append(
+            {
+                "name": w.name,
+                "pid": w.pid,
+                "lanes": w.lane_list,
+                "state": w.state,
+                "job": {"type": w.job_type, "id": w.job_id} if w.job_type else None,
+                "jobs_completed": w.jobs_completed or 0,
+                "heartbeat_age_s": round(age, 1) if age is not None else None,
+                "alive": (
+                    w.state in (WORKER_IDLE, WORKER_BUSY)
+                    and age is not None
+                    and age < lease_timeout
+                ),
+            }
+        )
+    return workers
+
+
 def get_queue_status() -> dict:
     """Return current queue status for UI display.
 
     Returns dict with:
-        running: {type, id, name} or None
-        queued: [{type, id, name, position}, ...]
+        running: {type, id, name, worker} of the oldest running job, or None
+        running_jobs: [{type, id, name, kind, lane, worker}, ...]
+        queued: [{type, id, name, kind, lane, position}, ...] in claim order
+        workers: [{name, pid, lanes, state, job, jobs_completed,
+                   heartbeat_age_s, alive}, ...]
     """
-    running_job = None
-    queued_jobs = []
-
-    # Check running
-    running_sim = Simulation.query.filter_by(status="running").first()
-    if running_sim:
-        running_job = {"type": "simulation", "id": running_sim.id, "name": running_sim.name}
-
-    running_weld = WeldProject.query.filter_by(status="running").first()
-    if running_weld:
-        running_job = {"type": "weld", "id": running_weld.id, "name": running_weld.name}
-
-    # Collect queued items
-    queued_sims = (
-        Simulation.query.filter_by(status="queued").order_by(Simulation.created_at.asc()).all()
-    )
-    queued_welds = (
-        WeldProject.query.filter_by(status="queued").order_by(WeldProject.created_at.asc()).all()
-    )
+    try:
+        lease_timeout = current_app.config.get("JOB_LEASE_TIMEOUT", LEASE_TIMEOUT)
+    except RuntimeError:
+        lease_timeout = LEASE_TIMEOUT
 
-    # Merge into single ordered list by id (FIFO approximation)
-    all_queued = []
-    for s in queued_sims:
-        all_queued.append(("simulation", s.id, s.name, s.created_at))
-    for w in queued_welds:
-        all_queued.append(("weld", w.id, w.name, w.created_at))
+    leases = {
+        (lease.job_type, lease.job_id): lease
+        for lease in JobLease.query.filter(JobLease.released_at.is_(None))
+    }
 
-    all_queued.sort(key=lambda x: (x[3], x[1]))  # Sort by created_at, then id
-
-    for pos, (jtype, jid, jname, _) in enumerate(all_queued, 1):
-        queued_jobs.append(
-            {
-                "type": jtype,
-                "id": jid,
-                "name": jname,
-                "position": pos,
-            }
-        )
+    running_jobs = []
+    for job_type, model in _JOB_MODELS.items():
+        for job in model.query.filter_by(status="running").order_by(model.started_at.asc()):
+            lease = leases.get((job_type, job.id))
+            kind = lease.kind if lease else job_kind(job_type, job)
+            running_jobs.append(
+                {
+                    "type": job_type,
+                    "id": job.id,
+                    "name": job.name,
+                    "kind": kind,
+                    "lane": KIND_LANES[kind],
+                    "worker": lease.worker_name if lease else None,
+                }
+            )
+
+    queued_jobs = [
+        {
+            "type": job_type,
+            "id": job_id,
+            "name": name,
+            "kind": kind,
+            "lane": KIND_LANES[kind],
+            "position": pos,
+        }
+        for pos, (job_type, job_id, name, kind, _) in enumerate(_queued_jobs(), 1)
+    ]
 
     return {
-        "running": running_job,
+        "running": running_jobs[0] if running_jobs else None,
+        "running_jobs": running_jobs,
         "queued": queued_jobs,
+        "workers": _worker_status(lease_timeout),
     }
 
 
 def get_queue_position(job_type: str, job_id: int) -> int | None:
-    """Get the queue position for a specific job, or None if not queued."""
+    """Get the queue position for a specific job, or None if not queued.
+
+    Positions follow claim order, so fast-lane jobs rank ahead of older
+    slow-lane ones.
+    """
     status = get_queue_status()
     for item in status["queued"]:
         if item["type"] == job_type and item["id"] == job_id:
             return item["position"]
     return None
+
+
+def get_job_worker(job_type: str, job_id: int) -> dict | None:
+    """Status of the worker holding a job's lease, or None if not running.
+
+    Same fields as the entries of ``get_queue_status()["workers"]`` plus the
+    job's lane.
+    """
+    lease = JobLease.query.filter_by(job_type=job_type, job_id=job_id, released_at=None).first()
+    if lease is None:
+        return None
+    try:
+        lease_timeout = current_app.config.get("JOB_LEASE_TIMEOUT", LEASE_TIMEOUT)
+    except RuntimeError:
+        lease_timeout = LEASE_TIMEOUT
+    for worker in _worker_status(lease_timeout):
+        if worker["name"] == lease.worker_name:
+            return {**worker, "lane": lease.lane}
+    return {"name": lease.worker_name, "lane": lease.lane, "alive": False}
+
+
+def get_queue_metrics(hours: float = 24.0) -> dict:
+    """Submit-to-start latency of jobs claimed in the last ``hours``.
+
+    Returns dict with ``count``, ``mean_s``, ``p50_s``, ``p95_s``, ``max_s``
+    over all jobs and the same statistics per lane under ``lanes``.
+    Latencies are None when no job with a known submit time was claimed.
+    """
+    since = datetime.utcnow() - timedelta(hours=hours)
+    rows = (
+        db.session.query(JobLease.lane, JobLease.wait_seconds)
+        .filter(JobLease.claimed_at >= since, JobLease.wait_seconds.isnot(None))
+        .all()
+    )
+
+    def _stats(waits: list[float]) -> dict:
+        if not waits:
+            return {"count": 0, "mean_s": None, "p50_s": None, "p95_s": None, "max_s": None}
+        w = np.asarray(waits)
+        return {
+            "count": len(waits),
+            "mean_s": round(float(w.mean()), 3),
+            "p50_s": round(float(np.percentile(w, 50)), 3),
+            "p95_s": round(float(np.percentile(w, 95)), 3),
+            "max_s": round(float(w.max()), 3),
+        }
+
+    metrics = _stats([wait for _, wait in rows])
+    metrics["hours"] = hours
+    metrics["lanes"] = {
+        lane: _stats([wait for row_lane, wait in rows if row_lane == lane]) for lane in LANES
+    }
+    return metrics
@@ -5,9 +5,16 @@ import json
 from app.extensions import db
 from app.models.material_changelog import MaterialChangeLog
 
+# Entity types whose changes alter a grade's compiled phase transformation models
+PHASE_MODEL_ENTITY_TYPES = {"ttt_parameters", "jmak_parameters", "martensite_parameters"}
+
 
 class MaterialChangeTracker:
-    """Tracks changes to material entities for audit/lineage purposes."""
+    """Tracks changes to material entities for audit/lineage purposes.
+
+    Logging a change to TTT, JMAK or martensite parameters also invalidates
+    the grade's cached phase models (see phase_transformation.phase_models).
+    """
 
     @staticmethod
     def _get_user_info():
@@ -21,6 +28,14 @@ class MaterialChangeTracker:
             pass
         return None, "system"
 
+    @staticmethod
+    def _invalidate_caches(entity_type, steel_grade_id):
+        """Drop cached data derived from the changed entity."""
+        if entity_type in PHASE_MODEL_ENTITY_TYPES:
+            from app.services.phase_transformation.phase_models import invalidate_phase_models
+
+            invalidate_phase_models(steel_grade_id)
+
     @classmethod
     def log_create(cls, entity_type, entity, steel_grade_id):
         """Log creation of a material entity."""
@@ -35,6 +50,7 @@ class MaterialChangeTracker:
             changed_by_username=username,
         )
         db.session.add(entry)
+        cls._invalidate_caches(entity_type, steel_grade_id)
 
     @classmethod
     def log_update(cls, entity_type, entity_id, steel_grade_id, changes):
@@ -59,6 +75,8 @@ class MaterialChangeTracker:
                 changed_by_username=username,
             )
             db.session.add(entry)
+        if changes:
+            cls._invalidate_caches(entity_type, steel_grade_id)
 
     @classmethod
     def log_delete(cls, entity_type, entity_id, steel_grade_id, name=None):
@@ -74,6 +92,34 @@ class MaterialChangeTracker:
             changed_by_username=username,
         )
         db.session.add(entry)
+        cls._invalidate_caches(entity_type, steel_grade_id)
+
+    @classmethod
+    def apply_tracked(cls, entity_type, entity, steel_grade_id, field_values, created=False):
+        """Apply field values to an entity and log the change.
+
+        Parameters
+        ----------
+        entity_type : str
+            Entity type recorded in the change log
+        entity : db.Model instance
+            The entity to update (new and not yet added if `created`)
+        steel_grade_id : int
+            Grade the entity belongs to
+        field_values : dict
+            {field_name: new_value}
+        created : bool
+            Log a creation instead of field-level changes
+        """
+        changes = {} if created else cls.detect_changes(entity, field_values)
+        for field, value in field_values.items():
+            setattr(entity, field, value)
+        if created:
+            db.session.add(entity)
+            db.session.flush()
+            cls.log_create(entity_type, entity, steel_grade_id)
+        elif changes:
+            cls.log_update(entity_type, entity.id, steel_grade_id, changes)
 
     @staticmethod
     def detect_changes(entity, field_values):
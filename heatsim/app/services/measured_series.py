@@ -0,0 +1,162 @@
+"""Preprocessed series of measured thermocouple data.
+
+Each uploaded channel is put once on a uniform time grid (bin means when
+the grid is coarser than the logger, interpolation otherwise; at most
+RESAMPLE_MAX_POINTS points unless that would make the step longer than
+RESAMPLE_MAX_STEP), its dT/dt is taken on that grid, and
+temperature and dT/dt are smoothed over SMOOTH_WINDOW points. The arrays
+are stored in MeasuredData.series_data, so measured plots and comparison
+metrics read them instead of decoding the raw JSON columns and
+differentiating them on every request. Rows uploaded before
+preprocessing are processed on first read.
+"""
+
+import io
+
+import numpy as np
+
+from app.extensions import db
+from app.services.visualization import moving_average
+
+# Bump when the preprocessing changes; stored series of older versions are redone
+PREPROCESS_VERSION = 2
+
+RESAMPLE_MAX_POINTS = 5000
+# Longest grid step (s): wider bins would average away quench peaks and
+# dT/dt of multi-day logs
+RESAMPLE_MAX_STEP = 1.0
+SMOOTH_WINDOW = 20
+
+# Arrays stored per channel
+FIELDS = ("time", "temp", "temp_smooth", "dtdt", "dtdt_smooth")
+
+
+def resample(
+    times, temps, max_points: int = RESAMPLE_MAX_POINTS, max_step: float = RESAMPLE_MAX_STEP
+) -> tuple:
+    """Put one channel on a uniform time grid.
+
+    The grid step is the median sample interval, widened so the grid has
+    at most max_points points but never beyond max_step seconds (long
+    logs get more points instead). Grid points average the samples
+    nearest to them; points without samples are interpolated.
+
+    Returns
+    -------
+    tuple of (np.ndarray, np.ndarray)
+        (grid times, temperatures)
+    """
+    times = np.asarray(times, dtype=float)
+    temps = np.asarray(temps, dtype=float)
+    valid = np.isfinite(times) & np.isfinite(temps)
+    times, temps = times[valid], temps[valid]
+    if times.size < 2 or times[-1] <= times[0]:
+        return times, temps
+
+    steps = np.diff(times)
+    step = float(np.median(steps[steps > 0]))
+    span = times[-1] - times[0]
+    max_points = max(max_points, int(np.ceil(span / max_step)) + 1)
+    n_points = int(min(round(span / step) + 1, max_points))
+    grid = np.linspace(times[0], times[-1], n_points)
+    if times.size <= n_points:
+        return grid, np.interp(grid, times, temps)
+
+    bins = np.rint((times - times[0]) / (grid[1] - grid[0])).astype(int)
+    np.clip(bins, 0, n_points - 1, out=bins)
+    counts = np.bincount(bins, minlength=n_points)
+    sums = np.bincount(bins, weights=temps, minlength=n_points)
+    filled = counts > 0
+    values = np.interp(grid, grid[filled], sums[filled] / counts[filled])
+    return grid, values
+
+
+def preprocess_channel(times, temps) -> dict[str, np.ndarray]:
+    """Resampled, differentiated and smoothed series of one channel (FIELDS)."""
+    grid, values = resample(times, temps)
+    dtdt = np.gradient(values, grid) if grid.size >= 2 else np.zeros_like(values)
+    return {
+        "time": grid,
+        "temp": values,
+        "temp_smooth": moving_average(values, SMOOTH_WINDOW),
+        "dtdt": dtdt,
+        "dtdt_smooth": moving_average(dtdt, SMOOTH_WINDOW),
+    }
+
+
+def pack_channels(series: dict[str, dict[str, np.ndarray]]) -> bytes:
+    """Encode preprocessed channels as a compressed npz blob."""
+    arrays = {
+        "version": np.array(PREPROCESS_VERSION),
+        "channels": np.array(list(series), dtype=str),
+    }
+    for i, fields in enumerate(series.values()):
+        for name in FIELDS:
+            dtype = np.float64 if name == "time" else np.float32
+            arrays[f"ch{i}_{name}"] = np.asarray(fields[name], dtype=dtype)
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def unpack_channels(blob: bytes) -> dict[str, dict[str, np.ndarray]] | None:
+    """Decode a blob of `pack_channels`; None if it is from another version."""
+    with np.load(io.BytesIO(blob)) as npz:
+        if int(npz["version"]) != PREPROCESS_VERSION:
+            return None
+        return {
+            str(channel): {name: npz[f"ch{i}_{name}"].astype(float) for name in FIELDS}
+            for i, channel in enumerate(npz["channels"])
+        }
+
+
+def preprocess(measured) -> None:
+    """Preprocess every channel of a measured dataset (does not commit).
+
+    Clears the stored time offset, which was computed from the old series.
+    """
+    channel_times = measured.channel_times
+    series = {
+        channel: preprocess_channel(channel_times.get(channel, measured.times), temps)
+        for channel, temps in measured.channels.items()
+    }
+    measured.series_data = pack_channels(series)
+    measured.time_offset = None
+    measured.offset_snapshot_id = None
+
+
+def channel_series(measured) -> dict[str, dict[str, np.ndarray]]:
+    """Preprocessed series of a dataset: {channel: {field: array}}.
+
+    Datasets stored without (current) preprocessed series are processed
+    now and committed.
+    """
+    series = unpack_channels(measured.series_data) if measured.series_data else None
+    if series is None:
+        preprocess(measured)
+        db.session.commit()
+        series = unpack_channels(measured.series_data)
+    return series
+
+
+def plot_channels(measured_list) -> list[dict]:
+    """Channel dicts for the measured plots, one per channel of each dataset.
+
+    Keys: name, times, temps (resampled), temps_smooth, dtdt, dtdt_smooth,
+    smooth_window.
+    """
+    channels = []
+    for m in measured_list:
+        for channel, fields in channel_series(m).items():
+            channels.append(
+                {
+                    "name": m.get_channel_label(channel),
+                    "times": fields["time"],
+                    "temps": fields["temp"],
+                    "temps_smooth": fields["temp_smooth"],
+                    "dtdt": fields["dtdt"],
+                    "dtdt_smooth": fields["dtdt_smooth"],
+                    "smooth_window": SMOOTH_WINDOW,
+                }
+            )
+    return channels
@@ -3,20 +3,23 @@
 Uses scipy.optimize to find optimal heat treatment parameters
 that achieve target metallurgical outcomes (hardness, t8/5,
 phase fractions). Evaluates objective using fast reduced-resolution
-simulations (31 nodes) following the SensitivityAnalyzer pattern.
+simulations (31 nodes) following the SensitivityAnalyzer pattern;
+differential evolution evaluates each generation as one batched solve,
+optionally split across a pool of worker processes.
 """
 
 import copy
 import logging
+import multiprocessing
 import time
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
 from scipy.optimize import differential_evolution, minimize
 
-from app.services.geometry import create_geometry
-from app.services.heat_solver import MultiPhaseHeatSolver, SolverConfig
+from app.services.batch_simulation import MaterialSnapshot, SimulationVariant, solve_variants
 
 if TYPE_CHECKING:
     from app.models.simulation import Simulation
@@ -143,6 +146,8 @@ class OptimizationResult:
     objective: OptimizationObjective
     parameters: list[OptimizationParameter]
     constraints: list[OptimizationConstraint] = field(default_factory=list)
+    workers: int = 1
+    generations: list[dict] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return {
@@ -185,6 +190,8 @@ class OptimizationResult:
                 }
                 for c in self.constraints
             ],
+            "workers": self.workers,
+            "generations": self.generations,
         }
 
 
@@ -216,6 +223,10 @@ class OptimizationService:
         self._best_params: dict[str, float] = {}
         self._best_outputs: dict[str, float] = {}
         self._start_time: float = 0.0
+        self._material: MaterialSnapshot | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._workers = 1
+        self._generations: list[dict] = []
 
     def optimize(
         self,
@@ -224,6 +235,7 @@ class OptimizationService:
         constraints: list[OptimizationConstraint] | None = None,
         method: str = "nelder-mead",
         max_iterations: int = 30,
+        workers: int = 1,
     ) -> OptimizationResult:
         """Run optimization.
 
@@ -239,6 +251,10 @@ class OptimizationService:
             'nelder-mead' or 'differential_evolution'.
         max_iterations : int
             Maximum optimizer iterations.
+        workers : int
+            Worker processes for differential evolution. With more than one,
+            each generation is split into per-worker batches that run in a
+            process pool; Nelder-Mead is sequential and always runs in-process.
 
         Returns
         -------
@@ -250,6 +266,9 @@ class OptimizationService:
         self._best_obj = float("inf")
         self._best_params = {}
         self._best_outputs = {}
+        self._generations = []
+        self._workers = max(1, int(workers)) if method == "differential_evolution" else 1
+        self._material = MaterialSnapshot.from_grade(self.sim.steel_grade)
 
         t_start = time.time()
         self._start_time = t_start
@@ -280,10 +299,17 @@ class OptimizationService:
                 logger.info(
                     f"Differential evolution: {n_params} params, "
                     f"popsize={safe_popsize}, maxiter={max_iterations}, "
-                    f"est. max evals={safe_popsize * n_params * (max_iterations + 1)}"
+                    f"est. max evals={safe_popsize * n_params * (max_iterations + 1)}, "
+                    f"workers={self._workers}"
                 )
+                if self._workers > 1:
+                    # Spawned workers start clean: no inherited DB connections or threads
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self._workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
                 result = differential_evolution(
-                    self._objective_function,
+                    self._population_objective,
                     bounds=bounds,
                     args=(parameters, objective, constraints),
                     maxiter=max_iterations,
@@ -292,6 +318,8 @@ class OptimizationService:
                     tol=1e-3,
                     polish=False,
                     init="sobol",
+                    vectorized=True,
+                    updating="deferred",
                 )
                 status = "completed" if result.success else "max_iterations"
             else:
@@ -324,6 +352,11 @@ class OptimizationService:
         except Exception as e:
             logger.error(f"Optimization failed: {e}")
             status = "failed"
+        finally:
+            if self._pool is not None:
+                # Don't wait for chunks still running after a timeout
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
 
         elapsed = time.time() - t_start
 
@@ -338,6 +371,8 @@ class OptimizationService:
             objective=objective,
             parameters=parameters,
             constraints=constraints,
+            workers=self._workers,
+            generations=self._generations,
         )
 
     def _objective_function(
@@ -348,6 +383,65 @@ class OptimizationService:
         constraints: list[OptimizationConstraint],
     ) -> float:
         """Evaluate objective for a parameter vector."""
+        self._check_limits()
+
+        param_values = self._param_values(x, parameters)
+        outputs = self._run_evaluation(param_values)
+        return self._record_evaluation(param_values, outputs, objective, constraints)
+
+    def _population_objective(
+        self,
+        population: np.ndarray,
+        parameters: list[OptimizationParameter],
+        objective: OptimizationObjective,
+        constraints: list[OptimizationConstraint],
+    ) -> np.ndarray:
+        """Evaluate a whole differential-evolution population in one batch.
+
+        Parameters
+        ----------
+        population : np.ndarray
+            Parameter vectors as columns, shape (n_params, S)
+
+        Returns
+        -------
+        np.ndarray
+            Objective value per member, shape (S,). Members beyond the
+            evaluation budget get +inf (never accepted) and the next call
+            stops the optimization.
+        """
+        self._check_limits()
+
+        n_members = population.shape[1]
+        n_eval = min(n_members, self.MAX_TOTAL_EVALUATIONS - self._eval_count)
+        param_sets = [self._param_values(population[:, i], parameters) for i in range(n_eval)]
+
+        gen_start = time.time()
+        batch_outputs = self._run_evaluations(param_sets)
+        self._record_generation(n_eval, time.time() - gen_start)
+
+        values = np.full(n_members, np.inf)
+        for i, (param_values, outputs) in enumerate(zip(param_sets, batch_outputs, strict=True)):
+            values[i] = self._record_evaluation(param_values, outputs, objective, constraints)
+        return values
+
+    def _record_generation(self, n_eval: int, wall_time: float) -> None:
+        """Log and keep the evaluation throughput of one DE generation."""
+        stats = {
+            "generation": len(self._generations) + 1,
+            "evaluations": n_eval,
+            "wall_time_s": round(wall_time, 3),
+            "evals_per_s": round(n_eval / wall_time, 2) if wall_time > 0 else 0.0,
+            "workers": self._workers,
+        }
+        self._generations.append(stats)
+        logger.info(
+            f"Generation {stats['generation']}: {n_eval} evals in {wall_time:.2f}s "
+            f"({stats['evals_per_s']} evals/s, {self._workers} workers)"
+        )
+
+    def _check_limits(self) -> None:
+        """Raise _OptimizationTimeout when the wall-time or evaluation budget is spent."""
         # Check wall-time timeout
         elapsed = time.time() - self._start_time
         if elapsed > self.MAX_WALL_TIME:
@@ -361,13 +455,19 @@ class OptimizationService:
                 f"Evaluation count {self._eval_count} reached limit {self.MAX_TOTAL_EVALUATIONS}"
             )
 
-        # Map vector to named parameters
-        param_values = {}
-        for i, p in enumerate(parameters):
-            param_values[p.key] = float(x[i])
+    @staticmethod
+    def _param_values(x: np.ndarray, parameters: list[OptimizationParameter]) -> dict[str, float]:
+        """Map a parameter vector to named parameters."""
+        return {p.key: float(x[i]) for i, p in enumerate(parameters)}
 
-        # Run evaluation
-        outputs = self._run_evaluation(param_values)
+    def _record_evaluation(
+        self,
+        param_values: dict[str, float],
+        outputs: dict[str, float],
+        objective: OptimizationObjective,
+        constraints: list[OptimizationConstraint],
+    ) -> float:
+        """Score one evaluation, append it to the history and track the best."""
         self._eval_count += 1
 
         # Get objective output value
@@ -428,103 +528,140 @@ class OptimizationService:
         return total_obj
 
     def _run_evaluation(self, param_values: dict[str, float]) -> dict[str, float]:
-        """Run a single reduced-resolution simulation with given parameters.
+        """Run a single reduced-resolution simulation with given parameters."""
+        return self._run_evaluations([param_values])[0]
 
-        Follows the SensitivityAnalyzer._run_with_modified_param() pattern.
+    def _run_evaluations(self, param_sets: list[dict[str, float]]) -> list[dict[str, float]]:
+        """Run reduced-resolution simulations for several parameter sets as one batch.
+
+        Follows the SensitivityAnalyzer._run_batch() pattern.
         """
+        variants = [self._build_variant(param_values) for param_values in param_sets]
+        grade = self.sim.steel_grade
         try:
-            ht_config = copy.deepcopy(self.sim.ht_config or {})
-            geom_config = copy.deepcopy(self.sim.geometry_dict or {})
+            if self._pool is not None and len(variants) > 1:
+                results = self._solve_in_pool(variants)
+            else:
+                material = self._material or MaterialSnapshot.from_grade(grade)
+                results = solve_variants(material, variants, self.sim.solver_dict)
+        except _OptimizationTimeout:
+            raise
+        except Exception as e:
+            logger.error(f"Optimization evaluation batch failed: {e}")
+            return [{k: 0.0 for k in OUTPUT_DEFINITIONS} for _ in variants]
+
+        # Hardness and phase prediction needs a phase diagram and composition
+        tracker = None
+        diagram = grade.phase_diagrams.first()
+        if diagram and grade.composition:
+            from app.services.phase_tracker import PhaseTracker
+
+            tracker = PhaseTracker(diagram)
+
+        outputs = []
+        for solver_result in results:
+            if solver_result is None:
+                logger.error("Optimization evaluation failed: no solver result")
+                outputs.append({k: 0.0 for k in OUTPUT_DEFINITIONS})
+                continue
+            try:
+                outputs.append(self._extract_outputs(solver_result, tracker))
+            except Exception as e:
+                logger.error(f"Optimization evaluation failed: {e}")
+                outputs.append({k: 0.0 for k in OUTPUT_DEFINITIONS})
+        return outputs
+
+    def _solve_in_pool(self, variants: list[SimulationVariant]) -> list:
+        """Split variants into one batch per worker and solve them in the pool.
+
+        Waits at most for the remaining wall-time budget; raises
+        _OptimizationTimeout if the generation does not finish in time. If a
+        batch fails, the batches still running are cancelled and its
+        exception is raised without waiting for them.
+        """
+        n_chunks = min(self._workers, len(variants))
+        bounds = np.linspace(0, len(variants), n_chunks + 1).astype(int)
+        futures = [
+            self._pool.submit(solve_variants, self._material, variants[lo:hi], self.sim.solver_dict)
+            for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
+
+        remaining = self.MAX_WALL_TIME - (time.time() - self._start_time)
+        done, not_done = wait(futures, timeout=max(remaining, 0.0), return_when=FIRST_EXCEPTION)
+        failed = next((f for f in futures if f in done and f.exception() is not None), None)
+        for future in not_done:
+            future.cancel()
+        if failed is not None:
+            raise failed.exception()
+        if not_done:
+            raise _OptimizationTimeout(
+                f"Wall time limit {self.MAX_WALL_TIME}s reached during a parallel generation"
+            )
 
-            # Apply parameter changes
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _build_variant(self, param_values: dict[str, float]) -> SimulationVariant:
+        """Copy the simulation configs with the parameter values applied."""
+        ht_config = copy.deepcopy(self.sim.ht_config or {})
+        geom_config = copy.deepcopy(self.sim.geometry_dict or {})
+
+        # Apply parameter changes
+        for key, value in param_values.items():
+            self._apply_params_to_config(key, value, ht_config, geom_config)
+
+        # Build geometry (use equivalent for CAD)
+        geom_type = self.sim.geometry_type
+        if geom_type == "cad":
+            geom_type = self.sim.cad_equivalent_type or "cylinder"
+            geom_config = copy.deepcopy(self.sim.cad_equivalent_geometry_dict or geom_config)
+            # Re-apply geometry params if any were optimized
             for key, value in param_values.items():
-                self._apply_params_to_config(key, value, ht_config, geom_config)
-
-            # Build geometry (use equivalent for CAD)
-            geom_type = self.sim.geometry_type
-            if geom_type == "cad":
-                geom_type = self.sim.cad_equivalent_type or "cylinder"
-                geom_config = copy.deepcopy(self.sim.cad_equivalent_geometry_dict or geom_config)
-                # Re-apply geometry params if any were optimized
-                for key, value in param_values.items():
-                    if key.startswith("geometry."):
-                        self._apply_params_to_config(key, value, ht_config, geom_config)
-
-            geometry = create_geometry(geom_type, geom_config)
-
-            # Reduced resolution solver (31 nodes for speed)
-            solver_dict = copy.deepcopy(self.sim.solver_dict or {})
-            solver_dict["n_nodes"] = min(solver_dict.get("n_nodes", 31), 31)
-            solver_config = SolverConfig.from_dict(solver_dict)
-
-            # Material properties
-            grade = self.sim.steel_grade
-            k_prop = grade.get_property("thermal_conductivity")
-            cp_prop = grade.get_property("specific_heat")
-            rho_prop = grade.get_property("density")
-            emiss_prop = grade.get_property("emissivity")
-            density = rho_prop.data_dict.get("value", 7850) if rho_prop else 7850
-            emissivity = emiss_prop.data_dict.get("value", 0.85) if emiss_prop else 0.85
-
-            # Build and configure solver
-            solver = MultiPhaseHeatSolver(geometry, config=solver_config)
-            solver.set_material(k_prop, cp_prop, density, emissivity)
-            solver.configure_from_ht_config(ht_config)
-
-            # Initial temperature
-            heating_cfg = ht_config.get("heating", {})
-            if heating_cfg.get("enabled", False):
-                initial_temp = heating_cfg.get("initial_temperature", 25.0)
-            else:
-                initial_temp = heating_cfg.get("target_temperature", 850.0)
-
-            # Run solver
-            result = solver.solve(initial_temperature=initial_temp)
-
-            # Extract outputs
-            outputs = {
-                "t8_5": round(result.t8_5 or 0.0, 2),
-                "core_cooling_rate": round(300.0 / max(result.t8_5 or 0.1, 0.1), 1),
-                "surface_cooling_rate": 0.0,
-                "hardness_hv_center": 0.0,
-                "hardness_hv_surface": 0.0,
-                "martensite": 0.0,
-                "bainite": 0.0,
-            }
-
-            # Surface cooling rate
-            n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
-            if n_pos > 1:
-                surface_temp = result.temperature[:, -1]
-                dtdt = np.gradient(surface_temp, result.time)
-                outputs["surface_cooling_rate"] = round(abs(float(np.min(dtdt))), 1)
-
-            # Hardness and phase prediction
-            diagram = grade.phase_diagrams.first()
-            if diagram and grade.composition:
-                from app.services.hardness_predictor import predict_hardness_profile
-                from app.services.phase_tracker import PhaseTracker
-
-                tracker = PhaseTracker(diagram)
-                try:
-                    hr = predict_hardness_profile(
-                        grade.composition, result.temperature, result.time, tracker
-                    )
-                    outputs["hardness_hv_center"] = hr.hardness_hv.get("center", 0)
-                    outputs["hardness_hv_surface"] = hr.hardness_hv.get("surface", 0)
+                if key.startswith("geometry."):
+                    self._apply_params_to_config(key, value, ht_config, geom_config)
+
+        return SimulationVariant(geom_type, geom_config, ht_config)
+
+    def _extract_outputs(self, result, tracker) -> dict[str, float]:
+        """Objective and constraint outputs of one solved variant."""
+        outputs = {
+            "t8_5": round(result.t8_5 or 0.0, 2),
+            "core_cooling_rate": round(300.0 / max(result.t8_5 or 0.1, 0.1), 1),
+            "surface_cooling_rate": 0.0,
+            "hardness_hv_center": 0.0,
+            "hardness_hv_surface": 0.0,
+            "martensite": 0.0,
+            "bainite": 0.0,
+        }
 
-                    # Phase fractions at center
-                    center_phases = hr.phase_fractions.get("center", {})
-                    outputs["martensite"] = round(center_phases.get("martensite", 0) * 100, 1)
-                    outputs["bainite"] = round(center_phases.get("bainite", 0) * 100, 1)
-                except Exception:
-                    pass
+        # Surface cooling rate
+        n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
+        if n_pos > 1:
+            surface_temp = result.temperature[:, -1]
+            dtdt = np.gradient(surface_temp, result.time)
+            outputs["surface_cooling_rate"] = round(abs(float(np.min(dtdt))), 1)
 
-            return outputs
+        # Hardness and phase prediction
+        if tracker is not None:
+            from app.services.hardness_predictor import predict_hardness_profile
 
-        except Exception as e:
-            logger.error(f"Optimization evaluation failed: {e}")
-            return {k: 0.0 for k in OUTPUT_DEFINITIONS}
+            try:
+                hr = predict_hardness_profile(
+                    self.sim.steel_grade.composition, result.temperature, result.time, tracker
+                )
+                outputs["hardness_hv_center"] = hr.hardness_hv.get("center", 0)
+                outputs["hardness_hv_surface"] = hr.hardness_hv.get("surface", 0)
+
+                # Phase fractions at center
+                center_phases = hr.phase_fractions.get("center", {})
+                outputs["martensite"] = round(center_phases.get("martensite", 0) * 100, 1)
+                outputs["bainite"] = round(center_phases.get("bainite", 0) * 100, 1)
+            except Exception:
+                pass
+
+        return outputs
 
     def _apply_params_to_config(
         self, key: str, value: float, ht_config: dict, geom_config: dict
@@ -50,6 +50,39 @@ class PhaseResult:
         return self
 
 
+# Cooling rate classes (K/s lower bound, phase fractions), fastest first
+COOLING_RATE_CLASSES = [
+    # Very fast (>100 K/s) - water quench
+    (100.0, {"martensite": 0.95, "retained_austenite": 0.05}),
+    # Fast (30-100 K/s) - intense quench
+    (30.0, {"martensite": 0.80, "bainite": 0.15, "retained_austenite": 0.05}),
+    # Medium (10-30 K/s) - oil quench
+    (10.0, {"martensite": 0.50, "bainite": 0.40, "retained_austenite": 0.10}),
+    # Slow (1-10 K/s) - forced air
+    (
+        1.0,
+        {
+            "martensite": 0.10,
+            "bainite": 0.70,
+            "ferrite": 0.10,
+            "pearlite": 0.05,
+            "retained_austenite": 0.05,
+        },
+    ),
+    # Very slow (<1 K/s) - furnace cool
+    (
+        -np.inf,
+        {
+            "martensite": 0.0,
+            "bainite": 0.05,
+            "ferrite": 0.50,
+            "pearlite": 0.45,
+            "retained_austenite": 0.0,
+        },
+    ),
+]
+
+
 class PhaseTracker:
     """Tracks phase transformations during cooling.
 
@@ -107,41 +140,67 @@ class PhaseTracker:
         PhaseResult
             Predicted phase fractions
         """
-        result = PhaseResult()
-
         # Calculate average cooling rate in transformation range
         cooling_rate = self._calculate_cooling_rate(times, temperatures, t8_5)
 
         # Simplified CCT-based prediction based on cooling rate
-        if cooling_rate > 100:  # Very fast (>100 K/s) - water quench
-            result.martensite = 0.95
-            result.retained_austenite = 0.05
-
-        elif cooling_rate > 30:  # Fast (30-100 K/s) - intense quench
-            result.martensite = 0.80
-            result.bainite = 0.15
-            result.retained_austenite = 0.05
-
-        elif cooling_rate > 10:  # Medium (10-30 K/s) - oil quench
-            result.martensite = 0.50
-            result.bainite = 0.40
-            result.retained_austenite = 0.10
-
-        elif cooling_rate > 1:  # Slow (1-10 K/s) - forced air
-            result.martensite = 0.10
-            result.bainite = 0.70
-            result.ferrite = 0.10
-            result.pearlite = 0.05
-            result.retained_austenite = 0.05
-
-        else:  # Very slow (<1 K/s) - furnace cool
-            result.ferrite = 0.50
-            result.pearlite = 0.45
-            result.bainite = 0.05
-            result.martensite = 0.0
-            result.retained_austenite = 0.0
-
-        return result.normalize()
+        for min_rate, fractions in COOLING_RATE_CLASSES:
+            if cooling_rate > min_rate:
+                break
+        return PhaseResult(**fractions).normalize()
+
+    def predict_phases_field(
+        self,
+        times: np.ndarray,
+        temperatures: np.ndarray,
+        t8_5: np.ndarray | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Predict final phase fractions at every position in one pass.
+
+        Array counterpart of `predict_phases` giving the same fractions
+        column by column.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Time array (seconds), shape (n_times,)
+        temperatures : np.ndarray
+            Temperature field (Celsius), shape (n_times, n_positions)
+        t8_5 : np.ndarray, optional
+            Cooling time 800-500°C per position (seconds); positions
+            without a positive value are estimated from their curve
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Phase name -> fraction per position, shape (n_positions,)
+        """
+        temperatures = np.asarray(temperatures, dtype=float)
+        n_positions = temperatures.shape[1]
+        if t8_5 is None:
+            t8_5 = np.zeros(n_positions)
+        t8_5 = np.broadcast_to(np.asarray(t8_5, dtype=float), (n_positions,))
+
+        cooling_rate = np.empty(n_positions)
+        known = t8_5 > 0
+        cooling_rate[known] = 300.0 / t8_5[known]
+        for j in np.flatnonzero(~known):
+            cooling_rate[j] = self._calculate_cooling_rate(times, temperatures[:, j])
+
+        # Class index per position: the first class whose lower bound is
+        # exceeded; NaN rates fall through to the last class like the loop
+        thresholds = np.array([min_rate for min_rate, _ in COOLING_RATE_CLASSES])
+        exceeded = cooling_rate[:, None] > thresholds[None, :]
+        exceeded[:, -1] = True
+        class_idx = np.argmax(exceeded, axis=1)
+
+        names = list(PhaseResult().to_dict())
+        table = np.array(
+            [[fractions.get(name, 0.0) for name in names] for _, fractions in COOLING_RATE_CLASSES]
+        )
+        table /= table.sum(axis=1, keepdims=True)
+        fractions = table[class_idx]
+        return {name: fractions[:, i] for i, name in enumerate(names)}
 
     def _calculate_cooling_rate(
         self, times: np.ndarray, temperatures: np.ndarray, t8_5: float | None = None
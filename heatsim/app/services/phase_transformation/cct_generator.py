@@ -7,12 +7,43 @@ Output format matches that of cct_predictor.predict():
     {phase: {'start': [[t,T],...], 'finish': [[t,T],...]}}
 """
 
-
 import numpy as np
 
 from .jmak_model import JMAKModel
 from .martensite_model import KoistinenMarburgerModel
-from .scheil_additivity import calculate_cct_transformation
+from .scheil_additivity import calculate_cct_transformation_field
+
+
+def _linear_cooling_field(
+    cooling_rates: list[float],
+    austenitizing_temp: float,
+    end_temp: float,
+    steps_per_second: float,
+    min_steps: int,
+    max_steps: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Linear cooling curves of several rates as one (time, rate) field.
+
+    Each rate gets its own time grid of clip(total_time * steps_per_second,
+    min_steps, max_steps) points. Shorter grids are padded by repeating
+    their last point: zero time steps at the end temperature, which leave
+    the Scheil integration unchanged.
+
+    Returns
+    -------
+    times, temperatures : np.ndarray
+        Shape (max steps, n_rates)
+    n_steps : np.ndarray
+        Grid length of each rate
+    """
+    rates = np.asarray(cooling_rates, dtype=float)
+    total_times = (austenitizing_temp - end_temp) / rates
+    n_steps = np.clip((total_times * steps_per_second).astype(int), min_steps, max_steps)
+    rows = np.arange(n_steps.max())[:, np.newaxis]
+    # Fraction of the cooling time reached at each row, 1 in the padding
+    progress = np.minimum(rows / (n_steps - 1), 1.0)
+    times = progress * total_times
+    return times, austenitizing_temp - rates * times, n_steps
 
 
 def generate_cct_from_ttt(
@@ -30,7 +61,8 @@ def generate_cct_from_ttt(
     For each cooling rate, simulates a linear cooling curve from
     austenitizing temperature to end temperature, applies Scheil
     additivity, and records the time/temperature at which each phase
-    starts (1%) and finishes (99%).
+    starts (1%) and finishes (99%). All rates are integrated together as
+    the columns of one field (`calculate_cct_transformation_field`).
 
     Parameters
     ----------
@@ -64,71 +96,48 @@ def generate_cct_from_ttt(
         # Logarithmic distribution of cooling rates — more points for smoother curves
         cooling_rates = np.logspace(-1, 2.3, 50).tolist()  # 0.1 to ~200 K/s
 
+    # At least 0.1 s resolution, 500 to 5000 steps per rate
+    times, temperatures, _ = _linear_cooling_field(
+        sorted(cooling_rates), austenitizing_temp, end_temp, 10, 500, 5000
+    )
+    result = calculate_cct_transformation_field(
+        times,
+        temperatures,
+        jmak_models,
+        martensite_model,
+        critical_temps,
+        store_history=True,
+    )
+    columns = np.arange(times.shape[1])
+
     curves = {}
-    phase_starts = {}  # phase -> list of (time, temp)
-    phase_finishes = {}  # phase -> list of (time, temp)
-
-    for cr in sorted(cooling_rates):
-        # Generate linear cooling curve
-        delta_T = austenitizing_temp - end_temp
-        total_time = delta_T / cr
-        n_steps = max(int(total_time * 10), 500)  # At least 0.1s resolution
-        n_steps = min(n_steps, 5000)  # Cap for performance
-
-        times = np.linspace(0, total_time, n_steps)
-        temperatures = austenitizing_temp - cr * times
-
-        # Run Scheil additivity
-        result = calculate_cct_transformation(
-            times, temperatures, jmak_models, martensite_model, critical_temps
-        )
-
-        # Extract start/finish points for each phase
-        for phase in result.phase_fractions:
-            if phase == "retained_austenite":
-                continue
-
-            frac = result.phase_fractions[phase]
-            final_frac = frac[-1]
-
-            if final_frac < 0.005:
-                continue
-
-            # Use absolute thresholds (not relative to final_frac)
-            # This gives consistent detection across cooling rates
-            abs_start = start_fraction  # e.g. 0.01 = 1% absolute
-            abs_finish = min(finish_fraction * final_frac, final_frac * 0.99)
-
-            # Start point: first time fraction exceeds 1% absolute
-            start_indices = np.where(frac >= abs_start)[0]
-            if len(start_indices) > 0:
-                idx = start_indices[0]
-                if phase not in phase_starts:
-                    phase_starts[phase] = []
-                phase_starts[phase].append([float(times[idx]), float(temperatures[idx])])
-
-            # Finish point: first time fraction reaches 99% of what this
-            # cooling rate ultimately produces
-            finish_indices = np.where(frac >= abs_finish)[0]
-            if len(finish_indices) > 0:
-                idx = finish_indices[0]
-                if phase not in phase_finishes:
-                    phase_finishes[phase] = []
-                phase_finishes[phase].append([float(times[idx]), float(temperatures[idx])])
-
-    # Build output in standard format
-    for phase in set(list(phase_starts.keys()) + list(phase_finishes.keys())):
-        phase_dict = {}
-        if phase in phase_starts and len(phase_starts[phase]) >= 2:
-            # Sort by time ascending (natural CCT ordering: fast cooling left, slow right)
-            start_pts = sorted(phase_starts[phase], key=lambda p: p[0])
-            phase_dict["start"] = start_pts
-        if phase in phase_finishes and len(phase_finishes[phase]) >= 2:
-            finish_pts = sorted(phase_finishes[phase], key=lambda p: p[0])
-            phase_dict["finish"] = finish_pts
-
-        if phase_dict:
-            curves[phase] = phase_dict
+    for phase, frac in result.phase_fractions.items():
+        if phase == "retained_austenite":
+            continue
+
+        final_frac = frac[-1]
+        formed = final_frac >= 0.005
+
+        # Start: first time the fraction exceeds an absolute threshold, which
+        # gives consistent detection across cooling rates. Finish: first time
+        # it reaches 99% of what this cooling rate ultimately produces.
+        abs_finish = np.minimum(finish_fraction * final_frac, final_frac * 0.99)
+        points = {}
+        for position, reached in (
+            ("start", frac >= start_fraction),
+            ("finish", frac >= abs_finish),
+        ):
+            found = formed & reached.any(axis=0)
+            idx = reached.argmax(axis=0)[found]
+            if found.sum() >= 2:
+                # Sort by time ascending (natural CCT ordering: fast cooling left, slow right)
+                pts = np.column_stack(
+                    [times[idx, columns[found]], temperatures[idx, columns[found]]]
+                )
+                points[position] = pts[np.argsort(pts[:, 0], kind="stable")].tolist()
+
+        if points:
+            curves[phase] = points
 
     return curves
 
@@ -163,21 +172,11 @@ def generate_cct_phase_fractions(
     if cooling_rates is None:
         cooling_rates = np.logspace(-1, 2.3, 20).tolist()
 
-    results = {}
-
-    for cr in sorted(cooling_rates):
-        delta_T = austenitizing_temp - end_temp
-        total_time = delta_T / cr
-        n_steps = max(int(total_time * 5), 200)
-        n_steps = min(n_steps, 3000)
-
-        times = np.linspace(0, total_time, n_steps)
-        temperatures = austenitizing_temp - cr * times
-
-        result = calculate_cct_transformation(
-            times, temperatures, jmak_models, martensite_model, critical_temps
-        )
-
-        results[float(cr)] = result.final_fractions
-
-    return results
+    rates = sorted(cooling_rates)
+    times, temperatures, _ = _linear_cooling_field(
+        rates, austenitizing_temp, end_temp, 5, 200, 3000
+    )
+    result = calculate_cct_transformation_field(
+        times, temperatures, jmak_models, martensite_model, critical_temps
+    )
+    return {float(cr): result.fractions_at(j) for j, cr in enumerate(rates)}
@@ -0,0 +1,169 @@
+"""Persisted TTT / CCT diagrams generated from JMAK parameters.
+
+Generating a CCT diagram integrates Scheil additivity over fifty cooling
+rates; the TTT diagram inverts JMAK at every temperature of each phase.
+`get_diagram` does it once per parameter version and stores the curves in
+ttt_curves, one row per phase and curve position, under a key hashing the
+generator version and TTTParameters.params_version. A logged parameter
+change gives the set a new params_version, so stored rows of the old one
+are never read again and are replaced by the next store.
+
+Calibration and auto-generation call `warm_diagrams` after committing new
+parameters, so the TTT/CCT pages and simulations read stored curves.
+"""
+
+import hashlib
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import db
+from app.models.ttt_parameters import CURVE_TYPE_CCT, CURVE_TYPE_TTT, TTTCurve
+
+from .cct_generator import generate_cct_from_ttt
+from .phase_models import PhaseModels, get_phase_models
+from .ttt_generator import generate_ttt_for_plotting
+
+logger = logging.getLogger(__name__)
+
+# Bump when a generator changes its output, so stored curves are not reused
+DIAGRAM_VERSION = 1
+
+
+def diagram_key(models: PhaseModels, curve_type: str) -> str | None:
+    """Key of a generated diagram, None if the models are not versioned."""
+    if models.version is None or models.ttt_parameters_id is None:
+        return None
+    content = f"v{DIAGRAM_VERSION}:{curve_type}:{models.version}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def generate_diagram(models: PhaseModels, curve_type: str) -> dict:
+    """Generate a diagram from compiled models (no caching).
+
+    Returns
+    -------
+    dict
+        {phase: {'start': [[t,T],...], 'finish': [[t,T],...]}}
+    """
+    if curve_type == CURVE_TYPE_TTT:
+        return generate_ttt_for_plotting(models.jmak_models, models.critical_temps)
+    if curve_type == CURVE_TYPE_CCT:
+        return generate_cct_from_ttt(
+            models.jmak_models,
+            models.martensite_model,
+            models.critical_temps,
+            austenitizing_temp=models.austenitizing_temperature or 900.0,
+        )
+    raise ValueError(f"Unknown curve type: {curve_type}")
+
+
+def load_diagram(ttt_parameters_id: int, curve_type: str, key: str) -> dict | None:
+    """Stored curves with a key, None if there are none."""
+    rows = (
+        TTTCurve.query.filter_by(
+            ttt_parameters_id=ttt_parameters_id, curve_type=curve_type, params_key=key
+        )
+        .order_by(TTTCurve.id)
+        .all()
+    )
+    if not rows:
+        return None
+    curves = {}
+    for row in rows:
+        curves.setdefault(row.phase, {})[row.curve_position] = row.points
+    return curves
+
+
+def store_diagram(ttt_parameters_id: int, curve_type: str, key: str, curves: dict) -> bool:
+    """Replace the stored curves of a parameter set and commit.
+
+    Returns
+    -------
+    bool
+        False if the curves could not be stored
+    """
+    try:
+        TTTCurve.query.filter_by(
+            ttt_parameters_id=ttt_parameters_id, curve_type=curve_type
+        ).delete()
+        for phase, positions in curves.items():
+            for position, points in positions.items():
+                row = TTTCurve(
+                    ttt_parameters_id=ttt_parameters_id,
+                    curve_type=curve_type,
+                    phase=phase,
+                    curve_position=position,
+                    params_key=key,
+                )
+                row.set_points(points)
+                db.session.add(row)
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        logger.warning("Storing %s curves of %s failed: %s", curve_type, ttt_parameters_id, e)
+        return False
+    return True
+
+
+def get_diagram(models: PhaseModels, curve_type: str, store: bool = True) -> dict:
+    """Stored diagram of the models' parameter version, generated on a miss.
+
+    Parameters
+    ----------
+    models : PhaseModels
+        Compiled models of a grade
+    curve_type : str
+        'TTT' or 'CCT'
+    store : bool
+        Store a generated diagram (commits the session). Callers with
+        uncommitted work of their own, such as simulation jobs, pass False.
+
+    Returns
+    -------
+    dict
+        {phase: {'start': [[t,T],...], 'finish': [[t,T],...]}}
+    """
+    key = diagram_key(models, curve_type)
+    if key is not None:
+        curves = load_diagram(models.ttt_parameters_id, curve_type, key)
+        if curves is not None:
+            return curves
+
+    curves = generate_diagram(models, curve_type)
+    if store and key is not None and curves:
+        store_diagram(models.ttt_parameters_id, curve_type, key, curves)
+    return curves
+
+
+def warm_diagrams(steel_grade_id: int) -> int:
+    """Generate and store the TTT and CCT diagrams of a grade if missing.
+
+    Call after committing new parameters. Failures are logged, not raised.
+
+    Returns
+    -------
+    int
+        Number of diagrams available from the store afterwards
+    """
+    models = get_phase_models(steel_grade_id)
+    if models is None or not models.jmak_models:
+        return 0
+    warmed = 0
+    for curve_type in (CURVE_TYPE_TTT, CURVE_TYPE_CCT):
+        key = diagram_key(models, curve_type)
+        if key is None:
+            continue
+        try:
+            if load_diagram(models.ttt_parameters_id, curve_type, key) is None:
+                curves = generate_diagram(models, curve_type)
+                if not curves or not store_diagram(
+                    models.ttt_parameters_id, curve_type, key, curves
+                ):
+                    continue
+            warmed += 1
+        except Exception as e:
+            logger.warning(
+                "Warming %s diagram of grade %s failed: %s", curve_type, steel_grade_id, e
+            )
+    return warmed
@@ -10,6 +10,9 @@ b(T) model options:
     - Gaussian: b = b_max * exp(-0.5 * ((T - T_nose) / sigma)^2)
     - Arrhenius: b = b0 * exp(-Q / (R * T_K))
     - Polynomial: b = sum(a_i * T^i)
+
+The b(T) factories return scalar functions; each also carries a
+``vectorized`` attribute evaluating b over a NumPy array of temperatures.
 """
 
 import math
@@ -45,6 +48,10 @@ def gaussian_b_function(b_max: float, t_nose: float, sigma: float) -> Callable:
     def b_func(T):
         return b_max * math.exp(-0.5 * ((T - t_nose) / sigma) ** 2)
 
+    def b_array(T):
+        return b_max * np.exp(-0.5 * ((T - t_nose) / sigma) ** 2)
+
+    b_func.vectorized = b_array
     return b_func
 
 
@@ -73,6 +80,13 @@ def arrhenius_b_function(b0: float, Q: float) -> Callable:
             return 0.0
         return b0 * math.exp(-Q / (R * T_K))
 
+    def b_array(T):
+        T_K = T + 273.15
+        with np.errstate(divide="ignore", over="ignore"):
+            b = b0 * np.exp(-Q / (R * np.where(T_K > 0, T_K, 1.0)))
+        return np.where(T_K > 0, b, 0.0)
+
+    b_func.vectorized = b_array
     return b_func
 
 
@@ -96,6 +110,10 @@ def polynomial_b_function(coefficients: list[float]) -> Callable:
         val = sum(c * T**i for i, c in enumerate(coefficients))
         return max(val, 0.0)  # b must be non-negative
 
+    def b_array(T):
+        return np.maximum(np.polynomial.polynomial.polyval(T, coefficients), 0.0)
+
+    b_func.vectorized = b_array
     return b_func
 
 
@@ -142,13 +160,39 @@ class JMAKModel:
         (T_min, T_max) in deg C where this model is valid
     """
 
-    def __init__(
-        self, n: float, b_func: Callable, temp_range: tuple[float, float] | None = None
-    ):
+    def __init__(self, n: float, b_func: Callable, temp_range: tuple[float, float] | None = None):
         self.n = n
         self.b_func = b_func
         self.temp_range = temp_range
 
+    def b_values(self, temperatures: np.ndarray) -> np.ndarray:
+        """Evaluate b(T) over an array of temperatures.
+
+        Uses the b function's ``vectorized`` form when it has one (all
+        factory-built functions do), otherwise evaluates it elementwise.
+
+        Parameters
+        ----------
+        temperatures : np.ndarray
+            Temperatures in deg C, any shape
+
+        Returns
+        -------
+        np.ndarray
+            b(T) with the same shape; 0 outside temp_range and wherever b is
+            not a positive finite number (no transformation)
+        """
+        T = np.asarray(temperatures, dtype=float)
+        vectorized = getattr(self.b_func, "vectorized", None)
+        if vectorized is not None:
+            b = np.broadcast_to(np.asarray(vectorized(T), dtype=float), T.shape)
+        else:
+            b = np.vectorize(self.b_func, otypes=[float])(T)
+        valid = np.isfinite(b) & (b > 0)
+        if self.temp_range:
+            valid &= (T >= self.temp_range[0]) & (T <= self.temp_range[1])
+        return np.where(valid, b, 0.0)
+
     def fraction_transformed(self, time: float, temperature: float) -> float:
         """Calculate fraction transformed at given time and temperature.
 
@@ -212,6 +256,29 @@ class JMAKModel:
         time = (log_term / b) ** (1.0 / self.n)
         return time
 
+    def times_to_fraction(self, fraction: float, temperatures: np.ndarray) -> np.ndarray:
+        """Array form of `time_to_fraction` over many temperatures.
+
+        Parameters
+        ----------
+        fraction : float
+            Target fraction transformed (0 < X < 1)
+        temperatures : np.ndarray
+            Temperatures in deg C, any shape
+
+        Returns
+        -------
+        np.ndarray
+            Times in seconds, NaN where transformation cannot occur
+        """
+        b = self.b_values(temperatures)
+        if fraction <= 0 or fraction >= 1:
+            return np.full(b.shape, np.nan)
+        log_term = math.log(1.0 / (1.0 - fraction))
+        with np.errstate(divide="ignore"):
+            times = (log_term / b) ** (1.0 / self.n)
+        return np.where(b > 0, times, np.nan)
+
     def transformation_rate(self, time: float, temperature: float) -> float:
         """Calculate instantaneous transformation rate dX/dt.
 
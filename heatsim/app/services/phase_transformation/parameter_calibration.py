@@ -7,11 +7,14 @@ test data. Supports:
 """
 
 import math
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from scipy.optimize import curve_fit
 
-from .jmak_model import JMAKModel, fit_jmak_parameters
+from .jmak_model import fit_jmak_parameters
 
 
 def calibrate_isothermal(data_points: list[dict], phase: str) -> tuple[float, str, dict]:
@@ -105,14 +108,104 @@ def calibrate_b_function(
     raise ValueError(f"Unknown model type: {model_type}")
 
 
+# Steps of the simulated linear cooling curve per measured cooling rate
+CCT_OBJECTIVE_STEPS = 500
+
+# ln of the JMAK exponent b * t^n at 1% transformed
+_LOG_START_EXPONENT = math.log(math.log(1.0 / 0.99))
+
+
+class CCTStartObjective:
+    """Squared error of predicted vs measured start temperatures (picklable).
+
+    Cools linearly from 900 to 25 deg C at every measured rate and finds
+    where the isothermal JMAK fraction with a Gaussian b(T) first reaches
+    1%. All cooling curves are evaluated together as one array; with
+    ``vectorized=True`` differential evolution passes the whole population
+    as columns, evaluated in the same call.
+
+    Parameters
+    ----------
+    cooling_rates : array-like
+        Measured cooling rates (K/s)
+    start_temps : array-like
+        Measured start temperatures (deg C)
+    """
+
+    def __init__(self, cooling_rates, start_temps):
+        rates = np.asarray(cooling_rates, dtype=float)
+        self.start_temps = np.asarray(start_temps, dtype=float)
+        progress = np.linspace(0.0, 1.0, CCT_OBJECTIVE_STEPS)[1:, np.newaxis]
+        # (step, rate) grids; the first step (t = 0) never transforms
+        self.times = progress * ((900 - 25) / rates)
+        self.temperatures = 900 - rates * self.times
+        self.log_times = np.log(self.times)
+
+    def __call__(self, params: np.ndarray) -> float | np.ndarray:
+        """Error of one parameter vector (4,) or of a population (4, S)."""
+        params = np.asarray(params, dtype=float)
+        single = params.ndim == 1
+        n, b_max, t_nose, sigma = (p[:, np.newaxis, np.newaxis] for p in params.reshape(4, -1))
+
+        # X >= 0.01  <=>  b * t^n >= ln(1/0.99), compared in log space
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            log_b = np.log(b_max) - 0.5 * ((self.temperatures - t_nose) / sigma) ** 2
+            reached = log_b + n * self.log_times >= _LOG_START_EXPONENT
+        found = reached.any(axis=1)
+        first = reached.argmax(axis=1)
+        predicted = self.temperatures[first, np.arange(self.temperatures.shape[1])]
+        error = np.where(found, (predicted - self.start_temps) ** 2, 0.0).sum(axis=1)
+
+        invalid = (n <= 0) | (b_max <= 0) | (sigma <= 0)
+        error = np.where(invalid.reshape(-1), 1e10, error)
+        return float(error[0]) if single else error
+
+
+class ThreadedObjective:
+    """Splits the population of a vectorized objective over a thread pool.
+
+    numpy releases the GIL in the array operations of the objective, so
+    threads scale where a process pool is unavailable (daemonic job
+    workers cannot start child processes).
+
+    Parameters
+    ----------
+    objective : callable
+        Vectorized objective: (4,) -> float, (4, S) -> (S,)
+    executor : ThreadPoolExecutor
+        Pool the population chunks are evaluated on
+    n_chunks : int
+        Number of chunks the population columns are split into
+    """
+
+    def __init__(self, objective, executor: ThreadPoolExecutor, n_chunks: int):
+        self.objective = objective
+        self.executor = executor
+        self.n_chunks = n_chunks
+
+    def __call__(self, params: np.ndarray) -> float | np.ndarray:
+        params = np.asarray(params, dtype=float)
+        if params.ndim == 1:
+            return self.objective(params)
+        n_chunks = min(self.n_chunks, params.shape[1])
+        chunks = np.array_split(params, n_chunks, axis=1)
+        return np.concatenate(list(self.executor.map(self.objective, chunks)))
+
+
 def calibrate_from_cct(
-    cct_data_points: list[dict], n_initial: float = 2.0, model_type: str = "gaussian"
+    cct_data_points: list[dict],
+    n_initial: float = 2.0,
+    model_type: str = "gaussian",
+    workers=1,
+    progress_callback: Callable[[float, float], bool | None] | None = None,
+    patience: int | None = None,
+    maxiter: int = 200,
 ) -> tuple[float, str, dict]:
     """Calibrate JMAK parameters from CCT dilatometry data.
 
     Uses an optimization approach: for each candidate (n, b_params),
-    runs Scheil additivity at the experimental cooling rates and
-    minimizes the error in predicted vs measured start/finish temperatures.
+    simulates the experimental cooling rates and minimizes the error in
+    predicted vs measured start temperatures (`CCTStartObjective`).
 
     Parameters
     ----------
@@ -123,6 +216,18 @@ def calibrate_from_cct(
         Initial guess for Avrami exponent
     model_type : str
         'gaussian' b-function model
+    workers : int
+        Threads the population of each generation is split over
+        (`ThreadedObjective`; -1: all CPUs). 1 evaluates the whole
+        population in one vectorized call on the calling thread.
+    progress_callback : callable, optional
+        Called after each generation with (fraction of maxiter done, best
+        error so far); returning True stops the optimization
+    patience : int, optional
+        Stop early when the best error has not improved by more than 0.1%
+        for this many generations
+    maxiter : int
+        Maximum number of generations
 
     Returns
     -------
@@ -133,9 +238,6 @@ def calibrate_from_cct(
 
     cooling_rates = np.array([d["cooling_rate"] for d in cct_data_points])
     start_temps = np.array([d["start_temperature"] for d in cct_data_points])
-    finish_temps = np.array(
-        [d.get("finish_temperature", d["start_temperature"] - 50) for d in cct_data_points]
-    )
 
     # Initial estimates from CCT data
     # Nose temperature: temperature where start occurs at shortest time
@@ -149,32 +251,18 @@ def calibrate_from_cct(
     t_start_est = (900 - start_temps[min_cr_idx]) / cooling_rates[min_cr_idx]
     b_max_init = max(math.log(100) / max(t_start_est**n_initial, 0.01), 1e-10)
 
-    def objective(params):
-        n, b_max, t_nose, sigma = params
-        if n <= 0 or b_max <= 0 or sigma <= 0:
-            return 1e10
-
-        b_func = lambda T: b_max * math.exp(-0.5 * ((T - t_nose) / sigma) ** 2)
-        model = JMAKModel(n=n, b_func=b_func)
-
-        error = 0.0
-        for i, cr in enumerate(cooling_rates):
-            # Simulate cooling
-            delta_T = 900 - 25
-            total_time = delta_T / cr
-            n_steps = 500
-            times = np.linspace(0, total_time, n_steps)
-            temperatures = 900 - cr * times
-
-            # Find predicted start temperature (1% fraction)
-            for j in range(1, n_steps):
-                frac = model.fraction_transformed(times[j], temperatures[j])
-                if frac >= 0.01:
-                    pred_start = temperatures[j]
-                    error += (pred_start - start_temps[i]) ** 2
-                    break
-
-        return error
+    objective = CCTStartObjective(cooling_rates, start_temps)
+    history = []
+
+    def callback(xk, convergence=None):
+        best = objective(xk)
+        history.append(best)
+        stop = False
+        if progress_callback is not None:
+            stop = bool(progress_callback(min(len(history) / maxiter, 1.0), best))
+        if patience and len(history) > patience:
+            stop = stop or best >= history[-patience - 1] * (1 - 1e-3)
+        return stop
 
     from scipy.optimize import differential_evolution
 
@@ -185,9 +273,19 @@ def calibrate_from_cct(
         (20, 300),  # sigma
     ]
 
+    n_threads = (os.cpu_count() or 1) if workers == -1 else max(int(workers), 1)
+    executor = ThreadPoolExecutor(n_threads) if n_threads > 1 else None
     try:
         result = differential_evolution(
-            objective, bounds, maxiter=200, tol=0.01, seed=42, polish=True
+            objective if executor is None else ThreadedObjective(objective, executor, n_threads),
+            bounds,
+            maxiter=maxiter,
+            tol=0.01,
+            seed=42,
+            polish=True,
+            callback=callback,
+            vectorized=True,
+            updating="deferred",
         )
         n_opt, b_max_opt, t_nose_opt, sigma_opt = result.x
         return (
@@ -210,6 +308,9 @@ def calibrate_from_cct(
                 "sigma": float(sigma_init),
             },
         )
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def extract_jmak_from_isothermal_curve(
@@ -0,0 +1,140 @@
+"""Process-wide cache of compiled phase transformation models per steel grade.
+
+Building the JMAK and martensite models of a grade takes three queries
+(TTT parameters, JMAK rows, martensite row) and a b(T) closure per phase.
+`get_phase_models` does it once per grade and parameter version and keeps
+the result as plain Python objects detached from the ORM session, so
+predictors built by later requests, jobs or threads share it.
+
+The version is TTTParameters.params_version, a random token replaced
+whenever MaterialChangeTracker logs a change to TTT, JMAK or martensite
+parameters (`invalidate_phase_models`). Checking it is one indexed lookup,
+and because it lives in the database, worker processes see edits made in
+the web process.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+
+from app.extensions import db
+from app.models.ttt_parameters import TTTParameters, new_params_version
+
+from .jmak_model import JMAKModel, create_b_function
+from .martensite_model import KoistinenMarburgerModel
+
+logger = logging.getLogger(__name__)
+
+# {steel_grade_id: (params_version, PhaseModels)}
+_cache: dict[int, tuple[str, "PhaseModels"]] = {}
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PhaseModels:
+    """Compiled transformation models of one steel grade.
+
+    Attributes
+    ----------
+    jmak_models : dict
+        {phase: JMAKModel} for every phase with valid JMAK parameters
+    martensite_model : KoistinenMarburgerModel or None
+        Koistinen-Marburger model from the martensite parameters or Ms/Mf
+    critical_temps : dict
+        {'Ae1', 'Ae3', 'Bs', 'Ms', 'Mf': float or None}
+    austenitizing_temperature : float or None
+        Reference austenitizing temperature in deg C
+    version : str or None
+        params_version the models were built from
+    ttt_parameters_id : int or None
+        TTTParameters row the models were built from
+    """
+
+    jmak_models: dict[str, JMAKModel] = field(default_factory=dict)
+    martensite_model: KoistinenMarburgerModel | None = None
+    critical_temps: dict[str, float | None] = field(default_factory=dict)
+    austenitizing_temperature: float | None = None
+    version: str | None = None
+    ttt_parameters_id: int | None = None
+
+
+def build_phase_models(ttt_params) -> PhaseModels:
+    """Compile the models of a TTTParameters row (no caching)."""
+    jmak_models = {}
+    for jmak in ttt_params.jmak_parameters.all():
+        try:
+            b_func = create_b_function(jmak.b_model_type, jmak.b_params_dict)
+            temp_range = None
+            if jmak.temp_range_min is not None and jmak.temp_range_max is not None:
+                temp_range = (jmak.temp_range_min, jmak.temp_range_max)
+            jmak_models[jmak.phase] = JMAKModel(
+                n=jmak.n_value, b_func=b_func, temp_range=temp_range
+            )
+        except Exception as e:
+            logger.warning("Failed to build JMAK model for %s: %s", jmak.phase, e)
+
+    martensite_model = None
+    mart_params = ttt_params.martensite_parameters
+    if mart_params:
+        martensite_model = KoistinenMarburgerModel(
+            ms=mart_params.ms, mf=mart_params.mf, alpha=mart_params.alpha_m
+        )
+    elif ttt_params.ms:
+        martensite_model = KoistinenMarburgerModel(ms=ttt_params.ms, mf=ttt_params.mf)
+
+    return PhaseModels(
+        jmak_models=jmak_models,
+        martensite_model=martensite_model,
+        critical_temps=ttt_params.temps_dict,
+        austenitizing_temperature=ttt_params.austenitizing_temperature,
+        version=ttt_params.params_version,
+        ttt_parameters_id=ttt_params.id,
+    )
+
+
+def get_phase_models(steel_grade_id: int) -> PhaseModels | None:
+    """Compiled models of a grade, cached per parameter version.
+
+    Returns
+    -------
+    PhaseModels or None
+        None if the grade has no TTT parameters
+    """
+    row = (
+        db.session.query(TTTParameters.id, TTTParameters.params_version)
+        .filter_by(steel_grade_id=steel_grade_id)
+        .first()
+    )
+    if row is None:
+        return None
+
+    with _cache_lock:
+        cached = _cache.get(steel_grade_id)
+    if cached is not None and row.params_version is not None and cached[0] == row.params_version:
+        return cached[1]
+
+    models = build_phase_models(db.session.get(TTTParameters, row.id))
+    # Rows from before params_version existed have no token: never cached
+    if row.params_version is not None:
+        with _cache_lock:
+            _cache[steel_grade_id] = (row.params_version, models)
+    return models
+
+
+def invalidate_phase_models(steel_grade_id: int) -> None:
+    """Give a grade's TTT parameters a new version and drop its cached models.
+
+    The new version is written in the caller's session and takes effect
+    for other processes when that session commits.
+    """
+    TTTParameters.query.filter_by(steel_grade_id=steel_grade_id).update(
+        {TTTParameters.params_version: new_params_version()}, synchronize_session="fetch"
+    )
+    with _cache_lock:
+        _cache.pop(steel_grade_id, None)
+
+
+def clear_phase_model_cache() -> None:
+    """Drop every cached model (tests, bulk imports)."""
+    with _cache_lock:
+        _cache.clear()
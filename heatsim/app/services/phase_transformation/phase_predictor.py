@@ -29,54 +29,31 @@ class PhasePredictor:
 
     def __init__(self, steel_grade):
         self.grade = steel_grade
-        self._ttt_params = None
+        self._models = None
         self._jmak_models = None
         self._martensite_model = None
         self._critical_temps = None
         self._loaded = False
 
     def _load(self):
-        """Lazy-load TTT parameters and build JMAK models."""
+        """Lazy-load the grade's compiled JMAK / martensite models.
+
+        Models are shared process-wide per parameter version (see
+        phase_models), so only the first predictor of a grade builds them.
+        """
         if self._loaded:
             return
         self._loaded = True
 
-        from app.models.ttt_parameters import TTTParameters
-
-        from .jmak_model import JMAKModel, create_b_function
-        from .martensite_model import KoistinenMarburgerModel
+        from .phase_models import get_phase_models
 
-        self._ttt_params = TTTParameters.query.filter_by(steel_grade_id=self.grade.id).first()
-
-        if self._ttt_params is None:
+        self._models = get_phase_models(self.grade.id)
+        if self._models is None:
             return
 
-        # Build critical temps dict
-        self._critical_temps = self._ttt_params.temps_dict
-
-        # Build JMAK models for each phase
-        self._jmak_models = {}
-        for jmak in self._ttt_params.jmak_parameters.all():
-            try:
-                b_func = create_b_function(jmak.b_model_type, jmak.b_params_dict)
-                temp_range = None
-                if jmak.temp_range_min is not None and jmak.temp_range_max is not None:
-                    temp_range = (jmak.temp_range_min, jmak.temp_range_max)
-                model = JMAKModel(n=jmak.n_value, b_func=b_func, temp_range=temp_range)
-                self._jmak_models[jmak.phase] = model
-            except Exception as e:
-                logger.warning("Failed to build JMAK model for %s: %s", jmak.phase, e)
-
-        # Build martensite model
-        mart_params = self._ttt_params.martensite_parameters
-        if mart_params:
-            self._martensite_model = KoistinenMarburgerModel(
-                ms=mart_params.ms, mf=mart_params.mf, alpha=mart_params.alpha_m
-            )
-        elif self._ttt_params.ms:
-            self._martensite_model = KoistinenMarburgerModel(
-                ms=self._ttt_params.ms, mf=self._ttt_params.mf
-            )
+        self._critical_temps = self._models.critical_temps
+        self._jmak_models = self._models.jmak_models
+        self._martensite_model = self._models.martensite_model
 
     @property
     def is_available(self) -> bool:
@@ -138,6 +115,51 @@ class PhasePredictor:
         tracker = PhaseTracker(diagram)
         return tracker.predict_phases(times, temperatures, t8_5)
 
+    def predict_phases(
+        self, times: np.ndarray, temperatures: np.ndarray, t8_5: float | None = None
+    ) -> PhaseResult:
+        """Predict phases at one position (same as `predict_phases_scheil`).
+
+        Lets a predictor stand in for a PhaseTracker in hardness prediction.
+        """
+        return self.predict_phases_scheil(times, temperatures, t8_5)
+
+    def predict_phases_field(
+        self, times: np.ndarray, temperatures: np.ndarray, t8_5: np.ndarray | None = None
+    ) -> dict[str, np.ndarray]:
+        """Predict final phase fractions at every position of a field (Tier 2).
+
+        Runs Scheil additivity over all positions at once; falls back to
+        the empirical PhaseTracker field form if JMAK is not available.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Time array (seconds), shape (n_times,)
+        temperatures : np.ndarray
+            Temperature field (deg C), shape (n_times, n_positions)
+        t8_5 : np.ndarray, optional
+            Cooling time 800-500 deg C per position (fallback only)
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Phase name -> fraction per position, shape (n_positions,)
+        """
+        self._load()
+
+        if self._jmak_models and len(self._jmak_models) > 0:
+            try:
+                return self._predict_scheil_field(times, temperatures)
+            except Exception as e:
+                logger.warning("Scheil field prediction failed, falling back: %s", e)
+
+        from app.services.phase_tracker import PhaseTracker
+
+        diagram = self.grade.phase_diagrams.first()
+        tracker = PhaseTracker(diagram)
+        return tracker.predict_phases_field(times, temperatures, t8_5)
+
     def _predict_scheil(self, times: np.ndarray, temperatures: np.ndarray) -> PhaseResult:
         """Internal Scheil prediction."""
         from .scheil_additivity import calculate_cct_transformation
@@ -155,9 +177,38 @@ class PhasePredictor:
             retained_austenite=result.final_fractions.get("retained_austenite", 0.0),
         ).normalize()
 
-    def get_cct_curves(self) -> dict | None:
+    def _predict_scheil_field(
+        self, times: np.ndarray, temperatures: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Internal Scheil prediction over a field, normalized like PhaseResult."""
+        from .scheil_additivity import calculate_cct_transformation_field
+
+        result = calculate_cct_transformation_field(
+            times, temperatures, self._jmak_models, self._martensite_model, self._critical_temps
+        )
+
+        names = list(PhaseResult().to_dict())
+        n_positions = result.n_positions
+        fractions = np.array(
+            [
+                np.broadcast_to(
+                    np.asarray(result.final_fractions.get(name, 0.0), dtype=float), n_positions
+                )
+                for name in names
+            ]
+        )
+        total = fractions.sum(axis=0)
+        fractions = np.divide(fractions, total, out=fractions.copy(), where=total > 0)
+        return {name: fractions[i] for i, name in enumerate(names)}
+
+    def get_cct_curves(self, store: bool = True) -> dict | None:
         """Get CCT curves using three-tier fallback.
 
+        Parameters
+        ----------
+        store : bool
+            Store JMAK curves generated on a cache miss (commits the session)
+
         Returns
         -------
         dict or None
@@ -175,18 +226,11 @@ class PhasePredictor:
         self._load()
         if self._jmak_models and len(self._jmak_models) > 0:
             try:
-                from .cct_generator import generate_cct_from_ttt
+                from app.models.ttt_parameters import CURVE_TYPE_CCT
 
-                austenitizing = 900.0
-                if self._ttt_params and self._ttt_params.austenitizing_temperature:
-                    austenitizing = self._ttt_params.austenitizing_temperature
+                from .diagram_cache import get_diagram
 
-                curves = generate_cct_from_ttt(
-                    self._jmak_models,
-                    self._martensite_model,
-                    self._critical_temps,
-                    austenitizing_temp=austenitizing,
-                )
+                curves = get_diagram(self._models, CURVE_TYPE_CCT, store=store)
                 if curves:
                     logger.debug("Using JMAK CCT curves for %s", self.grade.designation)
                     return curves
@@ -211,9 +255,14 @@ class PhasePredictor:
 
         return None
 
-    def get_ttt_curves(self) -> dict | None:
+    def get_ttt_curves(self, store: bool = True) -> dict | None:
         """Get TTT curves (JMAK only, or digitized).
 
+        Parameters
+        ----------
+        store : bool
+            Store JMAK curves generated on a cache miss (commits the session)
+
         Returns
         -------
         dict or None
@@ -230,9 +279,11 @@ class PhasePredictor:
         self._load()
         if self._jmak_models and len(self._jmak_models) > 0:
             try:
-                from .ttt_generator import generate_ttt_for_plotting
+                from app.models.ttt_parameters import CURVE_TYPE_TTT
+
+                from .diagram_cache import get_diagram
 
-                return generate_ttt_for_plotting(self._jmak_models, self._critical_temps)
+                return get_diagram(self._models, CURVE_TYPE_TTT, store=store)
             except Exception as e:
                 logger.warning("TTT generation failed: %s", e)
 
@@ -243,8 +294,8 @@ class PhasePredictor:
         self._load()
 
         # From TTT parameters
-        if self._ttt_params:
-            return self._ttt_params.temps_dict
+        if self._models:
+            return dict(self._models.critical_temps)
 
         # From phase diagram
         diagram = self.grade.phase_diagrams.first()
@@ -9,6 +9,9 @@ where tau(T) is the isothermal incubation time at temperature T.
 
 For phase fraction tracking during continuous cooling, we integrate
 the JMAK rate at each temperature step using a virtual-time approach.
+`calculate_cct_transformation` follows one cooling curve;
+`calculate_cct_transformation_field` runs the same recursion for every
+position of a (time, position) temperature field at once.
 """
 
 from dataclasses import dataclass, field
@@ -47,6 +50,30 @@ class CoolingTransformationResult:
     transformation_finish: dict[str, tuple[float, float]] = field(default_factory=dict)
 
 
+def _phase_temp_limits(
+    jmak_models: dict[str, JMAKModel], critical_temps: dict[str, float] | None
+) -> dict[str, tuple[float, float]]:
+    """Temperature window (T_min, T_max) of each modelled diffusional phase.
+
+    Phase ordering: transformations occur in sequence as temperature drops
+    ferrite (below Ae1), pearlite (below Ae1), bainite (below Bs),
+    martensite (below Ms, athermal). Returned in that order.
+    """
+    ct = critical_temps or {}
+    ae1 = ct.get("Ae1", 727)
+    bs = ct.get("Bs", 550)
+    ms = ct.get("Ms", 350)
+
+    limits = {}
+    if "ferrite" in jmak_models:
+        limits["ferrite"] = (bs + 20, ae1)
+    if "pearlite" in jmak_models:
+        limits["pearlite"] = (bs, ae1)
+    if "bainite" in jmak_models:
+        limits["bainite"] = (ms, bs)
+    return limits
+
+
 def calculate_cct_transformation(
     times: np.ndarray,
     temperatures: np.ndarray,
@@ -84,27 +111,9 @@ def calculate_cct_transformation(
         temperatures=temperatures,
     )
 
-    ct = critical_temps or {}
-    ae3 = ct.get("Ae3", 900)
-    ae1 = ct.get("Ae1", 727)
-    bs = ct.get("Bs", 550)
-    ms = ct.get("Ms", 350)
-
-    # Phase ordering: transformations occur in sequence as temperature drops
-    # ferrite (below Ae1), pearlite (below Ae1), bainite (below Bs),
-    # martensite (below Ms, athermal)
-    diffusional_phases = []
-    phase_temp_limits = {}
-
-    if "ferrite" in jmak_models:
-        diffusional_phases.append("ferrite")
-        phase_temp_limits["ferrite"] = (bs + 20, ae1)
-    if "pearlite" in jmak_models:
-        diffusional_phases.append("pearlite")
-        phase_temp_limits["pearlite"] = (bs, ae1)
-    if "bainite" in jmak_models:
-        diffusional_phases.append("bainite")
-        phase_temp_limits["bainite"] = (ms, bs)
+    ms = (critical_temps or {}).get("Ms", 350)
+    phase_temp_limits = _phase_temp_limits(jmak_models, critical_temps)
+    diffusional_phases = list(phase_temp_limits)
 
     # Initialize fraction arrays
     for phase in diffusional_phases:
@@ -211,6 +220,184 @@ def calculate_cct_transformation(
     return result
 
 
+@dataclass
+class FieldTransformationResult:
+    """Result of Scheil additivity over a (time, position) temperature field.
+
+    Attributes
+    ----------
+    times : np.ndarray
+        Time array (seconds), shape (n_times,) or (n_times, n_positions)
+    temperatures : np.ndarray
+        Temperature field (deg C), shape (n_times, n_positions)
+    final_fractions : dict of str -> np.ndarray
+        Final fraction of each phase at every position, shape (n_positions,)
+    phase_fractions : dict of str -> np.ndarray
+        Time-resolved fractions, shape (n_times, n_positions); only filled
+        when requested with ``store_history``
+    """
+
+    times: np.ndarray = field(default_factory=lambda: np.array([]))
+    temperatures: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))
+    final_fractions: dict[str, np.ndarray] = field(default_factory=dict)
+    phase_fractions: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def n_positions(self) -> int:
+        return self.temperatures.shape[1]
+
+    def fractions_at(self, position: int) -> dict[str, float]:
+        """Final phase fractions at one position."""
+        return {phase: float(f[position]) for phase, f in self.final_fractions.items()}
+
+
+def calculate_cct_transformation_field(
+    times: np.ndarray,
+    temperatures: np.ndarray,
+    jmak_models: dict[str, JMAKModel],
+    martensite_model: KoistinenMarburgerModel | None = None,
+    critical_temps: dict[str, float] | None = None,
+    store_history: bool = False,
+) -> FieldTransformationResult:
+    """Calculate phase transformations at every position of a cooling field.
+
+    Array form of `calculate_cct_transformation`: the virtual-time
+    recursion advances all positions together, one time step at a time.
+    b(T) is evaluated once over the whole field per phase and the phase
+    temperature windows become boolean masks, so each step is a handful of
+    NumPy operations on (n_positions,) arrays. Results match running
+    `calculate_cct_transformation` on each column.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Time array (seconds), shape (n_times,), monotonically increasing;
+        or shape (n_times, n_positions) for one time grid per position
+        (e.g. one column per cooling rate). Repeated times (zero steps)
+        leave a column unchanged, so shorter grids can be padded.
+    temperatures : np.ndarray
+        Temperature field (deg C), shape (n_times, n_positions)
+    jmak_models : dict
+        Phase name -> JMAKModel for each diffusional phase
+    martensite_model : KoistinenMarburgerModel, optional
+        Martensite transformation model
+    critical_temps : dict, optional
+        Critical temperatures {'Ae1', 'Ae3', 'Bs', 'Ms'}
+    store_history : bool
+        Also keep the time-resolved fractions of every position
+
+    Returns
+    -------
+    FieldTransformationResult
+    """
+    times = np.asarray(times, dtype=float)
+    temperatures = np.asarray(temperatures, dtype=float)
+    if temperatures.ndim == 1:
+        temperatures = temperatures[:, np.newaxis]
+    n_steps, n_pos = temperatures.shape
+    result = FieldTransformationResult(times=times, temperatures=temperatures)
+
+    ms = (critical_temps or {}).get("Ms", 350)
+    phase_temp_limits = _phase_temp_limits(jmak_models, critical_temps)
+    diffusional_phases = list(phase_temp_limits)
+
+    # Per-phase field quantities: rate parameter (0 where the model does not
+    # apply), where it is positive, a division-safe copy and the phase
+    # temperature window mask
+    b_fields, has_rate, b_safe, window, outside = {}, {}, {}, {}, {}
+    for phase, (t_min, t_max) in phase_temp_limits.items():
+        b = jmak_models[phase].b_values(temperatures)
+        b_fields[phase] = b
+        has_rate[phase] = b > 0
+        b_safe[phase] = np.where(has_rate[phase], b, 1.0)
+        window[phase] = (temperatures >= t_min) & (temperatures <= t_max)
+        outside[phase] = ~window[phase]
+
+    # Martensite fraction of available austenite at each (time, position)
+    if martensite_model is not None:
+        undercooling = martensite_model.ms - temperatures
+        f_martensite = np.where(
+            undercooling > 0,
+            np.clip(1.0 - np.exp(-martensite_model.alpha * undercooling), 0, 1),
+            0.0,
+        )
+        martensite_possible = temperatures < ms
+    else:
+        f_martensite = None
+
+    history = {}
+    if store_history:
+        for phase in [*diffusional_phases, "martensite"]:
+            history[phase] = np.zeros((n_steps, n_pos))
+        history["retained_austenite"] = np.ones((n_steps, n_pos))
+
+    fractions = {phase: np.zeros(n_pos) for phase in diffusional_phases}
+    virtual_times = {phase: np.zeros(n_pos) for phase in diffusional_phases}
+    martensite = np.zeros(n_pos)
+    total_diffusional = np.zeros(n_pos)
+
+    for i in range(1, n_steps):
+        dt = times[i] - times[i - 1]
+
+        # Austenite consumed by diffusional transformations up to the last step
+        austenite_available = 1.0 - total_diffusional
+        active = austenite_available > 0.001
+        austenite_safe = np.maximum(austenite_available, 0.001)
+
+        for phase in diffusional_phases:
+            n = jmak_models[phase].n
+            b = b_fields[phase][i]
+            rate = has_rate[phase][i]
+            prev = fractions[phase]
+            vt = virtual_times[phase]
+
+            # Outside the transformation range - reset virtual time
+            vt[active & outside[phase][i]] = 0.0
+            in_window = active & window[phase][i]
+            if not in_window.any():
+                continue
+
+            # 1. Virtual time that gives the current fraction at the new temperature
+            current = np.clip(prev / austenite_safe, 0.0, 0.999)
+            refit = in_window & rate & (current > 0.001)
+            if refit.any():
+                vt_refit = (np.log(1.0 / (1.0 - current)) / b_safe[phase][i]) ** (1.0 / n)
+                vt[refit] = vt_refit[refit]
+
+            # 2. Advance virtual time by dt (scalar, or one step per position)
+            vt += np.where(in_window, dt, 0.0)
+
+            # 3. Fraction at this temperature with the advanced time
+            exponent = np.minimum(b * np.maximum(vt, 0.0) ** n, 700)
+            new = np.where(rate & (vt > 0), 1.0 - np.exp(-exponent), 0.0)
+            new_abs = np.minimum(np.maximum(new * austenite_available, prev), austenite_available)
+            fractions[phase] = np.where(in_window, new_abs, prev)
+
+        if diffusional_phases:
+            total_diffusional = np.minimum(sum(fractions.values()), 1.0)
+
+        # Martensite (athermal - depends only on temperature, not time)
+        austenite_for_martensite = 1.0 - total_diffusional
+        if f_martensite is not None:
+            forms = martensite_possible[i] & (austenite_for_martensite > 0.001)
+            martensite = np.where(forms, f_martensite[i] * austenite_for_martensite, martensite)
+
+        if store_history:
+            for phase in diffusional_phases:
+                history[phase][i] = fractions[phase]
+            history["martensite"][i] = martensite
+            history["retained_austenite"][i] = np.maximum(1.0 - total_diffusional - martensite, 0.0)
+
+    for phase in diffusional_phases:
+        result.final_fractions[phase] = fractions[phase]
+    result.final_fractions["martensite"] = martensite
+    result.final_fractions["retained_austenite"] = np.maximum(
+        1.0 - total_diffusional - martensite, 0.0
+    )
+    result.phase_fractions = history
+    return result
+
+
 def calculate_scheil_integral(
     times: np.ndarray,
     temperatures: np.ndarray,
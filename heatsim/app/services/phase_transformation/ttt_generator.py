@@ -4,7 +4,6 @@ Generates isothermal TTT (Time-Temperature-Transformation) diagram data
 at 1% (start), 50%, and 99% (finish) transformation contours.
 """
 
-
 import numpy as np
 
 from .jmak_model import JMAKModel
@@ -69,15 +68,10 @@ def generate_ttt_diagram(
 
         for frac in fractions:
             label = fraction_labels.get(frac, f"f{frac:.2f}")
-            points = []
-
-            for T in temperatures:
-                time = model.time_to_fraction(frac, float(T))
-                if time is not None and time > 0 and time < 1e8:
-                    points.append([float(time), float(T)])
-
-            if points:
-                phase_curves[label] = points
+            times = model.times_to_fraction(frac, temperatures)
+            valid = (times > 0) & (times < 1e8)
+            if valid.any():
+                phase_curves[label] = np.column_stack([times[valid], temperatures[valid]]).tolist()
 
         if phase_curves:
             result[phase] = phase_curves
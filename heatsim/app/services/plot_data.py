@@ -9,14 +9,22 @@ Each builder returns a JSON-serializable dict:
 or None when the simulation has no data for that plot. The traces mirror
 the matplotlib plots in app/services/visualization.py so the interactive
 charts show the same information as the stored PNGs (used in reports).
+
+Builders of time-axis simulation plots (`full_cycle`, `phase_curve`,
+`dtdt_time`) also accept a time window (t_min, t_max): the traces then
+cover only that window, at full resolution when it fits MAX_TRACE_POINTS.
+Their dicts carry "range_query": True so the front end re-fetches the
+visible range when the user zooms.
 """
 
 import numpy as np
 
+from app.models.simulation import minmax_indices
+from app.services.measured_series import channel_series, plot_channels
 from app.services.visualization import (
     FOUR_POINT_COLORS,
     FOUR_POINT_LABELS,
-    moving_average,
+    measured_rate_series,
 )
 
 MAX_TRACE_POINTS = 2000
@@ -47,19 +55,15 @@ MEASURED_COLORS = [
 
 
 def _decimate(xs, ys, max_points=MAX_TRACE_POINTS):
-    """Stride-decimate paired arrays, always keeping the last point."""
-    xs = list(xs)
-    ys = list(ys)
+    """Min/max-downsample paired arrays, keeping both ends and every peak.
+
+    Accepts lists or arrays; only the kept points are converted to lists.
+    """
+    xs = np.asarray(xs)
+    ys = np.asarray(ys)
     n = min(len(xs), len(ys))
-    if n <= max_points:
-        return xs[:n], ys[:n]
-    step = max(1, n // max_points)
-    dx = xs[:n:step]
-    dy = ys[:n:step]
-    if dx[-1] != xs[n - 1]:
-        dx.append(xs[n - 1])
-        dy.append(ys[n - 1])
-    return dx, dy
+    keep = minmax_indices(ys[:n], max_points)
+    return xs[keep].tolist(), ys[keep].tolist()
 
 
 def _line_trace(xs, ys, name, color=None, dash=None, width=2):
@@ -95,23 +99,53 @@ def _full_cycle_result(sim):
     return _latest_results(sim).filter_by(result_type="full_cycle").first()
 
 
-def _position_traces(times, data_dict, fallback_values=None):
+def _position_dict(series, values):
+    if series:
+        return {key: series[key] for key in POSITION_KEYS if len(series.get(key, ()))}
+    return {"center": values} if values is not None and len(values) else {}
+
+
+def _stored_series(row):
+    """{position: temperature array} of a result row, center-only for legacy rows."""
+    return _position_dict(row.position_series, row.value_series)
+
+
+def _windowed(t_min, t_max):
+    return t_min is not None or t_max is not None
+
+
+def _window_series(row, t_min, t_max, max_points=None):
+    """(times, {position: temperatures}) of a row within [t_min, t_max]."""
+    times, values, series = row.series_window(
+        -np.inf if t_min is None else t_min,
+        np.inf if t_max is None else t_max,
+        max_points,
+    )
+    return times, _position_dict(series, values)
+
+
+def _trace_series(row, t_min=None, t_max=None):
+    """(times, {position: temperatures}) sized for a trace.
+
+    Uses the min/max level precomputed when the series was saved, so long
+    runs cost the same as short ones; falls back to the full series. With a
+    time window, the finest level that fits the window is used.
+    """
+    if _windowed(t_min, t_max):
+        return _window_series(row, t_min, t_max, MAX_TRACE_POINTS)
+    level = row.series_level(MAX_TRACE_POINTS)
+    if level is None:
+        return row.time_series, _stored_series(row)
+    times, values, series = level
+    return times, _position_dict(series, values)
+
+
+def _position_traces(times, series):
     """Build one trace per stored radial position (or a single center trace)."""
-    traces = []
-    if data_dict.get("positions"):
-        for key in POSITION_KEYS:
-            values = data_dict.get(key)
-            if values:
-                traces.append(
-                    _line_trace(times, values, FOUR_POINT_LABELS[key], FOUR_POINT_COLORS[key])
-                )
-    elif fallback_values:
-        traces.append(
-            _line_trace(
-                times, fallback_values, FOUR_POINT_LABELS["center"], FOUR_POINT_COLORS["center"]
-            )
-        )
-    return traces
+    return [
+        _line_trace(times, values, FOUR_POINT_LABELS[key], FOUR_POINT_COLORS[key])
+        for key, values in series.items()
+    ]
 
 
 def _furnace_trace(furnace_segments):
@@ -222,17 +256,17 @@ def _transformation_shapes(sim):
     return shapes, annotations
 
 
-def full_cycle(sim):
+def full_cycle(sim, t_min=None, t_max=None):
     """Full heat-treatment cycle: 4 positions + furnace profile + phase regions."""
     result = _full_cycle_result(sim)
     if not result:
         return None
-    times = result.time_array
-    if not times:
+    times, series = _trace_series(result, t_min, t_max)
+    if not len(times):
         return None
 
     data = result.data_dict
-    traces = _position_traces(times, data, fallback_values=result.value_array)
+    traces = _position_traces(times, series)
     if not traces:
         return None
 
@@ -253,10 +287,10 @@ def full_cycle(sim):
     annotations.extend(trans_annotations)
 
     # t8/5 annotation on the center curve
-    center = data.get("center") or result.value_array
-    if center:
-        center_arr = np.array(center, dtype=float)
-        times_arr = np.array(times, dtype=float)
+    center = series.get("center")
+    if center is not None:
+        center_arr = center
+        times_arr = times
         if center_arr.max() > 800 and center_arr.min() < 500:
             idx_800 = np.where(center_arr <= 800)[0]
             idx_500 = np.where(center_arr <= 500)[0]
@@ -279,10 +313,10 @@ def full_cycle(sim):
         layout["shapes"] = shapes
     if annotations:
         layout["annotations"] = annotations
-    return {"traces": traces, "layout": layout}
+    return {"traces": traces, "layout": layout, "range_query": True}
 
 
-def phase_curve(sim, phase):
+def phase_curve(sim, phase, t_min=None, t_max=None):
     """Temperature vs time for one process phase (all stored positions)."""
     rows = [
         r
@@ -293,42 +327,43 @@ def phase_curve(sim, phase):
         return None
     traces = []
     for row in rows:
-        times = row.time_array
-        if not times:
+        times, series = _trace_series(row, t_min, t_max)
+        if not len(times):
             continue
-        traces.extend(_position_traces(times, row.data_dict, fallback_values=row.value_array))
+        traces.extend(_position_traces(times, series))
     if not traces:
         return None
     layout = _layout(f"{phase.title()} - Temperature vs Time", "Time (s)", "Temperature (°C)")
-    return {"traces": traces, "layout": layout}
+    return {"traces": traces, "layout": layout, "range_query": True}
 
 
-def _phase_position_series(sim, phase):
-    """(times, {position: temps}) for a phase, falling back to center-only."""
+def _phase_position_series(sim, phase, t_min=None, t_max=None):
+    """(times, {position: temps}) for a phase, falling back to center-only.
+
+    With a time window, only the full-resolution samples of that window.
+    """
     rows = [
         r
         for r in _latest_results(sim).filter_by(phase=phase).all()
         if r.result_type in ("cooling_curve", "heating_curve")
     ]
     for row in rows:
-        times = row.time_array
-        if not times:
-            continue
-        data = row.data_dict
-        if data.get("positions"):
-            series = {k: data[k] for k in POSITION_KEYS if data.get(k)}
-        elif row.value_array:
-            series = {"center": row.value_array}
+        if _windowed(t_min, t_max):
+            times, series = _window_series(row, t_min, t_max)
         else:
+            times, series = row.time_series, _stored_series(row)
+        if not len(times):
+            continue
+        if not series:
             continue
         return times, series
     return None, None
 
 
-def dtdt_time(sim, phase):
+def dtdt_time(sim, phase, t_min=None, t_max=None):
     """dT/dt vs time for one process phase, derived from stored temperatures."""
-    times, series = _phase_position_series(sim, phase)
-    if not times or len(times) < 3:
+    times, series = _phase_position_series(sim, phase, t_min, t_max)
+    if times is None or len(times) < 3:
         return None
     times_arr = np.array(times, dtype=float)
     dt = np.diff(times_arr)
@@ -346,13 +381,13 @@ def dtdt_time(sim, phase):
             )
         )
     layout = _layout(f"dT/dt vs Time ({phase.title()})", "Time (s)", "dT/dt (°C/s)")
-    return {"traces": traces, "layout": layout}
+    return {"traces": traces, "layout": layout, "range_query": True}
 
 
 def dtdt_temp(sim, phase):
     """dT/dt vs temperature for one process phase."""
     times, series = _phase_position_series(sim, phase)
-    if not times or len(times) < 3:
+    if times is None or len(times) < 3:
         return None
     times_arr = np.array(times, dtype=float)
     dt = np.diff(times_arr)
@@ -375,9 +410,12 @@ def dtdt_temp(sim, phase):
 
 
 def _mass_and_cp(sim):
-    """(mass, cp_func) from geometry + material, mirroring simulation_runner."""
+    """(mass, cp_func) from geometry + material, mirroring simulation_runner.
+
+    cp_func is a compiled property: it evaluates whole temperature arrays.
+    """
     from app.services import create_geometry
-    from app.services.property_evaluator import evaluate_scalar
+    from app.services.property_evaluator import compile_property, evaluate_scalar
 
     geometry = create_geometry(sim.geometry_type, sim.geometry_dict)
     grade = sim.steel_grade
@@ -387,20 +425,16 @@ def _mass_and_cp(sim):
     mass = geometry.volume * density
 
     cp_prop = grade.get_property("specific_heat") if grade else None
-
-    def cp_func(temp):
-        return evaluate_scalar(cp_prop, 500.0, temperature=temp)
-
-    return mass, cp_func
+    return mass, compile_property(cp_prop, 500.0)
 
 
 def absorbed_power(sim, phase):
     """Absorbed power (m·Cp·dT/dt) vs time for heating/tempering phases."""
     times, series = _phase_position_series(sim, phase)
-    if not times or len(times) < 3:
+    if times is None or len(times) < 3:
         return None
     temps = series.get("center")
-    if not temps:
+    if temps is None:
         return None
     try:
         mass, cp_func = _mass_and_cp(sim)
@@ -412,7 +446,7 @@ def absorbed_power(sim, phase):
     dt[dt == 0] = 1e-6
     dTdt = np.diff(temps_arr) / dt
     temp_mid = 0.5 * (temps_arr[:-1] + temps_arr[1:])
-    cp_values = np.array([cp_func(t) for t in temp_mid])
+    cp_values = cp_func(temp_mid)
     power = mass * cp_values * dTdt
     mid = 0.5 * (times_arr[:-1] + times_arr[1:])
     total_energy_kj = float(np.trapz(np.clip(power, 0, None), mid)) / 1000.0
@@ -434,18 +468,7 @@ def absorbed_power(sim, phase):
 
 
 def _measured_channels_for_step(sim, step):
-    measured_list = [m for m in sim.measured_data.all() if m.process_step == step]
-    channels = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            channels.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.get_channel_times(channel),
-                    "temps": m.channels[channel],
-                }
-            )
-    return channels
+    return plot_channels(m for m in sim.measured_data.all() if m.process_step == step)
 
 
 def measured_tc(sim, step):
@@ -464,21 +487,13 @@ def measured_tc(sim, step):
 
 
 def _measured_dtdt_series(channels, smooth_window=20):
-    """[(mid_times, dTdt, temp_mid, name)] mirroring the matplotlib smoothing."""
+    """[(times, dTdt, temps, name)] mirroring the matplotlib smoothing."""
     series = []
     for c in channels:
-        times = np.array(c["times"], dtype=float)
-        temps = np.array(c["temps"], dtype=float)
-        if times.size < 3:
+        if len(c["times"]) < 3:
             continue
-        dt = np.diff(times)
-        dt[dt == 0] = 1e-6
-        dTdt = np.diff(temps) / dt
-        if smooth_window > 1:
-            dTdt = moving_average(dTdt, smooth_window)
-        mid = 0.5 * (times[:-1] + times[1:])
-        temp_mid = 0.5 * (temps[:-1] + temps[1:])
-        series.append((mid, dTdt, temp_mid, c["name"]))
+        times, dTdt, temps = measured_rate_series(c, smooth_window)
+        series.append((times, dTdt, temps, c["name"]))
     return series
 
 
@@ -489,9 +504,7 @@ def measured_dtdt(sim, step):
     if not series:
         return None
     traces = [
-        _line_trace(
-            mid.tolist(), dTdt.tolist(), name, MEASURED_COLORS[i % len(MEASURED_COLORS)], width=1.5
-        )
+        _line_trace(mid, dTdt, name, MEASURED_COLORS[i % len(MEASURED_COLORS)], width=1.5)
         for i, (mid, dTdt, _temp_mid, name) in enumerate(series)
     ]
     layout = _layout(
@@ -508,8 +521,8 @@ def measured_dtdt_temp(sim, step):
         return None
     traces = [
         _line_trace(
-            temp_mid.tolist(),
-            dTdt.tolist(),
+            temp_mid,
+            dTdt,
             name,
             MEASURED_COLORS[i % len(MEASURED_COLORS)],
             width=1.5,
@@ -536,12 +549,12 @@ def measured_power(sim, step):
         return None
     traces = []
     for i, (mid, dTdt, temp_mid, name) in enumerate(series):
-        cp_values = np.array([cp_func(t) for t in temp_mid])
+        cp_values = cp_func(temp_mid)
         power = mass * cp_values * dTdt
         traces.append(
             _line_trace(
-                mid.tolist(),
-                power.tolist(),
+                mid,
+                power,
                 name,
                 MEASURED_COLORS[i % len(MEASURED_COLORS)],
                 width=1.5,
@@ -563,11 +576,14 @@ def comparison_channel(sim, channel, offset=0.0):
             break
     if not md_match:
         return None
+    fields = channel_series(md_match).get(channel)
+    if fields is None:
+        return None
 
-    sim_times = cycle.time_array
-    sim_temps = cycle.data_dict.get("center") or cycle.value_array
-    meas_times = [t + offset for t in md_match.get_channel_times(channel)]
-    meas_temps = md_match.get_channel_data(channel)
+    sim_times = cycle.time_series
+    sim_temps = cycle.center_series
+    meas_times = fields["time"] + offset
+    meas_temps = fields["temp"]
 
     traces = [
         _line_trace(
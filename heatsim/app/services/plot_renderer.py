@@ -0,0 +1,329 @@
+"""Lazy, content-addressed rendering of simulation result plots.
+
+Simulation jobs do not draw matplotlib PNGs. `defer_plot` stores a plot
+spec on the result row instead: the visualization kind, its parameters and,
+for plots derived from another row's series (cooling rate, dT/dt, absorbed
+power), which row of the same snapshot to read. It also stores a content
+key, the SHA-256 of the spec and of the series it plots.
+
+`result_plot_image` renders a plot the first time it is viewed; idle queue
+workers pre-render pending plots through `render_pending_plots`. Images are
+stored once per key in rendered_plots, so identical results share one PNG
+and a changed spec or series never returns a stale image. Failed renders
+are not cached: a view retries them, and pre-rendering skips a plot for
+RENDER_RETRY_SECONDS after its last failure (kept on the result row).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.simulation import RenderedPlot, SimulationResult, unpack_series
+
+from . import visualization
+from .hardness_predictor import POSITION_KEYS
+
+logger = logging.getLogger(__name__)
+
+# Bump when a renderer changes its output, so cached images are not reused
+RENDERER_VERSION = 1
+
+# Pre-rendering waits this long before retrying a plot that failed to render
+RENDER_RETRY_SECONDS = 600
+
+# pyplot keeps global figure state: one render at a time per process
+_render_lock = threading.Lock()
+
+
+def _to_builtin(value):
+    """json.dumps default: numpy scalars and arrays to Python types."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _digest_series(digest, row: SimulationResult) -> None:
+    """Feed the stored series of a row into a hash."""
+    if row.series_data:
+        for name, array in sorted(unpack_series(row.series_data).items()):
+            digest.update(f"{name}:{array.dtype}:{array.shape}".encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+    else:
+        digest.update((row.time_data or "").encode())
+        digest.update((row.value_data or "").encode())
+
+
+def plot_key(spec: dict, row: SimulationResult, source: SimulationResult | None = None) -> str:
+    """Content key of a plot: SHA-256 of the spec and the series it plots."""
+    digest = hashlib.sha256(f"v{RENDERER_VERSION}".encode())
+    digest.update(json.dumps(spec, sort_keys=True).encode())
+    _digest_series(digest, row)
+    if source is not None:
+        _digest_series(digest, source)
+    return digest.hexdigest()
+
+
+def defer_plot(
+    result: SimulationResult, kind: str, source: SimulationResult | None = None, **params
+) -> None:
+    """Record what to plot for a result row instead of rendering it now.
+
+    Call after the row's own series (if any) are stored.
+
+    Parameters
+    ----------
+    result : SimulationResult
+        Row the plot belongs to
+    kind : str
+        Renderer name, a key of RENDERERS
+    source : SimulationResult, optional
+        Row of the same snapshot whose series the plot is drawn from
+    **params
+        Plot parameters (title, transformation temperatures, ...)
+    """
+    spec = {"kind": kind, "params": params}
+    if source is not None:
+        spec["source"] = {"result_type": source.result_type, "phase": source.phase}
+    # Round-trip so the key is computed from exactly what is stored
+    result.plot_spec = json.dumps(spec, default=_to_builtin)
+    result.plot_key = plot_key(json.loads(result.plot_spec), result, source)
+    result.plot_failed_at = None
+
+
+def _source_row(result: SimulationResult, spec: dict) -> SimulationResult | None:
+    source = spec.get("source")
+    if not source:
+        return None
+    return SimulationResult.query.filter_by(
+        simulation_id=result.simulation_id,
+        snapshot_id=result.snapshot_id,
+        result_type=source["result_type"],
+        phase=source["phase"],
+    ).first()
+
+
+def _position_matrix(row: SimulationResult) -> np.ndarray:
+    """[time, position] temperatures of the stored radial positions.
+
+    A row without position series gives its value series as one column.
+    """
+    series = row.position_series
+    columns = [series[key] for key in POSITION_KEYS if key in series]
+    if not columns:
+        return row.value_series[:, np.newaxis]
+    return np.column_stack(columns)
+
+
+def _phase_times(row: SimulationResult) -> np.ndarray:
+    """Phase row times relative to the start of the phase."""
+    times = row.time_series
+    return times - times[0] if len(times) else times
+
+
+def _render_cycle(row, source, params):
+    times = row.time_series
+    if params.get("relative_time"):
+        times = _phase_times(row)
+    spans = [
+        SimpleNamespace(
+            phase_name=span["phase_name"],
+            start_time=span["start_time"],
+            end_time=span["end_time"],
+            time=np.array([span["start_time"], span["end_time"]]),
+        )
+        for span in params.get("phase_spans") or []
+    ]
+    return visualization.create_heat_treatment_cycle_plot(
+        times,
+        _position_matrix(row),
+        phase_results=spans or None,
+        title=params["title"],
+        transformation_temps=params.get("transformation_temps"),
+        furnace_temps=params.get("furnace_temps"),
+    )
+
+
+def _render_temperature_profile(row, source, params):
+    times = row.time_series
+    return visualization.create_temperature_profile_plot(
+        np.asarray(params["positions"], dtype=float),
+        row.value_series,
+        times,
+        list(range(len(times))),
+        title=params["title"],
+        is_cylindrical=params.get("is_cylindrical", True),
+    )
+
+
+def _render_cooling_rate(row, source, params):
+    temperatures = _position_matrix(source)
+    return visualization.create_cooling_rate_plot(
+        source.time_series, temperatures[:, 0], temperatures[:, -1], title=params["title"]
+    )
+
+
+def _render_dtdt_time(row, source, params):
+    return visualization.create_dTdt_vs_time_plot(
+        _phase_times(source),
+        _position_matrix(source),
+        title=params["title"],
+        phase_name=params["phase_name"],
+    )
+
+
+def _render_dtdt_temp(row, source, params):
+    return visualization.create_dTdt_vs_temperature_plot(
+        _phase_times(source),
+        _position_matrix(source),
+        title=params["title"],
+        phase_name=params["phase_name"],
+    )
+
+
+def _render_absorbed_power(row, source, params):
+    # The power row's own value series holds Cp(T) of the center
+    return visualization.create_absorbed_power_plot(
+        _phase_times(source),
+        _position_matrix(source),
+        mass=params["mass"],
+        cp_values=row.value_series,
+        title=params["title"],
+        phase_name=params["phase_name"],
+    )
+
+
+def _render_phase_fraction(row, source, params):
+    return visualization.create_phase_fraction_plot(params["phases"], title=params["title"])
+
+
+def _render_hardness_profile(row, source, params):
+    hardness = SimpleNamespace(**params["hardness"])
+    return visualization.create_hardness_profile_plot(hardness, title=params["title"])
+
+
+# Renderer per plot kind: (row, source row or None, params) -> PNG bytes
+RENDERERS = {
+    "cycle": _render_cycle,
+    "temperature_profile": _render_temperature_profile,
+    "cooling_rate": _render_cooling_rate,
+    "dtdt_time": _render_dtdt_time,
+    "dtdt_temp": _render_dtdt_temp,
+    "absorbed_power": _render_absorbed_power,
+    "phase_fraction": _render_phase_fraction,
+    "hardness_profile": _render_hardness_profile,
+}
+
+# Kinds whose renderer reads a source row
+_SOURCE_KINDS = {"cooling_rate", "dtdt_time", "dtdt_temp", "absorbed_power"}
+
+
+def render_plot(result: SimulationResult) -> bytes:
+    """Render the deferred plot of a result row (no caching).
+
+    Raises
+    ------
+    ValueError
+        If the row has no plot spec, an unknown kind or a missing source row
+    """
+    spec = result.plot_spec_dict
+    renderer = RENDERERS.get(spec.get("kind"))
+    if renderer is None:
+        raise ValueError(f"Result {result.id} has no renderable plot spec")
+    source = _source_row(result, spec)
+    if source is None and spec["kind"] in _SOURCE_KINDS:
+        raise ValueError(f"Source series for result {result.id} not found")
+    with _render_lock:
+        return renderer(result, source, spec.get("params", {}))
+
+
+def _store(key: str, image: bytes) -> None:
+    db.session.add(RenderedPlot(key=key, image=image))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Rendered concurrently by another request or worker
+        db.session.rollback()
+
+
+def _mark_failed(key: str) -> None:
+    """Record a failed render on every row with the key (commits)."""
+    SimulationResult.query.filter_by(plot_key=key).update(
+        {SimulationResult.plot_failed_at: datetime.utcnow()}, synchronize_session="fetch"
+    )
+    db.session.commit()
+
+
+def result_plot_image(result: SimulationResult) -> bytes | None:
+    """PNG of a result: stored with the row, cached, or rendered now.
+
+    A plot that failed to render before is retried.
+
+    Returns None if the row has no plot or its plot cannot be rendered.
+    """
+    if result.plot_image is not None:
+        return result.plot_image
+    if result.plot_key is None:
+        return None
+    cached = db.session.get(RenderedPlot, result.plot_key)
+    if cached is not None:
+        return cached.image
+    key = result.plot_key
+    try:
+        image = render_plot(result)
+    except Exception as e:
+        logger.warning("Rendering plot of result %s failed: %s", result.id, e)
+        _mark_failed(key)
+        return None
+    _store(key, image)
+    return image
+
+
+def render_pending_plots(limit: int = 4) -> int:
+    """Render up to `limit` plots that have no cached image yet, newest first.
+
+    Used by idle queue workers. A plot that fails to render is skipped
+    for RENDER_RETRY_SECONDS, so it is not retried on every idle pass.
+
+    Returns
+    -------
+    int
+        Number of plots attempted (including failed ones)
+    """
+    retry_before = datetime.utcnow() - timedelta(seconds=RENDER_RETRY_SECONDS)
+    pending = (
+        SimulationResult.query.outerjoin(
+            RenderedPlot, RenderedPlot.key == SimulationResult.plot_key
+        )
+        .filter(
+            SimulationResult.plot_key.isnot(None),
+            RenderedPlot.key.is_(None),
+            db.or_(
+                SimulationResult.plot_failed_at.is_(None),
+                SimulationResult.plot_failed_at < retry_before,
+            ),
+        )
+        .order_by(SimulationResult.id.desc())
+        .limit(limit)
+        .all()
+    )
+    attempted = set()
+    for result in pending:
+        key = result.plot_key
+        if key in attempted:
+            continue
+        attempted.add(key)
+        try:
+            image = render_plot(result)
+        except Exception as e:
+            logger.warning("Pre-rendering plot of result %s failed: %s", result.id, e)
+            _mark_failed(key)
+            continue
+        _store(key, image)
+    return len(attempted)
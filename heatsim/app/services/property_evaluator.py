@@ -6,6 +6,11 @@ Handles interpolation and evaluation of material properties based on type:
 - table: Multi-variable lookup
 - polynomial: Polynomial evaluation
 - equation: Safe mathematical expression evaluation
+
+Solvers that evaluate a property over a whole temperature field should use
+``compile_property`` instead of calling ``evaluate`` per node: it turns the
+stored model into a ``CompiledProperty`` that maps a NumPy temperature array
+to values in a single vectorized call.
 """
 
 import math
@@ -14,6 +19,49 @@ import re
 import numpy as np
 from scipy import interpolate
 
+# Dense lookup grid used to compile table/equation properties. Covers room
+# temperature through solidus with margin; np.interp clamps outside it.
+LOOKUP_T_MIN = -50.0
+LOOKUP_T_MAX = 1600.0
+LOOKUP_T_STEP = 1.0
+
+
+class CompiledProperty:
+    """Vectorized, temperature-only form of a MaterialProperty.
+
+    Stores either a piecewise-linear table (evaluated with ``np.interp``) or
+    polynomial coefficients, so a whole temperature field is evaluated in
+    one NumPy call. Calling it with a scalar returns a 0-d array.
+
+    Parameters
+    ----------
+    temperatures, values : array-like, optional
+        Ascending table knots and their values
+    coefficients : array-like, optional
+        Polynomial coefficients [a0, a1, a2, ...]; takes precedence over the table
+    """
+
+    def __init__(self, temperatures=None, values=None, coefficients=None):
+        self.coefficients = (
+            np.asarray(coefficients, dtype=float) if coefficients is not None else None
+        )
+        self.temperatures = (
+            np.asarray(temperatures, dtype=float) if temperatures is not None else None
+        )
+        self.values = np.asarray(values, dtype=float) if values is not None else None
+
+    @classmethod
+    def constant(cls, value: float) -> "CompiledProperty":
+        """Compiled property that returns the same value everywhere."""
+        return cls(temperatures=[0.0], values=[float(value)])
+
+    def __call__(self, temperature) -> np.ndarray:
+        """Evaluate at one temperature or an array of temperatures (°C)."""
+        T = np.asarray(temperature, dtype=float)
+        if self.coefficients is not None:
+            return np.polynomial.polynomial.polyval(T, self.coefficients)
+        return np.interp(T, self.temperatures, self.values)
+
 
 class PropertyEvaluator:
     """Evaluates material properties at specified conditions."""
@@ -80,6 +128,59 @@ class PropertyEvaluator:
         else:
             return None
 
+    def compile(self) -> CompiledProperty | None:
+        """Compile the property into a vectorized temperature evaluator.
+
+        Constants, curves and polynomials compile exactly. Tables and
+        equations are sampled once onto a dense grid between LOOKUP_T_MIN
+        and LOOKUP_T_MAX; points where evaluation fails are stored as NaN.
+
+        Returns
+        -------
+        CompiledProperty or None
+            None if the stored data cannot be evaluated against temperature
+        """
+        prop_type = self.property.property_type
+
+        try:
+            if prop_type == "constant":
+                value = self._eval_constant()
+                return CompiledProperty.constant(float(value)) if value is not None else None
+
+            if prop_type == "curve":
+                temps = [float(t) for t in self.data.get("temperature", [])]
+                values = [float(v) for v in self.data.get("value", [])]
+                if not temps or len(temps) != len(values):
+                    return None
+                order = np.argsort(temps, kind="stable")
+                return CompiledProperty(
+                    temperatures=np.asarray(temps)[order], values=np.asarray(values)[order]
+                )
+
+            if prop_type == "polynomial":
+                if self.data.get("variable", "temperature") != "temperature":
+                    return None
+                coeffs = [float(c) for c in self.data.get("coefficients", [])]
+                return CompiledProperty(coefficients=coeffs) if coeffs else None
+        except (TypeError, ValueError):
+            return None
+
+        if prop_type not in ("table", "equation"):
+            return None
+
+        grid = np.arange(LOOKUP_T_MIN, LOOKUP_T_MAX + LOOKUP_T_STEP, LOOKUP_T_STEP)
+        samples = np.empty_like(grid)
+        for i, t in enumerate(grid):
+            try:
+                value = self.evaluate(temperature=float(t))
+            except (ArithmeticError, TypeError, ValueError):
+                value = None
+            samples[i] = value if value is not None else np.nan
+
+        if np.all(np.isnan(samples)):
+            return None
+        return CompiledProperty(temperatures=grid, values=samples)
+
     def _eval_constant(self) -> float | None:
         """Evaluate constant property."""
         return self.data.get("value")
@@ -270,6 +371,40 @@ def evaluate_scalar(property_model, default: float, temperature: float = 20.0) -
         return default
 
 
+def compile_property(property_model, default: float) -> CompiledProperty:
+    """Compile a property for vectorized evaluation, with a fallback value.
+
+    Missing properties and unevaluable data compile to a constant default,
+    and any NaN points in a sampled lookup table are replaced by it, so the
+    returned evaluator always yields finite numbers. An already compiled
+    property is returned unchanged.
+
+    Parameters
+    ----------
+    property_model : MaterialProperty, CompiledProperty or None
+        The property to compile
+    default : float
+        Value to use when the property is missing or unevaluable
+
+    Returns
+    -------
+    CompiledProperty
+        Vectorized evaluator accepting scalar or array temperatures (°C)
+    """
+    if property_model is None:
+        return CompiledProperty.constant(default)
+    if isinstance(property_model, CompiledProperty):
+        return property_model
+
+    compiled = PropertyEvaluator(property_model).compile()
+    if compiled is None:
+        return CompiledProperty.constant(default)
+
+    if compiled.values is not None:
+        compiled.values = np.where(np.isfinite(compiled.values), compiled.values, default)
+    return compiled
+
+
 class PropertyPlotter:
     """Generate plots for temperature-dependent material properties."""
 
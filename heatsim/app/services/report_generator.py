@@ -15,6 +15,8 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches
 from fpdf import FPDF
 
+from app.services.plot_renderer import result_plot_image
+
 
 class SimulationReportGenerator:
     """Generate Word reports for completed simulations."""
@@ -254,6 +256,8 @@ class SimulationReportGenerator:
         self._add_table_row(table, "Max Simulation Time", f"{solver.get('max_time', 1800):.0f} s")
         if solver.get("auto_dt", False):
             self._add_table_row(table, "Auto Time Step", "Enabled")
+        if solver.get("adaptive", False):
+            self._add_table_row(table, "Adaptive Time Step", "Enabled")
 
         self.doc.add_paragraph()
 
@@ -289,21 +293,24 @@ class SimulationReportGenerator:
 
         # Full cycle plot
         full_cycle = next((r for r in results if r.result_type == "full_cycle"), None)
-        if full_cycle and full_cycle.plot_image:
+        image = result_plot_image(full_cycle) if full_cycle else None
+        if image:
             self.doc.add_heading("Full Heat Treatment Cycle", level=3)
-            self._add_plot(full_cycle.plot_image)
+            self._add_plot(image)
 
         # Temperature profile
         profile = next((r for r in results if r.result_type == "temperature_profile"), None)
-        if profile and profile.plot_image:
+        image = result_plot_image(profile) if profile else None
+        if image:
             self.doc.add_heading("Temperature Profile", level=3)
-            self._add_plot(profile.plot_image)
+            self._add_plot(image)
 
         # Cooling rate
         rate = next((r for r in results if r.result_type == "cooling_rate"), None)
-        if rate and rate.plot_image:
+        image = result_plot_image(rate) if rate else None
+        if image:
             self.doc.add_heading("Cooling Rate", level=3)
-            self._add_plot(rate.plot_image)
+            self._add_plot(image)
 
     def _add_phase_fractions(self) -> None:
         """Add phase fraction results section."""
@@ -316,8 +323,9 @@ class SimulationReportGenerator:
         self.doc.add_heading("Phase Transformation", level=2)
 
         # Plot
-        if phase_result.plot_image:
-            self._add_plot(phase_result.plot_image)
+        image = result_plot_image(phase_result)
+        if image:
+            self._add_plot(image)
 
         # Phase fractions table
         phases = phase_result.phases_dict
@@ -349,8 +357,9 @@ class SimulationReportGenerator:
         self.doc.add_heading("Hardness Prediction", level=2)
 
         # Plot
-        if hardness_result.plot_image:
-            self._add_plot(hardness_result.plot_image)
+        image = result_plot_image(hardness_result)
+        if image:
+            self._add_plot(image)
 
         # Hardness values table
         data = hardness_result.data_dict
@@ -725,6 +734,8 @@ class SimulationPDFReportGenerator:
         ]
         if solver.get("auto_dt", False):
             rows.append(("Auto Time Step", "Enabled"))
+        if solver.get("adaptive", False):
+            rows.append(("Adaptive Time Step", "Enabled"))
         self._add_param_table(rows)
 
     def _add_results_summary(self) -> None:
@@ -771,19 +782,22 @@ class SimulationPDFReportGenerator:
 
         # Full cycle plot
         full_cycle = next((r for r in results if r.result_type == "full_cycle"), None)
-        if full_cycle and full_cycle.plot_image:
-            self._add_plot(full_cycle.plot_image, "Full Heat Treatment Cycle")
+        image = result_plot_image(full_cycle) if full_cycle else None
+        if image:
+            self._add_plot(image, "Full Heat Treatment Cycle")
 
         # Temperature profile - new page for readability
         profile = next((r for r in results if r.result_type == "temperature_profile"), None)
-        if profile and profile.plot_image:
+        image = result_plot_image(profile) if profile else None
+        if image:
             self.pdf.add_page()
-            self._add_plot(profile.plot_image, "Temperature Profile")
+            self._add_plot(image, "Temperature Profile")
 
         # Cooling rate
         rate = next((r for r in results if r.result_type == "cooling_rate"), None)
-        if rate and rate.plot_image:
-            self._add_plot(rate.plot_image, "Cooling Rate")
+        image = result_plot_image(rate) if rate else None
+        if image:
+            self._add_plot(image, "Cooling Rate")
 
     def _add_phase_fractions(self) -> None:
         """Add phase fraction results section."""
@@ -797,8 +811,9 @@ class SimulationPDFReportGenerator:
         self._add_section_heading("Phase Transformation")
 
         # Plot
-        if phase_result.plot_image:
-            self._add_plot(phase_result.plot_image)
+        image = result_plot_image(phase_result)
+        if image:
+            self._add_plot(image)
 
         # Phase fractions table
         phases = phase_result.phases_dict
@@ -829,8 +844,9 @@ class SimulationPDFReportGenerator:
         self._add_section_heading("Hardness Prediction")
 
         # Plot
-        if hardness_result.plot_image:
-            self._add_plot(hardness_result.plot_image)
+        image = result_plot_image(hardness_result)
+        if image:
+            self._add_plot(image)
 
         # Hardness values table
         data = hardness_result.data_dict
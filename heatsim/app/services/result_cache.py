@@ -0,0 +1,250 @@
+"""Content-addressed cache of simulation results.
+
+A run's results depend only on its inputs: the simulation configuration
+(``Simulation.compute_config_hash()``), the material data frozen in its
+snapshot and the grade's phase model parameters (``params_version``). The
+SHA-256 of these is the snapshot's ``cache_key``. After a built-in solver
+run completes, its snapshot is registered as a ResultCacheEntry under that
+key; a later run with the same key copies that snapshot's result rows
+instead of solving (results are read per simulation throughout, so rows
+are copied rather than shared).
+
+Every keyed snapshot records whether it was served from the cache
+(``reused_from_id``), which is what ``cache_stats`` counts. Entries unused
+for RESULT_CACHE_MAX_AGE_DAYS are evicted, and beyond RESULT_CACHE_MAX_ENTRIES
+the least recently used go first. COMSOL runs are not cached: their results
+refer to files written per simulation.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from app.extensions import db
+from app.models.simulation import STATUS_COMPLETED, Simulation, SimulationResult
+from app.models.snapshot import ResultCacheEntry, SimulationSnapshot
+from app.models.ttt_parameters import TTTParameters
+from app.services.plot_renderer import plot_key
+from app.services.snapshot_service import SnapshotService
+
+logger = logging.getLogger(__name__)
+
+# Bump when solver or post-processing changes make stored results stale
+RESULT_CACHE_VERSION = 1
+
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_ENTRIES = 5000
+
+# Columns not carried over when result rows are copied
+_RESULT_OWN_COLUMNS = {"id", "simulation_id", "snapshot_id", "created_at"}
+
+
+def snapshot_cache_key(sim: Simulation, snapshot: SimulationSnapshot) -> str | None:
+    """SHA-256 of everything the results of a run depend on.
+
+    Returns None when the run cannot be cached: COMSOL solver, or phase
+    model parameters without a version token.
+    """
+    if sim.solver_dict.get("solver_type", "builtin") == "comsol":
+        return None
+
+    ttt_version = (
+        db.session.query(TTTParameters.params_version)
+        .filter(TTTParameters.steel_grade_id == sim.steel_grade_id)
+        .first()
+    )
+    if ttt_version is not None and ttt_version[0] is None:
+        return None
+
+    inputs = {
+        "version": RESULT_CACHE_VERSION,
+        "config": sim.compute_config_hash(),
+        "designation": snapshot.steel_grade_designation,
+        "data_source": snapshot.steel_grade_data_source,
+        "material_properties": json.loads(snapshot.material_properties_snapshot or "null"),
+        "phase_diagram": json.loads(snapshot.phase_diagram_snapshot or "null"),
+        "composition": json.loads(snapshot.composition_snapshot or "null"),
+        "phase_properties": json.loads(snapshot.phase_properties_snapshot or "null"),
+        "ttt_params_version": ttt_version[0] if ttt_version else None,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def _cache_enabled() -> bool:
+    return current_app.config.get("RESULT_CACHE_ENABLED", True)
+
+
+def lookup(sim: Simulation, snapshot: SimulationSnapshot) -> SimulationSnapshot | None:
+    """Key a new snapshot and find a completed snapshot with the same key.
+
+    Sets ``snapshot.cache_key``. An entry whose snapshot was deleted, did
+    not complete or has no results is dropped. Does not commit.
+
+    Returns
+    -------
+    SimulationSnapshot or None
+        Snapshot whose results can be reused, None on a miss
+    """
+    if not _cache_enabled():
+        return None
+    snapshot.cache_key = snapshot_cache_key(sim, snapshot)
+    if snapshot.cache_key is None:
+        return None
+
+    entry = db.session.get(ResultCacheEntry, snapshot.cache_key)
+    if entry is None:
+        return None
+    source = db.session.get(SimulationSnapshot, entry.snapshot_id)
+    if (
+        source is None
+        or source.status != STATUS_COMPLETED
+        or not SimulationResult.query.filter_by(snapshot_id=source.id).count()
+    ):
+        db.session.delete(entry)
+        return None
+
+    entry.hits = (entry.hits or 0) + 1
+    entry.last_used_at = datetime.utcnow()
+    return source
+
+
+def store(snapshot: SimulationSnapshot) -> None:
+    """Register a completed, keyed snapshot as the entry for its key.
+
+    Replaces an existing entry (its snapshot is dropped or stale), then
+    evicts old entries. Commits.
+    """
+    if not snapshot.cache_key or snapshot.status != STATUS_COMPLETED or not _cache_enabled():
+        return
+    now = datetime.utcnow()
+    entry = db.session.get(ResultCacheEntry, snapshot.cache_key)
+    if entry is None:
+        entry = ResultCacheEntry(key=snapshot.cache_key, hits=0, created_at=now)
+        db.session.add(entry)
+    elif entry.snapshot_id != snapshot.id:
+        entry.hits = 0
+        entry.created_at = now
+    entry.snapshot_id = snapshot.id
+    entry.last_used_at = now
+    db.session.flush()
+    evict()
+    db.session.commit()
+
+
+def copy_results(source: SimulationSnapshot, sim: Simulation) -> SimulationSnapshot:
+    """Give a simulation a completed snapshot holding copies of source's results.
+
+    Plot titles naming the source simulation are renamed and their plot
+    keys recomputed. Does not commit.
+    """
+    snapshot = SnapshotService.create_snapshot(sim)
+    snapshot.started_at = source.started_at
+    reuse(source, sim, snapshot)
+    return snapshot
+
+
+def reuse(source: SimulationSnapshot, sim: Simulation, snapshot: SimulationSnapshot) -> None:
+    """Complete a running snapshot with copies of source's results (does not commit)."""
+    _copy_rows(source, sim, snapshot)
+    snapshot.reused_from_id = source.id
+
+
+def _copy_rows(source: SimulationSnapshot, sim: Simulation, snapshot: SimulationSnapshot) -> None:
+    source_sim = db.session.get(Simulation, source.simulation_id)
+    suffix = f" - {source_sim.name}" if source_sim else None
+    columns = [c.key for c in SimulationResult.__table__.columns]
+
+    copies = []
+    for row in SimulationResult.query.filter_by(snapshot_id=source.id).order_by(
+        SimulationResult.id
+    ):
+        copy = SimulationResult(
+            simulation_id=sim.id,
+            snapshot_id=snapshot.id,
+            **{c: getattr(row, c) for c in columns if c not in _RESULT_OWN_COLUMNS},
+        )
+        db.session.add(copy)
+        copies.append(copy)
+
+    if suffix and sim.name != source_sim.name:
+        by_source = {(r.result_type, r.phase): r for r in copies}
+        for copy in copies:
+            if not copy.plot_spec:
+                continue
+            spec = json.loads(copy.plot_spec)
+            title = spec["params"].get("title")
+            if not title or not title.endswith(suffix):
+                continue
+            spec["params"]["title"] = title[: -len(suffix)] + f" - {sim.name}"
+            ref = spec.get("source")
+            copy.plot_spec = json.dumps(spec)
+            copy.plot_key = plot_key(
+                spec, copy, by_source.get((ref["result_type"], ref["phase"])) if ref else None
+            )
+
+    SnapshotService.finalize_snapshot(snapshot, STATUS_COMPLETED)
+    SnapshotService.update_summary(snapshot, copies)
+
+
+def evict(max_age_days: float | None = None, max_entries: int | None = None) -> int:
+    """Drop entries unused for max_age_days, then all but the max_entries most recent.
+
+    Defaults come from RESULT_CACHE_MAX_AGE_DAYS and RESULT_CACHE_MAX_ENTRIES.
+    Does not commit.
+
+    Returns
+    -------
+    int
+        Number of entries removed
+    """
+    if max_age_days is None:
+        max_age_days = current_app.config.get("RESULT_CACHE_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS)
+    if max_entries is None:
+        max_entries = current_app.config.get("RESULT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+    removed = ResultCacheEntry.query.filter(ResultCacheEntry.last_used_at < cutoff).delete(
+        synchronize_session=False
+    )
+    overflow = (
+        db.session.query(ResultCacheEntry.key)
+        .order_by(ResultCacheEntry.last_used_at.desc())
+        .offset(max_entries)
+        .all()
+    )
+    if overflow:
+        removed += ResultCacheEntry.query.filter(
+            ResultCacheEntry.key.in_([key for (key,) in overflow])
+        ).delete(synchronize_session=False)
+    if removed:
+        logger.info("Evicted %d result cache entries", removed)
+    return removed
+
+
+def cache_stats(hours: float = 24.0) -> dict:
+    """Hits and misses of runs started in the last ``hours``, and entry counts.
+
+    Returns dict with ``hours``, ``hits``, ``misses``, ``hit_rate`` (None
+    without keyed runs), ``entries`` and ``entry_hits`` (hits over the
+    lifetime of the current entries).
+    """
+    since = datetime.utcnow() - timedelta(hours=hours)
+    keyed = SimulationSnapshot.query.filter(
+        SimulationSnapshot.cache_key.isnot(None), SimulationSnapshot.started_at >= since
+    )
+    hits = keyed.filter(SimulationSnapshot.reused_from_id.isnot(None)).count()
+    misses = keyed.filter(SimulationSnapshot.reused_from_id.is_(None)).count()
+    total = hits + misses
+    return {
+        "hours": hours,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 3) if total else None,
+        "entries": ResultCacheEntry.query.count(),
+        "entry_hits": int(
+            db.session.query(db.func.coalesce(db.func.sum(ResultCacheEntry.hits), 0)).scalar()
+        ),
+    }
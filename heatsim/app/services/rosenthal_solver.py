@@ -14,16 +14,19 @@ where:
     R = sqrt(ξ² + y² + z²)
     K0 = modified Bessel function of the second kind, order zero
 
+Temperatures, peak temperatures, thermal cycles, t8/5 and HAZ boundaries
+broadcast over arrays of points, e.g. a whole (y, z) section, and over
+batches of weld parameters (`RosenthalParams.stack`).
+
 References:
 - Rosenthal D., "Mathematical Theory of Heat Distribution during
   Welding and Cutting", Welding Journal, 1941
 - Easterling K., "Introduction to the Physical Metallurgy of Welding"
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 
 import numpy as np
-from scipy.optimize import brentq
 from scipy.special import k0
 
 # Default thermal properties for structural steel
@@ -68,6 +71,29 @@ class RosenthalParams:
     eta: float = 0.80
     plate_thickness: float = 0.020  # 20 mm
 
+    @classmethod
+    def stack(cls, params_list: list["RosenthalParams"], ndim: int = 1) -> "RosenthalParams":
+        """Combine parameter sets into one batch with array fields.
+
+        Every field becomes an array of shape (B, 1, ..., 1) with ``ndim``
+        unit axes, so solver methods evaluated on points of ``ndim``
+        dimensions return results of shape (B, *points.shape).
+
+        Parameters
+        ----------
+        params_list : list of RosenthalParams
+            Parameter sets, e.g. one per heat input of a slider range
+        ndim : int
+            Dimensions of the point arrays (2 for a (y, z) grid)
+        """
+        values = {
+            f.name: np.array([getattr(p, f.name) for p in params_list], dtype=float).reshape(
+                (-1,) + (1,) * ndim
+            )
+            for f in fields(cls)
+        }
+        return cls(**values)
+
 
 # Arc efficiency values for common welding processes
 ARC_EFFICIENCIES = {
@@ -78,6 +104,115 @@ ARC_EFFICIENCIES = {
 }
 
 
+# Moving-coordinate samples scanned per point for the peak temperature
+PEAK_SCAN_POINTS = 500
+
+# Thermal cycle sampled for t8/5
+T85_CYCLE_DURATION = 300.0  # s
+T85_CYCLE_POINTS = 500
+
+# Points evaluated per chunk (bounds the (points, samples) temporaries)
+_CHUNK_POINTS = 2048
+
+# Bisection steps taking a 128 mm bracket below 0.1 µm
+_BISECTION_STEPS = 21
+
+
+def _chunk_slices(n: int):
+    for start in range(0, n, _CHUNK_POINTS):
+        yield slice(start, start + _CHUNK_POINTS)
+
+
+def _param_columns(p: RosenthalParams, sl: slice) -> RosenthalParams:
+    """Slice the flattened array fields of p to a column chunk (n, 1)."""
+    return replace(
+        p,
+        **{f.name: getattr(p, f.name)[sl, None] for f in fields(p) if np.ndim(getattr(p, f.name))},
+    )
+
+
+def _temperature_3d(p: RosenthalParams, xi, y, z) -> np.ndarray:
+    """Broadcasting 3D Rosenthal temperature (see RosenthalSolver.temperature_3d)."""
+    R = np.sqrt(np.square(xi) + np.square(y) + np.square(z))
+    # Avoid singularity at source; cap at solidification temp
+    near = R < 1e-6
+    R = np.where(near, 1e-6, R)
+
+    # Clamp exponent to avoid underflow
+    exponent = np.maximum(-p.v * (R + xi) / (2 * p.alpha), -500.0)
+    T = p.T0 + (p.Q / (2 * np.pi * p.k)) * (1.0 / R) * np.exp(exponent)
+    T_source = np.minimum(p.T0 + p.Q / (2 * np.pi * p.k * 1e-6), 1500.0)
+    return np.where(near, T_source, T)
+
+
+def _temperature_2d(p: RosenthalParams, xi, y) -> np.ndarray:
+    """Broadcasting 2D Rosenthal temperature (see RosenthalSolver.temperature_2d)."""
+    d = p.plate_thickness
+    R = np.sqrt(np.square(xi) + np.square(y))
+    near = R < 1e-6
+    R = np.where(near, 1e-6, R)
+
+    arg_bessel = p.v * R / (2 * p.alpha)
+    # K0 diverges for very large arguments -> temp ~ 0
+    far = arg_bessel > 500
+    exponent = np.maximum(-p.v * xi / (2 * p.alpha), -500.0)
+    with np.errstate(over="ignore", invalid="ignore"):
+        T = p.T0 + (p.Q / (2 * np.pi * p.k * d)) * k0(np.minimum(arg_bessel, 500.0)) * np.exp(
+            exponent
+        )
+    T_source = np.minimum(p.T0 + p.Q / (2 * np.pi * p.k * d * 1e-6), 1500.0)
+    return np.where(near, T_source, np.where(far, p.T0, T))
+
+
+def _cooling_crossing(times, temps, level: float, after_peak) -> np.ndarray:
+    """Interpolated time of the first downward crossing of level after the peak, else NaN."""
+    upper, lower = temps[..., :-1], temps[..., 1:]
+    with np.errstate(invalid="ignore"):
+        crosses = after_peak & (upper >= level) & (lower < level)
+    i = np.asarray(np.argmax(crosses, axis=-1))[..., np.newaxis]
+    found = np.take_along_axis(crosses, i, axis=-1)[..., 0]
+    T_i = np.take_along_axis(upper, i, axis=-1)[..., 0]
+    T_j = np.take_along_axis(lower, i, axis=-1)[..., 0]
+    i = i[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Linear interpolation
+        frac = (level - T_j) / (T_i - T_j)
+        t = times[i + 1] + frac * (times[i] - times[i + 1])
+    return np.where(found, t, np.nan)
+
+
+def cooling_time_8_5(times: np.ndarray, temps: np.ndarray) -> np.ndarray:
+    """t8/5 cooling times of thermal cycles sampled at common times.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Sample times (n,)
+    temps : np.ndarray
+        Temperatures (..., n); NaN samples never peak or cross
+
+    Returns
+    -------
+    np.ndarray
+        Cooling time 800->500°C (s) per cycle (...), NaN where the peak
+        stays below 800°C or no positive t8/5 is found
+    """
+    peak_idx = np.asarray(np.argmax(np.where(np.isnan(temps), -np.inf, temps), axis=-1))
+    peak = np.take_along_axis(temps, peak_idx[..., np.newaxis], axis=-1)[..., 0]
+
+    # Only look at cooling portion (after peak)
+    after_peak = np.arange(temps.shape[-1] - 1) >= peak_idx[..., np.newaxis]
+    t_800 = _cooling_crossing(times, temps, 800.0, after_peak)
+    # Temperature starts below 800 after peak; use peak time
+    t_800 = np.where(np.isnan(t_800), times[peak_idx], t_800)
+    t_500 = _cooling_crossing(times, temps, 500.0, after_peak)
+
+    t8_5 = t_500 - t_800
+    with np.errstate(invalid="ignore"):
+        valid = (peak >= 800) & (t8_5 > 0)
+    return np.where(valid, t8_5, np.nan)
+
+
 class RosenthalSolver:
     """Rosenthal analytical welding thermal cycle solver.
 
@@ -164,73 +299,115 @@ class RosenthalSolver:
         )
         return cls(params)
 
-    def temperature_3d(self, xi: float, y: float, z: float) -> float:
+    def _flat_points(self, y, z):
+        """Broadcast points against array-valued params and flatten them.
+
+        Returns (shape, y, z, params): the broadcast shape, then y, z and
+        every array field of the params as 1-D arrays of that size.
+        """
+        p = self.params
+        arrays = {f.name: getattr(p, f.name) for f in fields(p) if np.ndim(getattr(p, f.name))}
+        shape = np.broadcast_shapes(
+            np.shape(y), np.shape(z), *(np.shape(a) for a in arrays.values())
+        )
+
+        def flat(a):
+            return np.broadcast_to(np.asarray(a, dtype=float), shape).ravel()
+
+        return shape, flat(y), flat(z), replace(p, **{name: flat(a) for name, a in arrays.items()})
+
+    def temperature_3d(self, xi, y, z):
         """3D Rosenthal solution for thick plate.
 
         T = T0 + (Q / 2πk) × (1/R) × exp(-v(R+ξ) / (2α))
 
         Parameters
         ----------
-        xi : float
+        xi : float or array-like
             Moving coordinate ξ = x - v*t (m), negative = behind source
-        y : float
+        y : float or array-like
             Transverse distance from weld line (m)
-        z : float
+        z : float or array-like
             Depth below surface (m)
 
         Returns
         -------
-        float
-            Temperature (°C)
+        float or np.ndarray
+            Temperature (°C); an array of the broadcast shape of the
+            coordinates (and array-valued params) unless all are scalars
         """
-        p = self.params
-        R = np.sqrt(xi**2 + y**2 + z**2)
-
-        if R < 1e-6:
-            # Avoid singularity at source; cap at solidification temp
-            return min(p.T0 + p.Q / (2 * np.pi * p.k * 1e-6), 1500.0)
-
-        exponent = -p.v * (R + xi) / (2 * p.alpha)
-        # Clamp exponent to avoid overflow
-        exponent = max(exponent, -500.0)
+        T = _temperature_3d(self.params, xi, y, z)
+        return float(T) if np.ndim(T) == 0 else T
 
-        T = p.T0 + (p.Q / (2 * np.pi * p.k)) * (1.0 / R) * np.exp(exponent)
-        return float(T)
-
-    def temperature_2d(self, xi: float, y: float) -> float:
+    def temperature_2d(self, xi, y):
         """2D Rosenthal solution for thin plate.
 
         T = T0 + (Q / 2πkd) × K0(v·R/(2α)) × exp(-v·ξ/(2α))
 
         Parameters
         ----------
-        xi : float
+        xi : float or array-like
             Moving coordinate (m)
-        y : float
+        y : float or array-like
             Transverse distance (m)
 
         Returns
         -------
-        float
-            Temperature (°C)
+        float or np.ndarray
+            Temperature (°C), broadcast like `temperature_3d`
         """
-        p = self.params
-        d = p.plate_thickness
-        R = np.sqrt(xi**2 + y**2)
+        T = _temperature_2d(self.params, xi, y)
+        return float(T) if np.ndim(T) == 0 else T
+
+    def thermal_cycles(
+        self,
+        y,
+        z=0.0,
+        duration: float = 120.0,
+        n_points: int = 200,
+        use_2d: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute thermal cycles T(t) at many fixed points at once.
+
+        Parameters
+        ----------
+        y : float or array-like
+            Transverse distances from weld line (m)
+        z : float or array-like
+            Depths below surface (m), broadcast against y
+        duration : float
+            Total cycle duration (s)
+        n_points : int
+            Number of time points
+        use_2d : bool
+            Use thin-plate (2D) model instead of 3D
 
-        if R < 1e-6:
-            return min(p.T0 + p.Q / (2 * np.pi * p.k * d * 1e-6), 1500.0)
+        Returns
+        -------
+        tuple of (times, temperatures)
+            times (n_points,) and temperatures (*shape, n_points), where
+            shape broadcasts y, z and any array-valued params
+        """
+        shape, y, z, p = self._flat_points(y, z)
+        times = np.linspace(0, duration, n_points)
 
-        arg_bessel = p.v * R / (2 * p.alpha)
-        # K0 diverges for very large arguments -> temp ~ 0
-        if arg_bessel > 500:
-            return p.T0
+        # The source is at x=0 at t=0; the monitoring point is at (0, y, z)
+        # At time t, source is at x_source = v*t
+        # ξ = x_point - x_source = 0 - v*t = -v*t
+        # But we want the source to approach first (ξ > 0) then recede (ξ < 0)
+        # So center time so source passes at t = duration * 0.15 (heat-up shorter than cool-down)
+        t_pass = duration * 0.15
 
-        exponent = -p.v * xi / (2 * p.alpha)
-        exponent = max(exponent, -500.0)
+        temps = np.empty((y.size, n_points))
+        for sl in _chunk_slices(y.size):
+            p_c = _param_columns(p, sl)
+            xi = -p_c.v * (times - t_pass)  # positive when source approaching
+            if use_2d:
+                temps[sl] = _temperature_2d(p_c, xi, y[sl, None])
+            else:
+                temps[sl] = _temperature_3d(p_c, xi, y[sl, None], z[sl, None])
 
-        T = p.T0 + (p.Q / (2 * np.pi * p.k * d)) * k0(arg_bessel) * np.exp(exponent)
-        return float(T)
+        return times, temps.reshape(shape + (n_points,))
 
     def thermal_cycle_at_point(
         self,
@@ -263,34 +440,57 @@ class RosenthalSolver:
         -------
         tuple of (times, temperatures) as numpy arrays
         """
-        p = self.params
-        times = np.linspace(0, duration, n_points)
+        return self.thermal_cycles(y, z, duration, n_points, use_2d)
 
-        # The source is at x=0 at t=0; the monitoring point is at (0, y, z)
-        # At time t, source is at x_source = v*t
-        # ξ = x_point - x_source = 0 - v*t = -v*t
-        # But we want the source to approach first (ξ > 0) then recede (ξ < 0)
-        # So center time so source passes at t = duration * 0.15 (heat-up shorter than cool-down)
-        t_pass = duration * 0.15
-        xi_arr = -p.v * (times - t_pass)  # positive when source approaching
+    def peak_temperatures(self, y, z=0.0, use_2d: bool = False) -> np.ndarray:
+        """Calculate peak temperatures over arrays of points.
 
-        temps = np.zeros(n_points)
-        for i, xi in enumerate(xi_arr):
+        The peak occurs near ξ=0 for the 3D case, so each point scans
+        PEAK_SCAN_POINTS values of ξ around it; all points are scanned
+        together in chunks.
+
+        Parameters
+        ----------
+        y : float or array-like
+            Transverse distances from weld line (m)
+        z : float or array-like
+            Depths below surface (m), broadcast against y (e.g. a (y, z) grid)
+        use_2d : bool
+            Use thin-plate model
+
+        Returns
+        -------
+        np.ndarray
+            Peak temperatures (°C) of the broadcast shape of y, z and any
+            array-valued params
+        """
+        shape, y, z, p = self._flat_points(y, z)
+        peaks = np.empty(y.size)
+        scan = np.linspace(0.0, 1.0, PEAK_SCAN_POINTS)
+
+        for sl in _chunk_slices(y.size):
+            y_c, z_c = y[sl, None], z[sl, None]
+            # Search for peak by scanning xi around 0
+            # Peak is near ξ = -y for 3D solution
+            lo = -np.maximum(0.05, 5 * np.abs(y_c))
+            hi = np.maximum(0.001, np.abs(y_c))
+            xi = lo + (hi - lo) * scan
+            p_c = _param_columns(p, sl)
             if use_2d:
-                temps[i] = self.temperature_2d(xi, y)
+                T_search = _temperature_2d(p_c, xi, y_c)
             else:
-                temps[i] = self.temperature_3d(xi, y, z)
+                T_search = _temperature_3d(p_c, xi, y_c, z_c)
+            peaks[sl] = T_search.max(axis=1)
 
-        return times, temps
+        # At weld center, cap at solidification
+        peaks[(y < 1e-6) & (z < 1e-6)] = 1500.0
+        return peaks.reshape(shape)
 
     def peak_temperature_at_distance(
         self, distances_m: np.ndarray, z: float = 0.0, use_2d: bool = False
     ) -> np.ndarray:
         """Calculate peak temperature at various transverse distances.
 
-        The peak occurs at ξ=0 for the 3D case, but more precisely
-        we search a small range around ξ=0.
-
         Parameters
         ----------
         distances_m : np.ndarray
@@ -305,33 +505,64 @@ class RosenthalSolver:
         np.ndarray
             Peak temperatures (°C)
         """
-        peak_temps = np.zeros(len(distances_m))
+        return self.peak_temperatures(np.asarray(distances_m, dtype=float), z, use_2d)
 
-        for i, y in enumerate(distances_m):
-            if y < 1e-6 and z < 1e-6:
-                # At weld center, cap at solidification
-                peak_temps[i] = 1500.0
-                continue
+    def haz_boundary_distances(self, target_temps, z=0.0, use_2d: bool = False) -> np.ndarray:
+        """Find the transverse distances where peak temperature equals targets.
 
-            # Search for peak by scanning xi around 0
-            # Peak is near ξ = -y for 3D solution
-            xi_search = np.linspace(-max(0.05, 5 * abs(y)), max(0.001, abs(y)), 500)
-            if use_2d:
-                T_search = np.array([self.temperature_2d(xi, y) for xi in xi_search])
-            else:
-                T_search = np.array([self.temperature_3d(xi, y, z) for xi in xi_search])
+        Brackets every target between 0.5 mm and the first of 1, 2, 4 ...
+        128 mm whose peak falls below it, then bisects all brackets
+        together to 0.1 µm.
 
-            peak_temps[i] = float(np.max(T_search))
+        Parameters
+        ----------
+        target_temps : float or array-like
+            Target peak temperatures (°C), e.g. [1500, 1100, 900, 727]
+        z : float or array-like
+            Depth below surface (m), broadcast against target_temps
+        use_2d : bool
+            Use thin-plate model
+
+        Returns
+        -------
+        np.ndarray
+            Distances from weld center (m): 0.0 where a target is not
+            reached, capped at 0.2
+        """
+        targets = np.asarray(target_temps, dtype=float)
 
-        return peak_temps
+        # Check that peak at some close distance exceeds target
+        y_close = 0.0005  # 0.5 mm
+        reached = self.peak_temperatures(np.full(targets.shape, y_close), z, use_2d) >= targets
+        shape = reached.shape
+        targets = np.broadcast_to(targets, shape)
+        z = np.broadcast_to(np.asarray(z, dtype=float), shape)
+
+        # Find upper bound where T_peak < target, up to 200mm
+        hi = np.full(shape, np.inf)
+        for y_max in 0.001 * 2.0 ** np.arange(8):
+            below = np.isinf(hi) & (
+                self.peak_temperatures(np.full(shape, y_max), z, use_2d) < targets
+            )
+            hi[below] = y_max
+        capped = np.isinf(hi)
+
+        lo = np.full(shape, y_close)
+        hi[capped] = 0.2
+        for _ in range(_BISECTION_STEPS):
+            mid = 0.5 * (lo + hi)
+            above = self.peak_temperatures(mid, z, use_2d) >= targets
+            lo = np.where(above, mid, lo)
+            hi = np.where(above, hi, mid)
+
+        distances = np.where(capped, 0.2, 0.5 * (lo + hi))
+        return np.where(reached, distances, 0.0)
 
     def haz_boundary_distance(
         self, target_temp: float, z: float = 0.0, use_2d: bool = False
     ) -> float:
         """Find the transverse distance where peak temperature equals target.
 
-        Uses root-finding (Brent's method) to solve T_peak(y) = target_temp.
-
         Parameters
         ----------
         target_temp : float
@@ -346,36 +577,30 @@ class RosenthalSolver:
         float
             Distance from weld center (m), or 0.0 if target not reached
         """
-        p = self.params
-
-        # Check that peak at some close distance exceeds target
-        y_close = 0.0005  # 0.5 mm
-        T_close = self.peak_temperature_at_distance(np.array([y_close]), z, use_2d)[0]
+        return float(self.haz_boundary_distances(target_temp, z, use_2d))
 
-        if T_close < target_temp:
-            return 0.0  # Target temp not reached even close to weld
+    def t8_5(self, y, z=0.0, use_2d: bool = False) -> np.ndarray:
+        """Calculate t8/5 cooling times over arrays of points.
 
-        # Binary search / brentq for the boundary
-        def func(y_val):
-            T_peak = self.peak_temperature_at_distance(np.array([y_val]), z, use_2d)[0]
-            return T_peak - target_temp
-
-        # Find upper bound where T_peak < target
-        y_max = 0.001  # Start at 1mm
-        while y_max < 0.2:  # Up to 200mm
-            T_far = self.peak_temperature_at_distance(np.array([y_max]), z, use_2d)[0]
-            if T_far < target_temp:
-                break
-            y_max *= 2
-
-        if y_max >= 0.2:
-            return 0.2  # Cap
+        Parameters
+        ----------
+        y : float or array-like
+            Transverse distances from weld line (m)
+        z : float or array-like
+            Depths below surface (m), broadcast against y
+        use_2d : bool
+            Use thin-plate model
 
-        try:
-            y_boundary = brentq(func, y_close, y_max, xtol=1e-6, maxiter=100)
-            return float(y_boundary)
-        except ValueError:
-            return 0.0
+        Returns
+        -------
+        np.ndarray
+            Cooling times 800->500°C (s) of the broadcast shape, NaN where
+            not applicable
+        """
+        times, temps = self.thermal_cycles(
+            y, z, duration=T85_CYCLE_DURATION, n_points=T85_CYCLE_POINTS, use_2d=use_2d
+        )
+        return cooling_time_8_5(times, temps)
 
     def t8_5_at_point(self, y: float, z: float = 0.0, use_2d: bool = False) -> float | None:
         """Calculate t8/5 cooling time at a specific point.
@@ -396,60 +621,14 @@ class RosenthalSolver:
         """
         # Generate a thermal cycle at this point
         times, temps = self.thermal_cycle_at_point(
-            y, z, duration=300.0, n_points=500, use_2d=use_2d
+            y, z, duration=T85_CYCLE_DURATION, n_points=T85_CYCLE_POINTS, use_2d=use_2d
         )
 
         if len(temps) == 0:
             return None
 
-        # Check if peak temperature exceeds 800°C
-        if np.max(temps) < 800:
-            return None
-
-        # Find peak index
-        peak_idx = np.argmax(temps)
-
-        # Only look at cooling portion (after peak)
-        cool_times = times[peak_idx:]
-        cool_temps = temps[peak_idx:]
-
-        # Find time when temperature crosses 800°C (cooling down)
-        idx_800 = None
-        for i in range(len(cool_temps) - 1):
-            if cool_temps[i] >= 800 and cool_temps[i + 1] < 800:
-                denom = cool_temps[i] - cool_temps[i + 1]
-                if denom <= 0:  # flat/NaN-tainted data
-                    continue
-                # Linear interpolation
-                frac = (800 - cool_temps[i + 1]) / denom
-                t_800 = cool_times[i + 1] + frac * (cool_times[i] - cool_times[i + 1])
-                idx_800 = t_800
-                break
-
-        if idx_800 is None:
-            # Temperature starts below 800 after peak; use peak time
-            if cool_temps[0] >= 800:
-                idx_800 = cool_times[0]
-            else:
-                return None
-
-        # Find time when temperature crosses 500°C
-        idx_500 = None
-        for i in range(len(cool_temps) - 1):
-            if cool_temps[i] >= 500 and cool_temps[i + 1] < 500:
-                denom = cool_temps[i] - cool_temps[i + 1]
-                if denom <= 0:  # flat/NaN-tainted data
-                    continue
-                frac = (500 - cool_temps[i + 1]) / denom
-                t_500 = cool_times[i + 1] + frac * (cool_times[i] - cool_times[i + 1])
-                idx_500 = t_500
-                break
-
-        if idx_500 is None:
-            return None
-
-        t8_5 = idx_500 - idx_800
-        return float(t8_5) if t8_5 > 0 else None
+        t8_5 = float(cooling_time_8_5(times, temps))
+        return None if np.isnan(t8_5) else t8_5
 
     def fusion_zone_width(self, solidus_temp: float = 1500.0, z: float = 0.0) -> float:
         """Estimate the fusion zone half-width.
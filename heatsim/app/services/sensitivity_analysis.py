@@ -2,6 +2,7 @@
 
 Varies one parameter at a time (OAT) and measures impact on key outputs:
 t8/5, core cooling rate, surface cooling rate, predicted hardness.
+All variations are solved together as one batched heat solve.
 """
 
 import copy
@@ -10,8 +11,7 @@ from dataclasses import dataclass, field
 
 import numpy as np
 
-from app.services.geometry import create_geometry
-from app.services.heat_solver import MultiPhaseHeatSolver, SolverConfig
+from app.services.batch_simulation import MaterialSnapshot, SimulationVariant, solve_variants
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +114,7 @@ class SensitivityAnalyzer:
 
         base_outputs = self._get_base_outputs()
         result = SensitivityAnalysisResult()
+        runs: list[tuple[SensitivityResult, str, float]] = []
 
         for param_key in parameters:
             if param_key not in SENSITIVITY_PARAMETERS:
@@ -136,15 +137,18 @@ class SensitivityAnalyzer:
             for var in param_def["variations"]:
                 new_value = base_value * (1 + var)
                 param_result.actual_values.append(round(new_value, 2))
-
-                outputs = self._run_with_modified_param(param_key, new_value)
-                for key in OUTPUT_KEYS:
-                    if key not in param_result.outputs:
-                        param_result.outputs[key] = []
-                    param_result.outputs[key].append(outputs.get(key, 0.0))
+                runs.append((param_result, param_key, new_value))
 
             result.parameters.append(param_result)
 
+        # Solve every variation of every parameter as one batch
+        batch_outputs = self._run_batch([(key, value) for _, key, value in runs])
+        for (param_result, _, _), outputs in zip(runs, batch_outputs, strict=True):
+            for key in OUTPUT_KEYS:
+                if key not in param_result.outputs:
+                    param_result.outputs[key] = []
+                param_result.outputs[key].append(outputs.get(key, 0.0))
+
         return result
 
     def _get_applicable_parameters(self) -> list[str]:
@@ -202,10 +206,10 @@ class SensitivityAnalyzer:
 
         # Surface cooling rate from multi-position data
         if full_result:
-            data = full_result.data_dict
-            if data and "surface" in data:
-                times = np.array(full_result.time_array)
-                surface_temps = np.array(data["surface"])
+            series = full_result.position_series
+            if "surface" in series:
+                times = full_result.time_series
+                surface_temps = series["surface"]
                 if len(times) > 2:
                     dtdt = np.gradient(surface_temps, times)
                     outputs["surface_cooling_rate"] = round(abs(float(np.min(dtdt))), 1)
@@ -220,86 +224,100 @@ class SensitivityAnalyzer:
 
     def _run_with_modified_param(self, param_key: str, new_value: float) -> dict[str, float]:
         """Run a single solver with one parameter modified."""
-        try:
-            ht_config = copy.deepcopy(self.sim.ht_config or {})
-            geom_config = copy.deepcopy(self.sim.geometry_dict or {})
-
-            # Apply modification
-            self._apply_parameter_change(param_key, new_value, ht_config, geom_config)
-
-            # Build geometry
-            geom_type = self.sim.cad_equivalent_type or self.sim.geometry_type
-            if self.sim.geometry_type == "cad":
-                geom_config = copy.deepcopy(self.sim.cad_equivalent_geometry_dict or geom_config)
-                if param_key == "part_size":
-                    self._apply_parameter_change(param_key, new_value, ht_config, geom_config)
-
-            geometry = create_geometry(geom_type, geom_config)
-
-            # Reduced resolution for speed
-            solver_dict = copy.deepcopy(self.sim.solver_dict or {})
-            solver_dict["n_nodes"] = min(solver_dict.get("n_nodes", 31), 31)
-            solver_config = SolverConfig.from_dict(solver_dict)
-
-            # Material properties
-            grade = self.sim.steel_grade
-            k_prop = grade.get_property("thermal_conductivity")
-            cp_prop = grade.get_property("specific_heat")
-            rho_prop = grade.get_property("density")
-            emiss_prop = grade.get_property("emissivity")
-            density = rho_prop.data_dict.get("value", 7850) if rho_prop else 7850
-            emissivity = emiss_prop.data_dict.get("value", 0.85) if emiss_prop else 0.85
-
-            # Solver
-            solver = MultiPhaseHeatSolver(geometry, config=solver_config)
-            solver.set_material(k_prop, cp_prop, density, emissivity)
-            solver.configure_from_ht_config(ht_config)
-
-            heating_cfg = ht_config.get("heating", {})
-            if heating_cfg.get("enabled", False):
-                initial_temp = heating_cfg.get("initial_temperature", 25.0)
-            else:
-                initial_temp = heating_cfg.get("target_temperature", 850.0)
-
-            result = solver.solve(initial_temperature=initial_temp)
-
-            # Extract outputs
-            outputs = {
-                "t8_5": round(result.t8_5 or 0.0, 2),
-                "core_cooling_rate": round(300.0 / max(result.t8_5 or 0.1, 0.1), 1),
-                "surface_cooling_rate": 0.0,
-                "hardness_hv_center": 0.0,
-                "hardness_hv_surface": 0.0,
-            }
-
-            # Surface cooling rate
-            n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
-            if n_pos > 1:
-                surface_temp = result.temperature[:, -1]
-                dtdt = np.gradient(surface_temp, result.time)
-                outputs["surface_cooling_rate"] = round(abs(float(np.min(dtdt))), 1)
-
-            # Hardness prediction
-            diagram = grade.phase_diagrams.first()
-            if diagram and grade.composition:
-                from app.services.hardness_predictor import predict_hardness_profile
-                from app.services.phase_tracker import PhaseTracker
-
-                tracker = PhaseTracker(diagram)
-                try:
-                    hr = predict_hardness_profile(
-                        grade.composition, result.temperature, result.time, tracker
-                    )
-                    outputs["hardness_hv_center"] = hr.hardness_hv.get("center", 0)
-                    outputs["hardness_hv_surface"] = hr.hardness_hv.get("surface", 0)
-                except Exception:
-                    pass
-
-            return outputs
+        return self._run_batch([(param_key, new_value)])[0]
+
+    def _run_batch(self, runs: list[tuple[str, float]]) -> list[dict[str, float]]:
+        """Solve several one-parameter modifications in one batched solve.
+
+        Parameters
+        ----------
+        runs : list of (param_key, new_value)
+            Modifications to evaluate
 
+        Returns
+        -------
+        list of dict
+            Outputs per run; all zeros for runs that failed
+        """
+        variants = [self._build_variant(key, value) for key, value in runs]
+        grade = self.sim.steel_grade
+        try:
+            results = solve_variants(
+                MaterialSnapshot.from_grade(grade), variants, self.sim.solver_dict
+            )
         except Exception as e:
-            logger.error(f"Sensitivity run failed for {param_key}={new_value}: {e}")
-            return {k: 0.0 for k in OUTPUT_KEYS}
+            logger.error(f"Sensitivity batch failed: {e}")
+            return [{k: 0.0 for k in OUTPUT_KEYS} for _ in variants]
+
+        # Hardness prediction needs a phase diagram and composition
+        tracker = None
+        diagram = grade.phase_diagrams.first()
+        if diagram and grade.composition:
+            from app.services.phase_tracker import PhaseTracker
+
+            tracker = PhaseTracker(diagram)
+
+        outputs = []
+        for (param_key, new_value), solver_result in zip(runs, results, strict=True):
+            if solver_result is None:
+                logger.error(f"Sensitivity run failed for {param_key}={new_value}")
+                outputs.append({k: 0.0 for k in OUTPUT_KEYS})
+                continue
+            try:
+                outputs.append(self._extract_outputs(solver_result, tracker))
+            except Exception as e:
+                logger.error(f"Sensitivity run failed for {param_key}={new_value}: {e}")
+                outputs.append({k: 0.0 for k in OUTPUT_KEYS})
+        return outputs
+
+    def _build_variant(self, param_key: str, new_value: float) -> SimulationVariant:
+        """Copy the simulation configs with one parameter modified."""
+        ht_config = copy.deepcopy(self.sim.ht_config or {})
+        geom_config = copy.deepcopy(self.sim.geometry_dict or {})
+
+        # Apply modification
+        self._apply_parameter_change(param_key, new_value, ht_config, geom_config)
+
+        # Build geometry
+        geom_type = self.sim.cad_equivalent_type or self.sim.geometry_type
+        if self.sim.geometry_type == "cad":
+            geom_config = copy.deepcopy(self.sim.cad_equivalent_geometry_dict or geom_config)
+            if param_key == "part_size":
+                self._apply_parameter_change(param_key, new_value, ht_config, geom_config)
+
+        return SimulationVariant(geom_type, geom_config, ht_config)
+
+    def _extract_outputs(self, result, tracker) -> dict[str, float]:
+        """Key outputs of one solved variant."""
+        outputs = {
+            "t8_5": round(result.t8_5 or 0.0, 2),
+            "core_cooling_rate": round(300.0 / max(result.t8_5 or 0.1, 0.1), 1),
+            "surface_cooling_rate": 0.0,
+            "hardness_hv_center": 0.0,
+            "hardness_hv_surface": 0.0,
+        }
+
+        # Surface cooling rate
+        n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
+        if n_pos > 1:
+            surface_temp = result.temperature[:, -1]
+            dtdt = np.gradient(surface_temp, result.time)
+            outputs["surface_cooling_rate"] = round(abs(float(np.min(dtdt))), 1)
+
+        # Hardness prediction
+        if tracker is not None:
+            from app.services.hardness_predictor import predict_hardness_profile
+
+            try:
+                hr = predict_hardness_profile(
+                    self.sim.steel_grade.composition, result.temperature, result.time, tracker
+                )
+                outputs["hardness_hv_center"] = hr.hardness_hv.get("center", 0)
+                outputs["hardness_hv_surface"] = hr.hardness_hv.get("surface", 0)
+            except Exception:
+                pass
+
+        return outputs
 
     def _apply_parameter_change(self, param_key, new_value, ht_config, geom_config):
         """Apply parameter change to configs in-place."""
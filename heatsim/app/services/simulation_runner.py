@@ -7,6 +7,8 @@ without a Flask request context (no flash() calls).
 import logging
 from datetime import datetime
 
+import numpy as np
+
 from app.extensions import db
 from app.models import AuditLog, SimulationSnapshot
 from app.models.simulation import (
@@ -23,10 +25,12 @@ from app.services import (
     SolverConfig,
     create_geometry,
     predict_hardness_profile,
+    result_cache,
     visualization,
 )
 from app.services.hardness_predictor import POSITION_KEYS, HardnessPredictor
-from app.services.property_evaluator import evaluate_scalar
+from app.services.plot_renderer import defer_plot
+from app.services.property_evaluator import compile_property, evaluate_scalar
 from app.services.snapshot_service import SnapshotService
 
 logger = logging.getLogger(__name__)
@@ -56,6 +60,16 @@ def run_heat_treatment(simulation_id: int) -> None:
             "run_simulation", resource_type="simulation", resource_id=sim.id, resource_name=sim.name
         )
 
+        # Same inputs solved before: copy those results instead of solving
+        source = result_cache.lookup(sim, snapshot)
+        if source is not None:
+            result_cache.reuse(source, sim, snapshot)
+            sim.status = STATUS_COMPLETED
+            sim.completed_at = datetime.utcnow()
+            db.session.commit()
+            logger.info("Simulation %d reused results of snapshot #%d", sim.id, source.id)
+            return
+
         # Check solver type: COMSOL or built-in
         solver_type = sim.solver_dict.get("solver_type", "builtin")
 
@@ -71,6 +85,11 @@ def run_heat_treatment(simulation_id: int) -> None:
 
         # ---------- Built-in 1D FDM path ----------
         _run_builtin(sim, snapshot)
+        try:
+            result_cache.store(snapshot)
+        except Exception:
+            db.session.rollback()
+            logger.exception("Could not cache results of simulation %d", simulation_id)
 
     except Exception as e:
         sim.status = STATUS_FAILED
@@ -81,10 +100,37 @@ def run_heat_treatment(simulation_id: int) -> None:
         logger.exception("Simulation %d failed: %s", simulation_id, e)
 
 
+def _four_point_series(temperature: np.ndarray) -> dict[str, np.ndarray]:
+    """Temperature history at the 4 reported radial positions.
+
+    Empty for single-position results.
+    """
+    n_pos = temperature.shape[1] if temperature.ndim > 1 else 1
+    if n_pos < 2:
+        return {}
+    return {
+        "center": temperature[:, 0],
+        "one_third": temperature[:, n_pos // 3],
+        "two_thirds": temperature[:, 2 * n_pos // 3],
+        "surface": temperature[:, n_pos - 1],
+    }
+
+
+def _phase_spans(phase_results) -> list[dict]:
+    """Start and end time of each solved phase, for cycle plot shading."""
+    return [
+        {"phase_name": pr.phase_name, "start_time": pr.start_time, "end_time": pr.end_time}
+        for pr in phase_results or []
+        if pr.time.size >= 2
+    ]
+
+
 def _predict_phases(sim, snapshot, grade, diagram, times, center_temp, t85):
     """Run phase prediction and store result.
 
-    Returns (tracker, phases) — tracker is set when using PhaseTracker fallback.
+    Returns (tracker, phases) — tracker is the phase model hardness
+    prediction uses: the PhasePredictor for grades with JMAK parameters,
+    otherwise the PhaseTracker fallback.
     """
     from app.services.phase_transformation import PhasePredictor
 
@@ -96,6 +142,7 @@ def _predict_phases(sim, snapshot, grade, diagram, times, center_temp, t85):
 
     predictor = PhasePredictor(grade)
     if predictor.is_available:
+        tracker = predictor
         phases = predictor.predict_phases_scheil(times, center_temp, t85)
         logger.info("Phase prediction via JMAK/Scheil for %s", grade.designation)
     elif diagram:
@@ -111,18 +158,25 @@ def _predict_phases(sim, snapshot, grade, diagram, times, center_temp, t85):
             location="center",
         )
         phase_result_obj.set_phase_fractions(phases.to_dict())
-        phase_result_obj.plot_image = visualization.create_phase_fraction_plot(
-            phases.to_dict(), title=f"Predicted Phase Fractions - {sim.name}"
+        defer_plot(
+            phase_result_obj,
+            "phase_fraction",
+            phases=phases.to_dict(),
+            title=f"Predicted Phase Fractions - {sim.name}",
         )
         db.session.add(phase_result_obj)
 
     return tracker, phases
 
 
-def _predict_hardness(sim, snapshot, grade, ht_config, temperatures_2d, times, tracker):
-    """Run hardness prediction and store result."""
-    diagram = grade.phase_diagrams.first() if grade else None
-    if not (diagram and grade and grade.composition):
+def _predict_hardness(
+    sim, snapshot, grade, ht_config, temperatures_2d, times, tracker, positions=None
+):
+    """Run hardness prediction and store result.
+
+    With the solver node positions the full radial profile is predicted too.
+    """
+    if tracker is None or not (grade and grade.composition):
         return
 
     try:
@@ -131,6 +185,7 @@ def _predict_hardness(sim, snapshot, grade, ht_config, temperatures_2d, times, t
             temperatures=temperatures_2d,
             times=times,
             phase_tracker=tracker,
+            positions=positions,
         )
 
         hardness_sim_result = SimulationResult(
@@ -162,8 +217,16 @@ def _predict_hardness(sim, snapshot, grade, ht_config, temperatures_2d, times, t
             hardness_result.tempering_time = hold_min
 
         hardness_sim_result.set_data(hardness_result.to_dict())
-        hardness_sim_result.plot_image = visualization.create_hardness_profile_plot(
-            hardness_result, title=f"Predicted Hardness - {sim.name}"
+        defer_plot(
+            hardness_sim_result,
+            "hardness_profile",
+            hardness={
+                "hardness_hv": hardness_result.hardness_hv,
+                "hardness_hrc": hardness_result.hardness_hrc,
+                "tempered_hardness_hv": hardness_result.tempered_hardness_hv,
+                "tempered_hardness_hrc": hardness_result.tempered_hardness_hrc,
+            },
+            title=f"Predicted Hardness - {sim.name}",
         )
         db.session.add(hardness_sim_result)
     except Exception as e:
@@ -237,7 +300,8 @@ def _run_comsol(sim: Simulation, snapshot: SimulationSnapshot) -> None:
             try:
                 from app.simulation.routes import _get_cct_curves_for_grade
 
-                cct_curves = _get_cct_curves_for_grade(grade, diagram)
+                # Read stored curves but don't commit mid-job
+                cct_curves = _get_cct_curves_for_grade(grade, diagram, store=False)
 
                 if cct_curves and combined_center is not None:
                     if combined_surface is not None:
@@ -367,24 +431,11 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
         location="center",
         t_800_500=float(result.t8_5) if result.t8_5 is not None else None,
     )
-    cycle_result.set_time_data(result.time.tolist())
-    cycle_result.set_value_data(result.center_temp.tolist())
-
-    # Store multi-position temperature data for CCT overlay
-    n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
-    multi_pos_data = {}
-    if n_pos > 1:
-        idx_center = 0
-        idx_one_third = n_pos // 3
-        idx_two_thirds = 2 * n_pos // 3
-        idx_surface = n_pos - 1
-        multi_pos_data = {
-            "positions": ["center", "one_third", "two_thirds", "surface"],
-            "center": result.temperature[:, idx_center].tolist(),
-            "one_third": result.temperature[:, idx_one_third].tolist(),
-            "two_thirds": result.temperature[:, idx_two_thirds].tolist(),
-            "surface": result.temperature[:, idx_surface].tolist(),
-        }
+    # Store center plus multi-position temperature data (for CCT overlay)
+    # as one compressed binary series
+    positions = _four_point_series(result.temperature)
+    cycle_result.set_series(result.time, result.center_temp, positions)
+    multi_pos_data = {"positions": list(positions)} if positions else {}
 
     # Build furnace/ambient temperature list for plotting (with ramp info)
     furnace_temps = []
@@ -436,21 +487,25 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
     # Persist furnace profile so interactive plots can rebuild it client-side
     if furnace_temps:
         multi_pos_data["furnace_segments"] = furnace_temps
+    # Step statistics (adaptive step count / wall-time reduction)
+    if result.solver_info:
+        multi_pos_data["solver_info"] = result.solver_info
     if multi_pos_data:
         cycle_result.set_data(multi_pos_data)
 
-    # Create comprehensive plot with phase markers (4 radial positions)
-    cycle_result.plot_image = visualization.create_heat_treatment_cycle_plot(
-        result.time,
-        result.temperature,
-        phase_results=result.phase_results,
+    # Comprehensive plot with phase markers (4 radial positions), rendered on demand
+    defer_plot(
+        cycle_result,
+        "cycle",
         title=f"Heat Treatment Cycle - {sim.name}",
         transformation_temps=trans_temps,
         furnace_temps=furnace_temps,
+        phase_spans=_phase_spans(result.phase_results),
     )
     db.session.add(cycle_result)
 
     # Store individual phase results with T vs Time plots
+    phase_rows = {}
     if result.phase_results:
         for phase_result in result.phase_results:
             if not phase_result.time.size or len(phase_result.time) < 2:
@@ -466,34 +521,23 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
                 location="center",
                 t_800_500=float(phase_result.t8_5) if phase_result.t8_5 is not None else None,
             )
-            pr.set_time_data(phase_result.absolute_time.tolist())
-            pr.set_value_data(phase_result.center_temp.tolist())
-
             # Persist multi-position temperatures so interactive plots can
             # render all four radial positions (and derive dT/dt and power)
-            phase_n_pos = (
-                phase_result.temperature.shape[1] if phase_result.temperature.ndim > 1 else 1
-            )
-            if phase_n_pos > 1:
-                pr.set_data(
-                    {
-                        "positions": ["center", "one_third", "two_thirds", "surface"],
-                        "center": phase_result.temperature[:, 0].tolist(),
-                        "one_third": phase_result.temperature[:, phase_n_pos // 3].tolist(),
-                        "two_thirds": phase_result.temperature[:, 2 * phase_n_pos // 3].tolist(),
-                        "surface": phase_result.temperature[:, phase_n_pos - 1].tolist(),
-                    }
-                )
+            positions = _four_point_series(phase_result.temperature)
+            pr.set_series(phase_result.absolute_time, phase_result.center_temp, positions)
+            if positions:
+                pr.set_data({"positions": list(positions)})
 
             if phase_result.temperature.size > 0:
-                pr.plot_image = visualization.create_heat_treatment_cycle_plot(
-                    phase_result.time,
-                    phase_result.temperature,
-                    phase_results=None,
+                defer_plot(
+                    pr,
+                    "cycle",
                     title=f"{phase_result.phase_name.title()} - {sim.name}",
                     transformation_temps=trans_temps,
+                    relative_time=True,
                 )
             db.session.add(pr)
+            phase_rows[phase_result.phase_name] = pr
 
     # Store temperature profile result
     profile_result = SimulationResult(
@@ -509,11 +553,12 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
     time_indices = [i for i in time_indices if i < n_times]
 
     is_cylindrical = sim.geometry_type in ["cylinder", "ring", "hollow_cylinder"]
-    profile_result.plot_image = visualization.create_temperature_profile_plot(
-        result.positions,
-        result.temperature,
-        result.time,
-        time_indices,
+    # Keep only the plotted profiles: [selected time, node]
+    profile_result.set_series(result.time[time_indices], result.temperature[time_indices, :])
+    defer_plot(
+        profile_result,
+        "temperature_profile",
+        positions=result.positions,
         title=f"Temperature Profile - {sim.name}",
         is_cylindrical=is_cylindrical,
     )
@@ -523,7 +568,16 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
     tracker, _ = _predict_phases(
         sim, snapshot, grade, diagram, result.time, result.center_temp, result.t8_5
     )
-    _predict_hardness(sim, snapshot, grade, ht_config, result.temperature, result.time, tracker)
+    _predict_hardness(
+        sim,
+        snapshot,
+        grade,
+        ht_config,
+        result.temperature,
+        result.time,
+        tracker,
+        positions=result.positions,
+    )
 
     # Cooling rate plot
     rate_result = SimulationResult(
@@ -533,9 +587,7 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
         phase="full",
         location="all",
     )
-    rate_result.plot_image = visualization.create_cooling_rate_plot(
-        result.time, result.center_temp, result.surface_temp, title=f"Cooling Rate - {sim.name}"
-    )
+    defer_plot(rate_result, "cooling_rate", source=cycle_result, title=f"Cooling Rate - {sim.name}")
     db.session.add(rate_result)
 
     # Generate dT/dt plots for heating and quenching phases
@@ -547,6 +599,7 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
                 continue
 
             phase_label = phase_result.phase_name.title()
+            source = phase_rows[phase_result.phase_name]
 
             # dT/dt vs Time plot
             dtdt_time_result = SimulationResult(
@@ -556,9 +609,10 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
                 phase=phase_result.phase_name,
                 location="all",
             )
-            dtdt_time_result.plot_image = visualization.create_dTdt_vs_time_plot(
-                phase_result.time,
-                phase_result.temperature,
+            defer_plot(
+                dtdt_time_result,
+                "dtdt_time",
+                source=source,
                 title=f"dT/dt vs Time ({phase_label}) - {sim.name}",
                 phase_name=phase_result.phase_name,
             )
@@ -572,9 +626,10 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
                 phase=phase_result.phase_name,
                 location="all",
             )
-            dtdt_temp_result.plot_image = visualization.create_dTdt_vs_temperature_plot(
-                phase_result.time,
-                phase_result.temperature,
+            defer_plot(
+                dtdt_temp_result,
+                "dtdt_temp",
+                source=source,
                 title=f"dT/dt vs Temperature ({phase_label}) - {sim.name}",
                 phase_name=phase_result.phase_name,
             )
@@ -582,15 +637,11 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
 
     # Generate absorbed power plots for heating and tempering phases
     if result.phase_results:
-        import numpy as np
-
         # Calculate mass from geometry
         mass = geometry.volume * density  # kg
 
-        # Create Cp interpolation function
-        def get_cp_at_temp(temp):
-            """Get specific heat at given temperature."""
-            return evaluate_scalar(cp_prop, 500.0, temperature=temp)
+        # Vectorized Cp(T) lookup
+        cp_func = compile_property(cp_prop, 500.0)
 
         for phase_result in result.phase_results:
             if phase_result.phase_name not in ("heating", "tempering"):
@@ -601,7 +652,7 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
             phase_label = phase_result.phase_name.title()
 
             center_temp = phase_result.center_temp
-            cp_values = np.array([get_cp_at_temp(t) for t in center_temp])
+            cp_values = cp_func(center_temp)
 
             power_result = SimulationResult(
                 simulation_id=sim.id,
@@ -610,11 +661,14 @@ def _run_builtin(sim: Simulation, snapshot: SimulationSnapshot) -> None:
                 phase=phase_result.phase_name,
                 location="all",
             )
-            power_result.plot_image = visualization.create_absorbed_power_plot(
-                phase_result.time,
-                phase_result.temperature,
+            # Cp(T) along the phase is the row's own series; temperatures come
+            # from the phase row
+            power_result.set_series(phase_result.time, cp_values)
+            defer_plot(
+                power_result,
+                "absorbed_power",
+                source=phase_rows[phase_result.phase_name],
                 mass=mass,
-                cp_values=cp_values,
                 title=f"Absorbed Power ({phase_label}) - {sim.name}",
                 phase_name=phase_result.phase_name,
             )
@@ -658,10 +712,7 @@ def _add_comsol_absorbed_power(
     density = evaluate_scalar(rho_prop, 7850.0, temperature=20.0)
     mass = geometry.volume * density
 
-    cp_prop = grade.get_property("specific_heat")
-
-    def get_cp_at_temp(temp):
-        return evaluate_scalar(cp_prop, 500.0, temperature=temp)
+    cp_func = compile_property(grade.get_property("specific_heat"), 500.0)
 
     for phase_name, phase_data in solver_results.get("phases", {}).items():
         if phase_name not in ("heating", "tempering"):
@@ -674,7 +725,7 @@ def _add_comsol_absorbed_power(
 
         times_arr = np.array(times)
         center_arr = np.array(center)
-        cp_values = np.array([get_cp_at_temp(t) for t in center_arr])
+        cp_values = cp_func(center_arr)
 
         # Build 2D temperature array (same helper approach as extractor)
         surface = phase_data.get("surface_temps", [])
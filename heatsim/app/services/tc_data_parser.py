@@ -2,20 +2,88 @@
 
 Supports the format from temperature loggers with up to 8 channels.
 Format: date;time;network ID;device type;device ID;sensor;data channel;data flags;data sequence number;value;
+
+Files are read in chunks of CHUNK_ROWS rows; timestamps and comma decimals
+are parsed per chunk with pandas and each channel's samples are kept as
+numpy arrays, so memory beyond the parsed arrays does not grow with the
+file. Validation and previews only read the first rows.
 """
 
-import csv
 import io
-from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Columns read from the logger export
+REQUIRED_COLUMNS = ("date", "time", "sensor", "value")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Rows parsed per chunk
+CHUNK_ROWS = 100_000
+
+# Rows read by validate_tc_csv and previews
+HEAD_ROWS = 20_000
+
+
+def _open_source(source):
+    """File-like object for a CSV given as text, bytes or an open file."""
+    if isinstance(source, str):
+        return io.StringIO(source)
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
 
 
-def parse_tc_csv(file_content: str) -> dict:
+def _parse_chunk(chunk: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Parse the well-formed rows of a chunk.
+
+    Rows the fast path rejects (padded fields, malformed values) are
+    retried with fields stripped.
+
+    Returns
+    -------
+    tuple of (seconds, values, codes, names)
+        Epoch seconds, values and sensor codes of the well-formed rows,
+        and the sensor name of each code
+    """
+    date, clock = chunk["date"], chunk["time"]
+    stamps = pd.to_datetime(date + " " + clock, format=TIMESTAMP_FORMAT, errors="coerce")
+    retry = stamps.isna()
+    if retry.any():
+        stamps[retry] = pd.to_datetime(
+            date[retry].str.strip() + " " + clock[retry].str.strip(),
+            format=TIMESTAMP_FORMAT,
+            errors="coerce",
+        )
+
+    # The reader parses comma decimals; a column with malformed values stays text
+    values = chunk["value"]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(
+            values.str.strip().str.replace(",", ".", regex=False), errors="coerce"
+        )
+
+    codes, names = pd.factorize(chunk["sensor"])
+    names = np.asarray([name.strip() for name in names], dtype=object)
+
+    ok = (stamps.notna() & values.notna()).to_numpy() & (codes >= 0)
+    ok[ok] = names[codes[ok]] != ""
+    seconds = stamps.to_numpy()[ok].astype("datetime64[s]").astype(np.int64)
+    return seconds, values.to_numpy(dtype=float)[ok], codes[ok], names
+
+
+def parse_tc_csv(source, max_rows: int | None = None, chunk_rows: int = CHUNK_ROWS) -> dict:
     """Parse thermocouple logger CSV data.
 
     Parameters
     ----------
-    file_content : str
-        CSV file content as string
+    source : str, bytes or file-like
+        CSV content, or an open text or binary (UTF-8) file; a file is read
+        from its current position
+    max_rows : int, optional
+        Stop after this many data rows (default: read the whole file)
+    chunk_rows : int
+        Rows parsed at a time
 
     Returns
     -------
@@ -24,128 +92,151 @@ def parse_tc_csv(file_content: str) -> dict:
         - start_time: datetime
         - end_time: datetime
         - duration_seconds: float
-        - times: list of seconds from start
-        - channels: dict of {channel_name: [temperatures]}
-        - statistics: dict of {channel_name: {min, max, avg}}
+        - times: array of seconds from start (first channel)
+        - channels: dict of {channel_name: array of temperatures}
+        - channel_times: dict of {channel_name: array of seconds from start}
+        - statistics: dict of {channel_name: {min, max, avg, count}}
     """
-    # Parse CSV with semicolon delimiter
-    reader = csv.DictReader(io.StringIO(file_content), delimiter=";")
-
-    # Collect data by channel
-    channel_data: dict[str, list[tuple[datetime, float]]] = {}
-
-    for row in reader:
-        try:
-            # Parse date and time
-            date_str = row.get("date", "").strip()
-            time_str = row.get("time", "").strip()
-            if not date_str or not time_str:
-                continue
-
-            timestamp = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
-
-            # Get sensor/channel name
-            sensor = row.get("sensor", "").strip()
-            if not sensor:
-                continue
-
-            # Parse value (European decimal format: comma as decimal separator)
-            value_str = row.get("value", "").strip()
-            if not value_str:
-                continue
-            value = float(value_str.replace(",", "."))
-
-            # Add to channel data
-            if sensor not in channel_data:
-                channel_data[sensor] = []
-            channel_data[sensor].append((timestamp, value))
-
-        except (ValueError, KeyError):
-            # Skip malformed rows
-            continue
-
-    if not channel_data:
+    try:
+        reader = pd.read_csv(
+            _open_source(source),
+            sep=";",
+            usecols=list(REQUIRED_COLUMNS),
+            dtype={"date": str, "time": str, "sensor": str},
+            decimal=",",
+            keep_default_na=False,
+            on_bad_lines="skip",
+            encoding="utf-8",
+            chunksize=chunk_rows,
+            nrows=max_rows,
+        )
+    except pd.errors.EmptyDataError as e:
+        raise ValueError("File is empty") from e
+    except UnicodeDecodeError as e:
+        raise ValueError("File is not UTF-8 text") from e
+    except ValueError as e:
+        raise ValueError("Missing required columns (date, time, sensor, value)") from e
+
+    # Per-channel lists of chunk arrays, in file order
+    stamp_parts: dict[str, list[np.ndarray]] = {}
+    value_parts: dict[str, list[np.ndarray]] = {}
+    with reader:
+        for chunk in reader:
+            seconds, values, codes, names = _parse_chunk(chunk)
+            for code in np.unique(codes):
+                sensor = names[code]
+                rows = codes == code
+                stamp_parts.setdefault(sensor, []).append(seconds[rows])
+                value_parts.setdefault(sensor, []).append(values[rows])
+
+    if not stamp_parts:
         raise ValueError("No valid data found in CSV file")
 
-    # Sort each channel by timestamp
-    for sensor in channel_data:
-        channel_data[sensor].sort(key=lambda x: x[0])
+    channel_stamps: dict[str, np.ndarray] = {}
+    channels: dict[str, np.ndarray] = {}
+    for sensor, parts in stamp_parts.items():
+        stamps = np.concatenate(parts)
+        temps = np.concatenate(value_parts[sensor])
+        # Sort each channel by timestamp (stable: equal stamps keep file order)
+        if np.any(np.diff(stamps) < 0):
+            order = np.argsort(stamps, kind="stable")
+            stamps, temps = stamps[order], temps[order]
+        channel_stamps[sensor] = stamps
+        channels[sensor] = temps
 
     # Find global time range
-    all_times = []
-    for sensor, data in channel_data.items():
-        all_times.extend([d[0] for d in data])
-
-    start_time = min(all_times)
-    end_time = max(all_times)
-    duration_seconds = (end_time - start_time).total_seconds()
-
-    # Extract temperature arrays and times per channel
-    channels: dict[str, list[float]] = {}
-    channel_times: dict[str, list[float]] = {}
-    statistics: dict[str, dict[str, float]] = {}
-
-    for sensor, data in channel_data.items():
-        # Each channel gets its own times array (seconds from global start)
-        channel_times[sensor] = [(d[0] - start_time).total_seconds() for d in data]
-        temps = [d[1] for d in data]
-        channels[sensor] = temps
+    start = min(int(s[0]) for s in channel_stamps.values())
+    end = max(int(s[-1]) for s in channel_stamps.values())
 
-        # Calculate statistics
-        statistics[sensor] = {
-            "min": min(temps),
-            "max": max(temps),
-            "avg": sum(temps) / len(temps),
-            "count": len(temps),
+    # Each channel gets its own times array (seconds from global start)
+    channel_times = {
+        sensor: (stamps - start).astype(float) for sensor, stamps in channel_stamps.items()
+    }
+    statistics = {
+        sensor: {
+            "min": float(temps.min()),
+            "max": float(temps.max()),
+            "avg": float(temps.mean()),
+            "count": int(len(temps)),
         }
+        for sensor, temps in channels.items()
+    }
 
     # For backwards compatibility, also provide unified times from first channel
-    reference_channel = list(channel_data.keys())[0]
-    times = channel_times[reference_channel]
+    reference_channel = next(iter(channels))
 
     return {
-        "start_time": start_time,
-        "end_time": end_time,
-        "duration_seconds": duration_seconds,
-        "times": times,
+        "start_time": pd.Timestamp(start, unit="s").to_pydatetime(),
+        "end_time": pd.Timestamp(end, unit="s").to_pydatetime(),
+        "duration_seconds": float(end - start),
+        "times": channel_times[reference_channel],
         "channels": channels,
         "channel_times": channel_times,  # Per-channel times
         "statistics": statistics,
     }
 
 
-def validate_tc_csv(file_content: str) -> tuple[bool, str]:
-    """Validate TC CSV file format.
+def parse_tc_head(source, max_rows: int = HEAD_ROWS) -> dict:
+    """Parse the first rows of a TC CSV, leaving a file at its position.
+
+    Parameters
+    ----------
+    source : str, bytes or file-like
+        As for parse_tc_csv; a file must be seekable
+    max_rows : int
+        Data rows to read
+
+    Returns
+    -------
+    dict
+        As parse_tc_csv, for the rows read
+    """
+    handle = _open_source(source)
+    position = handle.tell()
+    try:
+        return parse_tc_csv(handle, max_rows=max_rows, chunk_rows=max_rows)
+    finally:
+        handle.seek(position)
+
+
+def validate_tc_csv(source) -> tuple[bool, str]:
+    """Validate TC CSV file format from its first rows.
 
     Parameters
     ----------
-    file_content : str
-        CSV file content as string
+    source : str, bytes or file-like
+        CSV content or an open seekable file; a file is left at its position
 
     Returns
     -------
     tuple
         (is_valid, error_message)
     """
+    handle = _open_source(source)
+    position = handle.tell()
     try:
         # Check if it has the expected header
-        lines = file_content.strip().split("\n")
-        if not lines:
+        header = handle.readline()
+        handle.seek(position)
+        if isinstance(header, bytes):
+            header = header.decode("utf-8", errors="replace")
+        header = header.lower()
+        if not header.strip():
             return False, "File is empty"
 
-        header = lines[0].lower()
         if "date" not in header or "time" not in header or "sensor" not in header:
             return False, "Missing required columns (date, time, sensor)"
 
         if "value" not in header:
             return False, "Missing 'value' column"
 
-        # Try parsing
-        data = parse_tc_csv(file_content)
+        # Try parsing the head
+        data = parse_tc_head(handle)
         if not data["channels"]:
             return False, "No valid channel data found"
 
-        return True, f"Found {len(data['channels'])} channels with {len(data['times'])} data points"
+        points = sum(s["count"] for s in data["statistics"].values())
+        return True, f"Found {len(data['channels'])} channels ({points} data points checked)"
 
     except Exception as e:
         return False, str(e)
@@ -8,28 +8,28 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
-from app.services.tc_data_parser import parse_tc_csv, validate_tc_csv
+from app.services.tc_data_parser import parse_tc_head, validate_tc_csv
 
 
-def generate_preview(file_content: str) -> dict:
-    """Parse and preview TC CSV data.
+def generate_preview(source) -> dict:
+    """Parse and preview the first rows of TC CSV data.
 
     Parameters
     ----------
-    file_content : str
-        Raw CSV text
+    source : str, bytes or file-like
+        Raw CSV text or an open seekable file (see tc_data_parser)
 
     Returns
     -------
     dict
         {valid, message, plot_base64, channels, statistics, duration_seconds}
     """
-    is_valid, msg = validate_tc_csv(file_content)
+    is_valid, msg = validate_tc_csv(source)
     if not is_valid:
         return {"valid": False, "message": msg}
 
     try:
-        data = parse_tc_csv(file_content)
+        data = parse_tc_head(source)
     except Exception as e:
         return {"valid": False, "message": str(e)}
 
@@ -74,7 +74,7 @@ def generate_preview(file_content: str) -> dict:
 
     return {
         "valid": True,
-        "message": f"{len(channels)} channels, {len(times)} points",
+        "message": f"{len(channels)} channels, {len(times)} points (start of file)",
         "plot_base64": plot_b64,
         "channels": list(sorted(channels.keys())),
         "statistics": statistics,
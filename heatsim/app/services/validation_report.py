@@ -8,7 +8,6 @@ import tempfile
 from datetime import datetime
 from io import BytesIO
 
-import numpy as np
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches
@@ -16,6 +15,7 @@ from fpdf import FPDF
 
 from app.services import visualization
 from app.services.comparison_service import ComparisonService
+from app.services.measured_series import channel_series
 
 
 class ValidationReportGenerator:
@@ -190,14 +190,13 @@ class ValidationReportGenerator:
         if not cycle:
             return
 
-        sim_times = np.array(cycle.time_array)
-        sim_temps = np.array(cycle.data_dict.get("center", cycle.value_array))
+        sim_times = cycle.time_series
+        sim_temps = cycle.center_series
 
         measured_list = self.sim.measured_data.all()
         for md in measured_list:
-            for ch in md.available_channels:
-                meas_times = np.array(md.get_channel_times(ch))
-                meas_temps = np.array(md.get_channel_data(ch))
+            for ch, fields in channel_series(md).items():
+                meas_times, meas_temps = fields["time"], fields["temp"]
                 if len(meas_times) < 2:
                     continue
 
@@ -427,14 +426,13 @@ class ValidationPDFReportGenerator:
         if not cycle:
             return
 
-        sim_times = np.array(cycle.time_array)
-        sim_temps = np.array(cycle.data_dict.get("center", cycle.value_array))
+        sim_times = cycle.time_series
+        sim_temps = cycle.center_series
 
         measured_list = self.sim.measured_data.all()
         for md in measured_list:
-            for ch in md.available_channels:
-                meas_times = np.array(md.get_channel_times(ch))
-                meas_temps = np.array(md.get_channel_data(ch))
+            for ch, fields in channel_series(md).items():
+                meas_times, meas_temps = fields["time"], fields["temp"]
                 if len(meas_times) < 2:
                     continue
 
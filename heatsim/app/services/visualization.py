@@ -854,6 +854,48 @@ def moving_average(data: np.ndarray, window_size: int = 10) -> np.ndarray:
     return smoothed
 
 
+def measured_rate_series(data: dict, smooth_window: int = 0) -> tuple:
+    """Times, dT/dt and temperatures of one measured channel dict.
+
+    Channels from ``measured_series.plot_channels`` carry dT/dt on their
+    resampled grid (and its smoothed version for their ``smooth_window``),
+    which is used as is. Otherwise dT/dt is taken by finite differences
+    between samples and given at the interval midpoints.
+
+    Parameters
+    ----------
+    data : dict
+        Channel dict with keys times, temps and optionally dtdt,
+        dtdt_smooth, temps_smooth, smooth_window
+    smooth_window : int
+        Window size for moving average smoothing (0 to disable)
+
+    Returns
+    -------
+    tuple of (np.ndarray, np.ndarray, np.ndarray)
+        (times, dT/dt, temperatures), smoothed alike
+    """
+    if "dtdt" in data:
+        times = np.asarray(data["times"], dtype=float)
+        if smooth_window > 1 and smooth_window == data.get("smooth_window"):
+            return times, np.asarray(data["dtdt_smooth"]), np.asarray(data["temps_smooth"])
+        dTdt = np.asarray(data["dtdt"], dtype=float)
+        temps = np.asarray(data["temps"], dtype=float)
+    else:
+        times = np.array(data["times"], dtype=float)
+        temps = np.array(data["temps"], dtype=float)
+        dt = np.diff(times)
+        dt[dt == 0] = 1e-6  # Avoid division by zero
+        dTdt = np.diff(temps) / dt
+        times = 0.5 * (times[:-1] + times[1:])
+        temps = 0.5 * (temps[:-1] + temps[1:])
+
+    if smooth_window > 1:
+        dTdt = moving_average(dTdt, smooth_window)
+        temps = moving_average(temps, smooth_window)
+    return times, dTdt, temps
+
+
 def create_measured_dtdt_plot(
     measured_data: list[dict],
     title: str = "Measured dT/dt vs Time",
@@ -889,19 +931,10 @@ def create_measured_dtdt_plot(
     # Plot dT/dt for each channel
     plot_data = []
     for i, data in enumerate(measured_data):
-        times = np.array(data["times"])
-        temps = np.array(data["temps"])
         name = data.get("name", f"TC{i + 1}")
 
-        # Calculate dT/dt
-        dt = np.diff(times)
-        dt[dt == 0] = 1e-6  # Avoid division by zero
-        dTdt = np.diff(temps) / dt
-        time_mid = 0.5 * (times[:-1] + times[1:])
-
-        # Apply moving average smoothing
-        if smooth_window > 1:
-            dTdt = moving_average(dTdt, smooth_window)
+        # dT/dt with moving average smoothing
+        time_mid, dTdt, _ = measured_rate_series(data, smooth_window)
 
         plot_data.append((time_mid, dTdt, name))
         all_dTdt.extend(dTdt)
@@ -1067,7 +1100,8 @@ def create_measured_absorbed_power_plot(
     mass : float
         Part mass in kg
     cp_func : callable
-        Function that returns Cp(T) in J/kg·K
+        Vectorized function returning Cp(T) in J/kg·K for an array of
+        temperatures (e.g. a compiled property)
     title : str
         Plot title
     phase_name : str
@@ -1085,19 +1119,14 @@ def create_measured_absorbed_power_plot(
     total_energies = []
 
     for i, data in enumerate(measured_data):
-        times = np.array(data["times"])
-        temps = np.array(data["temps"])
         name = data.get("name", f"TC{i + 1}")
 
         # Calculate dT/dt
-        dt = np.diff(times)
-        dt[dt == 0] = 1e-6
-        dTdt = np.diff(temps) / dt
-        time_mid = 0.5 * (times[:-1] + times[1:])
-        temp_mid = 0.5 * (temps[:-1] + temps[1:])
+        time_mid, dTdt, temp_mid = measured_rate_series(data)
+        dt = np.gradient(time_mid) if len(time_mid) > 1 else np.zeros_like(time_mid)
 
         # Get Cp at mid-point temperatures
-        cp_mid = np.array([cp_func(t) for t in temp_mid])
+        cp_mid = np.asarray(cp_func(temp_mid), dtype=float)
 
         # Power in kW
         power_kw = (mass * cp_mid * dTdt) / 1000
@@ -1187,20 +1216,10 @@ def create_measured_dtdt_vs_temp_plot(
     # Plot dT/dt vs T for each channel
     plot_data = []
     for i, data in enumerate(measured_data):
-        times = np.array(data["times"])
-        temps = np.array(data["temps"])
         name = data.get("name", f"TC{i + 1}")
 
-        # Calculate dT/dt
-        dt = np.diff(times)
-        dt[dt == 0] = 1e-6  # Avoid division by zero
-        dTdt = np.diff(temps) / dt
-        temp_mid = 0.5 * (temps[:-1] + temps[1:])
-
-        # Apply moving average smoothing
-        if smooth_window > 1:
-            dTdt = moving_average(dTdt, smooth_window)
-            temp_mid = moving_average(temp_mid, smooth_window)
+        # dT/dt and temperature with moving average smoothing
+        _, dTdt, temp_mid = measured_rate_series(data, smooth_window)
 
         plot_data.append((temp_mid, dTdt, name))
         all_dTdt.extend(dTdt)
@@ -1941,7 +1960,9 @@ def create_jominy_curve_plot(
     if show_hrc:
         ax2 = ax1.twinx()
         # Filter valid HRC values
-        valid_hrc = [(d, h) for d, h in zip(distances_mm, hardness_hrc, strict=False) if h is not None]
+        valid_hrc = [
+            (d, h) for d, h in zip(distances_mm, hardness_hrc, strict=False) if h is not None
+        ]
         if valid_hrc:
             d_hrc, hrc_vals = zip(*valid_hrc, strict=False)
             ax2.plot(
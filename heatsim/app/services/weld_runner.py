@@ -82,10 +82,11 @@ def _run_goldak_multipass(project: WeldProject) -> None:
     """Run Goldak multipass simulation in background."""
     from app.services.goldak_multipass import GoldakMultiPassSolver
 
-    # Parse config from progress_message: 'goldak:preset:compare'
+    # Parse config from progress_message: 'goldak:preset:compare[:temperature_dependent]'
     parts = project.progress_message.split(":")
     preset = parts[1] if len(parts) > 1 else "medium"
     compare = parts[2] == "true" if len(parts) > 2 else True
+    temperature_dependent = len(parts) > 3 and parts[3] == "true"
 
     project.status = STATUS_RUNNING
     project.started_at = datetime.utcnow()
@@ -98,6 +99,7 @@ def _run_goldak_multipass(project: WeldProject) -> None:
             project,
             preset=preset,
             compare=compare,
+            temperature_dependent=temperature_dependent,
         )
         n_passes = project.total_strings or 1
 
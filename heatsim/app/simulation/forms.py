@@ -381,6 +381,11 @@ class SolverForm(FlaskForm):
         default=True,
         description="Calculate dt to limit simulation to ~20,000 time steps",
     )
+    adaptive = BooleanField(
+        "Adaptive time stepping",
+        default=False,
+        description="Error-controlled dt: small steps during quench, large steps during soaks",
+    )
     max_time = FloatField(
         "Maximum Simulation Time (s)",
         validators=[DataRequired(), NumberRange(min=10, max=180000)],
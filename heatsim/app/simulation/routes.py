@@ -20,6 +20,8 @@ from app.models import (
 from app.models.simulation import (
     AGITATION_LABELS,
     AGITATION_LEVELS,
+    BATCH_KIND_RUN,
+    BATCH_KIND_SWEEP,
     FURNACE_ATMOSPHERE_LABELS,
     FURNACE_ATMOSPHERES,
     GEOMETRY_CAD,
@@ -30,23 +32,20 @@ from app.models.simulation import (
     STATUS_FAILED,
     STATUS_QUEUED,
     STATUS_READY,
-    STATUS_RUNNING,
     Simulation,
+    SimulationBatch,
     SimulationResult,
     calculate_quench_htc,
 )
 from app.services import (
-    MultiPhaseHeatSolver,
-    PhaseTracker,
-    SolverConfig,
     create_geometry,
     generate_simulation_pdf_report,
     generate_simulation_report,
-    predict_hardness_profile,
+    measured_series,
     visualization,
 )
 from app.services.cad_geometry import analyze_step_file
-from app.services.hardness_predictor import POSITION_KEYS, HardnessPredictor
+from app.services.plot_renderer import result_plot_image
 from app.services.tc_data_parser import parse_tc_csv, validate_tc_csv
 
 from . import simulation_bp
@@ -244,6 +243,7 @@ def setup(id):
         solver_form.dt.data = solver.get("dt", 0.1)
         solver_form.max_time.data = solver.get("max_time", 1800)
         solver_form.auto_dt.data = solver.get("auto_dt", True)
+        solver_form.adaptive.data = solver.get("adaptive", False)
 
     if request.method == "POST":
         # Update geometry (convert mm to m)
@@ -290,6 +290,7 @@ def setup(id):
             "dt": dt,
             "max_time": max_time,
             "auto_dt": auto_dt,
+            "adaptive": "adaptive" in request.form,
         }
         sim.set_solver_config(solver_config)
 
@@ -928,7 +929,11 @@ def drift_check(id):
 @simulation_bp.route("/<int:id>/plot-data/<kind>")
 @login_required
 def plot_data(id, kind):
-    """JSON data for interactive (Plotly) result charts."""
+    """JSON data for interactive (Plotly) result charts.
+
+    Time-axis plots accept ``t_min`` / ``t_max`` to return only the visible
+    window of a zoomed chart.
+    """
     from app.services import plot_data as plot_data_service
 
     sim = Simulation.query.get_or_404(id)
@@ -939,11 +944,14 @@ def plot_data(id, kind):
     step = request.args.get("step", "")
     channel = request.args.get("channel", "")
     offset = request.args.get("offset", 0.0, type=float) or 0.0
+    # Visible time range of a zoomed chart (range_query builders only)
+    t_min = request.args.get("t_min", type=float)
+    t_max = request.args.get("t_max", type=float)
 
     builders = {
-        "full_cycle": lambda: plot_data_service.full_cycle(sim),
-        "phase_curve": lambda: plot_data_service.phase_curve(sim, phase),
-        "dtdt_time": lambda: plot_data_service.dtdt_time(sim, phase),
+        "full_cycle": lambda: plot_data_service.full_cycle(sim, t_min, t_max),
+        "phase_curve": lambda: plot_data_service.phase_curve(sim, phase, t_min, t_max),
+        "dtdt_time": lambda: plot_data_service.dtdt_time(sim, phase, t_min, t_max),
         "dtdt_temp": lambda: plot_data_service.dtdt_temp(sim, phase),
         "absorbed_power": lambda: plot_data_service.absorbed_power(sim, phase),
         "measured_tc": lambda: plot_data_service.measured_tc(sim, step),
@@ -977,9 +985,14 @@ def run(id):
         flash("Simulation is not ready to run.", "warning")
         return redirect(url_for("simulation.view", id=id))
 
+    from app.services.job_queue import notify_job_submitted
+
     sim.status = STATUS_QUEUED
+    sim.queued_at = datetime.utcnow()
     sim.error_message = None
+    sim.duplicate_of_id = None
     db.session.commit()
+    notify_job_submitted()
 
     AuditLog.log(
         "run_simulation", resource_type="simulation", resource_id=sim.id, resource_name=sim.name
@@ -1021,10 +1034,11 @@ def progress_status(id):
     if sim.user_id != current_user.id:
         return jsonify({"error": "Access denied"}), 403
 
-    from app.services.job_queue import get_queue_position, get_queue_status
+    from app.services.job_queue import get_job_worker, get_queue_position, get_queue_status
 
     queue_position = get_queue_position("simulation", sim.id)
     queue_info = get_queue_status()
+    worker = get_job_worker("simulation", sim.id)
 
     elapsed = None
     if sim.started_at:
@@ -1035,6 +1049,9 @@ def progress_status(id):
             "status": sim.status,
             "queue_position": queue_position,
             "running_job": queue_info["running"],
+            "worker": worker["name"] if worker else None,
+            "workers_busy": sum(w["state"] == "busy" for w in queue_info["workers"]),
+            "workers_alive": sum(w["alive"] for w in queue_info["workers"]),
             "elapsed_seconds": elapsed,
             "error_message": sim.error_message,
         }
@@ -1055,7 +1072,11 @@ def cancel(id):
         flash("Only queued simulations can be cancelled.", "warning")
         return redirect(url_for("simulation.view", id=id))
 
+    from app.services.batch_runner import detach_duplicates
+
+    detach_duplicates(sim)
     sim.status = STATUS_READY
+    sim.duplicate_of_id = None
     db.session.commit()
 
     flash("Simulation cancelled.", "info")
@@ -1065,13 +1086,16 @@ def cancel(id):
 @simulation_bp.route("/<int:id>/result/<int:result_id>/image")
 @login_required
 def result_image(id, result_id):
-    """Serve result plot image."""
+    """Serve result plot image (rendered on first view for deferred plots)."""
     result = SimulationResult.query.get_or_404(result_id)
+    if result.simulation_id != id:
+        return "", 404
 
-    if result.simulation_id != id or not result.plot_image:
+    image = result_plot_image(result)
+    if image is None:
         return "", 404
 
-    response = Response(result.plot_image, mimetype="image/png")
+    response = Response(image, mimetype="image/png")
     # Prevent browser caching to ensure fresh plots are displayed
     response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
     response.headers["Pragma"] = "no-cache"
@@ -1203,17 +1227,20 @@ def vtk_download(id, result_id):
     return response
 
 
-def _get_cct_curves_for_grade(grade, diagram):
+def _get_cct_curves_for_grade(grade, diagram, store=True):
     """Get CCT curves using three-tier fallback.
 
     Tier 1: Digitized PhaseDiagram curves
     Tier 2: JMAK/Scheil CCT (if TTTParameters exist)
     Tier 3: Empirical CCT predictor (from composition)
+
+    Generated JMAK curves are stored unless `store` is False (jobs with
+    uncommitted results).
     """
     from app.services.phase_transformation import PhasePredictor
 
     predictor = PhasePredictor(grade)
-    return predictor.get_cct_curves()
+    return predictor.get_cct_curves(store=store)
 
 
 @simulation_bp.route("/<int:id>/cct-overlay")
@@ -1234,18 +1261,18 @@ def cct_overlay(id):
     if not cycle_result:
         return Response("No simulation results", status=404)
 
-    full_times = np.array(cycle_result.time_array)
+    full_times = cycle_result.time_series
 
     # Determine transfer+quench time window from individual phase results
     transfer_result = sim.results.filter_by(result_type="cooling_curve", phase="transfer").first()
     quench_result = sim.results.filter_by(result_type="cooling_curve", phase="quenching").first()
 
     if quench_result:
-        q_times = np.array(quench_result.time_array)
+        q_times = quench_result.time_series
         t_end = q_times[-1] if len(q_times) > 0 else full_times[-1]
 
         if transfer_result:
-            tr_times = np.array(transfer_result.time_array)
+            tr_times = transfer_result.time_series
             t_start = tr_times[0] if len(tr_times) > 0 else q_times[0]
         else:
             t_start = q_times[0] if len(q_times) > 0 else 0.0
@@ -1259,12 +1286,12 @@ def cct_overlay(id):
     sliced_times = full_times[mask] - t_start  # zero-base
 
     # Build multi-position temperature array
-    multi_pos_data = cycle_result.data_dict
+    multi_pos_data = cycle_result.position_series
     if multi_pos_data and "center" in multi_pos_data:
-        full_center = np.array(multi_pos_data["center"])
-        full_one_third = np.array(multi_pos_data["one_third"])
-        full_two_thirds = np.array(multi_pos_data["two_thirds"])
-        full_surface = np.array(multi_pos_data["surface"])
+        full_center = multi_pos_data["center"]
+        full_one_third = multi_pos_data["one_third"]
+        full_two_thirds = multi_pos_data["two_thirds"]
+        full_surface = multi_pos_data["surface"]
 
         temps = np.column_stack(
             [
@@ -1277,7 +1304,7 @@ def cct_overlay(id):
         positions = ["Center", "1/3 R", "2/3 R", "Surface"]
     else:
         # Fall back to center-only
-        full_vals = np.array(cycle_result.value_array)
+        full_vals = cycle_result.value_series
         temps = full_vals[mask]
         positions = None
 
@@ -1485,7 +1512,11 @@ def export_comparison(id):
 @simulation_bp.route("/export/sweep")
 @login_required
 def export_sweep():
-    """Export sweep/comparison summary for multiple simulations as CSV."""
+    """Export sweep/comparison summary for multiple simulations as CSV.
+
+    Pass ``estimate=1`` to fill t8/5 for simulations that have not been run
+    with a batched reduced-resolution solve.
+    """
     from app.services.data_export import DataExporter
 
     ids_param = request.args.get("ids", "")
@@ -1506,7 +1537,9 @@ def export_sweep():
             flash("Access denied.", "danger")
             return redirect(url_for("simulation.index"))
 
-    csv_data = DataExporter.export_sweep_summary_csv(sim_ids)
+    csv_data = DataExporter.export_sweep_summary_csv(
+        sim_ids, estimate_missing=request.args.get("estimate") == "1"
+    )
     if not csv_data:
         flash("No data to export.", "warning")
         return redirect(url_for("simulation.index"))
@@ -1604,7 +1637,7 @@ def temperature_3d_snapshot(id):
         return Response("No results", status=404)
 
     # Get multi-position temperature data
-    multi_pos_data = cycle_result.data_dict
+    multi_pos_data = cycle_result.position_series
     time_idx = request.args.get("time_idx", type=int)
 
     if multi_pos_data and "center" in multi_pos_data:
@@ -1621,8 +1654,8 @@ def temperature_3d_snapshot(id):
         radial_positions = np.array([0, 0.33, 0.67, 1.0])
     else:
         # Fallback: use single-position data and create a gradient
-        value_arr = cycle_result.value_array
-        if not value_arr:
+        value_arr = cycle_result.value_series
+        if not len(value_arr):
             return Response("No temperature data", status=404)
         idx = time_idx if time_idx is not None else -1
         center_temp = value_arr[idx]
@@ -1690,23 +1723,23 @@ def temperature_3d_animation(id):
         return Response("No results", status=404)
 
     # Get time data
-    times = np.array(cycle_result.time_array)
+    times = cycle_result.time_series
 
     # Get multi-position temperature data
-    multi_pos_data = cycle_result.data_dict
+    multi_pos_data = cycle_result.position_series
     if not multi_pos_data or "center" not in multi_pos_data:
         # Fall back to single position
-        temps = np.array(cycle_result.value_array)
+        temps = cycle_result.value_series
         temperature_history = temps.reshape(-1, 1)
         radial_positions = np.array([0])
     else:
         # Build temperature history array [n_times, n_positions]
         temperature_history = np.column_stack(
             [
-                np.array(multi_pos_data["center"]),
-                np.array(multi_pos_data["one_third"]),
-                np.array(multi_pos_data["two_thirds"]),
-                np.array(multi_pos_data["surface"]),
+                multi_pos_data["center"],
+                multi_pos_data["one_third"],
+                multi_pos_data["two_thirds"],
+                multi_pos_data["surface"],
             ]
         )
         radial_positions = np.array([0, 0.33, 0.67, 1.0])
@@ -1866,7 +1899,10 @@ def delete(id):
         flash("Access denied.", "danger")
         return redirect(url_for("simulation.index"))
 
+    from app.services.batch_runner import detach_duplicates
+
     name = sim.name
+    detach_duplicates(sim)
     db.session.delete(sim)
     db.session.commit()
     AuditLog.log("delete_simulation", resource_type="simulation", resource_name=name)
@@ -1995,6 +2031,15 @@ def parameter_sweep(id):
         # Generate parameter values
         values = np.linspace(min_val, max_val, steps)
 
+        from app.services.batch_runner import create_batch
+
+        batch = create_batch(
+            f"{sim.name} - {param_path} sweep",
+            current_user.id,
+            kind=BATCH_KIND_SWEEP,
+            parameter=param_path,
+        )
+
         # Create simulations for each value
         created_sims = []
         for i, val in enumerate(values):
@@ -2013,6 +2058,8 @@ def parameter_sweep(id):
                 ambient_temperature=sim.ambient_temperature,
                 boundary_conditions=sim.boundary_conditions,
                 status=STATUS_READY,
+                batch_id=batch.id,
+                batch_value=float(val),
             )
 
             # Copy CAD fields if applicable
@@ -2044,21 +2091,20 @@ def parameter_sweep(id):
             db.session.add(new_sim)
             created_sims.append(new_sim)
 
-        db.session.commit()
-
-        # Run immediately if requested
+        # Clones form one batch; run now or later from the batch page
         if run_now:
-            flash(f"Created {len(created_sims)} simulations. Running them now...", "info")
-            # Note: Running multiple simulations synchronously would block.
-            # For now, just redirect to list - user can run manually or we add batch run later
-            flash(
-                f'Created {len(created_sims)} simulations. Use "Run" button to execute each.',
-                "success",
-            )
+            from app.services.batch_runner import submit_batch
+            from app.services.job_queue import notify_job_submitted
+
+            queued = submit_batch(batch, created_sims)
+            db.session.commit()
+            notify_job_submitted()
+            flash(f"Created and queued {queued} simulations for parameter sweep.", "success")
         else:
+            db.session.commit()
             flash(f"Created {len(created_sims)} simulations for parameter sweep.", "success")
 
-        return redirect(url_for("simulation.index"))
+        return redirect(url_for("simulation.batch_view", batch_id=batch.id))
 
     # Pre-populate with sensible defaults based on current config
     if request.method == "GET":
@@ -2167,8 +2213,6 @@ def compare_overlay_plot():
         return Response("Invalid IDs", status=400)
 
     # Collect data for each simulation
-    import numpy as np
-
     sim_data = []
     for sid in sim_ids:
         sim = Simulation.query.get(sid)
@@ -2176,12 +2220,12 @@ def compare_overlay_plot():
             continue
 
         cycle_result = sim.results.filter_by(result_type="full_cycle").first()
-        if cycle_result and cycle_result.time_array and cycle_result.value_array:
+        if cycle_result and len(cycle_result.time_series) and len(cycle_result.value_series):
             sim_data.append(
                 {
                     "name": sim.name,
-                    "times": np.array(cycle_result.time_array),
-                    "temps": np.array(cycle_result.value_array),
+                    "times": cycle_result.time_series,
+                    "temps": cycle_result.value_series,
                 }
             )
 
@@ -2199,38 +2243,88 @@ def compare_overlay_plot():
 @simulation_bp.route("/batch-run", methods=["POST"])
 @login_required
 def batch_run():
-    """Run multiple simulations sequentially."""
+    """Queue the selected simulations as one batch."""
+    from app.services.batch_runner import create_batch, submit_batch
+    from app.services.job_queue import notify_job_submitted
+
     sim_ids = request.form.getlist("sim_ids")
     if not sim_ids:
         flash("No simulations selected.", "warning")
         return redirect(url_for("simulation.index"))
 
-    success_count = 0
-    fail_count = 0
-
+    sims = []
     for sid in sim_ids:
         try:
             sim = Simulation.query.get(int(sid))
-            if not sim or sim.user_id != current_user.id:
-                continue
+        except ValueError:
+            continue
+        if sim and sim.user_id == current_user.id:
+            sims.append(sim)
 
-            if sim.status not in [STATUS_READY, STATUS_COMPLETED, STATUS_FAILED]:
-                continue
+    batch = create_batch(
+        f"Batch run {datetime.utcnow():%Y-%m-%d %H:%M}", current_user.id, kind=BATCH_KIND_RUN
+    )
+    queued = submit_batch(batch, sims)
+    if not queued:
+        db.session.rollback()
+        flash("None of the selected simulations is ready to run.", "warning")
+        return redirect(url_for("simulation.index"))
 
-            # Run simulation (same logic as single run)
-            _run_simulation(sim)
-            success_count += 1
+    db.session.commit()
+    notify_job_submitted()
+    skipped = len(sim_ids) - queued
+    flash(f"Queued {queued} simulation(s).", "info")
+    if skipped:
+        flash(f"{skipped} simulation(s) skipped (not ready or already queued).", "warning")
+    return redirect(url_for("simulation.batch_view", batch_id=batch.id))
 
-        except Exception as e:
-            fail_count += 1
-            current_app.logger.error(f"Batch run failed for sim {sid}: {e}")
 
-    if success_count > 0:
-        flash(f"Successfully ran {success_count} simulation(s).", "success")
-    if fail_count > 0:
-        flash(f"{fail_count} simulation(s) failed.", "warning")
+@simulation_bp.route("/batch/<int:batch_id>")
+@login_required
+def batch_view(batch_id):
+    """Aggregate progress and results of a batch run or sweep."""
+    from app.services.batch_runner import batch_summary
 
-    return redirect(url_for("simulation.index"))
+    batch = SimulationBatch.query.get_or_404(batch_id)
+    if batch.user_id != current_user.id:
+        flash("Access denied.", "danger")
+        return redirect(url_for("simulation.index"))
+
+    return render_template("simulation/batch.html", batch=batch, summary=batch_summary(batch))
+
+
+@simulation_bp.route("/batch/<int:batch_id>/status")
+@login_required
+def batch_status(batch_id):
+    """JSON endpoint for AJAX polling of a batch's progress and results."""
+    from flask import jsonify
+
+    from app.services.batch_runner import batch_summary
+
+    batch = SimulationBatch.query.get_or_404(batch_id)
+    if batch.user_id != current_user.id:
+        return jsonify({"error": "Access denied"}), 403
+
+    return jsonify(batch_summary(batch))
+
+
+@simulation_bp.route("/batch/<int:batch_id>/run", methods=["POST"])
+@login_required
+def batch_submit(batch_id):
+    """Queue the members of a batch that are not queued or running."""
+    from app.services.batch_runner import submit_batch
+    from app.services.job_queue import notify_job_submitted
+
+    batch = SimulationBatch.query.get_or_404(batch_id)
+    if batch.user_id != current_user.id:
+        flash("Access denied.", "danger")
+        return redirect(url_for("simulation.index"))
+
+    queued = submit_batch(batch, batch.members.all())
+    db.session.commit()
+    notify_job_submitted()
+    flash(f"Queued {queued} simulation(s).", "info")
+    return redirect(url_for("simulation.batch_view", batch_id=batch.id))
 
 
 @simulation_bp.route("/batch-delete", methods=["POST"])
@@ -2242,11 +2336,14 @@ def batch_delete():
         flash("No simulations selected.", "warning")
         return redirect(url_for("simulation.index"))
 
+    from app.services.batch_runner import detach_duplicates
+
     deleted_count = 0
     for sid in sim_ids:
         try:
             sim = Simulation.query.get(int(sid))
             if sim and sim.user_id == current_user.id:
+                detach_duplicates(sim)
                 db.session.delete(sim)
                 deleted_count += 1
         except Exception as e:
@@ -2257,239 +2354,6 @@ def batch_delete():
     return redirect(url_for("simulation.index"))
 
 
-def _run_simulation(sim):
-    """Internal helper to run a single simulation (used by batch_run)."""
-    # Create immutable snapshot
-    from app.services.snapshot_service import SnapshotService
-
-    snapshot = SnapshotService.create_snapshot(sim)
-
-    sim.status = STATUS_RUNNING
-    sim.started_at = datetime.utcnow()
-    sim.error_message = None
-    db.session.commit()
-
-    try:
-        # Build geometry (use equivalent geometry for CAD types)
-        if sim.geometry_type == GEOMETRY_CAD:
-            equiv_type = sim.cad_equivalent_type or "cylinder"
-            equiv_params = sim.cad_equivalent_geometry_dict
-            geometry = create_geometry(equiv_type, equiv_params)
-        else:
-            geometry = create_geometry(sim.geometry_type, sim.geometry_dict)
-
-        # Build solver config
-        solver_config = SolverConfig.from_dict(sim.solver_dict)
-
-        # Get material properties
-        grade = sim.steel_grade
-        k_prop = grade.get_property("thermal_conductivity")
-        cp_prop = grade.get_property("specific_heat")
-        rho_prop = grade.get_property("density")
-        emiss_prop = grade.get_property("emissivity")
-
-        density = 7850
-        if rho_prop:
-            density = rho_prop.data_dict.get("value", 7850)
-
-        emissivity = 0.85
-        if emiss_prop:
-            emissivity = emiss_prop.data_dict.get("value", 0.85)
-
-        # Get heat treatment config
-        ht_config = sim.ht_config
-        if not ht_config:
-            ht_config = sim.create_default_ht_config()
-
-        # Create multi-phase solver
-        solver = MultiPhaseHeatSolver(geometry, config=solver_config)
-        solver.set_material(k_prop, cp_prop, density, emissivity)
-        solver.configure_from_ht_config(ht_config)
-
-        # Determine initial temperature
-        heating_config = ht_config.get("heating", {})
-        if heating_config.get("enabled", False):
-            initial_temp = heating_config.get("initial_temperature", 25.0)
-        else:
-            initial_temp = heating_config.get(
-                "target_temperature", sim.initial_temperature or 850.0
-            )
-
-        # Run simulation
-        result = solver.solve(initial_temperature=initial_temp)
-
-        # Get phase diagram for transformation temps
-        diagram = grade.phase_diagrams.first()
-        trans_temps = diagram.temps_dict if diagram else {}
-
-        # Store full cycle result
-        cycle_result = SimulationResult(
-            simulation_id=sim.id,
-            snapshot_id=snapshot.id,
-            result_type="full_cycle",
-            phase="full",
-            location="center",
-            t_800_500=float(result.t8_5) if result.t8_5 is not None else None,
-        )
-        cycle_result.set_time_data(result.time.tolist())
-        cycle_result.set_value_data(result.center_temp.tolist())
-
-        # Store multi-position temperature data for CCT overlay
-        n_pos = result.temperature.shape[1] if result.temperature.ndim > 1 else 1
-        if n_pos > 1:
-            idx_center = 0
-            idx_one_third = n_pos // 3
-            idx_two_thirds = 2 * n_pos // 3
-            idx_surface = n_pos - 1
-            multi_pos_data = {
-                "positions": ["center", "one_third", "two_thirds", "surface"],
-                "center": result.temperature[:, idx_center].tolist(),
-                "one_third": result.temperature[:, idx_one_third].tolist(),
-                "two_thirds": result.temperature[:, idx_two_thirds].tolist(),
-                "surface": result.temperature[:, idx_surface].tolist(),
-            }
-            cycle_result.set_data(multi_pos_data)
-
-        # Build furnace temps
-        furnace_temps = []
-        if result.phase_results:
-            for pr in result.phase_results:
-                if pr.time.size < 2:
-                    continue
-                temp = None
-                phase_name = pr.phase_name
-                cold_furnace = False
-                furnace_start_temp = None
-                ramp_rate = 0
-
-                if phase_name == "heating":
-                    heating_cfg = ht_config.get("heating", {})
-                    temp = heating_cfg.get("target_temperature")
-                    cold_furnace = heating_cfg.get("cold_furnace", False)
-                    furnace_start_temp = heating_cfg.get("furnace_start_temperature", 25.0)
-                    ramp_rate = heating_cfg.get("furnace_ramp_rate", 0)
-                elif phase_name == "transfer":
-                    temp = ht_config.get("transfer", {}).get("ambient_temperature")
-                elif phase_name == "quenching":
-                    temp = ht_config.get("quenching", {}).get("media_temperature")
-                elif phase_name == "tempering":
-                    tempering_cfg = ht_config.get("tempering", {})
-                    temp = tempering_cfg.get("temperature")
-                    cold_furnace = tempering_cfg.get("cold_furnace", False)
-                    furnace_start_temp = tempering_cfg.get("furnace_start_temperature", 25.0)
-                    ramp_rate = tempering_cfg.get("furnace_ramp_rate", 0)
-                elif phase_name == "cooling":
-                    temp = ht_config.get("transfer", {}).get("ambient_temperature", 25.0)
-
-                if temp is not None:
-                    furnace_temps.append(
-                        {
-                            "start_time": pr.start_time,
-                            "end_time": pr.end_time,
-                            "temperature": temp,
-                            "phase_name": phase_name,
-                            "cold_furnace": cold_furnace,
-                            "furnace_start_temperature": furnace_start_temp
-                            if furnace_start_temp
-                            else temp,
-                            "furnace_ramp_rate": ramp_rate,
-                        }
-                    )
-
-        cycle_result.plot_image = visualization.create_heat_treatment_cycle_plot(
-            result.time,
-            result.temperature,
-            phase_results=result.phase_results,
-            title=f"Heat Treatment Cycle - {sim.name}",
-            transformation_temps=trans_temps,
-            furnace_temps=furnace_temps,
-        )
-        db.session.add(cycle_result)
-
-        # Phase transformation prediction
-        tracker = None
-        if diagram:
-            tracker = PhaseTracker(diagram)
-            phases = tracker.predict_phases(result.time, result.center_temp, result.t8_5)
-
-            phase_result = SimulationResult(
-                simulation_id=sim.id,
-                snapshot_id=snapshot.id,
-                result_type="phase_fraction",
-                phase="full",
-                location="center",
-            )
-            phase_result.set_phase_fractions(phases.to_dict())
-            phase_result.plot_image = visualization.create_phase_fraction_plot(
-                phases.to_dict(), title=f"Predicted Phase Fractions - {sim.name}"
-            )
-            db.session.add(phase_result)
-
-        # Hardness prediction
-        if diagram and grade.composition:
-            try:
-                hardness_result = predict_hardness_profile(
-                    composition=grade.composition,
-                    temperatures=result.temperature,
-                    times=result.time,
-                    phase_tracker=tracker,
-                )
-
-                hardness_sim_result = SimulationResult(
-                    simulation_id=sim.id,
-                    snapshot_id=snapshot.id,
-                    result_type="hardness_prediction",
-                    phase="full",
-                    location="all",
-                )
-                # Tempering hardness calculation
-                ht_config = sim.ht_config or {}
-                tempering_cfg = ht_config.get("tempering", {})
-                if tempering_cfg.get("enabled") and grade.composition:
-                    hp_c = grade.composition.hollomon_jaffe_c or 20.0
-                    temp_c = tempering_cfg.get("temperature", 550)
-                    hold_min = tempering_cfg.get("hold_time", 60)
-                    predictor = HardnessPredictor(grade.composition)
-                    hjp_val = 0.0
-                    for pos_key in POSITION_KEYS:
-                        hv_q = hardness_result.hardness_hv.get(pos_key, 0)
-                        if hv_q > 0:
-                            hv_t, hjp_val = predictor.tempered_hardness(
-                                hv_q, temp_c, hold_min, hp_c
-                            )
-                            hardness_result.tempered_hardness_hv[pos_key] = round(hv_t, 1)
-                            hrc_t = predictor.hv_to_hrc(hv_t)
-                            hardness_result.tempered_hardness_hrc[pos_key] = (
-                                round(hrc_t, 1) if hrc_t else None
-                            )
-                    hardness_result.hollomon_jaffe_parameter = round(hjp_val, 0)
-                    hardness_result.tempering_temperature = temp_c
-                    hardness_result.tempering_time = hold_min
-
-                hardness_sim_result.set_data(hardness_result.to_dict())
-                hardness_sim_result.plot_image = visualization.create_hardness_profile_plot(
-                    hardness_result, title=f"Predicted Hardness - {sim.name}"
-                )
-                db.session.add(hardness_sim_result)
-            except Exception as e:
-                current_app.logger.warning(f"Hardness prediction failed: {e}")
-
-        sim.status = STATUS_COMPLETED
-        sim.completed_at = datetime.utcnow()
-        SnapshotService.finalize_snapshot(snapshot, "completed")
-        new_results = SimulationResult.query.filter_by(snapshot_id=snapshot.id).all()
-        SnapshotService.update_summary(snapshot, new_results)
-        db.session.commit()
-
-    except Exception as e:
-        sim.status = STATUS_FAILED
-        sim.error_message = str(e)
-        if snapshot:
-            SnapshotService.finalize_snapshot(snapshot, "failed", str(e))
-        db.session.commit()
-        raise
-
-
 # ============================================================================
 # Measured TC Data Routes
 # ============================================================================
@@ -2519,14 +2383,13 @@ def upload_tc_data(id):
             return redirect(request.url)
 
         try:
-            # Read and parse file
-            content = file.read().decode("utf-8")
-            is_valid, msg = validate_tc_csv(content)
+            # Check the head, then parse the upload in chunks
+            is_valid, msg = validate_tc_csv(file.stream)
             if not is_valid:
                 flash(f"Invalid file format: {msg}", "danger")
                 return redirect(request.url)
 
-            data = parse_tc_csv(content)
+            data = parse_tc_csv(file.stream)
 
             # Create MeasuredData record
             name = request.form.get("name", file.filename)
@@ -2552,9 +2415,23 @@ def upload_tc_data(id):
             labels = {ch: ch for ch in data["channels"].keys()}
             measured.channel_labels_dict = labels
 
+            # Resample and differentiate once for comparisons and plots
+            measured_series.preprocess(measured)
+
             db.session.add(measured)
             db.session.commit()
 
+            # Align with the simulated cycle if there is one
+            full_result = sim.results.filter_by(result_type="full_cycle").first()
+            if full_result is not None:
+                from app.services.comparison_service import ComparisonService
+
+                try:
+                    ComparisonService.measured_offset(measured, full_result)
+                except Exception as e:
+                    db.session.rollback()
+                    current_app.logger.error(f"TC time offset detection failed: {e}")
+
             flash(
                 f"Uploaded {measured.num_channels} channels with {measured.num_points} data points.",
                 "success",
@@ -2647,22 +2524,11 @@ def comparison_plot(id):
         return Response("No simulation results", status=404)
 
     # Generate comparison plot
-    import numpy as np
-
-    sim_times = np.array(cycle_result.time_array)
-    sim_temps = np.array(cycle_result.value_array)
+    sim_times = cycle_result.time_series
+    sim_temps = cycle_result.value_series
 
     # Prepare measured data
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.times,
-                    "temps": m.channels[channel],
-                }
-            )
+    measured_data = measured_series.plot_channels(measured_list)
 
     # Create comparison plot
     plot_data = visualization.create_comparison_plot(
@@ -2685,40 +2551,31 @@ def cycle_plot_with_tc(id):
         simulation_id=sim.id, result_type="full_cycle"
     ).first()
 
-    if not cycle_result or not cycle_result.plot_image:
+    if not cycle_result or not cycle_result.has_plot:
         return Response("No simulation results", status=404)
 
     # Check if there's measured data
     measured_list = sim.measured_data.all()
     if not measured_list:
         # Return original plot if no measured data
-        return Response(cycle_result.plot_image, mimetype="image/png")
+        image = result_plot_image(cycle_result)
+        if image is None:
+            return Response("No simulation results", status=404)
+        return Response(image, mimetype="image/png")
 
     # Need to regenerate plot with measured data
     # Get the temperature field from stored result
-
-    import numpy as np
-
     # Get time and temperature data
-    times = np.array(cycle_result.time_array)
+    times = cycle_result.time_series
 
     # We need the full temperature field - check if it's stored
     # For now, use stored plot data to extract or regenerate
     # Since we don't have full temp field stored, create comparison plot instead
 
-    sim_temps = np.array(cycle_result.value_array)
+    sim_temps = cycle_result.value_series
 
     # Prepare measured data
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.times,
-                    "temps": m.channels[channel],
-                }
-            )
+    measured_data = measured_series.plot_channels(measured_list)
 
     # Create comparison plot
     plot_data = visualization.create_comparison_plot(
@@ -2740,17 +2597,8 @@ def measured_tc_plot(id):
     if not measured_list:
         return Response("No measured data", status=404)
 
-    # Prepare measured data with per-channel times
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.get_channel_times(channel),
-                    "temps": m.channels[channel],
-                }
-            )
+    # Prepare preprocessed measured channels
+    measured_data = measured_series.plot_channels(measured_list)
 
     # Create plot for measured data only
     plot_data = visualization.create_measured_tc_plot(
@@ -2772,17 +2620,8 @@ def measured_dtdt_plot(id):
     if not measured_list:
         return Response("No measured data", status=404)
 
-    # Prepare measured data with per-channel times
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.get_channel_times(channel),
-                    "temps": m.channels[channel],
-                }
-            )
+    # Prepare preprocessed measured channels
+    measured_data = measured_series.plot_channels(measured_list)
 
     # Create dT/dt plot for measured data
     plot_data = visualization.create_measured_dtdt_plot(
@@ -2804,17 +2643,8 @@ def measured_dtdt_temp_plot(id):
     if not measured_list:
         return Response("No measured data", status=404)
 
-    # Prepare measured data with per-channel times
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.get_channel_times(channel),
-                    "temps": m.channels[channel],
-                }
-            )
+    # Prepare preprocessed measured channels
+    measured_data = measured_series.plot_channels(measured_list)
 
     # Create dT/dt vs Temperature plot for measured data
     plot_data = visualization.create_measured_dtdt_vs_temp_plot(
@@ -2834,18 +2664,7 @@ def _get_measured_data_for_step(sim, process_step):
     measured_list = [m for m in sim.measured_data.all() if m.process_step == process_step]
     if not measured_list:
         return None
-
-    measured_data = []
-    for m in measured_list:
-        for channel in m.available_channels:
-            measured_data.append(
-                {
-                    "name": m.get_channel_label(channel),
-                    "times": m.get_channel_times(channel),
-                    "temps": m.channels[channel],
-                }
-            )
-    return measured_data
+    return measured_series.plot_channels(measured_list)
 
 
 @simulation_bp.route("/<int:id>/measured-tc-plot/<step>")
@@ -2916,7 +2735,7 @@ def measured_absorbed_power_plot_step(id, step):
         return Response("No measured data", status=404)
 
     # Get geometry and material properties for mass calculation
-    from app.services.property_evaluator import evaluate_scalar
+    from app.services.property_evaluator import compile_property, evaluate_scalar
 
     geometry = create_geometry(sim.geometry_type, sim.geometry_dict)
     grade = sim.steel_grade
@@ -2924,18 +2743,14 @@ def measured_absorbed_power_plot_step(id, step):
     density = evaluate_scalar(grade.get_property("density"), 7850.0, temperature=20.0)
     mass = geometry.volume * density
 
-    # Get Cp property for interpolation
-    cp_prop = grade.get_property("specific_heat")
-
-    def get_cp_at_temp(temp):
-        """Get specific heat at given temperature."""
-        return evaluate_scalar(cp_prop, 500.0, temperature=temp)
+    # Vectorized Cp(T) lookup
+    cp_func = compile_property(grade.get_property("specific_heat"), 500.0)
 
     # Generate absorbed power plot
     plot_data = visualization.create_measured_absorbed_power_plot(
         measured_data,
         mass=mass,
-        cp_func=get_cp_at_temp,
+        cp_func=cp_func,
         title=f"Measured Absorbed Power ({step.title()})",
         phase_name=step,
     )
@@ -2973,8 +2788,7 @@ def preview_tc_data(id):
             mimetype="application/json",
         )
 
-    content = file.read().decode("utf-8")
-    result = generate_preview(content)
+    result = generate_preview(file.stream)
     return Response(json_mod.dumps(result), mimetype="application/json")
 
 
@@ -2982,8 +2796,6 @@ def preview_tc_data(id):
 @login_required
 def comparison_plot_channel(id, channel):
     """Generate comparison plot for a specific measured channel vs simulation."""
-    import numpy as np
-
     sim = Simulation.query.get_or_404(id)
     if sim.user_id != current_user.id:
         return Response("Access denied", status=403)
@@ -2999,13 +2811,14 @@ def comparison_plot_channel(id, channel):
         if channel in md.available_channels:
             md_match = md
             break
-    if not md_match:
+    fields = measured_series.channel_series(md_match).get(channel) if md_match else None
+    if fields is None:
         return Response("Channel not found", status=404)
 
-    sim_times = np.array(cycle.time_array)
-    sim_temps = np.array(cycle.data_dict.get("center", cycle.value_array))
-    meas_times = np.array(md_match.get_channel_times(channel))
-    meas_temps = np.array(md_match.get_channel_data(channel))
+    sim_times = cycle.time_series
+    sim_temps = cycle.center_series
+    meas_times = fields["time"]
+    meas_temps = fields["temp"]
 
     # Optional time offset
     offset = request.args.get("offset", 0, type=float)
@@ -3186,6 +2999,7 @@ def optimize(id):
                 constraints=constraints,
                 method=form.method.data,
                 max_iterations=form.max_iterations.data or 30,
+                workers=current_app.config.get("OPTIMIZATION_WORKERS", 1),
             )
 
             # Delete previous optimization result if exists
@@ -5,6 +5,11 @@
  * line chart fetched from the simulation plot-data JSON endpoint. Zoom
  * (drag/scroll), pan and reset come from the standard Plotly modebar;
  * double-click resets the view.
+ *
+ * Charts whose data has "range_query": true re-fetch their traces for the
+ * visible time range (t_min / t_max) after each zoom or pan, so zooming into
+ * a long history shows full-resolution data; resetting the view re-fetches
+ * the whole history.
  */
 (function () {
     'use strict';
@@ -41,6 +46,56 @@
         el.appendChild(p);
     }
 
+    var RANGE_FETCH_DELAY_MS = 250;
+
+    function withRange(url, range) {
+        if (!range) return url;
+        var sep = url.indexOf('?') === -1 ? '?' : '&';
+        return url + sep + 't_min=' + encodeURIComponent(range[0]) +
+            '&t_max=' + encodeURIComponent(range[1]);
+    }
+
+    function visibleRange(event) {
+        // null: whole history; undefined: the event did not change the x axis
+        if (event['xaxis.autorange']) return null;
+        if (event['xaxis.range']) return event['xaxis.range'];
+        if ('xaxis.range[0]' in event && 'xaxis.range[1]' in event) {
+            return [event['xaxis.range[0]'], event['xaxis.range[1]']];
+        }
+        return undefined;
+    }
+
+    function fetchRange(el, range) {
+        // Only the newest request may replace the traces
+        var request = (el._heatsimRangeRequest || 0) + 1;
+        el._heatsimRangeRequest = request;
+        fetch(withRange(el._heatsimUrl, range))
+            .then(function (resp) {
+                return resp.ok ? resp.json() : null;
+            })
+            .then(function (data) {
+                if (!data || request !== el._heatsimRangeRequest) return;
+                // Keep the current layout so the zoomed axes stay put
+                Plotly.react(el, data.traces, el.layout, PLOT_CONFIG);
+            })
+            .catch(function () {
+                // Keep the traces already shown
+            });
+    }
+
+    function bindRangeQuery(el) {
+        // Plotly.react keeps listeners: replace the one from a previous render
+        el.removeAllListeners('plotly_relayout');
+        el.on('plotly_relayout', function (event) {
+            var range = visibleRange(event);
+            if (range === undefined) return;
+            clearTimeout(el._heatsimRangeTimer);
+            el._heatsimRangeTimer = setTimeout(function () {
+                fetchRange(el, range);
+            }, RANGE_FETCH_DELAY_MS);
+        });
+    }
+
     function renderPlot(el, url, useReact) {
         el.innerHTML = '<div class="spinner-border text-secondary my-4" role="status">' +
             '<span class="visually-hidden">Loading…</span></div>';
@@ -54,7 +109,10 @@
             .then(function (data) {
                 el.innerHTML = '';
                 var fn = useReact ? Plotly.react : Plotly.newPlot;
-                fn(el, data.traces, buildLayout(data.layout), PLOT_CONFIG);
+                return fn(el, data.traces, buildLayout(data.layout), PLOT_CONFIG).then(function () {
+                    el._heatsimUrl = url;
+                    if (data.range_query) bindRangeQuery(el);
+                });
             })
             .catch(function (err) {
                 showError(el, err.message);
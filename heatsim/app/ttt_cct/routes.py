@@ -1,25 +1,31 @@
 """Routes for TTT/CCT diagram viewing and JMAK parameter management."""
 
 import io
+import json
 import logging
+from datetime import datetime
 
 from flask import Response, flash, jsonify, redirect, render_template, request, url_for
-from flask_login import login_required
+from flask_login import current_user, login_required
 
 from app.extensions import db
 from app.models import SteelGrade
 from app.models.ttt_parameters import (
     B_MODEL_GAUSSIAN,
+    CALIBRATION_QUEUED,
+    CalibrationJob,
     JMAKParameters,
     MartensiteParameters,
     TTTCalibrationData,
     TTTCurve,
     TTTParameters,
 )
+from app.services.material_change_tracker import MaterialChangeTracker
 from app.services.phase_transformation import (
     PhasePredictor,
     calculate_critical_temperatures,
 )
+from app.services.phase_transformation.diagram_cache import warm_diagrams
 
 from . import ttt_cct_bp
 from .forms import (
@@ -105,19 +111,27 @@ def edit_parameters(grade_id):
     form = TTTParametersForm(obj=ttt)
 
     if form.validate_on_submit():
-        if ttt is None:
+        created = ttt is None
+        if created:
             ttt = TTTParameters(steel_grade_id=grade_id)
-            db.session.add(ttt)
-
-        ttt.ae1 = form.ae1.data
-        ttt.ae3 = form.ae3.data
-        ttt.bs = form.bs.data
-        ttt.ms = form.ms.data
-        ttt.mf = form.mf.data
-        ttt.austenitizing_temperature = form.austenitizing_temperature.data
-        ttt.grain_size_astm = form.grain_size_astm.data
-        ttt.data_source = form.data_source.data
-        ttt.notes = form.notes.data
+
+        MaterialChangeTracker.apply_tracked(
+            "ttt_parameters",
+            ttt,
+            grade_id,
+            {
+                "ae1": form.ae1.data,
+                "ae3": form.ae3.data,
+                "bs": form.bs.data,
+                "ms": form.ms.data,
+                "mf": form.mf.data,
+                "austenitizing_temperature": form.austenitizing_temperature.data,
+                "grain_size_astm": form.grain_size_astm.data,
+                "data_source": form.data_source.data,
+                "notes": form.notes.data,
+            },
+            created=created,
+        )
 
         # Invalidate cached curves
         TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
@@ -162,16 +176,9 @@ def edit_jmak(grade_id, phase):
             form.Q.data = b_params.get("Q")
 
     if form.validate_on_submit():
-        if jmak is None:
+        created = jmak is None
+        if created:
             jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=phase)
-            db.session.add(jmak)
-
-        jmak.n_value = form.n_value.data
-        jmak.b_model_type = form.b_model_type.data
-        jmak.nose_temperature = form.nose_temperature.data
-        jmak.nose_time = form.nose_time.data
-        jmak.temp_range_min = form.temp_range_min.data
-        jmak.temp_range_max = form.temp_range_max.data
 
         # Build b_parameters JSON
         if form.b_model_type.data == "gaussian":
@@ -187,7 +194,22 @@ def edit_jmak(grade_id, phase):
             }
         else:
             b_params = {}
-        jmak.set_b_params(b_params)
+
+        MaterialChangeTracker.apply_tracked(
+            "jmak_parameters",
+            jmak,
+            grade_id,
+            {
+                "n_value": form.n_value.data,
+                "b_model_type": form.b_model_type.data,
+                "b_parameters": json.dumps(b_params),
+                "nose_temperature": form.nose_temperature.data,
+                "nose_time": form.nose_time.data,
+                "temp_range_min": form.temp_range_min.data,
+                "temp_range_max": form.temp_range_max.data,
+            },
+            created=created,
+        )
 
         # Invalidate cached curves
         TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
@@ -214,13 +236,20 @@ def edit_martensite(grade_id):
     form = MartensiteForm(obj=mart)
 
     if form.validate_on_submit():
-        if mart is None:
+        created = mart is None
+        if created:
             mart = MartensiteParameters(ttt_parameters_id=ttt.id)
-            db.session.add(mart)
 
-        mart.ms = form.ms.data
-        mart.mf = form.mf.data
-        mart.alpha_m = form.alpha_m.data
+        MaterialChangeTracker.apply_tracked(
+            "martensite_parameters",
+            mart,
+            grade_id,
+            {"ms": form.ms.data, "mf": form.mf.data, "alpha_m": form.alpha_m.data},
+            created=created,
+        )
+
+        # Invalidate cached curves (CCT curves depend on Ms/Mf)
+        TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
 
         db.session.commit()
         flash("Martensite parameters saved.", "success")
@@ -243,28 +272,38 @@ def auto_generate(grade_id):
     temps = calculate_critical_temperatures(comp)
 
     ttt = TTTParameters.query.filter_by(steel_grade_id=grade_id).first()
-    if ttt is None:
+    created = ttt is None
+    if created:
         ttt = TTTParameters(steel_grade_id=grade_id)
-        db.session.add(ttt)
-
-    ttt.ae1 = temps["Ae1"]
-    ttt.ae3 = temps["Ae3"]
-    ttt.bs = temps["Bs"]
-    ttt.ms = temps["Ms"]
-    ttt.mf = temps["Mf"]
-    ttt.data_source = "empirical"
-    ttt.notes = "Auto-generated from composition using Andrews/Steven-Haynes"
 
-    db.session.flush()
+    MaterialChangeTracker.apply_tracked(
+        "ttt_parameters",
+        ttt,
+        grade_id,
+        {
+            "ae1": temps["Ae1"],
+            "ae3": temps["Ae3"],
+            "bs": temps["Bs"],
+            "ms": temps["Ms"],
+            "mf": temps["Mf"],
+            "data_source": "empirical",
+            "notes": "Auto-generated from composition using Andrews/Steven-Haynes",
+        },
+        created=created,
+    )
 
     # Create martensite parameters
     mart = ttt.martensite_parameters
-    if mart is None:
+    created = mart is None
+    if created:
         mart = MartensiteParameters(ttt_parameters_id=ttt.id)
-        db.session.add(mart)
-    mart.ms = temps["Ms"]
-    mart.mf = temps["Mf"]
-    mart.alpha_m = 0.011
+    MaterialChangeTracker.apply_tracked(
+        "martensite_parameters",
+        mart,
+        grade_id,
+        {"ms": temps["Ms"], "mf": temps["Mf"], "alpha_m": 0.011},
+        created=created,
+    )
 
     # Auto-generate JMAK parameters (estimated from composition)
     _auto_generate_jmak(ttt, comp, temps)
@@ -273,6 +312,7 @@ def auto_generate(grade_id):
     TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
 
     db.session.commit()
+    warm_diagrams(grade_id)
     flash("TTT parameters auto-generated from composition.", "success")
     return redirect(url_for("ttt_cct.view", grade_id=grade_id))
 
@@ -362,23 +402,31 @@ def _auto_generate_jmak(ttt, comp, temps):
     # Create/update JMAKParameters
     for cfg in phase_configs:
         jmak = ttt.jmak_parameters.filter_by(phase=cfg["phase"]).first()
-        if jmak is None:
+        created = jmak is None
+        if created:
             jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=cfg["phase"])
-            db.session.add(jmak)
 
-        jmak.n_value = cfg["n"]
-        jmak.b_model_type = B_MODEL_GAUSSIAN
-        jmak.set_b_params(
+        MaterialChangeTracker.apply_tracked(
+            "jmak_parameters",
+            jmak,
+            ttt.steel_grade_id,
             {
-                "b_max": cfg["b_max"],
-                "t_nose": cfg["t_nose"],
-                "sigma": cfg["sigma"],
-            }
+                "n_value": cfg["n"],
+                "b_model_type": B_MODEL_GAUSSIAN,
+                "b_parameters": json.dumps(
+                    {
+                        "b_max": cfg["b_max"],
+                        "t_nose": cfg["t_nose"],
+                        "sigma": cfg["sigma"],
+                    }
+                ),
+                "nose_temperature": cfg["nose_temp"],
+                "nose_time": cfg["nose_time"],
+                "temp_range_min": cfg["temp_min"],
+                "temp_range_max": cfg["temp_max"],
+            },
+            created=created,
         )
-        jmak.nose_temperature = cfg["nose_temp"]
-        jmak.nose_time = cfg["nose_time"]
-        jmak.temp_range_min = cfg["temp_min"]
-        jmak.temp_range_max = cfg["temp_max"]
 
 
 @ttt_cct_bp.route("/grade/<int:grade_id>/calibrate", methods=["GET", "POST"])
@@ -397,8 +445,8 @@ def calibrate(grade_id):
     if form.validate_on_submit():
         import csv
 
+        from app.services.calibration_runner import apply_calibration
         from app.services.phase_transformation.parameter_calibration import (
-            calibrate_from_cct,
             calibrate_isothermal,
         )
 
@@ -427,6 +475,11 @@ def calibrate(grade_id):
         if len(data_points) < 3:
             flash("Insufficient data points (need at least 3).", "danger")
             return redirect(url_for("ttt_cct.calibrate", grade_id=grade_id))
+        if form.test_type.data == "continuous_cooling" and any(
+            "start_temperature" not in dp for dp in data_points
+        ):
+            flash("CCT data needs a start_temperature column.", "danger")
+            return redirect(url_for("ttt_cct.calibrate", grade_id=grade_id))
 
         # Store calibration data
         for dp in data_points:
@@ -441,32 +494,32 @@ def calibrate(grade_id):
             )
             db.session.add(cal)
 
-        # Calibrate
-        try:
-            phase = form.phase.data
-            if form.test_type.data == "isothermal":
-                n_val, model_type, b_params = calibrate_isothermal(data_points, phase)
-            else:
-                n_val, model_type, b_params = calibrate_from_cct(data_points)
-
-            # Update JMAK parameters
-            jmak = ttt.jmak_parameters.filter_by(phase=phase).first()
-            if jmak is None:
-                jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=phase)
-                db.session.add(jmak)
+        phase = form.phase.data
+        if form.test_type.data == "continuous_cooling":
+            # Fitting takes up to a few hundred optimizer generations: queue it
+            from app.services.job_queue import notify_job_submitted
 
-            jmak.n_value = n_val
-            jmak.b_model_type = model_type
-            jmak.set_b_params(b_params)
-            if model_type == "gaussian":
-                jmak.nose_temperature = b_params.get("t_nose")
-
-            ttt.data_source = "calibrated"
-
-            # Invalidate cached curves
-            TTTCurve.query.filter_by(ttt_parameters_id=ttt.id).delete()
+            job = CalibrationJob(
+                ttt_parameters_id=ttt.id,
+                user_id=current_user.id,
+                phase=phase,
+                data_points=json.dumps(data_points),
+                status=CALIBRATION_QUEUED,
+                queued_at=datetime.utcnow(),
+                progress_message="Queued...",
+            )
+            db.session.add(job)
+            db.session.commit()
+            notify_job_submitted()
+            flash(f"Calibration of {phase} queued.", "info")
+            return redirect(url_for("ttt_cct.calibration_job", job_id=job.id))
 
+        # Isothermal fits are quick: calibrate now
+        try:
+            n_val, model_type, b_params = calibrate_isothermal(data_points, phase)
+            apply_calibration(ttt, phase, n_val, model_type, b_params)
             db.session.commit()
+            warm_diagrams(grade_id)
             flash(f"Calibrated {phase}: n={n_val:.2f}, model={model_type}", "success")
         except Exception as e:
             db.session.rollback()
@@ -478,6 +531,35 @@ def calibrate(grade_id):
     return render_template("ttt_cct/calibration.html", grade=grade, form=form)
 
 
+@ttt_cct_bp.route("/calibration-job/<int:job_id>")
+@login_required
+def calibration_job(job_id):
+    """Progress and result of a queued CCT calibration."""
+    job = CalibrationJob.query.get_or_404(job_id)
+    grade = job.ttt_parameters.steel_grade
+    return render_template("ttt_cct/calibration_job.html", job=job, grade=grade)
+
+
+@ttt_cct_bp.route("/calibration-job/<int:job_id>/status")
+@login_required
+def calibration_job_status(job_id):
+    """Calibration job status (JSON for AJAX polling)."""
+    job = CalibrationJob.query.get_or_404(job_id)
+
+    from app.services.job_queue import get_queue_position
+
+    return jsonify(
+        {
+            "status": job.status,
+            "progress_percent": job.progress_percent,
+            "progress_message": job.progress_message,
+            "error_message": job.error_message,
+            "queue_position": get_queue_position("calibration", job.id),
+            "result": job.result_dict,
+        }
+    )
+
+
 # ---- Plot routes (return PNG images) ----
 
 
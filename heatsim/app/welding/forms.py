@@ -322,3 +322,6 @@ class GoldakMultiPassForm(FlaskForm):
         default="medium",
     )
     compare_methods = BooleanField("Generate Rosenthal comparison", default=True)
+    temperature_dependent = BooleanField(
+        "Temperature-dependent k(T), Cp(T) from the steel grade", default=False
+    )
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from datetime import datetime
 from pathlib import Path
 
 from flask import (
@@ -327,14 +328,18 @@ def run(id):
             db.session.delete(result)
 
         # Enqueue for background execution
+        from app.services.job_queue import notify_job_submitted
+
         use_mock = form.use_mock_solver.data
         project.status = STATUS_QUEUED
+        project.queued_at = datetime.utcnow()
         project.progress_percent = 0.0
         project.current_string = 0
         project.error_message = None
         # Store mock preference as a flag in progress_message (worker reads + clears it)
         project.progress_message = "mock:" if use_mock else "Queued..."
         db.session.commit()
+        notify_job_submitted()
 
         flash("Simulation queued.", "info")
         return redirect(url_for("welding.progress", id=id))
@@ -377,13 +382,15 @@ def progress_status(id):
             }
         )
 
-    from app.services.job_queue import get_queue_position
+    from app.services.job_queue import get_job_worker, get_queue_position
 
     queue_position = get_queue_position("weld", project.id)
+    worker = get_job_worker("weld", project.id)
 
     return jsonify(
         {
             "status": project.status,
+            "worker": worker["name"] if worker else None,
             "current_string": project.current_string,
             "total_strings": project.total_strings,
             "progress_percent": project.progress_percent,
@@ -642,6 +649,49 @@ def haz_analysis(id):
     )
 
 
+@welding_bp.route("/<int:id>/haz/map")
+@login_required
+def haz_map(id):
+    """Analytical HAZ map over the transverse section (JSON for parameter sliders).
+
+    Query parameters heat_input (kJ/mm), travel_speed (mm/s) and preheat
+    (°C) override the project defaults; max_distance_mm and max_depth_mm
+    size the section.
+    """
+    project = WeldProject.query.get_or_404(id)
+
+    if project.user_id != current_user.id:
+        return jsonify({"error": "Access denied"}), 403
+
+    from dataclasses import replace
+
+    from app.services.haz_predictor import HAZPredictor
+    from app.services.rosenthal_solver import RosenthalSolver
+
+    solver = RosenthalSolver.from_weld_project(project)
+    p = solver.params
+    heat_input = request.args.get("heat_input", type=float) or project.default_heat_input
+    travel_speed = request.args.get("travel_speed", type=float) or project.default_travel_speed
+    preheat = request.args.get("preheat", type=float)
+    solver.params = replace(
+        p,
+        Q=p.eta * heat_input * travel_speed * 1000.0,
+        v=travel_speed / 1000.0,
+        T0=p.T0 if preheat is None else preheat,
+    )
+
+    phase_diagram = (
+        getattr(project.steel_grade, "phase_diagram", None) if project.steel_grade else None
+    )
+    predictor = HAZPredictor(solver, phase_diagram=phase_diagram)
+    return jsonify(
+        predictor.predict_map(
+            max_distance_mm=min(request.args.get("max_distance_mm", 20.0, type=float), 200.0),
+            max_depth_mm=min(request.args.get("max_depth_mm", 10.0, type=float), 200.0),
+        )
+    )
+
+
 @welding_bp.route("/<int:id>/preheat", methods=["GET", "POST"])
 @login_required
 def preheat(id):
@@ -863,10 +913,12 @@ def _get_goldak_rosenthal_comparison(project: WeldProject) -> dict:
         goldak_peak = result.peak_temperature_map[0, ny_mid:]
 
         # HAZ widths
+        zone_temps = [("fusion", 1500), ("cghaz", 1100), ("fghaz", 900), ("ichaz", 727)]
+        ros_widths = ros.haz_boundary_distances([temp for _, temp in zone_temps], z=0.0)
         ros_haz = {}
         goldak_haz = {}
-        for zone, temp in [("fusion", 1500), ("cghaz", 1100), ("fghaz", 900), ("ichaz", 727)]:
-            ros_haz[zone] = ros.haz_boundary_distance(temp, z=0.0) * 1000
+        for (zone, temp), width in zip(zone_temps, ros_widths, strict=True):
+            ros_haz[zone] = float(width) * 1000
             idx = np.where(goldak_peak < temp)[0]
             if len(idx) > 0 and idx[0] > 0:
                 goldak_haz[zone] = float(distances_mm[idx[0]])
@@ -953,15 +1005,20 @@ def goldak_multipass(id):
 
     if form.validate_on_submit():
         # Enqueue for background execution
+        from app.services.job_queue import notify_job_submitted
+
         project.status = STATUS_QUEUED
+        project.queued_at = datetime.utcnow()
         project.progress_percent = 0.0
         project.error_message = None
         project.started_at = None
         project.completed_at = None
         project.progress_message = (
             f"goldak:{form.grid_resolution.data}:{str(form.compare_methods.data).lower()}"
+            f":{str(form.temperature_dependent.data).lower()}"
         )
         db.session.commit()
+        notify_job_submitted()
         flash("Goldak multi-pass simulation queued.", "info")
         return redirect(url_for("welding.goldak_multipass", id=id))
 
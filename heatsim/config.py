@@ -57,6 +57,34 @@ class Config:
     COMSOL_TIMEOUT = int(os.environ.get("COMSOL_TIMEOUT", 3600))  # 1 hour default
     COMSOL_CORES = int(os.environ.get("COMSOL_CORES", 4))  # CPU cores for COMSOL
 
+    # Job queue: worker processes (0 = one thread in the web process), workers
+    # reserved for the fast lane, concurrency limits per job kind, lease timeout (s)
+    JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))
+    JOB_FAST_WORKERS = int(os.environ.get("JOB_FAST_WORKERS", 1))
+    JOB_KIND_LIMITS = {
+        "comsol": int(os.environ.get("JOB_LIMIT_COMSOL", 1)),
+        "goldak": int(os.environ.get("JOB_LIMIT_GOLDAK", 1)),
+    }
+    JOB_LEASE_TIMEOUT = int(os.environ.get("JOB_LEASE_TIMEOUT", 60))
+    # Fallback poll (s); submissions wake idle workers immediately
+    JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", 30))
+    # Result plots rendered per pass by idle workers (0 = only on first view)
+    PLOT_PRERENDER_BATCH = int(os.environ.get("PLOT_PRERENDER_BATCH", 4))
+
+    # Optimization: worker processes for differential evolution (1 = in-process)
+    OPTIMIZATION_WORKERS = int(os.environ.get("OPTIMIZATION_WORKERS", 1))
+    # CCT calibration: optimizer threads the population is split over
+    # (1 = single vectorized call, -1 = all CPUs) and early-stop patience
+    # (generations)
+    CALIBRATION_WORKERS = int(os.environ.get("CALIBRATION_WORKERS", 1))
+    CALIBRATION_PATIENCE = int(os.environ.get("CALIBRATION_PATIENCE", 25))
+
+    # Result cache: runs with inputs solved before copy those results. Entries
+    # unused for MAX_AGE_DAYS are evicted, beyond MAX_ENTRIES the least recently used
+    RESULT_CACHE_ENABLED = os.environ.get("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_MAX_AGE_DAYS = float(os.environ.get("RESULT_CACHE_MAX_AGE_DAYS", 30))
+    RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", 5000))
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -0,0 +1,73 @@
+"""Add job_workers and job_leases tables for the multi-worker job queue.
+
+Revision ID: 004_job_queue
+Revises: 003_hollomon_jaffe
+Create Date: 2026-10-16
+
+This migration targets the 'materials' bind database where simulations
+and weld_projects live. Tables are only created if missing (db.create_all
+at startup may already have created them).
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '004_job_queue'
+down_revision = '003_hollomon_jaffe'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Create job_workers and job_leases in materials DB."""
+    engine = _get_materials_engine()
+    metadata = sa.MetaData()
+
+    sa.Table(
+        'job_workers', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.Text(), nullable=False, unique=True),
+        sa.Column('pid', sa.Integer()),
+        sa.Column('lanes', sa.Text()),
+        sa.Column('state', sa.Text()),
+        sa.Column('job_type', sa.Text()),
+        sa.Column('job_id', sa.Integer()),
+        sa.Column('job_started_at', sa.DateTime()),
+        sa.Column('jobs_completed', sa.Integer()),
+        sa.Column('started_at', sa.DateTime()),
+        sa.Column('heartbeat_at', sa.DateTime()),
+    )
+    sa.Table(
+        'job_leases', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('job_type', sa.Text(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.Text(), nullable=False),
+        sa.Column('lane', sa.Text(), nullable=False),
+        sa.Column('slot', sa.Integer()),
+        sa.Column('worker_name', sa.Text(), nullable=False),
+        sa.Column('claimed_at', sa.DateTime()),
+        sa.Column('heartbeat_at', sa.DateTime()),
+        sa.Column('released_at', sa.DateTime()),
+        sa.Column('outcome', sa.Text()),
+        sa.UniqueConstraint('kind', 'slot', name='uq_job_lease_kind_slot'),
+        sa.Index('ix_job_leases_job', 'job_type', 'job_id'),
+        sa.Index('ix_job_leases_active', 'released_at'),
+    )
+    metadata.create_all(engine, checkfirst=True)
+
+
+def downgrade():
+    """Drop job_leases and job_workers from materials DB."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        conn.execute(sa.text('DROP TABLE IF EXISTS job_leases'))
+        conn.execute(sa.text('DROP TABLE IF EXISTS job_workers'))
+        conn.commit()
@@ -0,0 +1,56 @@
+"""Add queued_at to jobs and wait_seconds to job_leases.
+
+Revision ID: 005_job_latency
+Revises: 004_job_queue
+Create Date: 2026-10-16
+
+Records when simulations and weld projects were submitted to the job
+queue and how long each waited before a worker started it. Targets the
+'materials' bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '005_job_latency'
+down_revision = '004_job_queue'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ('simulations', 'queued_at', 'TIMESTAMP'),
+    ('weld_projects', 'queued_at', 'TIMESTAMP'),
+    ('job_leases', 'wait_seconds', 'FLOAT'),
+]
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Add the latency columns in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        for table, column, ddl in COLUMNS:
+            columns = [c['name'] for c in inspector.get_columns(table)]
+            if column not in columns:
+                conn.execute(sa.text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+        conn.commit()
+
+
+def downgrade():
+    """Remove the latency columns from materials DB."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        for table, column, _ in COLUMNS:
+            try:
+                conn.execute(sa.text(f'ALTER TABLE {table} DROP COLUMN {column}'))
+            except Exception:
+                pass
+        conn.commit()
@@ -0,0 +1,158 @@
+"""Add series_data to simulation_results and move JSON time series into it.
+
+Revision ID: 006_result_series
+Revises: 005_job_latency
+Create Date: 2026-10-16
+
+Time series of simulation results were stored as JSON text in time_data,
+value_data and (per position) result_data. They are now kept as one
+compressed npz blob per row. Existing rows are converted in batches; rows
+that cannot be converted stay JSON and remain readable. Targets the
+'materials' bind database.
+"""
+import io
+import json
+
+import numpy as np
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '006_result_series'
+down_revision = '005_job_latency'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+# Frozen copy of the series blob encoding as of this revision. Migrations
+# must not import app code: later changes to the app encoder would change
+# what this revision writes.
+SERIES_POSITION_PREFIX = 'pos_'
+
+
+def _pack_series(times, values=None, positions=None):
+    """Encode series as an npz blob (time float64, value/pos_<name> float32)."""
+    arrays = {'time': np.asarray(times, dtype=np.float64)}
+    if values is not None:
+        arrays['value'] = np.asarray(values, dtype=np.float32)
+    for name, series in (positions or {}).items():
+        arrays[SERIES_POSITION_PREFIX + name] = np.asarray(series, dtype=np.float32)
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _unpack_series(blob):
+    """Decode every member of a series blob."""
+    with np.load(io.BytesIO(blob)) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def legacy_series_to_blob(time_data, value_data, result_data):
+    """Convert the JSON series columns of a result row.
+
+    Position series named in ``result_data["positions"]`` move into the
+    blob; the rest of ``result_data`` is kept as JSON. Returns
+    (series_data blob, new result_data JSON); raises ValueError or
+    TypeError if a series is not valid JSON or not numeric.
+    """
+    times = json.loads(time_data) if time_data else []
+    values = json.loads(value_data) if value_data else None
+    data = json.loads(result_data) if result_data else None
+    positions = {}
+    if isinstance(data, dict):
+        for key in data.get('positions') or []:
+            if isinstance(data.get(key), list):
+                positions[key] = data.pop(key)
+    blob = _pack_series(times, values, positions)
+    return blob, json.dumps(data) if data is not None else None
+
+
+def migrate_legacy_series(connection, batch_size=200):
+    """Move JSON time series of existing result rows into series_data.
+
+    Rows that cannot be converted are left as JSON; they stay readable
+    through the legacy fallback of SimulationResult. Returns the number
+    of rows converted.
+    """
+    select = sa.text(
+        'SELECT id, time_data, value_data, result_data FROM simulation_results '
+        'WHERE id > :last_id AND series_data IS NULL AND time_data IS NOT NULL '
+        'ORDER BY id LIMIT :batch_size'
+    )
+    update = sa.text(
+        'UPDATE simulation_results SET series_data = :blob, result_data = :data, '
+        'time_data = NULL, value_data = NULL WHERE id = :id'
+    ).bindparams(sa.bindparam('blob', type_=sa.LargeBinary))
+    converted = 0
+    last_id = 0
+    while True:
+        rows = connection.execute(select, {'last_id': last_id, 'batch_size': batch_size}).all()
+        if not rows:
+            return converted
+        for row in rows:
+            last_id = row.id
+            try:
+                blob, data = legacy_series_to_blob(row.time_data, row.value_data, row.result_data)
+            except (ValueError, TypeError):
+                continue
+            connection.execute(update, {'blob': blob, 'data': data, 'id': row.id})
+            converted += 1
+
+
+def upgrade():
+    """Add series_data and convert existing rows in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    blob = 'BYTEA' if engine.dialect.name == 'postgresql' else 'BLOB'
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('simulation_results')]
+        if 'series_data' not in columns:
+            conn.execute(sa.text(f'ALTER TABLE simulation_results ADD COLUMN series_data {blob}'))
+        migrate_legacy_series(conn)
+        conn.commit()
+
+
+def downgrade():
+    """Write series back to JSON columns and remove series_data."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(sa.text(
+            'SELECT id, series_data, result_data FROM simulation_results '
+            'WHERE series_data IS NOT NULL'
+        )).all()
+        for row in rows:
+            series = _unpack_series(row.series_data)
+            data = json.loads(row.result_data) if row.result_data else None
+            positions = {
+                name[len(SERIES_POSITION_PREFIX):]: values.tolist()
+                for name, values in series.items()
+                if name.startswith(SERIES_POSITION_PREFIX)
+            }
+            if positions:
+                data = dict(data or {}, **positions)
+            conn.execute(
+                sa.text(
+                    'UPDATE simulation_results SET time_data = :time, value_data = :value, '
+                    'result_data = :data WHERE id = :id'
+                ),
+                {
+                    'time': json.dumps(series['time'].tolist()),
+                    'value': json.dumps(series['value'].tolist()) if 'value' in series else None,
+                    'data': json.dumps(data) if data is not None else None,
+                    'id': row.id,
+                },
+            )
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        try:
+            conn.execute(sa.text('ALTER TABLE simulation_results DROP COLUMN series_data'))
+        except Exception:
+            pass
+        conn.commit()
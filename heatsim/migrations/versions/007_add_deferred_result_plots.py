@@ -0,0 +1,80 @@
+"""Add deferred plot columns to simulation_results and the rendered_plots cache.
+
+Revision ID: 007_deferred_plots
+Revises: 006_result_series
+Create Date: 2026-10-16
+
+Simulation jobs no longer render PNGs; each result row stores a plot spec
+and a content key, and images are rendered on demand into rendered_plots
+(one row per key). Failed renders are not cached; the time of the last
+failure is kept on the result row so pre-rendering backs off. Targets the 'materials' bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '007_deferred_plots'
+down_revision = '006_result_series'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ('plot_spec', 'TEXT'),
+    ('plot_key', 'VARCHAR(64)'),
+    ('plot_failed_at', 'TIMESTAMP'),
+]
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Add the plot columns and create rendered_plots in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('simulation_results')]
+        for column, ddl in COLUMNS:
+            if column not in columns:
+                conn.execute(sa.text(f'ALTER TABLE simulation_results ADD COLUMN {column} {ddl}'))
+        conn.execute(sa.text(
+            'CREATE INDEX IF NOT EXISTS ix_simulation_results_plot_key '
+            'ON simulation_results (plot_key)'
+        ))
+        conn.commit()
+
+    metadata = sa.MetaData()
+    sa.Table(
+        'rendered_plots', metadata,
+        sa.Column('key', sa.String(64), primary_key=True),
+        sa.Column('image', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+    )
+    metadata.create_all(engine, checkfirst=True)
+
+
+def downgrade():
+    """Copy rendered images back into plot_image, then drop the new schema.
+
+    Deferred plots that were never rendered are lost.
+    """
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        conn.execute(sa.text(
+            'UPDATE simulation_results SET plot_image = '
+            '(SELECT image FROM rendered_plots WHERE rendered_plots.key = simulation_results.plot_key) '
+            'WHERE plot_image IS NULL AND plot_key IS NOT NULL'
+        ))
+        conn.execute(sa.text('DROP INDEX IF EXISTS ix_simulation_results_plot_key'))
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        for column, _ in COLUMNS:
+            try:
+                conn.execute(sa.text(f'ALTER TABLE simulation_results DROP COLUMN {column}'))
+            except Exception:
+                pass
+        conn.execute(sa.text('DROP TABLE IF EXISTS rendered_plots'))
+        conn.commit()
@@ -0,0 +1,61 @@
+"""Add params_version to ttt_parameters.
+
+Revision ID: 008_ttt_params_version
+Revises: 007_deferred_plots
+Create Date: 2026-10-16
+
+Compiled JMAK / martensite models are cached per steel grade and
+params_version, a random token replaced whenever a change to the grade's
+TTT parameters is logged. Existing rows get a token so they are cached
+too. Targets the 'materials' bind database.
+"""
+import uuid
+
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '008_ttt_params_version'
+down_revision = '007_deferred_plots'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Add params_version to ttt_parameters in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('ttt_parameters')]
+        if 'params_version' not in columns:
+            conn.execute(sa.text(
+                'ALTER TABLE ttt_parameters ADD COLUMN params_version VARCHAR(32)'
+            ))
+        ids = conn.execute(sa.text(
+            'SELECT id FROM ttt_parameters WHERE params_version IS NULL'
+        )).scalars().all()
+        for row_id in ids:
+            conn.execute(
+                sa.text('UPDATE ttt_parameters SET params_version = :version WHERE id = :id'),
+                {'version': uuid.uuid4().hex, 'id': row_id},
+            )
+        conn.commit()
+
+
+def downgrade():
+    """Remove params_version from ttt_parameters in materials DB."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        try:
+            conn.execute(sa.text('ALTER TABLE ttt_parameters DROP COLUMN params_version'))
+            conn.commit()
+        except Exception:
+            pass
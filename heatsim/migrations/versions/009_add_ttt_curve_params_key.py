@@ -0,0 +1,53 @@
+"""Add params_key to ttt_curves.
+
+Revision ID: 009_ttt_curve_params_key
+Revises: 008_ttt_params_version
+Create Date: 2026-10-16
+
+Generated TTT / CCT diagrams are stored in ttt_curves, keyed by a hash of
+the generator version and the parameter set's params_version. Existing
+rows have no key and are regenerated on first use. Targets the 'materials'
+bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '009_ttt_curve_params_key'
+down_revision = '008_ttt_params_version'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Add params_key to ttt_curves in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('ttt_curves')]
+        if 'params_key' not in columns:
+            conn.execute(sa.text('ALTER TABLE ttt_curves ADD COLUMN params_key VARCHAR(64)'))
+        conn.execute(sa.text(
+            'CREATE INDEX IF NOT EXISTS ix_ttt_curves_params_key ON ttt_curves (params_key)'
+        ))
+        conn.commit()
+
+
+def downgrade():
+    """Remove params_key from ttt_curves in materials DB."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        conn.execute(sa.text('DROP INDEX IF EXISTS ix_ttt_curves_params_key'))
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        try:
+            conn.execute(sa.text('ALTER TABLE ttt_curves DROP COLUMN params_key'))
+        except Exception:
+            pass
+        conn.commit()
@@ -0,0 +1,61 @@
+"""Add the calibration_jobs table.
+
+Revision ID: 010_calibration_jobs
+Revises: 009_ttt_curve_params_key
+Create Date: 2026-10-16
+
+CCT calibrations run as background jobs (job type 'calibration'); each row
+holds the uploaded test data, progress and the fitted parameters. Targets
+the 'materials' bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '010_calibration_jobs'
+down_revision = '009_ttt_curve_params_key'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Create calibration_jobs in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    metadata = sa.MetaData()
+    # Reflected so the foreign key can be resolved
+    sa.Table('ttt_parameters', metadata, autoload_with=engine)
+    sa.Table(
+        'calibration_jobs', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('ttt_parameters_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer()),
+        sa.Column('phase', sa.Text(), nullable=False),
+        sa.Column('data_points', sa.Text(), nullable=False),
+        sa.Column('status', sa.Text()),
+        sa.Column('progress_percent', sa.Float()),
+        sa.Column('progress_message', sa.Text()),
+        sa.Column('result', sa.Text()),
+        sa.Column('error_message', sa.Text()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('queued_at', sa.DateTime()),
+        sa.Column('started_at', sa.DateTime()),
+        sa.Column('completed_at', sa.DateTime()),
+        sa.ForeignKeyConstraint(['ttt_parameters_id'], ['ttt_parameters.id']),
+        sa.Index('ix_calibration_jobs_status', 'status'),
+    )
+    metadata.create_all(engine, checkfirst=True)
+
+
+def downgrade():
+    """Drop calibration_jobs from materials DB."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        conn.execute(sa.text('DROP TABLE IF EXISTS calibration_jobs'))
+        conn.commit()
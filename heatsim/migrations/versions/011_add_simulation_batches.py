@@ -0,0 +1,83 @@
+"""Add simulation_batches and batch membership columns to simulations.
+
+Revision ID: 011_simulation_batches
+Revises: 010_calibration_jobs
+Create Date: 2026-10-16
+
+Batch runs and parameter sweeps are queued as a group; members with the
+same configuration hash are solved once. Targets the 'materials' bind
+database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '011_simulation_batches'
+down_revision = '010_calibration_jobs'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ('batch_id', 'INTEGER REFERENCES simulation_batches(id)'),
+    ('batch_value', 'FLOAT'),
+    ('config_hash', 'VARCHAR(64)'),
+    ('duplicate_of_id', 'INTEGER REFERENCES simulations(id)'),
+]
+
+INDEXES = [
+    ('ix_simulations_batch', 'batch_id'),
+    ('ix_simulations_duplicate_of', 'duplicate_of_id'),
+]
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Create simulation_batches and add the membership columns (idempotent)."""
+    engine = _get_materials_engine()
+    metadata = sa.MetaData()
+    sa.Table(
+        'simulation_batches', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('user_id', sa.Integer()),
+        sa.Column('kind', sa.Text(), nullable=False),
+        sa.Column('parameter', sa.Text()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('queued_at', sa.DateTime()),
+        sa.Index('ix_simulation_batches_user', 'user_id'),
+    )
+    metadata.create_all(engine, checkfirst=True)
+
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('simulations')]
+        for column, ddl in COLUMNS:
+            if column not in columns:
+                conn.execute(sa.text(f'ALTER TABLE simulations ADD COLUMN {column} {ddl}'))
+        for index, column in INDEXES:
+            conn.execute(sa.text(
+                f'CREATE INDEX IF NOT EXISTS {index} ON simulations ({column})'
+            ))
+        conn.commit()
+
+
+def downgrade():
+    """Remove the membership columns and drop simulation_batches."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        for index, _ in INDEXES:
+            conn.execute(sa.text(f'DROP INDEX IF EXISTS {index}'))
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        for column, _ in COLUMNS:
+            try:
+                conn.execute(sa.text(f'ALTER TABLE simulations DROP COLUMN {column}'))
+            except Exception:
+                pass
+        conn.execute(sa.text('DROP TABLE IF EXISTS simulation_batches'))
+        conn.commit()
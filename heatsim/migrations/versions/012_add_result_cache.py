@@ -0,0 +1,79 @@
+"""Add result_cache_entries and cache columns to simulation_snapshots.
+
+Revision ID: 012_result_cache
+Revises: 011_simulation_batches
+Create Date: 2026-10-16
+
+Runs whose inputs hash to a key solved before copy that snapshot's
+results instead of solving. Targets the 'materials' bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '012_result_cache'
+down_revision = '011_simulation_batches'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ('cache_key', 'VARCHAR(64)'),
+    ('reused_from_id', 'INTEGER'),
+]
+
+INDEXES = [
+    ('ix_snapshots_cache_key', 'cache_key'),
+]
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def upgrade():
+    """Create result_cache_entries and add the snapshot columns (idempotent)."""
+    engine = _get_materials_engine()
+    metadata = sa.MetaData()
+    sa.Table(
+        'result_cache_entries', metadata,
+        sa.Column('key', sa.String(64), primary_key=True),
+        sa.Column('snapshot_id', sa.Integer(), nullable=False),
+        sa.Column('hits', sa.Integer()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('last_used_at', sa.DateTime()),
+        sa.Index('ix_result_cache_last_used', 'last_used_at'),
+    )
+    metadata.create_all(engine, checkfirst=True)
+
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('simulation_snapshots')]
+        for column, ddl in COLUMNS:
+            if column not in columns:
+                conn.execute(sa.text(
+                    f'ALTER TABLE simulation_snapshots ADD COLUMN {column} {ddl}'
+                ))
+        for index, column in INDEXES:
+            conn.execute(sa.text(
+                f'CREATE INDEX IF NOT EXISTS {index} ON simulation_snapshots ({column})'
+            ))
+        conn.commit()
+
+
+def downgrade():
+    """Remove the snapshot columns and drop result_cache_entries."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        for index, _ in INDEXES:
+            conn.execute(sa.text(f'DROP INDEX IF EXISTS {index}'))
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        for column, _ in COLUMNS:
+            try:
+                conn.execute(sa.text(f'ALTER TABLE simulation_snapshots DROP COLUMN {column}'))
+            except Exception:
+                pass
+        conn.execute(sa.text('DROP TABLE IF EXISTS result_cache_entries'))
+        conn.commit()
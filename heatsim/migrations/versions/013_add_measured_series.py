@@ -0,0 +1,61 @@
+"""Add preprocessed series and time offset columns to measured_data.
+
+Revision ID: 013_measured_series
+Revises: 012_result_cache
+Create Date: 2026-10-17
+
+Measured channels are resampled, differentiated and smoothed once at upload
+and stored as a compressed npz blob; the cross-correlation time offset
+against the simulated cycle is stored with the snapshot it was detected
+against. Existing rows are preprocessed on first read. Targets the
+'materials' bind database.
+"""
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '013_measured_series'
+down_revision = '012_result_cache'
+branch_labels = None
+depends_on = None
+
+
+def _get_materials_engine():
+    """Get SQLAlchemy engine for the materials bind."""
+    db = current_app.extensions['migrate'].db
+    return db.engines['materials']
+
+
+def _columns(engine):
+    blob = 'BYTEA' if engine.dialect.name == 'postgresql' else 'BLOB'
+    return [
+        ('series_data', blob),
+        ('time_offset', 'FLOAT'),
+        ('offset_snapshot_id', 'INTEGER'),
+    ]
+
+
+def upgrade():
+    """Add the measured_data columns in materials DB (idempotent)."""
+    engine = _get_materials_engine()
+    inspector = sa.inspect(engine)
+    with engine.connect() as conn:
+        columns = [c['name'] for c in inspector.get_columns('measured_data')]
+        for column, ddl in _columns(engine):
+            if column not in columns:
+                conn.execute(sa.text(f'ALTER TABLE measured_data ADD COLUMN {column} {ddl}'))
+        conn.commit()
+
+
+def downgrade():
+    """Remove the measured_data columns."""
+    engine = _get_materials_engine()
+    with engine.connect() as conn:
+        # SQLite doesn't support DROP COLUMN before 3.35.0
+        for column, _ in _columns(engine):
+            try:
+                conn.execute(sa.text(f'ALTER TABLE measured_data DROP COLUMN {column}'))
+            except Exception:
+                pass
+        conn.commit()
@@ -0,0 +1,119 @@
+"""Benchmark: legacy sparse vs vectorized banded Crank-Nicolson time step.
+
+Reimplements the previous per-node assembly + `scipy.sparse.diags` +
+`spsolve` step and times it against `HeatSolver._time_step` for cylinder,
+ring and plate geometries, checking that both give the same field.
+
+Run from project root:
+    python scripts/bench_banded_solver.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+import numpy as np
+from scipy.sparse import diags
+from scipy.sparse.linalg import spsolve
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import HeatSolver, SolverConfig, create_geometry
+from app.services.boundary_conditions import create_quench_bc
+
+GEOMETRIES = {
+    "cylinder": {"radius": 0.6, "length": 2.0},
+    "ring": {"outer_radius": 0.6, "inner_radius": 0.2, "length": 2.0},
+    "plate": {"thickness": 0.2, "width": 1.0, "length": 2.0},
+}
+
+
+def legacy_step(solver: HeatSolver, T, r, dr, dt):
+    """Previous implementation: Python-loop assembly, sparse matrix, spsolve."""
+    n = len(T)
+    theta = solver.config.theta
+    T_new = T.copy()
+    for _ in range(solver.config.max_iterations):
+        T_old_iter = T_new.copy()
+        k, cp = solver._get_properties(0.5 * (T + T_new))
+        Fo = k / (solver._rho * cp) * dt / dr**2
+        lower, main, upper, rhs = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+        for i in range(1, n - 1):
+            if solver._is_cylindrical:
+                a_w = Fo[i] * (r[i] - dr / 2) / r[i]
+                a_e = Fo[i] * (r[i] + dr / 2) / r[i]
+            else:
+                a_w = a_e = Fo[i]
+            main[i] = 1 + theta * (a_w + a_e)
+            lower[i] = -theta * a_w
+            upper[i] = -theta * a_e
+            rhs[i] = T[i] + (1 - theta) * (a_w * (T[i - 1] - T[i]) + a_e * (T[i + 1] - T[i]))
+
+        if solver._has_inner_bc:
+            Bi = solver.inner_bc.linearized_htc(T_new[0]) * dr / k[0]
+            a_e = Fo[0] * (r[0] + dr / 2) / r[0]
+            T_amb = solver.inner_bc.ambient_temp
+            main[0] = 1 + theta * (a_e + 2 * Fo[0] * Bi)
+            upper[0] = -theta * a_e
+            rhs[0] = (
+                T[0]
+                + (1 - theta) * (a_e * (T[1] - T[0]) + 2 * Fo[0] * Bi * (T_amb - T[0]))
+                + 2 * theta * Fo[0] * Bi * T_amb
+            )
+        else:
+            c = 4 if solver._is_cylindrical else 2
+            main[0] = 1 + c * theta * Fo[0]
+            upper[0] = -c * theta * Fo[0]
+            rhs[0] = T[0] + c * (1 - theta) * Fo[0] * (T[1] - T[0])
+
+        Bi = solver.outer_bc.linearized_htc(T_new[-1]) * dr / k[-1]
+        a_w = Fo[-1] * (r[-1] - dr / 2) / r[-1] if solver._is_cylindrical else 2 * Fo[-1]
+        T_amb = solver.outer_bc.ambient_temp
+        main[-1] = 1 + theta * (a_w + 2 * Fo[-1] * Bi)
+        lower[-1] = -theta * a_w
+        rhs[-1] = (
+            T[-1]
+            + (1 - theta) * (a_w * (T[-2] - T[-1]) + 2 * Fo[-1] * Bi * (T_amb - T[-1]))
+            + 2 * theta * Fo[-1] * Bi * T_amb
+        )
+
+        A = diags([lower[1:], main, upper[:-1]], [-1, 0, 1], format="csr")
+        T_new = spsolve(A, rhs)
+        if np.max(np.abs(T_new - T_old_iter)) < solver.config.convergence_tol:
+            break
+    return T_new
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 101
+    repeats = 50
+    dt = 1.0
+
+    print(f"Nodes: {n_nodes}, dt = {dt} s, {repeats} steps each")
+    for name, params in GEOMETRIES.items():
+        geometry = create_geometry(name, params)
+        solver = HeatSolver(
+            geometry, create_quench_bc("water", 25.0), config=SolverConfig(n_nodes=n_nodes)
+        )
+        r = geometry.create_mesh(n_nodes)
+        dr = r[1] - r[0]
+        T = np.linspace(850.0, 600.0, len(r))
+
+        max_diff = float(
+            np.max(np.abs(solver._time_step(T, r, dr, dt) - legacy_step(solver, T, r, dr, dt)))
+        )
+        t_legacy = timeit.timeit(lambda: legacy_step(solver, T, r, dr, dt), number=repeats)
+        t_banded = timeit.timeit(lambda: solver._time_step(T, r, dr, dt), number=repeats)
+
+        print(
+            f"  {name:<9} legacy {t_legacy / repeats * 1e3:7.3f} ms/step   "
+            f"banded {t_banded / repeats * 1e3:7.3f} ms/step   "
+            f"speedup {t_legacy / t_banded:5.1f}x   max |dT| {max_diff:.1e} °C"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
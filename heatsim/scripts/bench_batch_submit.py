@@ -0,0 +1,125 @@
+"""Benchmark: synchronous batch run vs queued batch with deduplication.
+
+Creates a sweep-like batch of simulations where every configuration
+appears twice. "Before" solves every member inside the request, as the
+batch-run route used to. "After" times the submission the route now
+makes (hashing and queueing, what the HTTP request waits for), then the
+queue's work: one solve per unique configuration plus copying results to
+the duplicates.
+
+Run from project root:
+    python scripts/bench_batch_submit.py [n_unique] [copies]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import uuid
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ.setdefault("FLASK_CONFIG", "testing")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db
+from app.models import MaterialProperty, Simulation, SteelGrade
+from app.models.material import DATA_SOURCE_STANDARD
+from app.models.simulation import GEOMETRY_CYLINDER, PROCESS_QUENCH_WATER, STATUS_READY
+from app.services.batch_runner import create_batch, settle_duplicates, submit_batch
+from app.services.simulation_runner import run_heat_treatment
+
+
+def seed_grade() -> SteelGrade:
+    grade = SteelGrade(
+        designation=f"BENCH-{uuid.uuid4().hex[:8]}", data_source=DATA_SOURCE_STANDARD
+    )
+    db.session.add(grade)
+    db.session.flush()
+    for name, value in (
+        ("thermal_conductivity", 40.0),
+        ("specific_heat", 500.0),
+        ("density", 7850.0),
+        ("emissivity", 0.85),
+    ):
+        db.session.add(
+            MaterialProperty(
+                steel_grade_id=grade.id,
+                property_name=name,
+                property_type="constant",
+                data=json.dumps({"value": value}),
+            )
+        )
+    db.session.commit()
+    return grade
+
+
+def make_batch(grade: SteelGrade, n_unique: int, copies: int) -> list[Simulation]:
+    sims = []
+    for i in range(n_unique):
+        for c in range(copies):
+            sim = Simulation(
+                name=f"bench {i}.{c}",
+                steel_grade_id=grade.id,
+                user_id=1,
+                geometry_type=GEOMETRY_CYLINDER,
+                process_type=PROCESS_QUENCH_WATER,
+                status=STATUS_READY,
+            )
+            sim.set_geometry({"radius": 0.02 + 0.005 * i, "length": 0.1})
+            sim.set_solver_config({"n_nodes": 21, "dt": 0.5, "max_time": 600})
+            ht = sim.create_default_ht_config()
+            ht["heating"]["enabled"] = False
+            ht["transfer"]["enabled"] = False
+            sim.set_ht_config(ht)
+            db.session.add(sim)
+            sims.append(sim)
+    db.session.commit()
+    return sims
+
+
+def main() -> int:
+    n_unique = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    app = create_app("testing")
+    # Measure deduplication alone, not reruns served by the result cache
+    app.config["RESULT_CACHE_ENABLED"] = False
+    with app.app_context():
+        db.create_all()
+        grade = seed_grade()
+
+        sims = make_batch(grade, n_unique, copies)
+        start = time.perf_counter()
+        for sim in sims:
+            run_heat_treatment(sim.id)
+        t_sync = time.perf_counter() - start
+
+        sims = make_batch(grade, n_unique, copies)
+        start = time.perf_counter()
+        batch = create_batch("bench", 1)
+        queued = submit_batch(batch, sims)
+        db.session.commit()
+        t_submit = time.perf_counter() - start
+
+        start = time.perf_counter()
+        runs = [s for s in sims if s.duplicate_of_id is None]
+        for sim in runs:
+            run_heat_treatment(sim.id)
+            settle_duplicates(sim.id)
+        t_queue = time.perf_counter() - start
+        done = sum(s.status == "completed" for s in sims)
+
+    print(f"Batch of {n_unique * copies} simulations ({n_unique} unique configurations)")
+    print(f"  before: request runs every member   {t_sync:8.2f} s")
+    print(f"  after:  request queues the batch    {t_submit * 1e3:8.1f} ms ({queued} queued)")
+    print(f"          queue work, {len(runs)} solves      {t_queue:8.2f} s ({done} completed)")
+    print(f"  solver work saved by deduplication  {1 - t_queue / t_sync:8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
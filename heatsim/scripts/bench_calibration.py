@@ -0,0 +1,103 @@
+"""Benchmark: CCT calibration objective, scalar loop vs vectorized population.
+
+Times one evaluation of the start-temperature objective the way
+calibrate_from_cct used to compute it (stepping every cooling curve
+through JMAKModel.fraction_transformed), one evaluation of
+CCTStartObjective, and one differential evolution generation (population
+of 60 candidates) evaluated column-wise in a single call. Then runs the
+full calibration, with and without early stopping.
+
+Run from project root:
+    python scripts/bench_calibration.py [n_points]
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.calibration_runner import CALIBRATION_PATIENCE
+from app.services.phase_transformation.jmak_model import JMAKModel
+from app.services.phase_transformation.parameter_calibration import (
+    CCT_OBJECTIVE_STEPS,
+    CCTStartObjective,
+    calibrate_from_cct,
+)
+
+# Differential evolution default popsize (15) times the 4 parameters
+POPULATION = 60
+
+
+def scalar_objective(params, cooling_rates, start_temps) -> float:
+    """Start temperature error stepping each cooling curve in Python."""
+    n, b_max, t_nose, sigma = params
+    if n <= 0 or b_max <= 0 or sigma <= 0:
+        return 1e10
+    model = JMAKModel(n=n, b_func=lambda T: b_max * math.exp(-0.5 * ((T - t_nose) / sigma) ** 2))
+    error = 0.0
+    for rate, start in zip(cooling_rates, start_temps, strict=True):
+        times = np.linspace(0, (900 - 25) / rate, CCT_OBJECTIVE_STEPS)
+        temperatures = 900 - rate * times
+        for j in range(1, CCT_OBJECTIVE_STEPS):
+            if model.fraction_transformed(times[j], temperatures[j]) >= 0.01:
+                error += (temperatures[j] - start) ** 2
+                break
+    return error
+
+
+def best_of(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    rates = np.logspace(-0.5, 2, n_points)
+    # Start temperatures falling from 680 to 450 deg C with cooling rate
+    starts = np.linspace(680, 450, n_points)
+    data = [
+        {"cooling_rate": float(r), "start_temperature": float(s)}
+        for r, s in zip(rates, starts, strict=True)
+    ]
+
+    rng = np.random.default_rng(42)
+    lower = np.array([0.5, 1e-6, 300, 20])[:, np.newaxis]
+    upper = np.array([4.0, 1e-1, 750, 150])[:, np.newaxis]
+    population = lower + (upper - lower) * rng.random((4, POPULATION))
+    objective = CCTStartObjective(rates, starts)
+
+    t_scalar = best_of(lambda: scalar_objective(population[:, 0], rates, starts), 5)
+    t_single = best_of(lambda: objective(population[:, 0]), 50)
+    t_loop_gen = best_of(
+        lambda: [scalar_objective(population[:, i], rates, starts) for i in range(POPULATION)], 1
+    )
+    t_gen = best_of(lambda: objective(population), 20)
+
+    t_full = best_of(lambda: calibrate_from_cct(data), 1)
+    t_patience = best_of(lambda: calibrate_from_cct(data, patience=CALIBRATION_PATIENCE), 1)
+
+    print(f"CCT start-temperature objective, {n_points} cooling rates")
+    print(f"  one vector   loop {t_scalar * 1e3:8.2f} ms   vectorized {t_single * 1e3:7.3f} ms")
+    print(
+        f"  generation   loop {t_loop_gen * 1e3:8.1f} ms   population {t_gen * 1e3:7.2f} ms   "
+        f"speedup {t_loop_gen / t_gen:6.0f}x"
+    )
+    print(
+        f"  calibrate_from_cct {t_full * 1e3:8.1f} ms   "
+        f"patience {CALIBRATION_PATIENCE} {t_patience * 1e3:8.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
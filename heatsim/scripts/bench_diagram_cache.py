@@ -0,0 +1,129 @@
+"""Benchmark: CCT diagram per cooling rate, as one field, and from the store.
+
+Stores a grade with TTT, three JMAK and martensite parameter rows in a
+scratch SQLite database, then times three ways of getting its CCT diagram:
+integrating Scheil additivity once per cooling rate (as the generator did
+before), integrating all rates together as one field, and reading the
+curves stored in ttt_curves.
+
+Run from project root:
+    python scripts/bench_diagram_cache.py [n_rates]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from flask import Flask
+
+from app.extensions import db
+from app.models import SteelGrade
+from app.models.material import DATA_SOURCE_STANDARD
+from app.models.ttt_parameters import JMAKParameters, MartensiteParameters, TTTParameters
+from app.services.phase_transformation import PhasePredictor
+from app.services.phase_transformation.cct_generator import generate_cct_from_ttt
+from app.services.phase_transformation.phase_models import get_phase_models
+from app.services.phase_transformation.scheil_additivity import calculate_cct_transformation
+
+# 4140-like kinetics: (phase, n, b_max, t_nose, sigma)
+JMAK_ROWS = [
+    ("ferrite", 1.2, 2e-3, 680, 40),
+    ("pearlite", 1.5, 1e-4, 580, 35),
+    ("bainite", 2.5, 1e-5, 420, 50),
+]
+
+
+def seed_grade() -> SteelGrade:
+    grade = SteelGrade(designation="BENCH 4140", data_source=DATA_SOURCE_STANDARD)
+    db.session.add(grade)
+    db.session.flush()
+    ttt = TTTParameters(steel_grade_id=grade.id, ae1=727, ae3=800, bs=550, ms=320, mf=105)
+    db.session.add(ttt)
+    db.session.flush()
+    for phase, n, b_max, t_nose, sigma in JMAK_ROWS:
+        jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=phase, n_value=n)
+        jmak.set_b_params({"b_max": b_max, "t_nose": t_nose, "sigma": sigma})
+        db.session.add(jmak)
+    db.session.add(MartensiteParameters(ttt_parameters_id=ttt.id, ms=320, mf=105, alpha_m=0.011))
+    db.session.commit()
+    return grade
+
+
+def per_rate(models, rates) -> int:
+    """Start points found integrating each cooling rate on its own."""
+    found = 0
+    for rate in rates:
+        total = (900.0 - 25.0) / rate
+        times = np.linspace(0, total, int(np.clip(total * 10, 500, 5000)))
+        result = calculate_cct_transformation(
+            times,
+            900.0 - rate * times,
+            models.jmak_models,
+            models.martensite_model,
+            models.critical_temps,
+        )
+        found += sum(1 for f in result.final_fractions.values() if f >= 0.005)
+    return found
+
+
+def best_of(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    n_rates = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rates = np.logspace(-1, 2.3, n_rates).tolist()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        app.config["SQLALCHEMY_BINDS"] = {"materials": f"sqlite:///{tmp}/bench.db"}
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            grade_id = seed_grade().id
+            models = get_phase_models(grade_id)
+
+            def field():
+                return generate_cct_from_ttt(
+                    models.jmak_models,
+                    models.martensite_model,
+                    models.critical_temps,
+                    cooling_rates=rates,
+                )
+
+            def stored():
+                # A fresh session per read, as for a new request
+                db.session.remove()
+                return PhasePredictor(db.session.get(SteelGrade, grade_id)).get_cct_curves()
+
+            t_loop = best_of(lambda: per_rate(models, rates), 3)
+            t_field = best_of(field, 3)
+            assert stored()  # first call generates and stores
+            t_stored = best_of(stored, 20)
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+
+    print(f"CCT diagram, 3 JMAK phases + martensite, {n_rates} cooling rates")
+    print(
+        f"  per rate {t_loop * 1e3:8.1f} ms   field {t_field * 1e3:8.1f} ms   "
+        f"stored {t_stored * 1e3:6.2f} ms"
+    )
+    print(f"  field speedup {t_loop / t_field:5.1f}x   stored speedup {t_loop / t_stored:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
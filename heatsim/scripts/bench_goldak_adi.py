@@ -0,0 +1,134 @@
+"""Benchmark: legacy per-line vs batched ADI time step of the Goldak solver.
+
+Reimplements the previous step (one Python-assembled tridiagonal system and
+one `solve_banded` call per row, then per column) and times it against
+`GoldakSolver._time_step_adi`, checking that both give the same field.
+Also reports the overhead of the temperature-dependent k(T), Cp(T) mode
+over the constant-property mode.
+
+Run from project root:
+    python scripts/bench_goldak_adi.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.goldak_solver import (
+    SOLIDUS_TEMP,
+    GoldakParams,
+    GoldakSolver,
+    GoldakSolverConfig,
+)
+from app.services.property_evaluator import CompiledProperty
+
+# Representative C-Mn steel curves, Cp with its ferrite/austenite peak
+K_CURVE = CompiledProperty([20, 200, 400, 600, 800, 1000, 1500], [52, 49, 43, 36, 27, 28, 32])
+CP_CURVE = CompiledProperty(
+    [20, 200, 400, 600, 700, 750, 800, 900, 1500], [450, 520, 590, 700, 850, 1400, 650, 610, 690]
+)
+
+
+def legacy_line(solver: GoldakSolver, T, q, d, dt_half, adiabatic_end):
+    """Previous per-line assembly + banded solve along one row or column."""
+    p = solver.params
+    theta = solver.config.theta
+    n = len(T)
+    Fo = np.full(n, p.alpha) * dt_half / d**2
+    k = np.full(n, p.k)
+    lower, main, upper, rhs = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+    for i in range(1, n - 1):
+        main[i] = 1.0 + 2.0 * theta * Fo[i]
+        lower[i] = upper[i] = -theta * Fo[i]
+        rhs[i] = (
+            T[i]
+            + (1.0 - theta) * Fo[i] * (T[i - 1] - 2 * T[i] + T[i + 1])
+            + dt_half * q[i] / (p.rho * p.Cp)
+        )
+
+    ends = [(0, 1, upper)] if adiabatic_end else [(0, 1, upper), (-1, -2, lower)]
+    for node, neighbour, offdiag in ends:
+        Bi = float(solver._linearized_htc(T[node])) * d / k[node]
+        main[node] = 1.0 + theta * (2.0 * Fo[node] + 2.0 * Fo[node] * Bi)
+        offdiag[node] = -2.0 * theta * Fo[node]
+        rhs[node] = (
+            T[node]
+            + (1.0 - theta)
+            * (2.0 * Fo[node] * (T[neighbour] - T[node]) + 2.0 * Fo[node] * Bi * (p.T0 - T[node]))
+            + 2.0 * theta * Fo[node] * Bi * p.T0
+            + dt_half * q[node] / (p.rho * p.Cp)
+        )
+    if adiabatic_end:
+        main[-1] = 1.0 + 2.0 * theta * Fo[-1]
+        lower[-1] = -2.0 * theta * Fo[-1]
+        rhs[-1] = (
+            T[-1]
+            + 2.0 * (1.0 - theta) * Fo[-1] * (T[-2] - T[-1])
+            + dt_half * q[-1] / (p.rho * p.Cp)
+        )
+
+    ab = np.zeros((3, n))
+    ab[0, 1:] = upper[:-1]
+    ab[1, :] = main
+    ab[2, :-1] = lower[1:]
+    return solve_banded((1, 1), ab, rhs)
+
+
+def legacy_step(solver: GoldakSolver, T, q):
+    """Previous implementation: loop over rows, then over columns."""
+    dt_half = solver.config.dt / 2.0
+    nz, ny = T.shape
+    T_half = np.copy(T)
+    for j in range(nz):
+        T_half[j, :] = legacy_line(solver, T[j, :], q[j, :], solver.dy, dt_half, False)
+    T_new = np.copy(T_half)
+    for i in range(ny):
+        T_new[:, i] = legacy_line(solver, T_half[:, i], q[:, i], solver.dz, dt_half, True)
+    return np.minimum(T_new, SOLIDUS_TEMP)
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 201
+    repeats = 20
+
+    params = GoldakParams(Q=5000.0, v=0.005, T0=20.0)
+    solver = GoldakSolver(params, GoldakSolverConfig(ny=n_nodes, nz=n_nodes, dt=0.05))
+    q = solver._goldak_source_2d(0.0)
+    # Start from a developed weld thermal field rather than a uniform one
+    T = np.full((solver.config.nz, solver.config.ny), params.T0)
+    for step in range(1, 41):
+        T = solver._time_step_adi(T, solver._goldak_source_2d(step * solver.config.dt))
+
+    max_diff = float(np.max(np.abs(solver._time_step_adi(T, q) - legacy_step(solver, T, q))))
+    t_legacy = timeit.timeit(lambda: legacy_step(solver, T, q), number=repeats)
+    t_batched = timeit.timeit(lambda: solver._time_step_adi(T, q), number=repeats)
+
+    solver_td = GoldakSolver(
+        params,
+        GoldakSolverConfig(ny=n_nodes, nz=n_nodes, dt=0.05, temperature_dependent=True),
+    )
+    solver_td.set_material(K_CURVE, CP_CURVE)
+    t_td = timeit.timeit(lambda: solver_td._time_step_adi(T, q), number=repeats)
+
+    print(f"Grid: {solver.config.ny} x {solver.config.nz}, {repeats} steps each")
+    print(
+        f"  legacy {t_legacy / repeats * 1e3:8.2f} ms/step   "
+        f"batched {t_batched / repeats * 1e3:7.2f} ms/step   "
+        f"speedup {t_legacy / t_batched:5.1f}x   max |dT| {max_diff:.1e} °C"
+    )
+    print(
+        f"  k(T), Cp(T) {t_td / repeats * 1e3:7.2f} ms/step   "
+        f"overhead vs constant {(t_td / t_batched - 1) * 100:+5.1f}%"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
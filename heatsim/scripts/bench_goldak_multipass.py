@@ -0,0 +1,155 @@
+"""Benchmark: multipass Goldak project with explicit vs implicit interpass cooling.
+
+Runs the same multipass weld end to end twice: once with the previous
+explicit interpass cooling (per-node Python loops, step limited by the
+explicit stability bound, reimplemented here) and once with the current
+implicit ADI cooling (`GoldakSolver.cool`). Reports total wall time, the
+interpass share, per-pass cooling times and the largest difference in the
+final field. Cooling times differ because the explicit scheme lost heat by
+convection only on the side faces, while `cool` uses the solver's own
+boundaries (convection and radiation).
+
+Run from project root:
+    python scripts/bench_goldak_multipass.py [n_passes] [preset]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.goldak_multipass import GoldakMultiPassSolver
+from app.services.goldak_solver import (
+    DEFAULT_CONDUCTIVITY,
+    DEFAULT_CONVECTION_HTC,
+    DEFAULT_DENSITY,
+    DEFAULT_EMISSIVITY,
+    DEFAULT_SPECIFIC_HEAT,
+    STEFAN_BOLTZMANN,
+)
+
+
+class _Strings(list):
+    def order_by(self, _):
+        return self
+
+    def all(self):
+        return list(self)
+
+
+class _Project:
+    process_type = "mig_mag"
+    steel_grade = None
+    preheat_temperature = 100.0
+    interpass_temperature = 250.0
+    default_heat_input = 1.5
+    default_travel_speed = 5.0
+
+    def __init__(self, n_passes: int):
+        self.strings = _Strings(_String(self, i + 1) for i in range(n_passes))
+
+
+class _String:
+    effective_heat_input = 1.5
+    effective_travel_speed = 5.0
+    effective_interpass_time = 600.0
+    simulation_duration = 60.0
+
+    def __init__(self, project, number: int):
+        self.project = project
+        self.string_number = number
+        self.display_name = f"String {number}"
+
+
+def legacy_cooling(field, y, z, target_temp, max_time):
+    """Previous explicit interpass cooling."""
+    nz, ny = field.shape
+    dy = y[1] - y[0]
+    dz = z[1] - z[0]
+    T = field.copy()
+    rho, Cp = DEFAULT_DENSITY, DEFAULT_SPECIFIC_HEAT
+    alpha = DEFAULT_CONDUCTIVITY / (rho * Cp)
+    dt_cool = min(0.5, 0.9 * 0.25 / (alpha * (1 / dy**2 + 1 / dz**2)))
+    T_amb = 20.0
+
+    t = 0.0
+    while t < max_time:
+        if np.max(T) <= target_temp:
+            break
+        T_new = T.copy()
+        for j in range(1, nz - 1):
+            for i in range(1, ny - 1):
+                T_new[j, i] = T[j, i] + alpha * dt_cool * (
+                    (T[j, i - 1] - 2 * T[j, i] + T[j, i + 1]) / dy**2
+                    + (T[j - 1, i] - 2 * T[j, i] + T[j + 1, i]) / dz**2
+                )
+        for i in range(ny):
+            h = DEFAULT_CONVECTION_HTC + DEFAULT_EMISSIVITY * STEFAN_BOLTZMANN * (
+                (T[0, i] + 273.15) ** 2 + (T_amb + 273.15) ** 2
+            ) * ((T[0, i] + 273.15) + (T_amb + 273.15))
+            T_new[0, i] = T[0, i] - dt_cool * 2 * h * (T[0, i] - T_amb) / (rho * Cp * dz)
+            T_new[0, i] += alpha * dt_cool * 2 * (T[1, i] - T[0, i]) / dz**2
+        T_new[-1, :] = T[-1, :] + alpha * dt_cool * 2 * (T[-2, :] - T[-1, :]) / dz**2
+        for j in range(nz):
+            for side, neighbour in ((0, 1), (ny - 1, ny - 2)):
+                T_new[j, side] -= (
+                    dt_cool * 2 * DEFAULT_CONVECTION_HTC * (T[j, side] - T_amb) / (rho * Cp * dy)
+                )
+                T_new[j, side] += alpha * dt_cool * 2 * (T[j, neighbour] - T[j, side]) / dy**2
+        T = np.maximum(T_new, T_amb)
+        t += dt_cool
+    return T, t
+
+
+class _Timed(GoldakMultiPassSolver):
+    """Multipass solver recording the time spent in interpass cooling."""
+
+    legacy = False
+    cooling_wall = 0.0
+
+    def _apply_interpass_cooling(self, field, solver, target_temp, max_time=600.0):
+        start = time.perf_counter()
+        if self.legacy:
+            out = legacy_cooling(field, solver.y, solver.z, target_temp, max_time)
+        else:
+            out = super()._apply_interpass_cooling(field, solver, target_temp, max_time)
+        self.cooling_wall += time.perf_counter() - start
+        return out
+
+
+def run(n_passes: int, preset: str, legacy: bool):
+    solver = _Timed.with_preset(_Project(n_passes), preset, compare=False)
+    solver.legacy = legacy
+    start = time.perf_counter()
+    result = solver.run()
+    return result, time.perf_counter() - start, solver.cooling_wall
+
+
+def main() -> int:
+    n_passes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    preset = sys.argv[2] if len(sys.argv) > 2 else "coarse"
+
+    before, t_before, cool_before = run(n_passes, preset, legacy=True)
+    after, t_after, cool_after = run(n_passes, preset, legacy=False)
+
+    print(f"Multipass Goldak, {n_passes} passes, '{preset}' grid")
+    print(f"  explicit cooling  total {t_before:8.2f} s   interpass {cool_before:8.2f} s")
+    print(f"  implicit ADI      total {t_after:8.2f} s   interpass {cool_after:8.3f} s")
+    print(f"  end-to-end speedup {t_before / t_after:6.1f}x")
+    for b, a in zip(before.pass_summary[:-1], after.pass_summary[:-1], strict=True):
+        print(
+            f"    pass {b['pass_number']:2d}  cooling time explicit "
+            f"{b['interpass_cooling_time']:7.1f} s   implicit {a['interpass_cooling_time']:7.1f} s"
+        )
+    diff = np.max(np.abs(before.final_temperature_field - after.final_temperature_field))
+    print(f"  max |d final field| {diff:.1f} K")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Benchmark: legacy vs fused per-step bookkeeping of GoldakSolver.solve.
+
+Replays a sequence of ADI steps and times the previous bookkeeping (field
+copy, np.maximum into a new peak map, two full-field np.where crossings,
+probe values appended to dict lists) against `_ThermalCycleTracker.update`.
+Then compares the t8/5 of both against a fine time step run: the legacy
+crossing times are quantized to the step, the tracker interpolates them.
+
+Run from project root:
+    python scripts/bench_goldak_tracking.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.goldak_solver import (
+    GoldakParams,
+    GoldakSolver,
+    GoldakSolverConfig,
+    _ThermalCycleTracker,
+)
+
+PROBES = {"center": (0, 0), "side": (0, 1)}
+
+
+class LegacyBookkeeping:
+    """Previous per-step updates: new arrays every step, step-quantized crossings."""
+
+    def __init__(self, T):
+        self.peak_map = T.copy()
+        self.t800_map = np.full(T.shape, -1.0)
+        self.t500_map = np.full(T.shape, -1.0)
+        self.probe_times = {name: [0.0] for name in PROBES}
+        self.probe_temps = {name: [float(T[idx])] for name, idx in PROBES.items()}
+
+    def update(self, T_old, T, t):
+        T_old = T_old.copy()
+        self.peak_map = np.maximum(self.peak_map, T)
+        cooling_800 = (T_old >= 800) & (T < 800)
+        self.t800_map = np.where(cooling_800 & (self.t800_map < 0), t, self.t800_map)
+        cooling_500 = (T_old >= 500) & (T < 500)
+        self.t500_map = np.where(cooling_500 & (self.t500_map < 0), t, self.t500_map)
+        for name, idx in PROBES.items():
+            self.probe_times[name].append(float(t))
+            self.probe_temps[name].append(float(T[idx]))
+
+    def t8_5_map(self):
+        t8_5 = np.zeros(self.t800_map.shape)
+        valid = (self.t800_map > 0) & (self.t500_map > 0) & (self.t500_map > self.t800_map)
+        t8_5[valid] = self.t500_map[valid] - self.t800_map[valid]
+        return t8_5
+
+
+def run_fields(solver: GoldakSolver, n_steps: int) -> list[np.ndarray]:
+    """Temperature fields of the first n_steps steps."""
+    T = np.full((solver.config.nz, solver.config.ny), solver.params.T0)
+    fields = [T]
+    for step in range(1, n_steps + 1):
+        T = solver._time_step_adi(T, solver._goldak_source_2d(step * solver.config.dt))
+        fields.append(T)
+    return fields
+
+
+def replay(book, fields, dt):
+    for step in range(1, len(fields)):
+        if isinstance(book, _ThermalCycleTracker):
+            book.update(fields[step - 1], fields[step], (step - 1) * dt, step * dt)
+            book.record_probes(fields[step], step * dt)
+        else:
+            book.update(fields[step - 1], fields[step], step * dt)
+    return book
+
+
+def t8_5_errors(stride: int, reference_dt: float = 0.005) -> tuple[float, float]:
+    """Mean |t8/5 error| of legacy and interpolated crossings vs the fine run.
+
+    Both bookkeepings see every `stride`-th field of one fine time step run,
+    so the difference is only how the crossing times are resolved.
+    """
+    config = GoldakSolverConfig(ny=41, nz=21, dt=reference_dt, total_time=60.0)
+    solver = GoldakSolver(GoldakParams(Q=5000.0, v=0.005), config)
+    fields = run_fields(solver, int(config.total_time / reference_dt))
+    reference = replay(_ThermalCycleTracker(fields[0], PROBES, len(fields)), fields, reference_dt)
+    coarse = fields[::stride]
+    dt = reference_dt * stride
+    legacy = replay(LegacyBookkeeping(coarse[0]), coarse, dt).t8_5_map()
+    interpolated = replay(_ThermalCycleTracker(coarse[0], PROBES, len(coarse)), coarse, dt)
+
+    exact = reference.t8_5_map()
+    valid = exact > 0
+    return (
+        float(np.mean(np.abs(legacy[valid] - exact[valid]))),
+        float(np.mean(np.abs(interpolated.t8_5_map()[valid] - exact[valid]))),
+    )
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 201
+    n_steps = 100
+    repeats = 5
+
+    config = GoldakSolverConfig(ny=n_nodes, nz=n_nodes, dt=0.05, total_time=120.0)
+    solver = GoldakSolver(GoldakParams(Q=5000.0, v=0.005), config)
+    # Steps around the torch passage, where nodes heat up and cool through 800/500 °C
+    fields = run_fields(solver, 500)[-n_steps - 1 :]
+
+    t_legacy = timeit.timeit(
+        lambda: replay(LegacyBookkeeping(fields[0]), fields, config.dt), number=repeats
+    )
+    t_fused = timeit.timeit(
+        lambda: replay(_ThermalCycleTracker(fields[0], PROBES, len(fields)), fields, config.dt),
+        number=repeats,
+    )
+    per_step = repeats * n_steps
+    print(f"Grid: {solver.config.ny} x {solver.config.nz}, {n_steps} steps x {repeats}")
+    print(
+        f"  bookkeeping  legacy {t_legacy / per_step * 1e3:6.3f} ms/step   "
+        f"fused {t_fused / per_step * 1e3:6.3f} ms/step   speedup {t_legacy / t_fused:4.1f}x"
+    )
+
+    print("t8/5 over the HAZ, mean |error| vs crossings resolved at dt = 0.005 s:")
+    for stride in (10, 20, 40):
+        legacy, interpolated = t8_5_errors(stride)
+        print(
+            f"  sampled every {stride * 0.005:4.2f} s   legacy {legacy:6.3f} s   "
+            f"interpolated {interpolated:6.3f} s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Benchmark: 4-point vs full-resolution hardness profile.
+
+Solves a water and an oil quench of a 100 mm bar on n radial nodes and times
+`predict_hardness_profile` at the 4 fixed positions against profile mode,
+which evaluates t8/5, phases and properties at every node in one pass. Also
+times the naive alternative of running the scalar 4-point logic per node,
+checks that profile mode reproduces the 4-point values, and prints the case
+depths derived from the profile.
+
+Run from project root:
+    python scripts/bench_hardness_profile.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import HeatSolver, PhaseTracker, SolverConfig, create_geometry
+from app.services.boundary_conditions import create_quench_bc
+from app.services.hardness_predictor import (
+    HardnessPredictor,
+    _calculate_t8_5,
+    predict_hardness_profile,
+)
+
+# AISI 4340
+COMPOSITION = {"C": 0.40, "Mn": 0.70, "Si": 0.25, "Cr": 0.80, "Ni": 1.80, "Mo": 0.25, "V": 0.0}
+
+
+class Composition(SimpleNamespace):
+    """Stand-in for the SteelComposition model."""
+
+    def to_dict(self):
+        return dict(COMPOSITION)
+
+
+def per_node(composition, temperatures, times, tracker):
+    """Naive full profile: the scalar 4-point logic repeated at every node."""
+    predictor = HardnessPredictor(composition)
+    hv = []
+    for j in range(temperatures.shape[1]):
+        t8_5 = _calculate_t8_5(times, temperatures[:, j])
+        phases = tracker.predict_phases(times, temperatures[:, j], t8_5).to_dict()
+        hv.append(predictor.predict_hardness(phases, t8_5))
+        predictor.hv_to_hrc(hv[-1])
+    return hv
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 101
+    repeats = 50
+
+    composition = Composition(carbon_equivalent_iiw=0.75, ideal_diameter_di=3.5)
+    tracker = PhaseTracker()
+    geometry = create_geometry("cylinder", {"radius": 0.05, "length": 0.5})
+
+    for quenchant in ("water", "oil"):
+        config = SolverConfig(n_nodes=n_nodes, dt=0.5, max_time=1800.0)
+        result = HeatSolver(geometry, create_quench_bc(quenchant, 40.0), config=config).solve(850.0)
+        args = (composition, result.temperature, result.time, tracker)
+
+        t_four = timeit.timeit(lambda: predict_hardness_profile(*args), number=repeats)
+        t_profile = timeit.timeit(
+            lambda: predict_hardness_profile(*args, positions=result.positions), number=repeats
+        )
+        t_naive = timeit.timeit(lambda: per_node(*args), number=repeats)
+
+        four = predict_hardness_profile(*args).to_dict()
+        full = predict_hardness_profile(*args, positions=result.positions)
+        profile = full.profile
+        full = full.to_dict()
+        full.pop("profile")
+
+        print(f"{quenchant} quench: {result.temperature.shape[1]} nodes x {len(result.time)} times")
+        print(
+            f"  4-point {t_four / repeats * 1e3:6.2f} ms   "
+            f"profile {t_profile / repeats * 1e3:6.2f} ms   "
+            f"per-node scalar {t_naive / repeats * 1e3:7.2f} ms   "
+            f"4-point values identical: {four == full}"
+        )
+        print(
+            f"  surface {profile.hardness_hv[-1]:.0f} HV   "
+            f"case depth (550 HV) {profile.case_depth_mm:.2f} mm   "
+            f"effective hardening depth {profile.effective_hardening_depth_mm:.2f} mm"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
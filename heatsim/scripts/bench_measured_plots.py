@@ -0,0 +1,162 @@
+"""Benchmark: measured-data plots and comparison metrics, raw vs preprocessed.
+
+Stores a synthetic thermocouple log (1 Hz, several channels, noisy) and a
+full-cycle result, then times what one request does. "Before" is the
+previous path: decode the JSON channel columns, differentiate and smooth
+the raw samples, and detect the time offset by cross-correlation on every
+comparison. "After" reads the series preprocessed at upload and the stored
+offset. Rows are expired before each request so both paths load from the
+database.
+
+Run from project root:
+    python scripts/bench_measured_plots.py [hours] [channels]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ.setdefault("FLASK_CONFIG", "testing")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from bench_batch_submit import make_batch, seed_grade
+
+from app import create_app
+from app.extensions import db
+from app.models import MeasuredData, SimulationResult
+from app.services import measured_series, plot_data, visualization
+from app.services.comparison_service import ComparisonService
+from app.services.snapshot_service import SnapshotService
+
+REPEATS = 3
+
+
+def seed(hours: float, n_channels: int):
+    sim = make_batch(seed_grade(), 1, 1)[0]
+    snapshot = SnapshotService.create_snapshot(sim)
+    sim_times = np.arange(0.0, hours * 3600.0, 5.0)
+    cycle = SimulationResult(
+        simulation_id=sim.id,
+        snapshot_id=snapshot.id,
+        result_type="full_cycle",
+        location="center",
+        phase="full",
+    )
+    cycle.set_time_data(sim_times.tolist())
+    cycle.set_value_data((20.0 + 830.0 * np.exp(-sim_times / 3000.0)).tolist())
+    db.session.add(cycle)
+
+    rng = np.random.default_rng(0)
+    times = np.arange(0.0, hours * 3600.0)
+    md = MeasuredData(simulation_id=sim.id, name="bench log", process_step="full")
+    md.times = times
+    md.channels = {
+        f"TC{ch}": 20.0
+        + (830.0 + ch) * np.exp(-(times - 30.0) / 3000.0)
+        + rng.normal(0.0, 0.5, times.size)
+        for ch in range(1, n_channels + 1)
+    }
+    md.channel_times = {f"TC{ch}": times for ch in range(1, n_channels + 1)}
+    md.channel_labels_dict = {f"TC{ch}": f"TC{ch}" for ch in range(1, n_channels + 1)}
+    db.session.add(md)
+    db.session.commit()
+    return sim
+
+
+def raw_channels(sim) -> list[dict]:
+    """The previous route code: channel dicts from the JSON columns."""
+    return [
+        {
+            "name": m.get_channel_label(ch),
+            "times": m.get_channel_times(ch),
+            "temps": m.channels[ch],
+        }
+        for m in sim.measured_data.all()
+        for ch in m.available_channels
+    ]
+
+
+def raw_compare(sim):
+    """The previous compare_simulation: raw first channel, offset detected."""
+    cycle = sim.results.filter_by(result_type="full_cycle").first()
+    md = sim.measured_data.first()
+    ch = list(md.channels.keys())[0]
+    return ComparisonService.compare(
+        cycle.time_series,
+        cycle.value_series,
+        np.array(md.get_channel_times(ch)),
+        np.array(md.channels[ch]),
+    )
+
+
+def timed(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        db.session.expire_all()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 6.0
+    n_channels = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        sim = seed(hours, n_channels)
+
+        cases = [
+            (
+                "dT/dt PNG",
+                lambda: visualization.create_measured_dtdt_plot(raw_channels(sim)),
+                lambda: visualization.create_measured_dtdt_plot(
+                    measured_series.plot_channels(sim.measured_data.all())
+                ),
+            ),
+            (
+                "dT/dt vs T PNG",
+                lambda: visualization.create_measured_dtdt_vs_temp_plot(raw_channels(sim)),
+                lambda: visualization.create_measured_dtdt_vs_temp_plot(
+                    measured_series.plot_channels(sim.measured_data.all())
+                ),
+            ),
+            (
+                "dT/dt chart JSON",
+                lambda: [
+                    plot_data._line_trace(mid, dtdt, name)
+                    for mid, dtdt, _, name in plot_data._measured_dtdt_series(raw_channels(sim))
+                ],
+                lambda: plot_data.measured_dtdt(sim, "full"),
+            ),
+            (
+                "comparison metrics",
+                lambda: raw_compare(sim),
+                lambda: ComparisonService.compare_simulation(sim),
+            ),
+        ]
+
+        # Preprocess (as at upload) and detect the offset once
+        start = time.perf_counter()
+        measured_series.channel_series(sim.measured_data.first())
+        t_pre = time.perf_counter() - start
+        ComparisonService.compare_simulation(sim)
+
+        rows = [(name, timed(before), timed(after)) for name, before, after in cases]
+
+    print(f"{hours:g} h at 1 Hz, {n_channels} channels ({int(hours * 3600) * n_channels} points)")
+    print(f"  preprocessing at upload (once)  {t_pre:8.3f} s")
+    for name, before, after in rows:
+        print(f"  {name:20s} before {before:7.3f} s  after {after:7.3f} s  {before / after:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Benchmark: building vs reusing the compiled phase models of a steel grade.
+
+Stores a grade with TTT, three JMAK and martensite parameter rows in a
+scratch SQLite database, then times loading a PhasePredictor with an empty
+model cache (three queries and closure construction, as every predictor
+did before) against loading it from the cache (one version lookup).
+
+Run from project root:
+    python scripts/bench_phase_models.py [repeats]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app.extensions import db
+from app.models import SteelGrade
+from app.models.material import DATA_SOURCE_STANDARD
+from app.models.ttt_parameters import JMAKParameters, MartensiteParameters, TTTParameters
+from app.services.phase_transformation import PhasePredictor
+from app.services.phase_transformation.phase_models import clear_phase_model_cache
+
+# 4140-like kinetics: (phase, n, b_max, t_nose, sigma)
+JMAK_ROWS = [
+    ("ferrite", 1.2, 2e-3, 680, 40),
+    ("pearlite", 1.5, 1e-4, 580, 35),
+    ("bainite", 2.5, 1e-5, 420, 50),
+]
+
+
+def seed_grade() -> SteelGrade:
+    grade = SteelGrade(designation="BENCH 4140", data_source=DATA_SOURCE_STANDARD)
+    db.session.add(grade)
+    db.session.flush()
+    ttt = TTTParameters(steel_grade_id=grade.id, ae1=727, ae3=800, bs=550, ms=320, mf=105)
+    db.session.add(ttt)
+    db.session.flush()
+    for phase, n, b_max, t_nose, sigma in JMAK_ROWS:
+        jmak = JMAKParameters(ttt_parameters_id=ttt.id, phase=phase, n_value=n)
+        jmak.set_b_params({"b_max": b_max, "t_nose": t_nose, "sigma": sigma})
+        db.session.add(jmak)
+    db.session.add(MartensiteParameters(ttt_parameters_id=ttt.id, ms=320, mf=105, alpha_m=0.011))
+    db.session.commit()
+    return grade
+
+
+def main() -> int:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        app.config["SQLALCHEMY_BINDS"] = {"materials": f"sqlite:///{tmp}/bench.db"}
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            grade_id = seed_grade().id
+
+            def load():
+                # A fresh session per load, as for a new request or job
+                db.session.remove()
+                predictor = PhasePredictor(db.session.get(SteelGrade, grade_id))
+                return predictor.is_available
+
+            def load_uncached():
+                clear_phase_model_cache()
+                return load()
+
+            assert load_uncached() and load()
+            t_build = timeit.timeit(load_uncached, number=repeats) / repeats
+            t_cached = timeit.timeit(load, number=repeats) / repeats
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+
+    print(f"PhasePredictor load, 3 JMAK phases + martensite, {repeats} repeats")
+    print(
+        f"  build {t_build * 1e3:6.3f} ms   cached {t_cached * 1e3:6.3f} ms   "
+        f"speedup {t_build / t_cached:4.1f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
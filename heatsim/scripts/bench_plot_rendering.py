@@ -0,0 +1,143 @@
+"""Benchmark: eager PNG rendering vs deferred plot specs in a simulation job.
+
+Solves a heat / transfer / quench cycle of a 100 mm bar with the multi-phase
+solver, then produces the plots of the builtin runner twice: once the
+previous way (every matplotlib PNG drawn inside the job), once the deferred
+way (series stored and a plot spec plus content key recorded per row, as
+`_run_builtin` now does). Also reports what a first view costs when it
+renders one deferred plot.
+
+Run from project root:
+    python scripts/bench_plot_rendering.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import Simulation, SimulationResult
+from app.services import MultiPhaseHeatSolver, SolverConfig, create_geometry, visualization
+from app.services.plot_renderer import RENDERERS, defer_plot
+from app.services.simulation_runner import _four_point_series, _phase_spans
+
+MASS = 30.8  # kg, 100 mm x 500 mm bar
+CP = 600.0
+
+
+def eager(result, title="Bench"):
+    """Previous job: draw every PNG."""
+    images = [
+        visualization.create_heat_treatment_cycle_plot(
+            result.time, result.temperature, phase_results=result.phase_results, title=title
+        )
+    ]
+    for pr in result.phase_results:
+        if pr.time.size < 2:
+            continue
+        images.append(
+            visualization.create_heat_treatment_cycle_plot(pr.time, pr.temperature, title=title)
+        )
+    n = len(result.time)
+    images.append(
+        visualization.create_temperature_profile_plot(
+            result.positions, result.temperature, result.time, [0, n // 2, n - 1], title=title
+        )
+    )
+    images.append(
+        visualization.create_cooling_rate_plot(
+            result.time, result.center_temp, result.surface_temp, title=title
+        )
+    )
+    for pr in result.phase_results:
+        if pr.phase_name not in ("heating", "quenching") or pr.time.size < 3:
+            continue
+        images.append(visualization.create_dTdt_vs_time_plot(pr.time, pr.temperature, title))
+        images.append(visualization.create_dTdt_vs_temperature_plot(pr.time, pr.temperature, title))
+        if pr.phase_name == "heating":
+            cp = np.full(pr.time.size, CP)
+            images.append(
+                visualization.create_absorbed_power_plot(pr.time, pr.temperature, MASS, cp, title)
+            )
+    return images
+
+
+def deferred(result, title="Bench"):
+    """Current job: store series and record plot specs (no rendering)."""
+    cycle = SimulationResult(result_type="full_cycle", phase="full")
+    cycle.set_series(result.time, result.center_temp, _four_point_series(result.temperature))
+    defer_plot(cycle, "cycle", title=title, phase_spans=_phase_spans(result.phase_results))
+    rows = [cycle]
+    phase_rows = {}
+    for pr in result.phase_results:
+        if pr.time.size < 2:
+            continue
+        row = SimulationResult(result_type="cooling_curve", phase=pr.phase_name)
+        row.set_series(pr.absolute_time, pr.center_temp, _four_point_series(pr.temperature))
+        defer_plot(row, "cycle", title=title, relative_time=True)
+        phase_rows[pr.phase_name] = row
+        rows.append(row)
+    n = len(result.time)
+    profile = SimulationResult(result_type="temperature_profile", phase="full")
+    profile.set_series(result.time[[0, n // 2, n - 1]], result.temperature[[0, n // 2, n - 1]])
+    defer_plot(profile, "temperature_profile", positions=result.positions, title=title)
+    rate = SimulationResult(result_type="cooling_rate", phase="full")
+    defer_plot(rate, "cooling_rate", source=cycle, title=title)
+    rows += [profile, rate]
+    for pr in result.phase_results:
+        if pr.phase_name not in ("heating", "quenching") or pr.time.size < 3:
+            continue
+        source = phase_rows[pr.phase_name]
+        for kind in ("dtdt_time", "dtdt_temp"):
+            row = SimulationResult(result_type=kind, phase=pr.phase_name)
+            defer_plot(row, kind, source=source, title=title, phase_name=pr.phase_name)
+            rows.append(row)
+        if pr.phase_name == "heating":
+            power = SimulationResult(result_type="absorbed_power", phase=pr.phase_name)
+            power.set_series(pr.time, np.full(pr.time.size, CP))
+            defer_plot(power, "absorbed_power", source=source, mass=MASS, title=title)
+            rows.append(power)
+    return rows
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 51
+
+    geometry = create_geometry("cylinder", {"radius": 0.05, "length": 0.5})
+    solver = MultiPhaseHeatSolver(geometry, config=SolverConfig(n_nodes=n_nodes, dt=0.5))
+    solver.set_material(None, None, 7850.0, 0.85)
+    solver.configure_from_ht_config(Simulation().create_default_ht_config())
+    result = solver.solve(initial_temperature=25.0)
+
+    start = time.perf_counter()
+    images = eager(result)
+    t_eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows = deferred(result)
+    t_deferred = time.perf_counter() - start
+
+    # First view of the full-cycle plot: render it from the stored row
+    cycle = rows[0]
+    start = time.perf_counter()
+    RENDERERS["cycle"](cycle, None, cycle.plot_spec_dict["params"])
+    t_view = time.perf_counter() - start
+
+    print(f"Cycle: {len(result.time)} times x {n_nodes} nodes, {len(images)} plots")
+    print(
+        f"  job plotting  eager {t_eager * 1e3:8.1f} ms   deferred {t_deferred * 1e3:6.1f} ms   "
+        f"saved {(t_eager - t_deferred) * 1e3:8.1f} ms per job"
+    )
+    print(f"  first view of the full-cycle plot {t_view * 1e3:6.1f} ms, later views cached")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Benchmark: per-node scalar vs compiled (vectorized) property evaluation.
+
+Times the property lookups done in one nonlinear iteration of
+`HeatSolver._time_step` — k(T) and Cp(T) at every node — using the legacy
+per-node `PropertyEvaluator.evaluate()` path and the compiled evaluator,
+then times a full `_time_step` for context.
+
+Run from project root:
+    python scripts/bench_property_eval.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import HeatSolver, SolverConfig, create_geometry
+from app.services.boundary_conditions import create_heating_bc
+from app.services.property_evaluator import PropertyEvaluator, compile_property
+
+
+def _property(property_type: str, data: dict) -> SimpleNamespace:
+    """Duck-typed stand-in for a MaterialProperty row (no DB needed)."""
+    return SimpleNamespace(property_type=property_type, data_dict=data)
+
+
+K_CURVE = _property(
+    "curve",
+    {"temperature": [20, 200, 400, 600, 800, 1000, 1200], "value": [48, 46, 42, 36, 27, 28, 30]},
+)
+CP_EQUATION = _property(
+    "equation",
+    {"equation": "450 + 0.28*T + 1e-4*T*T", "variables": {"T": "temperature"}},
+)
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 101
+    T = np.linspace(850.0, 300.0, n_nodes)
+    repeats = 20
+
+    k_eval = PropertyEvaluator(K_CURVE)
+    cp_eval = PropertyEvaluator(CP_EQUATION)
+
+    def scalar_lookup():
+        k = np.array([k_eval.evaluate(temperature=Ti) for Ti in T])
+        cp = np.array([cp_eval.evaluate(temperature=Ti) for Ti in T])
+        return k, cp
+
+    k_func = compile_property(K_CURVE, 40.0)
+    cp_func = compile_property(CP_EQUATION, 500.0)
+
+    def compiled_lookup():
+        return k_func(T), cp_func(T)
+
+    k_ref, cp_ref = scalar_lookup()
+    k_new, cp_new = compiled_lookup()
+    max_err_k = float(np.max(np.abs(k_new - k_ref)))
+    max_err_cp = float(np.max(np.abs(cp_new - cp_ref)))
+
+    t_scalar = timeit.timeit(scalar_lookup, number=repeats) / repeats
+    t_compiled = timeit.timeit(compiled_lookup, number=repeats) / repeats
+
+    geometry = create_geometry("cylinder", {"radius": 0.6, "length": 2.0})
+    solver = HeatSolver(
+        geometry, create_heating_bc(target_temperature=850.0), config=SolverConfig(n_nodes=n_nodes)
+    )
+    solver.set_material(K_CURVE, CP_EQUATION, density=7850.0)
+    r = geometry.create_mesh(n_nodes)
+    dr = r[1] - r[0]
+    t_step = timeit.timeit(lambda: solver._time_step(T, r, dr, 1.0), number=repeats) / repeats
+
+    print(f"Nodes: {n_nodes}")
+    print(f"  scalar property lookup   : {t_scalar * 1e3:8.3f} ms / iteration")
+    print(f"  compiled property lookup : {t_compiled * 1e3:8.3f} ms / iteration")
+    print(f"  speedup                  : {t_scalar / t_compiled:8.1f}x")
+    print(f"  max |dk| = {max_err_k:.2e}  max |dcp| = {max_err_cp:.2e}")
+    print(f"  full _time_step (compiled): {t_step * 1e3:8.3f} ms / step")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
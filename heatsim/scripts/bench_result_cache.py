@@ -0,0 +1,64 @@
+"""Benchmark: rerunning simulations with and without the result cache.
+
+Solves a set of simulations with distinct inputs (cache misses), then
+reruns each of them: once with the cache disabled (every rerun solves
+again, the old behaviour) and once with it enabled (reruns copy the
+cached results).
+
+Run from project root:
+    python scripts/bench_result_cache.py [n_sims]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ.setdefault("FLASK_CONFIG", "testing")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_batch_submit import make_batch, seed_grade
+
+from app import create_app
+from app.extensions import db
+from app.services.result_cache import cache_stats
+from app.services.simulation_runner import run_heat_treatment
+
+
+def run_all(sims) -> float:
+    start = time.perf_counter()
+    for sim in sims:
+        run_heat_treatment(sim.id)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    n_sims = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        sims = make_batch(seed_grade(), n_sims, 1)
+
+        t_first = run_all(sims)
+        app.config["RESULT_CACHE_ENABLED"] = False
+        t_uncached = run_all(sims)
+        app.config["RESULT_CACHE_ENABLED"] = True
+        t_cached = run_all(sims)
+        stats = cache_stats()
+        done = sum(s.status == "completed" for s in sims)
+
+    print(f"{n_sims} simulations, {done} completed")
+    print(f"  first runs (misses)           {t_first:8.2f} s")
+    print(f"  before: reruns solve again    {t_uncached:8.2f} s")
+    print(f"  after:  reruns hit the cache  {t_cached:8.2f} s")
+    print(f"  speedup                       {t_uncached / t_cached:8.1f}x")
+    print(f"  hits {stats['hits']}, misses {stats['misses']}, entries {stats['entries']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
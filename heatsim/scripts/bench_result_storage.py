@@ -0,0 +1,123 @@
+"""Benchmark: JSON text vs compressed binary storage of result time series.
+
+Solves a long slow cool of a 100 mm bar, then stores its full-cycle result
+(center series plus 4 radial positions) twice: once the previous way as
+JSON text in time_data / value_data / result_data, once as a series_data
+npz blob, each in its own SQLite file. Reports write time, stored bytes,
+database file size and the latency of the full-cycle plot-data builder
+(the /plot-data/full_cycle endpoint) reading the row back from the database.
+
+Run from project root:
+    python scripts/bench_result_storage.py [n_times]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app.extensions import db
+from app.models import Simulation, SimulationResult, SteelGrade
+from app.models.material import DATA_SOURCE_STANDARD
+from app.models.simulation import STATUS_COMPLETED
+from app.services import HeatSolver, SolverConfig, create_geometry, plot_data
+from app.services.boundary_conditions import create_quench_bc
+from app.services.simulation_runner import _four_point_series
+
+
+def legacy_write(row, result, positions):
+    """Previous storage: every series as JSON text."""
+    row.set_time_data(result.time.tolist())
+    row.set_value_data(result.center_temp.tolist())
+    data = {"positions": list(positions)}
+    data.update({name: series.tolist() for name, series in positions.items()})
+    row.set_data(data)
+
+
+def binary_write(row, result, positions):
+    row.set_series(result.time, result.center_temp, positions)
+    row.set_data({"positions": list(positions)})
+
+
+def stored_bytes(row) -> int:
+    return sum(
+        len(value or b"")
+        for value in (row.time_data, row.value_data, row.result_data, row.series_data)
+    )
+
+
+def main() -> int:
+    n_times = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeats = 10
+
+    geometry = create_geometry("cylinder", {"radius": 0.05, "length": 0.5})
+    config = SolverConfig(n_nodes=51, dt=0.5, max_time=0.5 * (n_times - 1), output_interval=1)
+    result = HeatSolver(geometry, create_quench_bc("air", 25.0), config=config).solve(850.0)
+    positions = _four_point_series(result.temperature)
+
+    print(f"Full-cycle result: {len(result.time)} times x 5 series")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, write in (("json", legacy_write), ("binary", binary_write)):
+            path = os.path.join(tmp, f"{label}.db")
+            # Bare app on a scratch database, not the instance databases
+            app = Flask(__name__)
+            app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+            app.config["SQLALCHEMY_BINDS"] = {"materials": f"sqlite:///{path}"}
+            db.init_app(app)
+            with app.app_context():
+                db.create_all()
+                grade = SteelGrade(designation="BENCH", data_source=DATA_SOURCE_STANDARD)
+                db.session.add(grade)
+                db.session.commit()
+                sim = Simulation(
+                    name=f"Bench {label}",
+                    steel_grade_id=grade.id,
+                    user_id=1,
+                    geometry_type="cylinder",
+                    process_type="quench_water",
+                    status=STATUS_COMPLETED,
+                )
+                db.session.add(sim)
+                db.session.commit()
+                base_size = os.path.getsize(path)
+
+                start = time.perf_counter()
+                row = SimulationResult(
+                    simulation_id=sim.id, result_type="full_cycle", phase="full", location="center"
+                )
+                write(row, result, positions)
+                db.session.add(row)
+                db.session.commit()
+                t_write = time.perf_counter() - start
+                size = stored_bytes(row)
+                file_growth = os.path.getsize(path) - base_size
+
+                def plot(sim_id=sim.id):
+                    db.session.expire_all()
+                    return plot_data.full_cycle(db.session.get(Simulation, sim_id))
+
+                payload = json.dumps(plot())
+                t_plot = timeit.timeit(plot, number=repeats) / repeats
+                db.session.remove()
+                for engine in db.engines.values():
+                    engine.dispose()
+            print(
+                f"  {label:6s}  write {t_write * 1e3:7.1f} ms   stored {size / 1024:8.1f} KiB   "
+                f"db file +{file_growth / 1024:8.1f} KiB   "
+                f"full_cycle plot data {t_plot * 1e3:6.1f} ms ({len(payload) / 1024:.0f} KiB JSON)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Benchmark: point-by-point vs vectorized Rosenthal HAZ evaluation.
+
+Evaluates peak temperature and t8/5 over a transverse (y, z) section
+twice: once calling the scalar `peak_temperature_at_distance` and
+`t8_5_at_point` per grid point, once with single `peak_temperatures` /
+`t8_5` calls over the whole grid. Then times the four HAZ zone
+boundaries and a batch of heat inputs. Reports timings and the largest
+differences.
+
+Run from project root:
+    python scripts/bench_rosenthal.py [ny] [nz]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.rosenthal_solver import RosenthalParams, RosenthalSolver
+
+ZONE_TEMPS = [1500.0, 1100.0, 900.0, 727.0]
+
+
+def main() -> int:
+    ny = int(sys.argv[1]) if len(sys.argv) > 1 else 41
+    nz = int(sys.argv[2]) if len(sys.argv) > 2 else 21
+    solver = RosenthalSolver(RosenthalParams())
+    y = np.linspace(0.0, 0.02, ny)
+    z = np.linspace(0.0, 0.01, nz)
+
+    start = time.perf_counter()
+    peak_loop = np.array(
+        [[solver.peak_temperature_at_distance(np.array([yj]), zi)[0] for yj in y] for zi in z]
+    )
+    t85_loop = np.array(
+        [[solver.t8_5_at_point(yj, zi) or np.nan for yj in y] for zi in z], dtype=float
+    )
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    peak_grid = solver.peak_temperatures(y[np.newaxis, :], z[:, np.newaxis])
+    t85_grid = solver.t8_5(y[np.newaxis, :], z[:, np.newaxis])
+    t_grid = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_bounds = [float(solver.haz_boundary_distances(temp)) for temp in ZONE_TEMPS]
+    t_bounds_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    bounds = solver.haz_boundary_distances(ZONE_TEMPS)
+    t_bounds = time.perf_counter() - start
+
+    heat_inputs = [RosenthalParams(Q=q) for q in np.linspace(1500.0, 6000.0, 10)]
+    batch = RosenthalSolver(RosenthalParams.stack(heat_inputs, ndim=2))
+    start = time.perf_counter()
+    batch.peak_temperatures(y[np.newaxis, :], z[:, np.newaxis])
+    t_batch = time.perf_counter() - start
+
+    print(f"Rosenthal HAZ section {ny} x {nz} points")
+    print(
+        f"  peak + t8/5  loop {t_loop * 1e3:9.1f} ms   grid {t_grid * 1e3:7.1f} ms   "
+        f"speedup {t_loop / t_grid:5.0f}x"
+    )
+    print(
+        f"    max |d peak| {np.max(np.abs(peak_grid - peak_loop)):.2e} K   "
+        f"max |d t8/5| {np.nanmax(np.abs(t85_grid - t85_loop)):.2e} s"
+    )
+    print(
+        f"  zone boundaries  one by one {t_bounds_loop * 1e3:6.1f} ms   "
+        f"together {t_bounds * 1e3:6.1f} ms   "
+        f"max |d| {np.max(np.abs(bounds - loop_bounds)) * 1e6:.2f} um"
+    )
+    print(f"  10 heat inputs, peak map {t_batch * 1e3:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Benchmark: scalar vs field Scheil additivity over a quenched cross-section.
+
+Solves an oil quench of a 100 mm bar on n radial nodes, then computes the
+phase fractions at every node twice: once by calling the scalar
+`calculate_cct_transformation` per node, once with a single
+`calculate_cct_transformation_field` call. Reports both timings and the
+largest difference in final phase fraction.
+
+Run from project root:
+    python scripts/bench_scheil_field.py [n_nodes]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import HeatSolver, SolverConfig, create_geometry
+from app.services.boundary_conditions import create_quench_bc
+from app.services.phase_transformation.jmak_model import JMAKModel, gaussian_b_function
+from app.services.phase_transformation.martensite_model import KoistinenMarburgerModel
+from app.services.phase_transformation.scheil_additivity import (
+    calculate_cct_transformation,
+    calculate_cct_transformation_field,
+)
+
+# 4140-like kinetics
+JMAK_MODELS = {
+    "ferrite": JMAKModel(n=1.2, b_func=gaussian_b_function(b_max=2e-3, t_nose=680, sigma=40)),
+    "pearlite": JMAKModel(n=1.5, b_func=gaussian_b_function(b_max=1e-4, t_nose=580, sigma=35)),
+    "bainite": JMAKModel(n=2.5, b_func=gaussian_b_function(b_max=1e-5, t_nose=420, sigma=50)),
+}
+MARTENSITE = KoistinenMarburgerModel(ms=320, mf=105, alpha=0.011)
+CRITICAL_TEMPS = {"Ae1": 727, "Ae3": 800, "Bs": 550, "Ms": 320}
+
+
+def main() -> int:
+    n_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 101
+
+    geometry = create_geometry("cylinder", {"radius": 0.05, "length": 0.5})
+    config = SolverConfig(n_nodes=n_nodes, dt=0.5, max_time=1800.0)
+    solver = HeatSolver(geometry, create_quench_bc("oil", 40.0), config=config)
+    result = solver.solve(850.0)
+    times, temperatures = result.time, result.temperature
+    n_pos = temperatures.shape[1]
+
+    start = time.perf_counter()
+    scalar = [
+        calculate_cct_transformation(
+            times, temperatures[:, j], JMAK_MODELS, MARTENSITE, CRITICAL_TEMPS
+        ).final_fractions
+        for j in range(n_pos)
+    ]
+    t_scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    field = calculate_cct_transformation_field(
+        times, temperatures, JMAK_MODELS, MARTENSITE, CRITICAL_TEMPS
+    )
+    t_field = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculate_cct_transformation(times, temperatures[:, 0], JMAK_MODELS, MARTENSITE, CRITICAL_TEMPS)
+    t_one = time.perf_counter() - start
+
+    max_diff = max(
+        abs(scalar[j][phase] - field.final_fractions[phase][j])
+        for j in range(n_pos)
+        for phase in field.final_fractions
+    )
+    print(f"Quench: {n_pos} nodes x {len(times)} time steps")
+    print(
+        f"  scalar {t_scalar * 1e3:8.1f} ms ({t_one * 1e3:.1f} ms for one node)   "
+        f"field {t_field * 1e3:7.1f} ms   speedup {t_scalar / t_field:5.1f}x   "
+        f"max |dX| {max_diff:.1e}"
+    )
+    print(
+        "  center / surface martensite: "
+        f"{field.final_fractions['martensite'][0]:.3f} / "
+        f"{field.final_fractions['martensite'][-1]:.3f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
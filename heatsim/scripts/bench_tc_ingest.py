@@ -0,0 +1,116 @@
+"""Benchmark: thermocouple CSV ingestion, whole-file vs chunked streaming.
+
+Writes a synthetic logger export (1 Hz, several channels) and parses it
+twice, each in a fresh process so peak memory is comparable. "Before" is
+the previous parser: the upload decoded into one string, csv.DictReader
+and datetime.strptime per row, lists of (datetime, value) tuples per
+channel. "After" is parse_tc_csv reading the file in chunks.
+
+Run from project root:
+    python scripts/bench_tc_ingest.py [hours] [channels]
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEADER = (
+    "date;time;network ID;device type;device ID;sensor;data channel;"
+    "data flags;data sequence number;value;\n"
+)
+
+
+def write_file(path: str, hours: float, n_channels: int) -> int:
+    start = datetime(2026, 3, 2, 6, 0, 0)
+    n_rows = 0
+    with open(path, "w") as f:
+        f.write(HEADER)
+        for s in range(int(hours * 3600)):
+            stamp = start + timedelta(seconds=s)
+            day, clock = stamp.strftime("%Y-%m-%d"), stamp.strftime("%H:%M:%S")
+            lines = []
+            for ch in range(1, n_channels + 1):
+                value = f"{850.0 - 0.01 * s + ch:.2f}".replace(".", ",")
+                lines.append(f"{day};{clock};1;logger;7;TC{ch};{ch};0;{n_rows};{value};\n")
+                n_rows += 1
+            f.write("".join(lines))
+    return n_rows
+
+
+def legacy_parse(file_content: str) -> dict:
+    """The previous parse_tc_csv (statistics only; same row handling)."""
+    channel_data: dict[str, list[tuple[datetime, float]]] = {}
+    for row in csv.DictReader(io.StringIO(file_content), delimiter=";"):
+        try:
+            timestamp = datetime.strptime(
+                f"{row['date'].strip()} {row['time'].strip()}", "%Y-%m-%d %H:%M:%S"
+            )
+            sensor = row["sensor"].strip()
+            value = float(row["value"].strip().replace(",", "."))
+        except (ValueError, KeyError):
+            continue
+        channel_data.setdefault(sensor, []).append((timestamp, value))
+    start = min(d[0][0] for d in channel_data.values())
+    channels, channel_times = {}, {}
+    for sensor, data in channel_data.items():
+        data.sort(key=lambda x: x[0])
+        channel_times[sensor] = [(d[0] - start).total_seconds() for d in data]
+        channels[sensor] = [d[1] for d in data]
+    return {"channels": channels, "channel_times": channel_times}
+
+
+def run_one(mode: str, path: str) -> None:
+    """Parse in this process; print seconds and peak RSS growth (MB)."""
+    from app.services.tc_data_parser import parse_tc_csv
+
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "legacy":
+        with open(path, "rb") as f:
+            data = legacy_parse(f.read().decode("utf-8"))
+    else:
+        with open(path, "rb") as f:
+            data = parse_tc_csv(f)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    points = sum(len(v) for v in data["channels"].values())
+    print(f"{elapsed:.3f} {(peak - base) / 1024:.1f} {points}")
+
+
+def main() -> int:
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run_one(sys.argv[2], sys.argv[3])
+        return 0
+
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 6.0
+    n_channels = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tc.csv")
+        n_rows = write_file(path, hours, n_channels)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{n_rows} rows, {n_channels} channels, {size_mb:.0f} MB")
+        for mode, label in (("legacy", "before: whole file"), ("stream", "after:  chunked")):
+            out = subprocess.run(
+                [sys.executable, __file__, "--run", mode, path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            seconds, peak_mb, points = float(out[0]), float(out[1]), int(out[2])
+            print(f"  {label:20s} {seconds:7.2f} s  peak +{peak_mb:6.0f} MB  ({points} points)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Benchmark: stride vs min/max downsampling of interactive plot traces.
+
+Solves a water quench of a 300 mm bar at a 0.1 s step and reduces the
+center cooling rate dT/dt, simulated and with thermocouple-like noise, to
+MAX_TRACE_POINTS samples twice: by the previous stride decimation and by
+`minmax_indices`. Reports how much of the peak cooling rate each keeps. Then stores the run as a full-cycle row
+in a scratch SQLite database and times the full-cycle plot-data builder
+with the precomputed min/max level against downsampling the full series
+at request time.
+
+Run from project root:
+    python scripts/bench_trace_downsampling.py [max_time_s]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app.extensions import db
+from app.models import Simulation, SimulationResult, SteelGrade
+from app.models.material import DATA_SOURCE_STANDARD
+from app.models.simulation import STATUS_COMPLETED, minmax_indices
+from app.services import HeatSolver, SolverConfig, create_geometry, plot_data
+from app.services.boundary_conditions import create_quench_bc
+from app.services.simulation_runner import _four_point_series
+
+
+def stride_indices(n: int, max_points: int) -> np.ndarray:
+    """Previous decimation: every n-th point plus the last one."""
+    keep = np.arange(0, n, max(1, n // max_points))
+    return keep if keep[-1] == n - 1 else np.append(keep, n - 1)
+
+
+def main() -> int:
+    max_time = float(sys.argv[1]) if len(sys.argv) > 1 else 3600.0
+    max_points = plot_data.MAX_TRACE_POINTS
+    repeats = 20
+
+    geometry = create_geometry("cylinder", {"radius": 0.15, "length": 1.0})
+    config = SolverConfig(n_nodes=51, dt=0.1, max_time=max_time, output_interval=1)
+    result = HeatSolver(geometry, create_quench_bc("water", 25.0), config=config).solve(850.0)
+    times = result.time
+    n = len(times)
+    # A thermocouple reading of the center: the simulated curve plus 0.2 °C noise
+    measured = result.center_temp + np.random.default_rng(0).normal(0.0, 0.2, n)
+    print(f"Water quench: {n} samples, trace budget {max_points} points")
+    for label, series in (("simulated", result.center_temp), ("measured", measured)):
+        rate = np.diff(series) / np.diff(times)
+        peak = rate.min()
+        kept = {
+            "stride": rate[stride_indices(len(rate), max_points)].min(),
+            "min/max": rate[minmax_indices(rate, max_points)].min(),
+        }
+        print(
+            f"  {label:9s} center dT/dt peak {peak:8.2f} °C/s   kept: "
+            + "   ".join(f"{name} {value / peak * 100:5.1f}%" for name, value in kept.items())
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        app.config["SQLALCHEMY_BINDS"] = {"materials": f"sqlite:///{tmp}/bench.db"}
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            grade = SteelGrade(designation="BENCH", data_source=DATA_SOURCE_STANDARD)
+            db.session.add(grade)
+            db.session.commit()
+            sim = Simulation(
+                name="Bench",
+                steel_grade_id=grade.id,
+                user_id=1,
+                geometry_type="cylinder",
+                process_type="quench_water",
+                status=STATUS_COMPLETED,
+            )
+            db.session.add(sim)
+            db.session.commit()
+            positions = _four_point_series(result.temperature)
+            row = SimulationResult(
+                simulation_id=sim.id, result_type="full_cycle", phase="full", location="center"
+            )
+            row.set_series(times, result.center_temp, positions)
+            row.set_data({"positions": list(positions)})
+            db.session.add(row)
+            db.session.commit()
+
+            def level():
+                db.session.expire_all()
+                return plot_data.full_cycle(db.session.get(Simulation, sim.id))
+
+            def full_series():
+                db.session.expire_all()
+                cycle = db.session.get(SimulationResult, row.id)
+                return plot_data._position_traces(
+                    cycle.time_series, plot_data._stored_series(cycle)
+                )
+
+            t_level = timeit.timeit(level, number=repeats) / repeats
+            t_full = timeit.timeit(full_series, number=repeats) / repeats
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+    print(
+        f"  full_cycle traces: precomputed level {t_level * 1e3:6.2f} ms   "
+        f"downsampling full series {t_full * 1e3:6.2f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -65,8 +65,8 @@ from app.models.simulation import PROCESS_QUENCH_WATER
 def app():
     """Create application for the test session."""
     app = create_app("testing")
-    # Override binds to ensure in-memory SQLite for materials
-    app.config["SQLALCHEMY_BINDS"] = {"materials": "sqlite://"}
+    # TestingConfig binds materials to in-memory SQLite, never instance/
+    assert app.config["SQLALCHEMY_BINDS"] == {"materials": "sqlite://"}
     yield app
 
 
@@ -273,3 +273,10 @@ class TestEdgeCases:
         if "bainite" in curves:
             max_bainite_temp = max(p[1] for p in curves["bainite"]["start"])
             assert max_bainite_temp <= 410  # Near or below Bs
+
+    def test_memoized_prediction_returns_new_lists(self, aisi4340_comp):
+        """Repeated predictions are equal but never share mutable curves."""
+        first = predict_cct_curves(aisi4340_comp)
+        first["pearlite"]["start"].clear()
+        second = predict_cct_curves(aisi4340_comp)
+        assert second == CCTCurvePredictor(aisi4340_comp).predict()
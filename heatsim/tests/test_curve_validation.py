@@ -145,3 +145,87 @@ class TestEvaluateScalar:
 
         prop = self._prop(db, sample_steel_grade, "density", "constant", {"value": "junk!"})
         assert evaluate_scalar(prop, 7850.0) == 7850.0
+
+
+class TestCompileProperty:
+    """compile_property must match PropertyEvaluator.evaluate over arrays."""
+
+    def _prop(self, db, grade, name, ptype, data):
+        from app.models import MaterialProperty
+
+        prop = MaterialProperty(
+            steel_grade_id=grade.id, property_name=name, property_type=ptype
+        )
+        prop.set_data(data)
+        db.session.add(prop)
+        db.session.commit()
+        return prop
+
+    def test_none_compiles_to_default(self):
+        import numpy as np
+
+        from app.services.property_evaluator import compile_property
+
+        func = compile_property(None, 40.0)
+        assert np.allclose(func(np.array([20.0, 500.0, 900.0])), 40.0)
+
+    def test_curve_matches_scalar_evaluate(self, db, sample_steel_grade):
+        import numpy as np
+
+        from app.services.property_evaluator import PropertyEvaluator, compile_property
+
+        prop = self._prop(
+            db,
+            sample_steel_grade,
+            "thermal_conductivity",
+            "curve",
+            {"temperature": [20, 400, 800], "value": [48.0, 40.0, 26.0]},
+        )
+        temps = np.linspace(-100.0, 1200.0, 57)
+        scalar = [PropertyEvaluator(prop).evaluate(temperature=t) for t in temps]
+        assert np.allclose(compile_property(prop, 40.0)(temps), scalar)
+
+    def test_polynomial_matches_scalar_evaluate(self, db, sample_steel_grade):
+        import numpy as np
+
+        from app.services.property_evaluator import PropertyEvaluator, compile_property
+
+        prop = self._prop(
+            db,
+            sample_steel_grade,
+            "specific_heat",
+            "polynomial",
+            {"variable": "temperature", "coefficients": [450.0, 0.28, 1e-4]},
+        )
+        temps = np.array([20.0, 300.0, 750.0])
+        scalar = [PropertyEvaluator(prop).evaluate(temperature=t) for t in temps]
+        assert np.allclose(compile_property(prop, 500.0)(temps), scalar)
+
+    def test_equation_sampled_to_lookup_table(self, db, sample_steel_grade):
+        import numpy as np
+
+        from app.services.property_evaluator import compile_property
+
+        prop = self._prop(
+            db,
+            sample_steel_grade,
+            "thermal_conductivity",
+            "equation",
+            {"equation": "42.5 - 0.015*T", "variables": {"T": "temperature"}},
+        )
+        temps = np.array([20.0, 333.3, 1000.0])
+        assert np.allclose(compile_property(prop, 40.0)(temps), 42.5 - 0.015 * temps)
+
+    def test_unevaluable_equation_falls_back_to_default(self, db, sample_steel_grade):
+        import numpy as np
+
+        from app.services.property_evaluator import compile_property
+
+        prop = self._prop(
+            db,
+            sample_steel_grade,
+            "specific_heat",
+            "equation",
+            {"equation": "1/0", "variables": {"T": "temperature"}},
+        )
+        assert np.allclose(compile_property(prop, 500.0)(np.array([20.0, 800.0])), 500.0)
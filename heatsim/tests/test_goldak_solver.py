@@ -3,14 +3,17 @@
 import numpy as np
 import pytest
 
+from app.services.goldak_multipass import GRID_PRESETS, GoldakMultiPassSolver
 from app.services.goldak_solver import (
     SOLIDUS_TEMP,
     GoldakParams,
     GoldakResult,
     GoldakSolver,
     GoldakSolverConfig,
+    _ThermalCycleTracker,
     estimate_pool_params,
 )
+from app.services.property_evaluator import CompiledProperty
 
 
 class TestGoldakParams:
@@ -317,3 +320,259 @@ class TestGoldakSolverEdgeCases:
         solver = GoldakSolver(params, config)
         result = solver.solve()
         assert result.fusion_zone_area_mm2 >= 0
+
+
+class TestBatchedADI:
+    """The batched ADI sweeps solve each row/column system independently."""
+
+    def _dense_line(self, solver, T, src, Fo, Bi_first, Bi_last):
+        """Reference: dense solve of one line's tridiagonal system."""
+        theta = solver.config.theta
+        T_amb = solver.params.T0
+        n = len(T)
+        A = np.zeros((n, n))
+        b = T + src
+        for i in range(1, n - 1):
+            A[i, i - 1 : i + 2] = [-theta * Fo, 1 + 2 * theta * Fo, -theta * Fo]
+            b[i] += (1 - theta) * Fo * (T[i - 1] - 2 * T[i] + T[i + 1])
+        for node, nb, Bi in ((0, 1, Bi_first), (n - 1, n - 2, Bi_last)):
+            Bi = 0.0 if Bi is None else Bi
+            A[node, node] = 1 + theta * (2 * Fo + 2 * Fo * Bi)
+            A[node, nb] = -2 * theta * Fo
+            b[node] += (1 - theta) * (2 * Fo * (T[nb] - T[node]) + 2 * Fo * Bi * (T_amb - T[node]))
+            b[node] += 2 * theta * Fo * Bi * T_amb
+        return np.linalg.solve(A, b)
+
+    @pytest.mark.parametrize("adiabatic_end", [False, True])
+    def test_sweep_matches_per_line_solve(self, adiabatic_end):
+        solver = GoldakSolver(GoldakParams(), GoldakSolverConfig(ny=9, nz=7))
+        rng = np.random.default_rng(0)
+        m, n = 5, 9
+        T = rng.uniform(20.0, 1400.0, (m, n))
+        src = rng.uniform(0.0, 50.0, (m, n))
+        Bi_first = rng.uniform(0.0, 0.1, m)
+        Bi_last = None if adiabatic_end else rng.uniform(0.0, 0.1, m)
+        Fo = 0.7
+
+        result = solver._implicit_sweep(
+            T, src, Fo, Bi_first, Bi_last, np.zeros((3, m, n)), np.zeros((m, n))
+        )
+
+        for j in range(m):
+            expected = self._dense_line(
+                solver, T[j], src[j], Fo, Bi_first[j], None if Bi_last is None else Bi_last[j]
+            )
+            np.testing.assert_allclose(result[j], expected, rtol=1e-10)
+
+    def test_linearized_htc_vectorized(self):
+        solver = GoldakSolver(GoldakParams())
+        T_s = np.array([20.0, 500.0, 1200.0])
+        h = solver._linearized_htc(T_s)
+        assert h.shape == (3,)
+        for T, h_i in zip(T_s, h, strict=True):
+            assert float(solver._linearized_htc(T)) == pytest.approx(h_i)
+        assert np.all(np.diff(h) > 0)
+
+    def test_time_step_reuses_buffers(self):
+        solver = GoldakSolver(GoldakParams(Q=5000), GoldakSolverConfig(ny=21, nz=11))
+        T = np.full((11, 21), solver.params.T0)
+        T = solver._time_step_adi(T, solver._goldak_source_2d(0.0))
+        ab_y, ab_z = solver._ab_y, solver._ab_z
+        solver._time_step_adi(T, solver._goldak_source_2d(0.1))
+        assert solver._ab_y is ab_y
+        assert solver._ab_z is ab_z
+        assert ab_y.shape == (3, 11, 21)
+        assert ab_z.shape == (3, 21, 11)
+
+    @pytest.mark.parametrize("axis", ["y", "z"])
+    def test_step_diffuses_over_full_dt(self, axis):
+        """A cosine mode decays at the analytic rate in both directions.
+
+        With insulated surfaces the lowest mode along y (or z) decays as
+        exp(-alpha * (pi / L)^2 * t); pass steps and cooling steps agree.
+        """
+        params = GoldakParams(emissivity=0.0, h_conv=0.0)
+        length = 2.0 * params.plate_half_width if axis == "y" else params.plate_thickness
+        rate = params.alpha * (np.pi / length) ** 2
+        # 20 steps over which the mode halves
+        n_steps = 20
+        dt = np.log(2.0) / rate / n_steps
+        decay = 0.5
+
+        solver = GoldakSolver(params, GoldakSolverConfig(ny=41, nz=31, dt=dt))
+        y, z = np.meshgrid(solver.y, solver.z)
+        if axis == "y":
+            mode = np.cos(np.pi * (y + params.plate_half_width) / length)
+        else:
+            mode = np.cos(np.pi * z / length)
+        field = params.T0 + 100.0 * mode
+
+        no_source = np.zeros_like(field)
+        T_pass, T_cool = field, field
+        for _ in range(n_steps):
+            T_pass = solver._time_step_adi(T_pass, no_source)
+            T_cool = solver._time_step_adi(T_cool, no_source, dt=dt, theta=1.0)
+        for T in (T_pass, T_cool):
+            amplitude = np.sum((T - params.T0) * mode) / np.sum(mode * mode)
+            # Half-length sub-steps would leave ~71 (sqrt(0.5)) of the 100
+            assert amplitude == pytest.approx(100.0 * decay, rel=0.03)
+
+
+class TestInterpassCooling:
+    """Implicit interpass cooling with growing time steps."""
+
+    def _hot_field(self):
+        solver = GoldakSolver(GoldakParams(T0=100.0), GoldakSolverConfig(ny=21, nz=11))
+        y, z = np.meshgrid(solver.y, solver.z)
+        field = 100.0 + 1100.0 * np.exp(-(y**2) / 1e-4 - z**2 / 4e-5)
+        return solver, field
+
+    def test_cools_to_target(self):
+        solver, field = self._hot_field()
+        cooled, t = solver.cool(field, 250.0)
+        assert 0 < t < 600.0
+        assert np.max(cooled) == pytest.approx(250.0, abs=0.5)
+        assert np.all(cooled >= 20.0)
+
+    def test_respects_max_time(self):
+        solver, field = self._hot_field()
+        cooled, t = solver.cool(field, 50.0, max_time=45.0)
+        assert t == pytest.approx(45.0)
+        assert np.max(cooled) > 50.0
+
+    def test_already_below_target(self):
+        solver, field = self._hot_field()
+        cooled, t = solver.cool(field, 2000.0)
+        assert t == 0.0
+        np.testing.assert_array_equal(cooled, field)
+
+    def test_cooling_time_independent_of_step(self, monkeypatch):
+        """Large implicit steps land on the same cooling time as small ones."""
+        import app.services.goldak_solver as goldak_solver
+
+        solver, field = self._hot_field()
+        _, t_coarse = solver.cool(field, 250.0)
+        monkeypatch.setattr(goldak_solver, "COOLING_MAX_DT", 0.5)
+        _, t_fine = solver.cool(field, 250.0)
+        assert t_coarse == pytest.approx(t_fine, rel=0.02)
+
+    def test_multipass_uses_cooling_time(self):
+        solver, field = self._hot_field()
+        multipass = GoldakMultiPassSolver(project=None)
+        cooled, t = multipass._apply_interpass_cooling(field, solver, 250.0, max_time=600.0)
+        expected, t_expected = solver.cool(field, 250.0, max_time=600.0)
+        assert t == t_expected
+        np.testing.assert_array_equal(cooled, expected)
+
+
+class TestTemperatureDependentProperties:
+    """k(T), Cp(T) mode of the ADI solver."""
+
+    def _make_solver(self, temperature_dependent=True):
+        params = GoldakParams(Q=5000, v=0.005)
+        config = GoldakSolverConfig(
+            ny=21,
+            nz=11,
+            dt=0.1,
+            total_time=20.0,
+            output_interval=10,
+            temperature_dependent=temperature_dependent,
+        )
+        return GoldakSolver(params, config)
+
+    def test_constant_curves_match_constant_mode(self):
+        reference = self._make_solver(temperature_dependent=False).solve()
+        solver = self._make_solver()
+        solver.set_material(
+            CompiledProperty.constant(solver.params.k), CompiledProperty.constant(solver.params.Cp)
+        )
+        result = solver.solve()
+        np.testing.assert_allclose(
+            result.peak_temperature_map, reference.peak_temperature_map, rtol=1e-12
+        )
+        assert result.solver_info["temperature_dependent"] is True
+
+    def test_curves_ignored_without_flag(self):
+        solver = self._make_solver(temperature_dependent=False)
+        solver.set_material(CompiledProperty.constant(10.0), CompiledProperty.constant(900.0))
+        k, cp = solver._get_properties(np.full((11, 21), 500.0))
+        assert k == solver.params.k
+        assert cp == solver.params.Cp
+        assert solver.solve().solver_info["temperature_dependent"] is False
+
+    def test_properties_evaluated_over_field(self):
+        solver = self._make_solver()
+        solver.set_material(
+            CompiledProperty([0.0, 1000.0], [50.0, 30.0]),
+            CompiledProperty([0.0, 1000.0], [450.0, 650.0]),
+        )
+        k, cp = solver._get_properties(np.array([[0.0, 500.0], [1000.0, 250.0]]))
+        np.testing.assert_allclose(k, [[50.0, 40.0], [30.0, 45.0]])
+        np.testing.assert_allclose(cp, [[450.0, 550.0], [650.0, 500.0]])
+
+    def test_latent_heat_peak_lowers_peak_temperature(self):
+        """A Cp spike (transformation heat) absorbs energy on heating."""
+        base = self._make_solver()
+        base.set_material(None, CompiledProperty.constant(500.0))
+        peaked = self._make_solver()
+        peaked.set_material(
+            None,
+            CompiledProperty(
+                [0.0, 350.0, 400.0, 450.0, 1500.0], [500.0, 500.0, 3000.0, 500.0, 500.0]
+            ),
+        )
+        # HAZ surface node heated through the peak (the fusion zone is capped at solidus)
+        haz = (0, 21 // 2 - 2)
+        assert (
+            peaked.solve().peak_temperature_map[haz] < base.solve().peak_temperature_map[haz] - 20
+        )
+
+    def test_multipass_preset_passes_flag_through(self):
+        solver = GoldakMultiPassSolver.with_preset(None, "coarse", temperature_dependent=True)
+        assert solver.config.temperature_dependent is True
+        assert GRID_PRESETS["coarse"].temperature_dependent is False
+
+
+class TestThermalCycleTracker:
+    """Fused peak / t8/5 / probe bookkeeping."""
+
+    def _replay(self, temps, dt):
+        """Track a uniform 2x3 field following the given temperature history."""
+        fields = [np.full((2, 3), T) for T in temps]
+        tracker = _ThermalCycleTracker(fields[0], {"a": (0, 0), "b": (1, 2)}, len(fields))
+        for step in range(1, len(fields)):
+            tracker.update(fields[step - 1], fields[step], (step - 1) * dt, step * dt)
+            tracker.record_probes(fields[step], step * dt)
+        return tracker
+
+    def test_crossings_interpolated_between_steps(self):
+        # Linear cooling at 100 °C/s sampled every 0.3 s: 800 °C at 2.0 s, 500 °C at 5.0 s
+        temps = [1000.0 - 100.0 * 0.3 * i for i in range(25)]
+        tracker = self._replay(temps, 0.3)
+        np.testing.assert_allclose(tracker.crossing_times[0], 2.0)
+        np.testing.assert_allclose(tracker.crossing_times[1], 5.0)
+        np.testing.assert_allclose(tracker.t8_5_map(), 3.0)
+
+    def test_first_cooling_crossing_kept(self):
+        tracker = self._replay([900.0, 700.0, 450.0, 900.0, 400.0], 1.0)
+        np.testing.assert_allclose(tracker.crossing_times[0], 0.5)
+        np.testing.assert_allclose(tracker.crossing_times[1], 1.8)
+
+    def test_no_crossing_when_not_cooled_through_both(self):
+        tracker = self._replay([20.0, 900.0, 600.0], 1.0)
+        assert np.all(tracker.t8_5_map() == 0.0)
+        np.testing.assert_allclose(tracker.peak, 900.0)
+
+    def test_probe_histories_preallocated(self):
+        tracker = self._replay([20.0, 100.0, 300.0], 0.5)
+        cycles = tracker.probe_cycles()
+        assert cycles["a"]["times"] == [0.0, 0.5, 1.0]
+        assert cycles["b"]["temps"] == [20.0, 100.0, 300.0]
+        assert tracker.probe_temps.shape == (2, 3)
+
+    def test_solver_t8_5_not_quantized_to_time_step(self):
+        dt = 0.2
+        config = GoldakSolverConfig(ny=21, nz=11, dt=dt, total_time=60.0, output_interval=10)
+        t8_5 = GoldakSolver(GoldakParams(Q=5000, v=0.005), config).solve().center_t8_5
+        assert t8_5 is not None
+        assert abs(t8_5 / dt - round(t8_5 / dt)) > 1e-6
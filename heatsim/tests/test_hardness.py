@@ -1,4 +1,4 @@
-"""Tests for Hollomon-Jaffe tempering hardness calculation."""
+"""Tests for hardness prediction: Hollomon-Jaffe tempering, t8/5 and radial profiles."""
 
 import math
 from unittest.mock import MagicMock
@@ -167,3 +167,155 @@ class TestCalculateT85EdgeCases:
         temps = np.array([900.0, np.nan, 700.0, np.nan, 450.0, 300.0])
         result = _calculate_t8_5(times, temps)
         assert result >= 0
+
+
+def _quench_field(n_positions=21, n_times=200):
+    """Synthetic quench: nodes cool exponentially, slower toward the center."""
+    import numpy as np
+
+    times = np.linspace(0, 400, n_times)
+    tau = np.linspace(200.0, 2.0, n_positions)  # center (index 0) slowest
+    temps = 20.0 + 830.0 * np.exp(-times[:, None] / tau[None, :])
+    positions = np.linspace(0.0, 0.025, n_positions)
+    return times, temps, positions
+
+
+class TestCalculateT85Field:
+    """_calculate_t8_5_field must match _calculate_t8_5 column by column."""
+
+    def test_matches_scalar_on_random_histories(self):
+        import numpy as np
+
+        from app.services.hardness_predictor import _calculate_t8_5, _calculate_t8_5_field
+
+        rng = np.random.default_rng(0)
+        for trial in range(50):
+            n_times = int(rng.integers(2, 40))
+            times = np.sort(rng.uniform(0, 100, n_times))
+            temps = rng.uniform(300, 1000, (n_times, 6))
+            if trial % 3 == 0:
+                temps[rng.integers(0, n_times), 0] = np.nan
+            temps[:, -1] = 800.0
+            expected = [_calculate_t8_5(times, temps[:, j]) for j in range(6)]
+            np.testing.assert_allclose(_calculate_t8_5_field(times, temps), expected)
+
+    def test_single_sample_returns_default(self):
+        import numpy as np
+
+        from app.services.hardness_predictor import _calculate_t8_5_field
+
+        result = _calculate_t8_5_field(np.array([0.0]), np.array([[900.0, 400.0]]))
+        assert result.tolist() == [10.0, 10.0]
+
+
+class TestPhaseTrackerField:
+    def test_matches_scalar_prediction(self):
+        import numpy as np
+
+        from app.services.phase_tracker import PhaseTracker
+
+        times, temps, _ = _quench_field()
+        tracker = PhaseTracker()
+        t8_5 = np.geomspace(0.5, 1000.0, temps.shape[1])
+        t8_5[3] = np.nan  # estimated from the curve instead
+        field = tracker.predict_phases_field(times, temps, t8_5)
+        for j in range(temps.shape[1]):
+            scalar = tracker.predict_phases(times, temps[:, j], t8_5[j]).to_dict()
+            for phase, value in scalar.items():
+                assert field[phase][j] == pytest.approx(value)
+
+
+class TestHardnessProfileMode:
+    def test_four_points_match_legacy_call(self, mock_composition):
+        from app.services.hardness_predictor import predict_hardness_profile
+        from app.services.phase_tracker import PhaseTracker
+
+        times, temps, positions = _quench_field()
+        tracker = PhaseTracker()
+        legacy = predict_hardness_profile(mock_composition, temps, times, tracker)
+        profiled = predict_hardness_profile(
+            mock_composition, temps, times, tracker, positions=positions
+        )
+        data = profiled.to_dict()
+        assert data.pop("profile")
+        assert data == legacy.to_dict()
+
+    def test_profile_covers_every_node(self, mock_composition):
+        import json
+
+        import numpy as np
+
+        from app.services.hardness_predictor import predict_hardness_profile
+        from app.services.phase_tracker import PhaseTracker
+
+        times, temps, positions = _quench_field()
+        profile = predict_hardness_profile(
+            mock_composition, temps, times, PhaseTracker(), positions=positions
+        ).profile
+        assert profile.hardness_hv.dtype == np.float32
+        assert len(profile.hardness_hv) == temps.shape[1]
+        assert profile.positions_mm[-1] == pytest.approx(25.0)
+        # Surface quenches faster, so it is at least as hard as the center
+        assert profile.hardness_hv[-1] >= profile.hardness_hv[0]
+        total = sum(profile.phase_fractions.values())
+        np.testing.assert_allclose(total, 1.0, rtol=1e-6)
+        json.dumps(profile.to_dict())
+
+    def test_tracker_without_field_method(self, mock_composition):
+        from app.services.hardness_predictor import predict_hardness_profile
+        from app.services.phase_tracker import PhaseTracker
+
+        times, temps, positions = _quench_field(n_positions=7)
+        real = PhaseTracker()
+        tracker = MagicMock(spec=["predict_phases"])
+        tracker.predict_phases.side_effect = real.predict_phases
+        result = predict_hardness_profile(
+            mock_composition, temps, times, tracker, positions=positions
+        )
+        assert tracker.predict_phases.call_count == 7
+        expected = predict_hardness_profile(mock_composition, temps, times, real)
+        assert result.hardness_hv == expected.hardness_hv
+
+
+class TestHardeningDepth:
+    @staticmethod
+    def _profile(hv):
+        import numpy as np
+
+        from app.services.hardness_predictor import HardnessProfile
+
+        hv = np.asarray(hv, dtype=np.float32)
+        zeros = np.zeros_like(hv)
+        return HardnessProfile(
+            positions_mm=np.linspace(0.0, 10.0, len(hv), dtype=np.float32),
+            t8_5=zeros,
+            phase_fractions={"martensite": zeros},
+            hardness_hv=hv,
+            hardness_hrc=zeros,
+            uts_mpa=zeros,
+            ys_mpa=zeros,
+        )
+
+    def test_interpolates_between_nodes(self):
+        # Nodes every 2.5 mm; 550 HV is reached halfway between 2.5 and 5 mm depth
+        profile = self._profile([300, 300, 500, 600, 700])
+        assert profile.case_depth_mm == pytest.approx(3.75)
+        # 80% of 700 HV = 560 HV, 40% of the way from 2.5 to 5 mm
+        assert profile.effective_hardening_depth_mm == pytest.approx(3.5)
+
+    def test_soft_surface_has_zero_depth(self):
+        assert self._profile([300, 400, 500]).case_depth_mm == 0.0
+
+    def test_through_hardened_section(self):
+        assert self._profile([600, 650, 700]).case_depth_mm == pytest.approx(10.0)
+
+    def test_hrc_below_range_stored_as_none(self, mock_composition):
+        import numpy as np
+
+        predictor = HardnessPredictor(mock_composition)
+        hrc = predictor.hv_to_hrc_field(np.array([150.0, 513.0]))
+        assert np.isnan(hrc[0])
+        assert hrc[1] == pytest.approx(predictor.hv_to_hrc(513.0))
+        profile = self._profile([150, 513])
+        profile.hardness_hrc = hrc.astype(np.float32)
+        assert profile.to_dict()["hardness_hrc"][0] is None
@@ -0,0 +1,336 @@
+"""Tests for the 1D finite-difference heat solver."""
+
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy.sparse import diags
+from scipy.sparse.linalg import spsolve
+
+from app.services import (
+    HeatSolver,
+    MultiPhaseHeatSolver,
+    SolverConfig,
+    create_geometry,
+    optimization_service,
+)
+from app.services.batch_simulation import MaterialSnapshot, SimulationVariant, solve_variants
+from app.services.boundary_conditions import create_quench_bc
+from app.services.heat_solver import BatchHeatSolver
+from app.services.property_evaluator import CompiledProperty
+
+
+def _reference_step(solver, T, r, dr, dt):
+    """Legacy per-node sparse assembly + spsolve, kept as the accuracy reference."""
+    n = len(T)
+    theta = solver.config.theta
+    T_new = T.copy()
+    for _ in range(solver.config.max_iterations):
+        T_old_iter = T_new.copy()
+        k, cp = solver._get_properties(0.5 * (T + T_new))
+        Fo = k / (solver._rho * cp) * dt / dr**2
+        lower, main, upper, rhs = np.zeros(n), np.zeros(n), np.zeros(n), np.zeros(n)
+        for i in range(1, n - 1):
+            if solver._is_cylindrical:
+                a_w = Fo[i] * (r[i] - dr / 2) / r[i]
+                a_e = Fo[i] * (r[i] + dr / 2) / r[i]
+            else:
+                a_w = a_e = Fo[i]
+            main[i] = 1 + theta * (a_w + a_e)
+            lower[i] = -theta * a_w
+            upper[i] = -theta * a_e
+            rhs[i] = T[i] + (1 - theta) * (a_w * (T[i - 1] - T[i]) + a_e * (T[i + 1] - T[i]))
+
+        if solver._has_inner_bc:
+            Bi = solver.inner_bc.linearized_htc(T_new[0]) * dr / k[0]
+            a_e = Fo[0] * (r[0] + dr / 2) / r[0]
+            T_amb = solver.inner_bc.ambient_temp
+            main[0] = 1 + theta * (a_e + 2 * Fo[0] * Bi)
+            upper[0] = -theta * a_e
+            rhs[0] = (
+                T[0]
+                + (1 - theta) * (a_e * (T[1] - T[0]) + 2 * Fo[0] * Bi * (T_amb - T[0]))
+                + 2 * theta * Fo[0] * Bi * T_amb
+            )
+        else:
+            c = 4 if solver._is_cylindrical else 2
+            main[0] = 1 + c * theta * Fo[0]
+            upper[0] = -c * theta * Fo[0]
+            rhs[0] = T[0] + c * (1 - theta) * Fo[0] * (T[1] - T[0])
+
+        Bi = solver.outer_bc.linearized_htc(T_new[-1]) * dr / k[-1]
+        a_w = Fo[-1] * (r[-1] - dr / 2) / r[-1] if solver._is_cylindrical else 2 * Fo[-1]
+        T_amb = solver.outer_bc.ambient_temp
+        main[-1] = 1 + theta * (a_w + 2 * Fo[-1] * Bi)
+        lower[-1] = -theta * a_w
+        rhs[-1] = (
+            T[-1]
+            + (1 - theta) * (a_w * (T[-2] - T[-1]) + 2 * Fo[-1] * Bi * (T_amb - T[-1]))
+            + 2 * theta * Fo[-1] * Bi * T_amb
+        )
+
+        A = diags([lower[1:], main, upper[:-1]], [-1, 0, 1], format="csr")
+        T_new = spsolve(A, rhs)
+        if np.max(np.abs(T_new - T_old_iter)) < solver.config.convergence_tol:
+            break
+    return T_new
+
+
+GEOMETRIES = [
+    ("cylinder", {"radius": 0.05, "length": 0.2}),
+    ("ring", {"outer_radius": 0.1, "inner_radius": 0.04, "length": 0.2}),
+    ("plate", {"thickness": 0.04, "width": 0.2, "length": 0.2}),
+]
+
+
+class TestBandedTimeStep:
+    """Vectorized banded assembly must match the legacy sparse path."""
+
+    @pytest.mark.parametrize("geo_type,params", GEOMETRIES)
+    def test_matches_sparse_reference(self, geo_type, params):
+        geometry = create_geometry(geo_type, params)
+        solver = HeatSolver(
+            geometry, create_quench_bc("water", 25.0), config=SolverConfig(n_nodes=31)
+        )
+        r = geometry.create_mesh(31)
+        dr = r[1] - r[0]
+        T = np.linspace(850.0, 700.0, len(r))
+
+        for dt in (0.1, 2.0):
+            expected = _reference_step(solver, T, r, dr, dt)
+            actual = solver._time_step(T, r, dr, dt)
+            assert np.allclose(actual, expected, rtol=0, atol=1e-8)
+
+    def test_buffers_reused_between_steps(self):
+        geometry = create_geometry("cylinder", {"radius": 0.05, "length": 0.2})
+        solver = HeatSolver(geometry, create_quench_bc("oil", 60.0))
+        r = geometry.create_mesh(21)
+        T = np.full(len(r), 850.0)
+        solver._time_step(T, r, r[1] - r[0], 0.5)
+        ab = solver._ab
+        solver._time_step(T, r, r[1] - r[0], 0.5)
+        assert solver._ab is ab
+
+    def test_multiphase_quench_cools(self):
+        geometry = create_geometry("cylinder", {"radius": 0.025, "length": 0.1})
+        solver = MultiPhaseHeatSolver(geometry, SolverConfig(n_nodes=21, dt=0.5))
+        solver.set_material(None, None, density=7850.0)
+        solver.configure_from_ht_config(
+            {"quenching": {"media": "water", "media_temperature": 25.0, "duration": 120.0}}
+        )
+        result = solver.solve(initial_temperature=850.0)
+        assert result.center_temp[-1] < 200.0
+        assert np.all(np.diff(result.surface_temp) <= 1e-6)
+
+
+def _forging_solver(adaptive: bool) -> MultiPhaseHeatSolver:
+    geometry = create_geometry("cylinder", {"radius": 0.15, "length": 0.5})
+    solver = MultiPhaseHeatSolver(geometry, SolverConfig(n_nodes=31, dt=1.0, adaptive=adaptive))
+    solver.set_material(None, None, density=7850.0)
+    solver.configure_from_ht_config(
+        {
+            "heating": {
+                "enabled": True,
+                "initial_temperature": 25.0,
+                "target_temperature": 850.0,
+                "hold_time": 10.0,
+                "end_condition": "equilibrium",
+            },
+            "transfer": {"enabled": True, "duration": 20.0},
+            "quenching": {"media": "water", "media_temperature": 25.0, "duration": 600.0},
+        }
+    )
+    return solver
+
+
+class TestAdaptiveTimeStepping:
+    """Step-doubling adaptive dt in solve_phase."""
+
+    def test_config_defaults_to_fixed_step(self):
+        assert SolverConfig().adaptive is False
+        assert SolverConfig.from_dict({"adaptive": True, "dt_max": 30.0}).dt_max == 30.0
+
+    def test_fixed_step_reports_statistics(self):
+        result = _forging_solver(adaptive=False).solve(initial_temperature=25.0)
+        info = result.solver_info
+        assert info["adaptive"] is False
+        assert info["n_steps"] == info["fixed_steps"]
+        assert info["step_reduction"] == pytest.approx(1.0)
+
+    def test_adaptive_matches_fixed_with_fewer_steps(self):
+        fixed = _forging_solver(adaptive=False).solve(initial_temperature=25.0)
+        adaptive = _forging_solver(adaptive=True).solve(initial_temperature=25.0)
+
+        assert adaptive.solver_info["n_steps"] * 10 < fixed.solver_info["n_steps"]
+        assert adaptive.solver_info["step_reduction"] > 10
+
+        # Same phase sequence, end times and final field within tolerance
+        assert [p.phase_name for p in adaptive.phase_results] == [
+            p.phase_name for p in fixed.phase_results
+        ]
+        heat_fixed, heat_adaptive = fixed.phase_results[0], adaptive.phase_results[0]
+        assert heat_adaptive.end_time == pytest.approx(heat_fixed.end_time, rel=0.02)
+        assert np.allclose(adaptive.temperature[-1], fixed.temperature[-1], atol=2.0)
+
+    def test_adaptive_shrinks_dt_in_quench(self):
+        result = _forging_solver(adaptive=True).solve(initial_temperature=25.0)
+        phases = result.solver_info["phases"]
+        assert phases["quenching"]["dt_min_used"] < 1.0
+        assert phases["heating"]["dt_max_used"] > 10.0
+
+
+def _variant_config(htc: float, media_temp: float, hold: float) -> dict:
+    return {
+        "heating": {
+            "enabled": True,
+            "initial_temperature": 25.0,
+            "target_temperature": 850.0,
+            "hold_time": hold,
+            "end_condition": "equilibrium",
+        },
+        "transfer": {"enabled": True, "duration": 15.0},
+        "quenching": {
+            "media": "water",
+            "media_temperature": media_temp,
+            "duration": 90.0,
+            "htc_override": htc,
+        },
+    }
+
+
+class TestBatchHeatSolver:
+    """BatchHeatSolver must reproduce independent MultiPhaseHeatSolver runs."""
+
+    @pytest.mark.parametrize(
+        "geo_type,key,params",
+        [
+            ("cylinder", "radius", {"length": 0.1}),
+            ("ring", "outer_radius", {"inner_radius": 0.01, "length": 0.1}),
+            ("plate", "thickness", {"width": 0.1, "length": 0.1}),
+        ],
+    )
+    def test_matches_individual_solves(self, geo_type, key, params):
+        config = SolverConfig(n_nodes=21, dt=1.0)
+        geometries = [
+            create_geometry(geo_type, {**params, key: size}) for size in (0.015, 0.02, 0.025)
+        ]
+        ht_configs = [
+            _variant_config(htc, media_temp, hold)
+            for htc, media_temp, hold in (
+                (800.0, 25.0, 5.0),
+                (2500.0, 40.0, 10.0),
+                (5000.0, 60.0, 0.0),
+            )
+        ]
+
+        batch = BatchHeatSolver(geometries, config)
+        batch.set_material(None, None, density=7850.0)
+        batch.configure_from_ht_configs(ht_configs)
+        results = batch.solve(initial_temperatures=25.0)
+
+        assert len(results) == 3
+        for geometry, ht_config, result in zip(geometries, ht_configs, results, strict=True):
+            single = MultiPhaseHeatSolver(geometry, config)
+            single.set_material(None, None, density=7850.0)
+            single.configure_from_ht_config(ht_config)
+            expected = single.solve(initial_temperature=25.0)
+
+            assert np.array_equal(result.time, expected.time)
+            assert np.allclose(result.temperature, expected.temperature, atol=1e-3)
+            assert result.t8_5 == expected.t8_5
+            assert [p.end_time for p in result.phase_results] == pytest.approx(
+                [p.end_time for p in expected.phase_results]
+            )
+            assert result.solver_info["batch_size"] == 3
+
+    def test_variants_finish_independently(self):
+        geometries = [create_geometry("cylinder", {"radius": 0.02, "length": 0.1})] * 2
+        short = {"quenching": {"media": "oil", "media_temperature": 60.0, "duration": 30.0}}
+        long = {"quenching": {"media": "oil", "media_temperature": 60.0, "duration": 120.0}}
+
+        batch = BatchHeatSolver(geometries, SolverConfig(n_nodes=21, dt=0.5))
+        batch.configure_from_ht_configs([short, long])
+        results = batch.solve(initial_temperatures=[850.0, 800.0])
+
+        assert results[0].time[-1] == pytest.approx(30.0)
+        assert results[1].time[-1] == pytest.approx(120.0)
+        assert results[0].temperature[0, 0] == 850.0
+        assert results[1].temperature[0, 0] == 800.0
+
+    def test_rejects_mixed_coordinate_systems(self):
+        geometries = [
+            create_geometry("cylinder", {"radius": 0.02, "length": 0.1}),
+            create_geometry("plate", {"thickness": 0.02, "width": 0.1, "length": 0.1}),
+        ]
+        with pytest.raises(ValueError):
+            BatchHeatSolver(geometries)
+
+    def test_config_count_must_match(self):
+        batch = BatchHeatSolver([create_geometry("cylinder", {"radius": 0.02, "length": 0.1})])
+        with pytest.raises(ValueError):
+            batch.configure_from_ht_configs([{}, {}])
+
+
+def _snapshot() -> MaterialSnapshot:
+    return MaterialSnapshot(
+        conductivity=CompiledProperty(temperatures=[20, 800], values=[45.0, 27.0]),
+        specific_heat=CompiledProperty(coefficients=[450.0, 0.3]),
+    )
+
+
+class TestSolveVariants:
+    """ORM-free variant batches, as shipped to optimization worker processes."""
+
+    def test_snapshot_is_picklable(self):
+        material = _snapshot()
+        restored = pickle.loads(pickle.dumps(material))
+        assert np.allclose(
+            restored.conductivity([100.0, 500.0]), material.conductivity([100.0, 500.0])
+        )
+        assert restored.specific_heat(300.0) == pytest.approx(540.0)
+
+    def test_worker_process_matches_in_process(self):
+        variants = [
+            SimulationVariant(
+                "cylinder", {"radius": radius, "length": 0.1}, _variant_config(htc, 25.0, 0.0)
+            )
+            for radius, htc in ((0.015, 1000.0), (0.02, 3000.0))
+        ]
+        variants.append(SimulationVariant("sphere", {"radius": 0.02}, {}))
+        solver_dict = {"n_nodes": 15, "dt": 1.0}
+
+        local = solve_variants(_snapshot(), variants, solver_dict)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            remote = pool.submit(solve_variants, _snapshot(), variants, solver_dict).result()
+
+        assert local[2] is None and remote[2] is None
+        for a, b in zip(local[:2], remote[:2], strict=True):
+            assert np.array_equal(a.temperature, b.temperature)
+            assert a.t8_5 == b.t8_5
+
+    def test_failed_batch_raises_without_waiting(self, monkeypatch):
+        release = threading.Event()
+
+        def fake_solve(material, variants, solver_dict):
+            if variants[0] == "bad":
+                raise ValueError("solver diverged")
+            release.wait(30)
+            return variants
+
+        monkeypatch.setattr(optimization_service, "solve_variants", fake_solve)
+        svc = optimization_service.OptimizationService(SimpleNamespace(solver_dict={}))
+        svc._workers = 2
+        svc._start_time = time.time()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            svc._pool = pool
+            start = time.perf_counter()
+            try:
+                with pytest.raises(ValueError, match="diverged"):
+                    svc._solve_in_pool(["slow", "bad"])
+                assert time.perf_counter() - start < 5
+            finally:
+                release.set()
@@ -380,6 +380,16 @@ class TestTTTGeneration:
         assert "finish" in curves["pearlite"]
         assert len(curves["pearlite"]["start"]) > 0
 
+    def test_times_to_fraction_matches_scalar(self, pearlite_jmak):
+        temperatures = np.linspace(350, 750, 41)
+        times = pearlite_jmak.times_to_fraction(0.5, temperatures)
+        for T, t in zip(temperatures, times, strict=True):
+            expected = pearlite_jmak.time_to_fraction(0.5, float(T))
+            if expected is None:
+                assert np.isnan(t)
+            else:
+                assert t == pytest.approx(expected, rel=1e-12)
+
 
 # === CCT Generation ===
 
@@ -398,6 +408,29 @@ class TestCCTGeneration:
             if isinstance(phase_curves, dict):
                 assert "start" in phase_curves or "finish" in phase_curves
 
+    def test_generate_cct_matches_single_rate(self, pearlite_jmak, bainite_jmak, km_model):
+        jmak_models = {"pearlite": pearlite_jmak, "bainite": bainite_jmak}
+        critical_temps = {"Ae1": 727, "Ae3": 840, "Bs": 550, "Ms": 320, "Mf": 120}
+        rates = [0.1, 1.0, 10.0]
+
+        curves = generate_cct_from_ttt(jmak_models, km_model, critical_temps, cooling_rates=rates)
+
+        # Same start points as integrating each rate's own cooling curve
+        expected = []
+        for rate in rates:
+            total = (900.0 - 25.0) / rate
+            times = np.linspace(0, total, int(np.clip(total * 10, 500, 5000)))
+            temps = 900.0 - rate * times
+            result = calculate_cct_transformation(
+                times, temps, jmak_models, km_model, critical_temps
+            )
+            reached = result.phase_fractions["pearlite"] >= 0.01
+            if result.final_fractions["pearlite"] >= 0.005 and reached.any():
+                idx = int(np.argmax(reached))
+                expected.append([times[idx], temps[idx]])
+        expected.sort(key=lambda p: p[0])
+        assert np.allclose(curves["pearlite"]["start"], expected)
+
     def test_generate_cct_phase_fractions(self, pearlite_jmak, km_model):
         jmak_models = {"pearlite": pearlite_jmak}
         critical_temps = {"Ae1": 727, "Ae3": 840, "Bs": 550, "Ms": 320, "Mf": 120}
@@ -1,10 +1,25 @@
 """Tests for the background job queue service."""
 
 import json
+import multiprocessing
+import threading
+import time
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from app.models.job_queue import (
+    KIND_GOLDAK,
+    LANE_FAST,
+    LANES,
+    LEASE_ORPHANED,
+    LEASE_RELEASED,
+    WORKER_IDLE,
+    WORKER_LOST,
+    JobLease,
+    JobWorker,
+)
 from app.models.simulation import (
     STATUS_FAILED,
     STATUS_QUEUED,
@@ -12,6 +27,13 @@ from app.models.simulation import (
     STATUS_RUNNING,
     Simulation,
 )
+from app.models.ttt_parameters import (
+    CALIBRATION_FAILED,
+    CALIBRATION_QUEUED,
+    CALIBRATION_RUNNING,
+    CalibrationJob,
+    TTTParameters,
+)
 from app.models.weld_project import (
     STATUS_CONFIGURED,
     WeldProject,
@@ -29,11 +51,38 @@ from app.models.weld_project import (
 from app.services.job_queue import (
     _claim_next_job,
     _mark_failed,
+    _process_next_job,
+    _register_worker,
+    _Wakeup,
+    _worker_loop,
+    get_job_worker,
+    get_queue_metrics,
     get_queue_position,
     get_queue_status,
+    recover_orphaned_jobs,
+    worker_lanes,
 )
 
 
+@pytest.fixture()
+def sample_calibration_job(db, engineer_user, sample_steel_grade):
+    """A queued CCT calibration of sample_steel_grade."""
+    ttt = TTTParameters(steel_grade_id=sample_steel_grade.id, ae1=727, ae3=800)
+    db.session.add(ttt)
+    db.session.flush()
+    job = CalibrationJob(
+        ttt_parameters_id=ttt.id,
+        user_id=engineer_user.id,
+        phase="bainite",
+        data_points=json.dumps([{"cooling_rate": 1.0, "start_temperature": 600.0}] * 3),
+        status=CALIBRATION_QUEUED,
+        queued_at=datetime.utcnow(),
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
 class TestClaimNextJob:
     """Test FIFO claim ordering."""
 
@@ -62,6 +111,15 @@ class TestClaimNextJob:
         assert result[0] == "weld"
         assert result[1] == sample_weld_project.id
 
+    def test_single_queued_calibration(self, db, sample_calibration_job):
+        """Queued calibration jobs run in the fast lane."""
+        result = _claim_next_job(lanes=(LANE_FAST,))
+        assert result == ("calibration", sample_calibration_job.id)
+
+        job = db.session.get(CalibrationJob, sample_calibration_job.id)
+        assert job.status == CALIBRATION_RUNNING
+        assert job.started_at is not None
+
     def test_fifo_ordering(self, db, engineer_user, sample_steel_grade):
         """Earlier ID is picked first when both types are queued."""
         sim = Simulation(
@@ -131,6 +189,16 @@ class TestMarkFailed:
         proj = db.session.get(WeldProject, sample_weld_project.id)
         assert proj.status == WELD_FAILED
 
+    def test_marks_running_calibration_as_failed(self, db, sample_calibration_job):
+        sample_calibration_job.status = CALIBRATION_RUNNING
+        db.session.commit()
+
+        _mark_failed("calibration", sample_calibration_job.id, "no convergence")
+
+        job = db.session.get(CalibrationJob, sample_calibration_job.id)
+        assert job.status == CALIBRATION_FAILED
+        assert job.error_message == "no convergence"
+
     def test_ignores_completed(self, db, sample_simulation):
         """Don't overwrite completed status."""
         sample_simulation.status = "completed"
@@ -180,6 +248,25 @@ class TestMarkFailed:
         assert sim.status == STATUS_FAILED
         assert sim.error_message == "boom in solver"
 
+    def test_execute_job_settles_batch_duplicates(self, db, engineer_user, sample_steel_grade):
+        """Members waiting on a crashed batch run fail with it."""
+        from app.services.job_queue import _execute_job
+
+        run = _queued_sim(db, engineer_user, sample_steel_grade, "Run")
+        dup = _queued_sim(db, engineer_user, sample_steel_grade, "Duplicate")
+        dup.duplicate_of_id = run.id
+        run.status = STATUS_RUNNING
+        db.session.commit()
+
+        with patch(
+            "app.services.simulation_runner.run_heat_treatment",
+            side_effect=RuntimeError("boom in solver"),
+        ):
+            _execute_job("simulation", run.id)
+
+        assert dup.status == STATUS_FAILED
+        assert dup.error_message == "boom in solver"
+
 
 class TestGetQueueStatus:
     """Test queue status reporting."""
@@ -374,3 +461,269 @@ class TestWeldQueueRoutes:
         assert rv.status_code == 200
         data = rv.get_json()
         assert "queue_position" in data
+
+
+def _queued_sim(db, user, grade, name, solver_type="builtin"):
+    sim = Simulation(
+        name=name,
+        steel_grade_id=grade.id,
+        user_id=user.id,
+        geometry_type="cylinder",
+        process_type="quench_water",
+        status=STATUS_QUEUED,
+    )
+    sim.set_solver_config({"solver_type": solver_type})
+    db.session.add(sim)
+    db.session.commit()
+    return sim
+
+
+def _queued_weld(db, user, grade, name, goldak=False):
+    proj = WeldProject(
+        name=name,
+        steel_grade_id=grade.id,
+        user_id=user.id,
+        process_type="gtaw",
+        status=WELD_QUEUED,
+        total_strings=1,
+        progress_message="goldak:medium:false" if goldak else None,
+    )
+    db.session.add(proj)
+    db.session.commit()
+    return proj
+
+
+class TestLanesAndLimits:
+    """Priority lanes, per-kind limits and atomic claiming."""
+
+    def test_worker_lanes_reserve_fast_workers(self):
+        assert worker_lanes(1, 1) == [LANES]
+        assert worker_lanes(3, 1) == [(LANE_FAST,), LANES, LANES]
+        assert worker_lanes(2, 5) == [(LANE_FAST,), LANES]
+
+    def test_claim_marks_running_and_leases(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+
+        assert _claim_next_job("w1") == ("simulation", sample_simulation.id)
+        db.session.expire_all()
+        assert db.session.get(Simulation, sample_simulation.id).status == STATUS_RUNNING
+        lease = JobLease.query.one()
+        assert lease.worker_name == "w1" and lease.released_at is None
+        # Already claimed: nothing left for a second worker
+        assert _claim_next_job("w2") is None
+
+    def test_fast_lane_overtakes_older_slow_job(self, db, engineer_user, sample_steel_grade):
+        goldak = _queued_weld(db, engineer_user, sample_steel_grade, "Multipass", goldak=True)
+        quench = _queued_sim(db, engineer_user, sample_steel_grade, "Quench")
+
+        assert get_queue_position("simulation", quench.id) == 1
+        assert get_queue_position("weld", goldak.id) == 2
+        assert _claim_next_job("w1") == ("simulation", quench.id)
+
+    def test_fast_only_worker_skips_slow_jobs(self, db, engineer_user, sample_steel_grade):
+        _queued_sim(db, engineer_user, sample_steel_grade, "COMSOL", solver_type="comsol")
+        assert _claim_next_job("fast", (LANE_FAST,)) is None
+        assert _claim_next_job("any", LANES) is not None
+
+    def test_kind_limit(self, app, db, engineer_user, sample_steel_grade):
+        first = _queued_weld(db, engineer_user, sample_steel_grade, "G1", goldak=True)
+        second = _queued_weld(db, engineer_user, sample_steel_grade, "G2", goldak=True)
+        assert app.config["JOB_KIND_LIMITS"][KIND_GOLDAK] == 1
+
+        assert _claim_next_job("w1") == ("weld", first.id)
+        assert _claim_next_job("w2") is None
+
+        lease = JobLease.query.filter_by(job_id=first.id).one()
+        lease.released_at = datetime.utcnow()
+        lease.slot = None
+        db.session.commit()
+        assert _claim_next_job("w2") == ("weld", second.id)
+
+    def test_cancelled_job_not_claimed(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+        with patch(
+            "app.services.job_queue._queued_jobs",
+            return_value=[
+                ("simulation", sample_simulation.id, "x", "heat_treatment", sample_simulation)
+            ],
+        ):
+            sample_simulation.status = STATUS_READY
+            db.session.commit()
+            assert _claim_next_job("w1") is None
+        assert JobLease.query.count() == 0
+
+
+class TestWorkers:
+    """Worker execution, status reporting and orphan recovery."""
+
+    def test_process_next_job_releases_lease(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+        _register_worker("w1", LANES)
+
+        with patch("app.services.simulation_runner.run_heat_treatment") as run:
+            assert _process_next_job("w1") is True
+        run.assert_called_once_with(sample_simulation.id)
+
+        lease = JobLease.query.one()
+        assert lease.outcome == LEASE_RELEASED and lease.released_at is not None
+        worker = JobWorker.query.filter_by(name="w1").one()
+        assert worker.state == WORKER_IDLE and worker.jobs_completed == 1
+        assert _process_next_job("w1") is False
+
+    def test_status_reports_workers(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+        _register_worker("w1", (LANE_FAST,))
+        _claim_next_job("w1")
+
+        status = get_queue_status()
+        assert status["running"]["worker"] == "w1"
+        assert status["workers"][0]["name"] == "w1"
+        assert status["workers"][0]["lanes"] == [LANE_FAST]
+        assert status["workers"][0]["alive"] is True
+        assert get_job_worker("simulation", sample_simulation.id)["name"] == "w1"
+
+    def _orphan(self, db, job_type, job_id):
+        assert _claim_next_job("dead") == (job_type, job_id)
+        stale = datetime.utcnow() - timedelta(minutes=10)
+        JobLease.query.update({"heartbeat_at": stale})
+        db.session.commit()
+
+    def test_orphaned_simulation_requeued_then_failed(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+
+        self._orphan(db, "simulation", sample_simulation.id)
+        assert recover_orphaned_jobs(lease_timeout=60) == 1
+        assert db.session.get(Simulation, sample_simulation.id).status == STATUS_QUEUED
+        assert JobLease.query.one().outcome == LEASE_ORPHANED
+
+        self._orphan(db, "simulation", sample_simulation.id)
+        assert recover_orphaned_jobs(lease_timeout=60) == 1
+        sim = db.session.get(Simulation, sample_simulation.id)
+        assert sim.status == STATUS_FAILED
+        assert "dead" in sim.error_message
+
+    def test_orphaned_weld_failed(self, db, sample_weld_project):
+        sample_weld_project.status = WELD_QUEUED
+        db.session.commit()
+
+        self._orphan(db, "weld", sample_weld_project.id)
+        recover_orphaned_jobs(lease_timeout=60)
+        assert db.session.get(WeldProject, sample_weld_project.id).status == WELD_FAILED
+
+    def test_live_lease_and_stale_worker(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+        _register_worker("idle", LANES)
+        JobWorker.query.update({"heartbeat_at": datetime.utcnow() - timedelta(minutes=10)})
+        _claim_next_job("w1")
+
+        assert recover_orphaned_jobs(lease_timeout=60) == 0
+        assert db.session.get(Simulation, sample_simulation.id).status == STATUS_RUNNING
+        assert JobWorker.query.filter_by(name="idle").one().state == WORKER_LOST
+
+
+class TestWakeup:
+    """Submissions wake idle workers instead of waiting for the next poll."""
+
+    def test_notify_wakes_waiting_worker(self):
+        wakeup = _Wakeup(multiprocessing.get_context("spawn"))
+        seen = wakeup.seq
+        threading.Timer(0.05, wakeup.notify).start()
+
+        start = time.monotonic()
+        wakeup.wait(seen, timeout=10.0, shutdown=threading.Event())
+        assert time.monotonic() - start < 2.0
+        assert wakeup.seq == seen + 1
+
+    def test_submission_before_wait_is_not_lost(self):
+        wakeup = _Wakeup(multiprocessing.get_context("spawn"))
+        seen = wakeup.seq
+        wakeup.notify()  # Job queued while the worker was still querying
+
+        start = time.monotonic()
+        wakeup.wait(seen, timeout=10.0, shutdown=threading.Event())
+        assert time.monotonic() - start < 0.5
+
+    def test_idle_worker_claims_on_notify(self, app):
+        wakeup = _Wakeup(multiprocessing.get_context("spawn"))
+        shutdown = threading.Event()
+        calls = []
+
+        def fake_process(worker_name, lanes):
+            calls.append(time.monotonic())
+            return False
+
+        with (
+            patch("app.services.job_queue.db"),
+            patch("app.services.job_queue._register_worker"),
+            patch("app.services.job_queue._set_worker_state"),
+            patch("app.services.job_queue._heartbeat_loop"),
+            patch("app.services.job_queue._process_next_job", side_effect=fake_process),
+            patch.dict(app.config, {"JOB_POLL_INTERVAL": 60.0}),
+        ):
+            worker = threading.Thread(
+                target=_worker_loop, args=(app, "t", LANES, shutdown, wakeup), daemon=True
+            )
+            worker.start()
+            while not calls:
+                time.sleep(0.01)
+
+            submitted = time.monotonic()
+            wakeup.notify()
+            while len(calls) < 2 and time.monotonic() - submitted < 5.0:
+                time.sleep(0.01)
+
+            shutdown.set()
+            wakeup.notify()
+            worker.join(timeout=5.0)
+
+        assert len(calls) >= 2
+        assert calls[1] - submitted < 1.0
+        assert not worker.is_alive()
+
+
+class TestQueueLatency:
+    """Submit-to-start latency recorded on leases."""
+
+    def test_claim_records_wait(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        sample_simulation.queued_at = datetime.utcnow() - timedelta(seconds=5)
+        db.session.commit()
+
+        _claim_next_job("w1")
+        lease = JobLease.query.one()
+        assert lease.wait_seconds == pytest.approx(5.0, abs=1.0)
+
+        metrics = get_queue_metrics()
+        assert metrics["count"] == 1
+        assert metrics["p50_s"] == pytest.approx(lease.wait_seconds, abs=1e-3)
+        assert metrics["lanes"][LANE_FAST]["count"] == 1
+
+    def test_unknown_submit_time_excluded(self, db, sample_simulation):
+        sample_simulation.status = STATUS_QUEUED
+        db.session.commit()
+
+        _claim_next_job("w1")
+        assert JobLease.query.one().wait_seconds is None
+        assert get_queue_metrics()["count"] == 0
+
+    def test_fifo_by_submit_time(self, db, engineer_user, sample_steel_grade):
+        older = _queued_sim(db, engineer_user, sample_steel_grade, "Created first")
+        newer = _queued_sim(db, engineer_user, sample_steel_grade, "Created second")
+        older.queued_at = datetime.utcnow()
+        newer.queued_at = older.queued_at - timedelta(seconds=30)
+        db.session.commit()
+
+        assert _claim_next_job("w1") == ("simulation", newer.id)
+
+    def test_run_route_records_submit_time(self, logged_in_client, sample_simulation, db):
+        sample_simulation.status = STATUS_READY
+        db.session.commit()
+
+        logged_in_client.post(f"/simulation/{sample_simulation.id}/run")
+        assert db.session.get(Simulation, sample_simulation.id).queued_at is not None
@@ -1,10 +1,30 @@
-"""Tests for measured data blueprint routes."""
+"""Tests for measured data blueprint routes and thermocouple CSV ingestion."""
 
+import io
 import json
 
+import numpy as np
 import pytest
 
-from app.models import MeasuredData, Simulation
+from app.models import MeasuredData, Simulation, SimulationResult
+from app.services import measured_series
+from app.services.comparison_service import ComparisonService
+from app.services.snapshot_service import SnapshotService
+from app.services.tc_data_parser import parse_tc_csv, parse_tc_head, validate_tc_csv
+
+TC_HEADER = (
+    "date;time;network ID;device type;device ID;sensor;data channel;"
+    "data flags;data sequence number;value;\n"
+)
+
+
+def _tc_csv(rows) -> str:
+    """Logger CSV from (timestamp, sensor, value) rows."""
+    lines = [
+        f"{stamp[:10]};{stamp[11:]};1;logger;7;{sensor};1;0;{i};{value};\n"
+        for i, (stamp, sensor, value) in enumerate(rows)
+    ]
+    return TC_HEADER + "".join(lines)
 
 
 class TestMeasuredIndex:
@@ -156,3 +176,209 @@ class TestMeasuredDelete:
     def test_pagination(self, logged_in_client, sample_simulation, db):
         rv = logged_in_client.get("/measured/?page=1")
         assert rv.status_code == 200
+
+
+class TestTCDataParser:
+    ROWS = [
+        ("2026-03-02 10:00:00", "TC1", "850,5"),
+        ("2026-03-02 10:00:00", "TC2", "820"),
+        ("2026-03-02 10:00:02", "TC1", "840,25"),
+        ("not-a-date 10:00:03", "TC1", "1"),
+        ("2026-03-02 10:00:01", "TC1", "845"),
+        ("2026-03-02 10:00:03", "TC2", "n/a"),
+        ("2026-03-02 10:00:04", "TC2", "790,0"),
+    ]
+
+    def test_parses_channels(self):
+        data = parse_tc_csv(_tc_csv(self.ROWS))
+        assert data["duration_seconds"] == 4.0
+        assert data["start_time"].isoformat() == "2026-03-02T10:00:00"
+        # Sorted by time, comma decimals, malformed rows skipped
+        np.testing.assert_array_equal(data["channels"]["TC1"], [850.5, 845.0, 840.25])
+        np.testing.assert_array_equal(data["channel_times"]["TC1"], [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(data["channel_times"]["TC2"], [0.0, 4.0])
+        np.testing.assert_array_equal(data["times"], data["channel_times"]["TC1"])
+        assert data["statistics"]["TC2"] == {"min": 790.0, "max": 820.0, "avg": 805.0, "count": 2}
+
+    def test_chunks_match_whole_file(self):
+        whole = parse_tc_csv(_tc_csv(self.ROWS))
+        chunked = parse_tc_csv(io.BytesIO(_tc_csv(self.ROWS).encode()), chunk_rows=2)
+        assert chunked["statistics"] == whole["statistics"]
+        for ch in whole["channels"]:
+            np.testing.assert_array_equal(chunked["channels"][ch], whole["channels"][ch])
+            np.testing.assert_array_equal(chunked["channel_times"][ch], whole["channel_times"][ch])
+
+    def test_head_leaves_stream_in_place(self):
+        stream = io.BytesIO(_tc_csv(self.ROWS).encode())
+        head = parse_tc_head(stream, max_rows=2)
+        assert stream.tell() == 0
+        assert head["statistics"]["TC1"]["count"] == 1
+        assert validate_tc_csv(stream)[0]
+        assert stream.tell() == 0
+        assert parse_tc_csv(stream)["statistics"]["TC1"]["count"] == 3
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            ("", "File is empty"),
+            ("date;time;value\n", "Missing required columns"),
+            ("date;time;sensor\n", "Missing 'value' column"),
+            (TC_HEADER, "No valid data"),
+        ],
+    )
+    def test_validate_rejects(self, content, message):
+        is_valid, msg = validate_tc_csv(content)
+        assert not is_valid
+        assert message in msg
+
+
+class TestTCUpload:
+    def _post(self, client, sim, url, content):
+        return client.post(
+            f"/simulation/{sim.id}/{url}",
+            data={"tc_file": (io.BytesIO(content.encode()), "log.csv"), "name": "Run 1"},
+            content_type="multipart/form-data",
+        )
+
+    def test_upload_stores_channels(self, logged_in_client, sample_simulation, db):
+        rows = [
+            (f"2026-03-02 10:00:{s:02d}", f"TC{ch}", f"{900 - 10 * s + ch},5")
+            for s in range(30)
+            for ch in (1, 2)
+        ]
+        rv = self._post(logged_in_client, sample_simulation, "upload-tc", _tc_csv(rows))
+        assert rv.status_code == 302
+        md = MeasuredData.query.one()
+        assert md.available_channels == ["TC1", "TC2"]
+        assert md.channels["TC2"][:2] == [902.5, 892.5]
+        assert md.channel_times["TC1"][-1] == 29.0
+        assert md.duration_seconds == 29.0
+
+    def test_upload_rejects_invalid(self, logged_in_client, sample_simulation, db):
+        self._post(logged_in_client, sample_simulation, "upload-tc", "a;b\n1;2\n")
+        assert MeasuredData.query.count() == 0
+
+    def test_preview(self, logged_in_client, sample_simulation, db):
+        rv = self._post(
+            logged_in_client, sample_simulation, "preview-tc-data", _tc_csv(TestTCDataParser.ROWS)
+        )
+        data = rv.get_json()
+        assert data["valid"]
+        assert data["channels"] == ["TC1", "TC2"]
+        assert data["plot_base64"]
+
+
+class TestMeasuredSeries:
+    @pytest.fixture
+    def measured(self, db, sample_simulation):
+        times = np.arange(0.0, 600.0, 0.5)
+        md = MeasuredData(simulation_id=sample_simulation.id, name="Cycle", process_step="full")
+        md.times = times
+        md.channels = {"TC1": 900.0 - 1.2 * times, "TC2": 880.0 - 1.0 * times}
+        md.channel_times = {"TC1": times, "TC2": times}
+        md.channel_labels_dict = {"TC1": "Core", "TC2": "Surface"}
+        db.session.add(md)
+        db.session.commit()
+        return md
+
+    @pytest.fixture
+    def full_cycle(self, db, sample_simulation):
+        snapshot = SnapshotService.create_snapshot(sample_simulation)
+        times = np.arange(0.0, 600.0, 2.0)
+        result = SimulationResult(
+            simulation_id=sample_simulation.id,
+            snapshot_id=snapshot.id,
+            result_type="full_cycle",
+            location="center",
+            phase="full",
+        )
+        result.set_time_data(times.tolist())
+        result.set_value_data((900.0 - 1.2 * times).tolist())
+        db.session.add(result)
+        db.session.commit()
+        return result
+
+    def test_resample_caps_points(self):
+        times = np.arange(0.0, 100.0, 0.01)
+        grid, temps = measured_series.resample(times, 500.0 + times, max_points=1000)
+        assert grid.size == 1000
+        np.testing.assert_allclose(np.diff(grid), grid[1] - grid[0])
+        # Bin means; the end bins only hold half a step of samples
+        np.testing.assert_allclose(temps[1:-1], 500.0 + grid[1:-1], atol=0.01)
+
+    def test_resample_step_bounded_for_long_logs(self):
+        """A multi-day 1 Hz log keeps 1 s bins, so a quench keeps its peak and rate."""
+        times = np.arange(0.0, 3 * 86400.0)
+        temps = np.full(times.size, 20.0)
+        quench = times >= 100000.0
+        temps[quench] = 20.0 + 830.0 * np.exp(-(times[quench] - 100000.0) / 20.0)
+        temps[times < 100000.0] = 850.0
+        temps[times < 90000.0] = 20.0
+
+        fields = measured_series.preprocess_channel(times, temps)
+        grid = fields["time"]
+        assert grid[1] - grid[0] <= measured_series.RESAMPLE_MAX_STEP
+        assert fields["temp"].max() == pytest.approx(850.0)
+        # Steepest cooling of the quench is -830/20 K/s at its start
+        assert fields["dtdt"].min() == pytest.approx(-830.0 / 20.0, rel=0.05)
+
+    def test_upload_preprocesses(self, logged_in_client, sample_simulation, db):
+        rows = [
+            (f"2026-03-02 10:{s // 60:02d}:{s % 60:02d}", "TC1", f"{900 - 2 * s}")
+            for s in range(120)
+        ]
+        TestTCUpload()._post(logged_in_client, sample_simulation, "upload-tc", _tc_csv(rows))
+        md = MeasuredData.query.one()
+        assert md.series_data is not None
+        fields = measured_series.unpack_channels(md.series_data)["TC1"]
+        assert set(fields) == set(measured_series.FIELDS)
+        np.testing.assert_allclose(fields["dtdt"], -2.0, atol=1e-6)
+
+    def test_backfills_on_read(self, measured, db):
+        assert measured.series_data is None
+        series = measured_series.channel_series(measured)
+        assert list(series) == ["TC1", "TC2"]
+        db.session.expire_all()
+        assert MeasuredData.query.one().series_data is not None
+        channels = measured_series.plot_channels([measured])
+        assert [c["name"] for c in channels] == ["Core", "Surface"]
+        np.testing.assert_allclose(channels[1]["dtdt_smooth"], -1.0, atol=1e-4)
+
+    def test_offset_detected_once_per_snapshot(
+        self, measured, full_cycle, db, sample_simulation, monkeypatch
+    ):
+        calls = []
+        detect = ComparisonService._detect_time_offset
+
+        def counting(*args):
+            calls.append(args)
+            return detect(*args)
+
+        monkeypatch.setattr(ComparisonService, "_detect_time_offset", staticmethod(counting))
+        first = ComparisonService.compare_simulation(sample_simulation)
+        second = ComparisonService.compare_simulation(sample_simulation)
+        assert len(calls) == 1
+        assert second.time_offset == first.time_offset
+        assert measured.offset_snapshot_id == full_cycle.snapshot_id
+
+        # A rerun (new snapshot) detects the offset again
+        full_cycle.snapshot_id = SnapshotService.create_snapshot(sample_simulation).id
+        db.session.commit()
+        assert ComparisonService.measured_offset(measured, full_cycle) == first.time_offset
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "measured-tc-plot",
+            "measured-dtdt-plot",
+            "measured-dtdt-temp-plot/full",
+            "comparison-plot",
+            "comparison-plot-channel/TC1",
+            "plot-data/measured_dtdt?step=full",
+            "plot-data/comparison_channel?channel=TC1",
+        ],
+    )
+    def test_plots_render(self, logged_in_client, sample_simulation, measured, full_cycle, url):
+        rv = logged_in_client.get(f"/simulation/{sample_simulation.id}/{url}")
+        assert rv.status_code == 200
@@ -1,7 +1,10 @@
 """Tests for database models — validates fixtures and both DB binds."""
 
+import importlib.util
 import json
+from pathlib import Path
 
+import numpy as np
 import pytest
 
 from app.models import (
@@ -19,6 +22,21 @@ from app.models import (
     SystemSetting,
     User,
 )
+from app.models.simulation import (
+    SERIES_LOD_POINTS,
+    SimulationResult,
+    minmax_indices,
+    unpack_series,
+)
+
+
+def _load_migration(filename):
+    """Import a migration module by file name (names start with a digit)."""
+    path = Path(__file__).resolve().parents[1] / "migrations" / "versions" / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
 class TestUserModel:
@@ -216,3 +234,165 @@ class TestAuditLog:
         assert entry.action_label == "Login"
         entry2 = AuditLog(username="test", action="unknown")
         assert entry2.action_label == "unknown"
+
+
+class TestSimulationResultSeries:
+    def _result(self, db, simulation, **kwargs):
+        result = SimulationResult(
+            simulation_id=simulation.id, result_type="full_cycle", phase="full", **kwargs
+        )
+        db.session.add(result)
+        return result
+
+    def test_set_series_round_trip(self, db, sample_simulation):
+        times = np.linspace(0.0, 36000.0, 1001)
+        center = np.linspace(850.0, 20.0, 1001)
+        result = self._result(db, sample_simulation)
+        result.set_series(times, center, {"center": center, "surface": center - 5.0})
+        db.session.commit()
+        db.session.expire_all()
+
+        row = db.session.get(SimulationResult, result.id)
+        assert row.time_data is None and row.value_data is None
+        np.testing.assert_array_equal(row.time_series, times)
+        np.testing.assert_allclose(row.value_series, center, rtol=1e-6)
+        assert set(row.position_series) == {"center", "surface"}
+        np.testing.assert_allclose(row.position_series["surface"], center - 5.0, rtol=1e-6)
+        assert row.time_array == times.tolist()
+        assert len(row.value_array) == 1001
+
+    def test_blob_dtypes(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_series([0.0, 1.0], [800.0, 700.0], {"center": [800.0, 700.0]})
+        arrays = unpack_series(result.series_data)
+        assert arrays["time"].dtype == np.float64
+        assert arrays["value"].dtype == np.float32
+        assert arrays["pos_center"].dtype == np.float32
+
+    def test_legacy_json_fallback(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_time_data([0.0, 1.0, 2.0])
+        result.set_value_data([850.0, 800.0, 760.0])
+        result.set_data({"positions": ["center"], "center": [850.0, 801.0, 762.0]})
+        db.session.commit()
+
+        assert result.series_data is None
+        np.testing.assert_array_equal(result.time_series, [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(result.center_series, [850.0, 801.0, 762.0])
+        assert result.value_array == [850.0, 800.0, 760.0]
+
+    def test_center_series_defaults_to_values(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_series([0.0, 1.0], [800.0, 700.0])
+        assert result.position_series == {}
+        np.testing.assert_allclose(result.center_series, [800.0, 700.0])
+
+    def test_set_time_data_repacks_blob(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_series([0.0, 1.0], [800.0, 700.0], {"center": [800.0, 700.0]})
+        result.set_time_data([0.0, 2.0])
+        assert result.time_data is None
+        np.testing.assert_array_equal(result.time_series, [0.0, 2.0])
+        np.testing.assert_allclose(result.position_series["center"], [800.0, 700.0])
+
+    def test_legacy_series_to_blob_moves_positions(self):
+        migration = _load_migration("006_add_result_series_blob.py")
+        blob, data = migration.legacy_series_to_blob(
+            "[0, 1]",
+            "[850, 800]",
+            json.dumps({"positions": ["center"], "center": [850, 800], "solver_info": {"n": 3}}),
+        )
+        arrays = unpack_series(blob)
+        np.testing.assert_allclose(arrays["pos_center"], [850.0, 800.0])
+        assert json.loads(data) == {"positions": ["center"], "solver_info": {"n": 3}}
+
+    def test_migrate_legacy_series(self, db, sample_simulation):
+        migration = _load_migration("006_add_result_series_blob.py")
+        legacy = self._result(db, sample_simulation, time_data="[0, 1]", value_data="[850, 800]")
+        broken = self._result(db, sample_simulation, time_data="not json", value_data="[1]")
+        db.session.commit()
+
+        with db.engines["materials"].connect() as conn:
+            assert migration.migrate_legacy_series(conn, batch_size=1) == 1
+            conn.commit()
+        db.session.expire_all()
+
+        assert legacy.time_data is None and legacy.series_data is not None
+        np.testing.assert_allclose(legacy.value_series, [850.0, 800.0])
+        assert broken.series_data is None and broken.time_data == "not json"
+
+    def test_long_series_store_levels(self, db, sample_simulation):
+        times = np.arange(40000) * 0.1
+        center = 850.0 * np.exp(-times / 300.0) + 20.0
+        center[12345] += 200.0  # one-sample spike
+        result = self._result(db, sample_simulation)
+        result.set_series(times, center, {"center": center, "surface": center - 5.0})
+
+        members = unpack_series(result.series_data)
+        assert {"lod0_time", "lod0_value", "lod0_pos_center", "lod1_time"} <= set(members)
+        times_0, values_0, positions_0 = result.series_level(SERIES_LOD_POINTS)
+        assert len(times_0) <= SERIES_LOD_POINTS
+        assert set(positions_0) == {"center", "surface"}
+        assert values_0.max() == pytest.approx(center.max(), rel=1e-6)
+        assert times_0[0] == 0.0 and times_0[-1] == times[-1]
+        # A larger budget picks the finer level
+        assert len(result.series_level(4 * SERIES_LOD_POINTS)[0]) > len(times_0)
+
+    def test_short_series_have_no_levels(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_series(np.arange(100.0), np.linspace(850.0, 20.0, 100))
+        assert result.series_level(SERIES_LOD_POINTS) is None
+        assert not any(name.startswith("lod") for name in unpack_series(result.series_data))
+
+    def test_series_window(self, db, sample_simulation):
+        times = np.arange(40000) * 0.1
+        center = 850.0 * np.exp(-times / 300.0) + 20.0
+        result = self._result(db, sample_simulation)
+        result.set_series(times, center, {"center": center})
+
+        # A 30 s window fits the budget: full resolution, plus one edge sample each side
+        window_times, values, positions = result.series_window(100.0, 130.0, SERIES_LOD_POINTS)
+        assert window_times[0] == pytest.approx(99.9)
+        assert window_times[-1] == pytest.approx(130.1)
+        assert np.allclose(np.diff(window_times), 0.1)
+        assert len(values) == len(positions["center"]) == len(window_times)
+
+        # The whole history comes from a min/max level within the budget
+        wide_times, _, wide = result.series_window(-np.inf, np.inf, SERIES_LOD_POINTS)
+        assert len(wide_times) <= SERIES_LOD_POINTS
+        assert wide["center"][0] == pytest.approx(center[0], rel=1e-6)
+
+        # Without a budget, always the full series
+        assert len(result.series_window(0.0, 3000.0)[0]) == 30002
+
+    def test_series_window_legacy_row(self, db, sample_simulation):
+        result = self._result(db, sample_simulation)
+        result.set_time_data([0.0, 1.0, 2.0, 3.0, 4.0])
+        result.set_value_data([900.0, 800.0, 700.0, 600.0, 500.0])
+        times, values, positions = result.series_window(1.5, 2.5, 10)
+        assert times.tolist() == [1.0, 2.0, 3.0]
+        assert values.tolist() == [800.0, 700.0, 600.0]
+        assert positions == {}
+
+
+class TestMinMaxIndices:
+    def test_short_series_unchanged(self):
+        np.testing.assert_array_equal(minmax_indices(np.arange(10.0), 20), np.arange(10))
+
+    def test_keeps_extremes_and_ends(self):
+        values = np.sin(np.linspace(0.0, 60.0, 50001))
+        values[777] = 5.0
+        values[31313] = -5.0
+        keep = minmax_indices(values, 500)
+        assert len(keep) <= 500
+        assert {0, 777, 31313, 50000} <= set(keep.tolist())
+        assert np.all(np.diff(keep) > 0)
+
+    def test_several_series_within_budget(self):
+        x = np.linspace(0.0, 100.0, 30001)
+        series = np.vstack([np.sin(x), np.cos(3 * x), np.sin(7 * x)])
+        keep = minmax_indices(series, 1000)
+        assert len(keep) <= 1000
+        for row in series:
+            assert row[keep].max() == row.max()
+            assert row[keep].min() == row.min()
@@ -38,6 +38,7 @@ from app.services.phase_transformation.jmak_model import (
 )
 from app.services.phase_transformation.martensite_model import KoistinenMarburgerModel
 from app.services.phase_transformation.parameter_calibration import (
+    CCTStartObjective,
     calibrate_b_function,
     calibrate_from_cct,
     calibrate_isothermal,
@@ -45,7 +46,9 @@ from app.services.phase_transformation.parameter_calibration import (
 )
 from app.services.phase_transformation.scheil_additivity import (
     CoolingTransformationResult,
+    FieldTransformationResult,
     calculate_cct_transformation,
+    calculate_cct_transformation_field,
     calculate_scheil_integral,
 )
 from app.services.phase_transformation.ttt_generator import (
@@ -500,6 +503,98 @@ class TestScheilAdditivity:
             assert T_start < 727  # Below Ae1
 
 
+class TestJMAKBValues:
+    """Vectorized b(T) evaluation."""
+
+    @pytest.mark.parametrize(
+        "b_func",
+        [
+            gaussian_b_function(b_max=0.01, t_nose=550, sigma=50),
+            arrhenius_b_function(b0=1e6, Q=150000),
+            polynomial_b_function([0.01, -1e-5, 1e-9]),
+            lambda T: 1e-3 * max(600 - T, 0.0),  # no vectorized form
+        ],
+    )
+    def test_matches_scalar_b_func(self, b_func):
+        model = JMAKModel(n=2.0, b_func=b_func)
+        T = np.array([[-300.0, 200.0, 450.0], [550.0, 700.0, 900.0]])
+        expected = [[max(b_func(x), 0.0) for x in row] for row in T]
+        np.testing.assert_allclose(model.b_values(T), expected, rtol=1e-12)
+
+    def test_zero_outside_temp_range(self):
+        model = JMAKModel(n=2.0, b_func=gaussian_b_function(0.01, 550, 50), temp_range=(500, 600))
+        b = model.b_values(np.array([450.0, 550.0, 650.0]))
+        assert b[0] == 0.0 and b[2] == 0.0
+        assert b[1] == pytest.approx(0.01)
+
+
+class TestScheilAdditivityField:
+    """Array Scheil engine over a (time, position) field."""
+
+    @pytest.fixture
+    def models_and_temps(self):
+        jmak = {
+            "ferrite": JMAKModel(n=1.2, b_func=gaussian_b_function(2e-3, 680, 40)),
+            "pearlite": JMAKModel(n=1.5, b_func=gaussian_b_function(1e-4, 580, 35)),
+            "bainite": JMAKModel(n=2.5, b_func=gaussian_b_function(1e-5, 420, 50)),
+        }
+        mart = KoistinenMarburgerModel(ms=320, mf=105, alpha=0.011)
+        temps = {"Ae1": 727, "Ae3": 800, "Bs": 550, "Ms": 320}
+        return jmak, mart, temps
+
+    @pytest.fixture
+    def cooling_field(self):
+        """Positions cooling from 900 deg C at 0.2 to 100 K/s."""
+        times = np.linspace(0, 2000, 800)
+        rates = np.logspace(np.log10(0.2), 2, 12)
+        return times, np.maximum(900 - np.outer(times, rates), 25.0)
+
+    def test_matches_scalar_per_position(self, models_and_temps, cooling_field):
+        jmak, mart, temps = models_and_temps
+        times, field = cooling_field
+        result = calculate_cct_transformation_field(
+            times, field, jmak, mart, temps, store_history=True
+        )
+        assert isinstance(result, FieldTransformationResult)
+        assert result.n_positions == field.shape[1]
+        for j in range(field.shape[1]):
+            scalar = calculate_cct_transformation(times, field[:, j], jmak, mart, temps)
+            for phase, history in scalar.phase_fractions.items():
+                np.testing.assert_allclose(result.phase_fractions[phase][:, j], history, atol=1e-12)
+                assert result.fractions_at(j)[phase] == pytest.approx(
+                    scalar.final_fractions[phase], abs=1e-12
+                )
+
+    def test_spans_diffusional_to_martensitic(self, models_and_temps, cooling_field):
+        jmak, mart, temps = models_and_temps
+        times, field = cooling_field
+        final = calculate_cct_transformation_field(times, field, jmak, mart, temps).final_fractions
+        assert final["martensite"][-1] > 0.9
+        assert final["martensite"][0] < 0.1
+        total = sum(final.values())
+        np.testing.assert_allclose(total, 1.0, atol=1e-6)
+        assert not calculate_cct_transformation_field(
+            times, field, jmak, mart, temps
+        ).phase_fractions
+
+    def test_single_curve_input(self, models_and_temps):
+        jmak, mart, temps = models_and_temps
+        times = np.linspace(0, 1000, 300)
+        temperatures = 900 - 0.8 * times
+        result = calculate_cct_transformation_field(times, temperatures, jmak, mart, temps)
+        scalar = calculate_cct_transformation(times, temperatures, jmak, mart, temps)
+        assert result.n_positions == 1
+        for phase, value in scalar.final_fractions.items():
+            assert result.final_fractions[phase][0] == pytest.approx(value, abs=1e-12)
+
+    def test_without_martensite_model(self, models_and_temps):
+        jmak, _, temps = models_and_temps
+        times = np.linspace(0, 100, 200)
+        field = np.column_stack([900 - 8.5 * times, 900 - 2.0 * times])
+        result = calculate_cct_transformation_field(times, field, jmak, None, temps)
+        assert np.all(result.final_fractions["martensite"] == 0.0)
+
+
 # ===================================================================
 # TTT Generator Tests
 # ===================================================================
@@ -848,6 +943,105 @@ class TestParameterCalibration:
         assert b_params["b_max"] > 0
         assert b_params["sigma"] > 0
 
+    def test_cct_objective_matches_scalar_loop(self):
+        """Vectorized objective equals stepping each cooling curve in turn."""
+        rates = [0.5, 2.0, 10.0, 50.0]
+        starts = [650.0, 600.0, 550.0, 500.0]
+        params = np.array([1.8, 2e-3, 600.0, 60.0])
+
+        expected = 0.0
+        model = JMAKModel(n=params[0], b_func=gaussian_b_function(*params[1:]))
+        for rate, start in zip(rates, starts, strict=True):
+            times = np.linspace(0, (900 - 25) / rate, 500)
+            for t, T in zip(times[1:], 900 - rate * times[1:], strict=True):
+                if model.fraction_transformed(t, T) >= 0.01:
+                    expected += (T - start) ** 2
+                    break
+
+        objective = CCTStartObjective(rates, starts)
+        assert objective(params) == pytest.approx(expected, rel=1e-9)
+
+    def test_cct_objective_population(self):
+        """A (4, S) population scores each column like a single call."""
+        objective = CCTStartObjective([0.5, 2.0, 10.0], [650.0, 600.0, 550.0])
+        population = np.array(
+            [
+                [1.0, 2.0, 3.0, -1.0],
+                [1e-3, 1e-5, 1e-1, 1e-3],
+                [600.0, 450.0, 700.0, 600.0],
+                [50.0, 80.0, 30.0, 50.0],
+            ]
+        )
+        errors = objective(population)
+        assert errors.shape == (4,)
+        for i in range(4):
+            assert errors[i] == pytest.approx(objective(population[:, i]))
+        assert errors[3] == 1e10
+
+    def test_threaded_objective_matches_vectorized(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.phase_transformation.parameter_calibration import ThreadedObjective
+
+        objective = CCTStartObjective([0.5, 2.0, 10.0], [650.0, 600.0, 550.0])
+        rng = np.random.default_rng(0)
+        population = np.vstack(
+            [
+                rng.uniform(0.5, 4.0, 7),
+                10.0 ** rng.uniform(-6, 0, 7),
+                rng.uniform(200, 800, 7),
+                rng.uniform(20, 300, 7),
+            ]
+        )
+        with ThreadPoolExecutor(3) as pool:
+            threaded = ThreadedObjective(objective, pool, 3)
+            np.testing.assert_array_equal(threaded(population), objective(population))
+            assert threaded(population[:, 0]) == objective(population[:, 0])
+
+    def test_calibrate_from_cct_workers_match_single(self):
+        """Thread workers give the same fit as the single vectorized call."""
+        cct_data = [
+            {"cooling_rate": 0.5, "start_temperature": 650},
+            {"cooling_rate": 2, "start_temperature": 600},
+            {"cooling_rate": 10, "start_temperature": 550},
+            {"cooling_rate": 50, "start_temperature": 500},
+        ]
+        single = calibrate_from_cct(cct_data, patience=5)
+        threaded = calibrate_from_cct(cct_data, workers=4, patience=5)
+        assert threaded[0] == pytest.approx(single[0])
+        assert threaded[2] == pytest.approx(single[2])
+
+    def test_calibrate_from_cct_reports_progress(self):
+        cct_data = [
+            {"cooling_rate": 0.5, "start_temperature": 650},
+            {"cooling_rate": 2, "start_temperature": 600},
+            {"cooling_rate": 10, "start_temperature": 550},
+        ]
+        calls = []
+
+        def progress(fraction, best):
+            calls.append((fraction, best))
+            return len(calls) >= 3
+
+        calibrate_from_cct(cct_data, progress_callback=progress)
+        assert len(calls) == 3
+        assert calls[0][0] == pytest.approx(1 / 200)
+        assert calls[2][1] <= calls[0][1]
+
+    def test_calibrate_from_cct_patience_stops_early(self):
+        cct_data = [
+            {"cooling_rate": 0.5, "start_temperature": 650},
+            {"cooling_rate": 2, "start_temperature": 600},
+            {"cooling_rate": 10, "start_temperature": 550},
+        ]
+        calls = []
+        calibrate_from_cct(
+            cct_data, progress_callback=lambda f, best: calls.append(best), patience=5
+        )
+        assert len(calls) < 200
+        # Stopped because the last 5 generations brought no real improvement
+        assert calls[-1] >= calls[-6] * (1 - 1e-3)
+
     def test_calibrate_from_cct_too_few_points(self):
         with pytest.raises(ValueError, match="at least 3"):
             calibrate_from_cct(
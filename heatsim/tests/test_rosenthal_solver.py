@@ -1,8 +1,11 @@
 """Tests for Rosenthal analytical solver t8/5 edge cases."""
 
+import math
 from unittest.mock import patch
 
 import numpy as np
+import pytest
+from scipy.special import k0
 
 from app.services.rosenthal_solver import RosenthalParams, RosenthalSolver
 
@@ -40,3 +43,128 @@ class TestT85AtPoint:
         temps = np.full(6, 600.0)
         with patch.object(RosenthalSolver, "thermal_cycle_at_point", return_value=(times, temps)):
             assert solver.t8_5_at_point(y=0.002) is None
+
+
+# Scalar reference: the per-point loops the vectorized solver replaced
+
+
+def _reference_temperature(p, xi, y, z=0.0, use_2d=False):
+    if use_2d:
+        d = p.plate_thickness
+        R = math.sqrt(xi**2 + y**2)
+        if R < 1e-6:
+            return min(p.T0 + p.Q / (2 * math.pi * p.k * d * 1e-6), 1500.0)
+        arg_bessel = p.v * R / (2 * p.alpha)
+        if arg_bessel > 500:
+            return p.T0
+        exponent = max(-p.v * xi / (2 * p.alpha), -500.0)
+        return p.T0 + (p.Q / (2 * math.pi * p.k * d)) * float(k0(arg_bessel)) * math.exp(exponent)
+    R = math.sqrt(xi**2 + y**2 + z**2)
+    if R < 1e-6:
+        return min(p.T0 + p.Q / (2 * math.pi * p.k * 1e-6), 1500.0)
+    exponent = max(-p.v * (R + xi) / (2 * p.alpha), -500.0)
+    return p.T0 + (p.Q / (2 * math.pi * p.k)) * (1.0 / R) * math.exp(exponent)
+
+
+def _reference_peak(p, y, z=0.0, use_2d=False):
+    if y < 1e-6 and z < 1e-6:
+        return 1500.0
+    xi_search = np.linspace(-max(0.05, 5 * abs(y)), max(0.001, abs(y)), 500)
+    return max(_reference_temperature(p, xi, y, z, use_2d) for xi in xi_search)
+
+
+def _reference_t8_5(p, y, z=0.0, use_2d=False):
+    times = np.linspace(0, 300.0, 500)
+    xi_arr = -p.v * (times - 300.0 * 0.15)
+    temps = np.array([_reference_temperature(p, xi, y, z, use_2d) for xi in xi_arr])
+    if np.max(temps) < 800:
+        return None
+    peak = int(np.argmax(temps))
+    cool_times, cool_temps = times[peak:], temps[peak:]
+
+    def crossing(level):
+        for i in range(len(cool_temps) - 1):
+            if cool_temps[i] >= level and cool_temps[i + 1] < level:
+                frac = (level - cool_temps[i + 1]) / (cool_temps[i] - cool_temps[i + 1])
+                return cool_times[i + 1] + frac * (cool_times[i] - cool_times[i + 1])
+        return None
+
+    t_800 = crossing(800)
+    if t_800 is None:
+        t_800 = cool_times[0] if cool_temps[0] >= 800 else None
+    t_500 = crossing(500)
+    if t_800 is None or t_500 is None or t_500 <= t_800:
+        return None
+    return t_500 - t_800
+
+
+class TestVectorized:
+    def _solver(self):
+        return RosenthalSolver(RosenthalParams())
+
+    @pytest.mark.parametrize("use_2d", [False, True])
+    def test_grid_matches_scalar_reference(self, use_2d):
+        solver = self._solver()
+        p = solver.params
+        y = np.array([0.0, 0.001, 0.003, 0.006])[:, np.newaxis]
+        z = np.array([0.0, 0.002])[np.newaxis, :]
+
+        peaks = solver.peak_temperatures(y, z, use_2d=use_2d)
+        t85 = solver.t8_5(y, z, use_2d=use_2d)
+        assert peaks.shape == t85.shape == (4, 2)
+        for i in range(4):
+            for j in range(2):
+                expected = _reference_peak(p, y[i, 0], z[0, j], use_2d)
+                assert peaks[i, j] == pytest.approx(expected, rel=1e-9)
+                reference = _reference_t8_5(p, y[i, 0], z[0, j], use_2d)
+                if reference is None:
+                    assert np.isnan(t85[i, j])
+                else:
+                    assert t85[i, j] == pytest.approx(reference, rel=1e-9)
+
+    def test_temperature_matches_scalar_reference(self):
+        solver = self._solver()
+        p = solver.params
+        xi = np.array([-0.05, -0.01, -1e-7, 0.0, 0.002, 0.01])
+        for y in (0.0, 0.002, 0.01):
+            temps_3d = solver.temperature_3d(xi, y, 0.001)
+            temps_2d = solver.temperature_2d(xi, y)
+            for k, x in enumerate(xi):
+                assert temps_3d[k] == pytest.approx(_reference_temperature(p, x, y, 0.001))
+                assert temps_2d[k] == pytest.approx(_reference_temperature(p, x, y, use_2d=True))
+
+    def test_thermal_cycles_stack_points(self):
+        solver = self._solver()
+        times, temps = solver.thermal_cycles(np.array([0.002, 0.005]), n_points=50)
+        assert temps.shape == (2, 50)
+        _, single = solver.thermal_cycle_at_point(0.005, n_points=50)
+        np.testing.assert_array_equal(temps[1], single)
+
+    def test_temperature_broadcasts(self):
+        solver = self._solver()
+        xi = np.array([-0.01, 0.0, 0.01])
+        temps = solver.temperature_3d(xi, 0.002, 0.0)
+        assert temps.shape == (3,)
+        assert temps[1] == solver.temperature_3d(0.0, 0.002, 0.0)
+        assert isinstance(solver.temperature_2d(0.0, 0.002), float)
+
+    def test_haz_boundaries_ordered(self):
+        solver = self._solver()
+        fz, cghaz, fghaz, ichaz = solver.haz_boundary_distances([1500, 1100, 900, 727])
+        assert 0 < fz < cghaz < fghaz < ichaz
+        peak = solver.peak_temperature_at_distance(np.array([fghaz]))[0]
+        assert peak == pytest.approx(900, abs=1.0)
+        assert solver.haz_boundary_distance(900) == fghaz
+        assert solver.haz_boundary_distance(1e5) == 0.0
+
+    def test_stacked_params_batch(self):
+        heat_inputs = [RosenthalParams(Q=q) for q in (2000.0, 3000.0, 4000.0)]
+        batch = RosenthalSolver(RosenthalParams.stack(heat_inputs))
+        distances = np.array([0.002, 0.004, 0.008])
+
+        peaks = batch.peak_temperatures(distances)
+        assert peaks.shape == (3, 3)
+        for params, row in zip(heat_inputs, peaks, strict=True):
+            np.testing.assert_array_equal(row, RosenthalSolver(params).peak_temperatures(distances))
+        # More heat input, hotter at every distance
+        assert np.all(np.diff(peaks, axis=0) > 0)
@@ -3,21 +3,28 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from app.models import (
     GEOMETRY_CYLINDER,
     STATUS_COMPLETED,
     STATUS_DRAFT,
+    STATUS_QUEUED,
     STATUS_READY,
     STATUS_RUNNING,
     AuditLog,
     HeatTreatmentTemplate,
     Simulation,
+    SimulationBatch,
     SimulationResult,
+    SimulationSnapshot,
     SteelComposition,
     SteelGrade,
 )
+from app.services.batch_runner import settle_duplicates
+from app.services.job_queue import _claim_next_job
+from app.services.snapshot_service import SnapshotService
 
 
 class TestSimulationIndex:
@@ -621,6 +628,111 @@ class TestPlotData:
         assert len(data["traces"]) == 1  # legacy row: center only
         assert data["traces"][0]["name"] == "Center"
 
+    def test_phase_curve_binary_series(self, db, logged_in_client, completed_sim):
+        times = np.arange(50) * 2.0
+        center = 900.0 - 15.0 * np.arange(50)
+        heating = SimulationResult(
+            simulation_id=completed_sim.id,
+            result_type="cooling_curve",
+            location="all",
+            phase="heating",
+        )
+        heating.set_series(times, center, {"center": center, "surface": center - 20.0})
+        heating.set_data({"positions": ["center", "surface"]})
+        db.session.add(heating)
+        db.session.commit()
+
+        rv = logged_in_client.get(
+            f"/simulation/{completed_sim.id}/plot-data/phase_curve?phase=heating"
+        )
+        assert rv.status_code == 200
+        traces = {t["name"]: t for t in rv.get_json()["traces"]}
+        assert set(traces) == {"Center", "Surface"}
+        assert traces["Surface"]["y"][0] == pytest.approx(880.0)
+
+    def test_long_quench_keeps_peaks(self, db, logged_in_client, completed_sim):
+        from app.services.plot_data import MAX_TRACE_POINTS
+
+        # 0.1 s steps over an hour: a sharp surface quench then a slow tail
+        times = np.arange(36000) * 0.1
+        surface = 25.0 + 800.0 * np.exp(-times / 2.0)
+        center = 25.0 + 800.0 * np.exp(-times / 600.0)
+        quench = SimulationResult(
+            simulation_id=completed_sim.id,
+            result_type="cooling_curve",
+            location="all",
+            phase="tempering",
+        )
+        quench.set_series(times, center, {"center": center, "surface": surface})
+        quench.set_data({"positions": ["center", "surface"]})
+        db.session.add(quench)
+        db.session.commit()
+
+        base = f"/simulation/{completed_sim.id}/plot-data"
+        traces = {
+            t["name"]: t
+            for t in logged_in_client.get(f"{base}/phase_curve?phase=tempering").get_json()[
+                "traces"
+            ]
+        }
+        assert len(traces["Surface"]["x"]) <= MAX_TRACE_POINTS
+        assert traces["Surface"]["y"][0] == pytest.approx(825.0)
+
+        # dT/dt extreme of the first 0.1 s step survives downsampling
+        dtdt = logged_in_client.get(f"{base}/dtdt_time?phase=tempering").get_json()
+        surface_rate = next(t for t in dtdt["traces"] if t["name"] == "Surface")
+        assert len(surface_rate["y"]) <= MAX_TRACE_POINTS
+        expected = (surface[1] - surface[0]) / 0.1
+        assert min(surface_rate["y"]) == pytest.approx(expected, rel=1e-3)
+
+    def test_time_window_full_resolution(self, db, logged_in_client, completed_sim):
+        # 10 h of 0.1 s samples: the first 30 s come back at full resolution
+        times = np.arange(360000) * 0.1
+        center = 25.0 + 800.0 * np.exp(-times / 600.0)
+        surface = 25.0 + 800.0 * np.exp(-times / 2.0)
+        row = SimulationResult(
+            simulation_id=completed_sim.id,
+            result_type="cooling_curve",
+            location="all",
+            phase="tempering",
+        )
+        row.set_series(times, center, {"center": center, "surface": surface})
+        row.set_data({"positions": ["center", "surface"]})
+        db.session.add(row)
+        db.session.commit()
+
+        base = f"/simulation/{completed_sim.id}/plot-data"
+        whole = logged_in_client.get(f"{base}/phase_curve?phase=tempering").get_json()
+        assert whole["range_query"] is True
+        coarse = next(t for t in whole["traces"] if t["name"] == "Surface")
+        assert sum(1 for x in coarse["x"] if x <= 30.0) < 100
+
+        zoomed = logged_in_client.get(
+            f"{base}/phase_curve?phase=tempering&t_min=0&t_max=30"
+        ).get_json()
+        surface_trace = next(t for t in zoomed["traces"] if t["name"] == "Surface")
+        assert len(surface_trace["x"]) == 302
+        assert surface_trace["x"][:3] == pytest.approx([0.0, 0.1, 0.2])
+        assert surface_trace["x"][-1] == pytest.approx(30.1)
+
+        rates = logged_in_client.get(
+            f"{base}/dtdt_time?phase=tempering&t_min=10&t_max=20"
+        ).get_json()
+        surface_rate = next(t for t in rates["traces"] if t["name"] == "Surface")
+        # 9.9..20.1 s: 103 samples, 102 step midpoints
+        assert len(surface_rate["x"]) == 102
+        assert surface_rate["x"][0] == pytest.approx(9.95)
+        assert surface_rate["x"][-1] == pytest.approx(20.05)
+
+    def test_full_cycle_time_window(self, logged_in_client, completed_sim):
+        rv = logged_in_client.get(
+            f"/simulation/{completed_sim.id}/plot-data/full_cycle?t_min=10&t_max=20"
+        )
+        assert rv.status_code == 200
+        center = next(t for t in rv.get_json()["traces"] if t["name"] == "Center")
+        # 2 s samples: 10..20 s plus one sample either side
+        assert center["x"] == [8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0]
+
     def test_dtdt_time_json(self, logged_in_client, completed_sim):
         rv = logged_in_client.get(
             f"/simulation/{completed_sim.id}/plot-data/dtdt_time?phase=quenching"
@@ -772,7 +884,399 @@ class TestBatchDelete:
         assert rv.status_code == 200
 
 
+def _ready_clones(db, sim, n):
+    """n ready copies of sim with the same inputs."""
+    clones = []
+    for i in range(n):
+        clone = Simulation(
+            name=f"{sim.name} {i}",
+            steel_grade_id=sim.steel_grade_id,
+            user_id=sim.user_id,
+            geometry_type=sim.geometry_type,
+            geometry_config=sim.geometry_config,
+            heat_treatment_config=sim.heat_treatment_config,
+            solver_config=sim.solver_config,
+            process_type=sim.process_type,
+            status=STATUS_READY,
+        )
+        db.session.add(clone)
+        clones.append(clone)
+    db.session.commit()
+    return clones
+
+
+class TestBatchRun:
+    def _submit(self, client, sims):
+        return client.post("/simulation/batch-run", data={"sim_ids": [str(s.id) for s in sims]})
+
+    def test_queues_batch_without_running(self, logged_in_client, sample_simulation, db):
+        sims = _ready_clones(db, sample_simulation, 3)
+        sims[2].set_geometry({"radius": 0.02, "length": 0.1})
+        db.session.commit()
+
+        rv = self._submit(logged_in_client, sims)
+        batch = SimulationBatch.query.one()
+        assert rv.status_code == 302
+        assert rv.location.endswith(f"/simulation/batch/{batch.id}")
+        assert [s.status for s in batch.members] == [STATUS_QUEUED] * 3
+        assert SimulationSnapshot.query.count() == 0
+
+        # Identical inputs: the second waits on the first and is never claimed
+        assert sims[1].duplicate_of_id == sims[0].id
+        assert sims[2].duplicate_of_id is None
+        assert sims[0].config_hash == sims[1].config_hash != sims[2].config_hash
+        claimed = {_claim_next_job()[1], _claim_next_job()[1]}
+        assert claimed == {sims[0].id, sims[2].id}
+        assert _claim_next_job() is None
+
+    def test_skips_unready(self, logged_in_client, sample_simulation, db):
+        rv = self._submit(logged_in_client, [sample_simulation])
+        assert rv.status_code == 302
+        assert SimulationBatch.query.count() == 0
+        assert sample_simulation.status == STATUS_DRAFT
+
+    def test_duplicates_receive_results(self, logged_in_client, sample_simulation, db):
+        sims = _ready_clones(db, sample_simulation, 3)
+        self._submit(logged_in_client, sims)
+        run = sims[0]
+        snapshot = SnapshotService.create_snapshot(run)
+        db.session.add(
+            SimulationResult(
+                simulation_id=run.id,
+                snapshot_id=snapshot.id,
+                result_type="full_cycle",
+                phase="full",
+                t_800_500=12.5,
+            )
+        )
+        SnapshotService.finalize_snapshot(snapshot, "completed")
+        snapshot.t_800_500 = 12.5
+        run.status = STATUS_COMPLETED
+        db.session.commit()
+
+        assert settle_duplicates(run.id) == 2
+        for dup in sims[1:]:
+            assert dup.status == STATUS_COMPLETED
+            dup_snapshot = dup.snapshots.filter_by(status="completed").one()
+            (row,) = SimulationResult.query.filter_by(snapshot_id=dup_snapshot.id).all()
+            assert row.simulation_id == dup.id
+            assert row.t_800_500 == 12.5
+
+        rv = logged_in_client.get(f"/simulation/batch/{sims[0].batch_id}/status")
+        data = rv.get_json()
+        assert data["status"] == STATUS_COMPLETED
+        assert (data["finished"], data["total"], data["percent"]) == (3, 3, 100.0)
+        assert [m["t_800_500"] for m in data["members"]] == [12.5] * 3
+
+    def test_failed_run_fails_duplicates(self, logged_in_client, sample_simulation, db):
+        sims = _ready_clones(db, sample_simulation, 2)
+        self._submit(logged_in_client, sims)
+        sims[0].status = "failed"
+        sims[0].error_message = "solver diverged"
+        db.session.commit()
+
+        settle_duplicates(sims[0].id)
+        assert sims[1].status == "failed"
+        assert sims[1].error_message == "solver diverged"
+
+    def test_cancel_hands_over_duplicates(self, logged_in_client, sample_simulation, db):
+        sims = _ready_clones(db, sample_simulation, 3)
+        self._submit(logged_in_client, sims)
+
+        logged_in_client.post(f"/simulation/{sims[0].id}/cancel")
+        assert sims[0].status == STATUS_READY
+        assert sims[1].duplicate_of_id is None
+        assert sims[2].duplicate_of_id == sims[1].id
+        assert _claim_next_job() == ("simulation", sims[1].id)
+
+    def test_batch_page(self, logged_in_client, sample_simulation, db):
+        sims = _ready_clones(db, sample_simulation, 2)
+        self._submit(logged_in_client, sims)
+        batch = SimulationBatch.query.one()
+        rv = logged_in_client.get(f"/simulation/batch/{batch.id}")
+        assert rv.status_code == 200
+        assert b"Batch run" in rv.data
+
+    def test_batch_access_denied(self, logged_in_client, db, admin_user):
+        batch = SimulationBatch(name="Other", user_id=admin_user.id, kind="batch")
+        db.session.add(batch)
+        db.session.commit()
+        rv = logged_in_client.get(f"/simulation/batch/{batch.id}/status")
+        assert rv.status_code == 403
+
+
+class TestParameterSweep:
+    def _sweep(self, client, sim, run_now, min_value=20.0, max_value=60.0):
+        data = {
+            "parameter": "quenching.media_temperature",
+            "min_value": min_value,
+            "max_value": max_value,
+            "steps": 3,
+        }
+        if run_now:
+            data["run_immediately"] = "y"
+        return client.post(f"/simulation/{sim.id}/sweep", data=data)
+
+    def test_sweep_creates_batch(self, logged_in_client, sample_simulation, db):
+        rv = self._sweep(logged_in_client, sample_simulation, run_now=False)
+        batch = SimulationBatch.query.one()
+        assert rv.location.endswith(f"/simulation/batch/{batch.id}")
+        assert batch.kind == "sweep"
+        assert batch.parameter == "quenching.media_temperature"
+        members = batch.members.all()
+        assert [m.batch_value for m in members] == [20.0, 40.0, 60.0]
+        assert all(m.status == STATUS_READY for m in members)
+
+        logged_in_client.post(f"/simulation/batch/{batch.id}/run")
+        assert all(m.status == STATUS_QUEUED for m in members)
+
+    def test_identical_sweep_points_solved_once(self, logged_in_client, sample_simulation, db):
+        self._sweep(logged_in_client, sample_simulation, True, min_value=40.0, max_value=40.0)
+        members = SimulationBatch.query.one().members.all()
+        assert all(m.status == STATUS_QUEUED for m in members)
+        assert [m.duplicate_of_id for m in members] == [None, members[0].id, members[0].id]
+
+
 class TestHTCApi:
     def test_htc_json(self, logged_in_client):
         rv = logged_in_client.get("/simulation/api/htc/water/moderate")
         assert rv.status_code == 200
+
+
+class TestSweepExport:
+    def test_summary_csv(self, logged_in_client, sample_simulation):
+        rv = logged_in_client.get(f"/simulation/export/sweep?ids={sample_simulation.id}")
+        assert rv.status_code == 200
+        header, row = rv.data.decode().strip().splitlines()
+        assert header.endswith("t8_5_source")
+        assert row.split(",")[4] == ""  # not run, no estimate requested
+
+    def test_estimates_unrun_simulations(self, logged_in_client, sample_simulation, db):
+        ht = sample_simulation.ht_config
+        ht["heating"]["enabled"] = False
+        ht["transfer"]["enabled"] = False
+        ht["quenching"]["duration"] = 120.0
+        sample_simulation.set_ht_config(ht)
+        db.session.commit()
+
+        rv = logged_in_client.get(f"/simulation/export/sweep?ids={sample_simulation.id}&estimate=1")
+        assert rv.status_code == 200
+        row = rv.data.decode().strip().splitlines()[1].split(",")
+        assert float(row[4]) > 0
+        assert row[-1] == "estimated"
+
+
+class TestDeferredPlots:
+    """Result plots are rendered on first view, not by the simulation job."""
+
+    @pytest.fixture
+    def run_sim(self, db, sample_simulation):
+        from app.services.simulation_runner import run_heat_treatment
+
+        run_heat_treatment(sample_simulation.id)
+        assert sample_simulation.status == STATUS_COMPLETED
+        return sample_simulation
+
+    def test_job_stores_specs_not_images(self, run_sim):
+        rows = SimulationResult.query.filter_by(simulation_id=run_sim.id).all()
+        kinds = {r.result_type for r in rows}
+        assert {"full_cycle", "temperature_profile", "cooling_rate", "dTdt_vs_time"} <= kinds
+        for row in rows:
+            assert row.plot_image is None
+            assert row.has_plot
+            assert len(row.plot_key) == 64
+
+    def test_first_view_renders_then_cached(self, db, logged_in_client, run_sim):
+        from app.models import RenderedPlot
+
+        rate = SimulationResult.query.filter_by(
+            simulation_id=run_sim.id, result_type="cooling_rate"
+        ).first()
+        url = f"/simulation/{run_sim.id}/result/{rate.id}/image"
+        rv = logged_in_client.get(url)
+        assert rv.status_code == 200
+        assert rv.data.startswith(b"\x89PNG")
+        assert db.session.get(RenderedPlot, rate.plot_key).image == rv.data
+
+        with patch("app.services.plot_renderer.render_plot") as render:
+            assert logged_in_client.get(url).data == rv.data
+        render.assert_not_called()
+
+    def test_render_pending_plots(self, run_sim):
+        from app.models import RenderedPlot
+        from app.services.plot_renderer import render_pending_plots
+
+        n_plots = SimulationResult.query.filter(SimulationResult.plot_key.isnot(None)).count()
+        assert render_pending_plots(limit=3) == 3
+        assert render_pending_plots(limit=100) == n_plots - 3
+        assert render_pending_plots() == 0
+        assert all(p.image for p in RenderedPlot.query.all())
+
+    def test_failed_render_backs_off_and_is_not_cached(self, db, sample_simulation):
+        from datetime import timedelta
+
+        from app.models import RenderedPlot
+        from app.services import plot_renderer
+        from app.services.plot_renderer import defer_plot, render_pending_plots, result_plot_image
+
+        row = SimulationResult(
+            simulation_id=sample_simulation.id, result_type="cooling_rate", phase="full"
+        )
+        # Spec from a renderer that no longer exists: the plot cannot be drawn
+        defer_plot(row, "removed_kind", title="Rate")
+        db.session.add(row)
+        db.session.commit()
+
+        assert render_pending_plots() == 1
+        assert db.session.get(RenderedPlot, row.plot_key) is None
+        assert row.plot_failed_at is not None
+        # Backing off: not retried on the next idle pass
+        assert render_pending_plots() == 0
+
+        # Once the backoff has passed it is retried
+        row.plot_failed_at -= timedelta(seconds=plot_renderer.RENDER_RETRY_SECONDS + 1)
+        db.session.commit()
+        assert render_pending_plots() == 1
+
+        # A view retries right away and caches the image once it renders
+        with patch.object(plot_renderer, "render_plot", return_value=b"\x89PNG fixed"):
+            assert result_plot_image(row) == b"\x89PNG fixed"
+        assert db.session.get(RenderedPlot, row.plot_key).image == b"\x89PNG fixed"
+        assert render_pending_plots() == 0
+
+    def test_key_is_content_addressed(self, db, sample_simulation):
+        from app.services.plot_renderer import defer_plot
+
+        def cycle_row(temps, title="Cycle"):
+            row = SimulationResult(
+                simulation_id=sample_simulation.id, result_type="full_cycle", phase="full"
+            )
+            row.set_series([0.0, 1.0, 2.0], temps)
+            defer_plot(row, "cycle", title=title, transformation_temps={"Ms": np.float64(320)})
+            return row
+
+        a = cycle_row([850.0, 800.0, 760.0])
+        assert cycle_row([850.0, 800.0, 760.0]).plot_key == a.plot_key
+        assert cycle_row([850.0, 800.0, 761.0]).plot_key != a.plot_key
+        assert cycle_row([850.0, 800.0, 760.0], title="Other").plot_key != a.plot_key
+        assert a.plot_spec_dict["params"]["transformation_temps"] == {"Ms": 320.0}
+
+
+class TestResultCache:
+    """Runs with inputs solved before copy those results instead of solving."""
+
+    @pytest.fixture
+    def solved(self, db, sample_simulation):
+        from app.services.simulation_runner import run_heat_treatment
+
+        run_heat_treatment(sample_simulation.id)
+        return sample_simulation.snapshots.filter_by(status="completed").one()
+
+    def _run(self, sim):
+        from app.services.simulation_runner import _run_builtin, run_heat_treatment
+
+        with patch(
+            "app.services.simulation_runner._run_builtin", side_effect=_run_builtin
+        ) as solve:
+            run_heat_treatment(sim.id)
+        assert sim.status == STATUS_COMPLETED
+        return solve.called, sim.snapshots.order_by(SimulationSnapshot.version.desc()).first()
+
+    def test_hit_copies_results(self, db, sample_simulation, solved):
+        from app.models import ResultCacheEntry
+
+        (clone,) = _ready_clones(db, sample_simulation, 1)
+        solved_again, snapshot = self._run(clone)
+        assert not solved_again
+        assert snapshot.reused_from_id == solved.id
+        assert snapshot.cache_key == solved.cache_key
+        assert snapshot.t_800_500 == solved.t_800_500
+        assert db.session.get(ResultCacheEntry, solved.cache_key).hits == 1
+
+        source_rows = SimulationResult.query.filter_by(snapshot_id=solved.id).all()
+        rows = SimulationResult.query.filter_by(snapshot_id=snapshot.id).all()
+        assert len(rows) == len(source_rows)
+        assert all(r.simulation_id == clone.id for r in rows)
+        cycle = next(r for r in rows if r.result_type == "full_cycle")
+        assert cycle.plot_spec_dict["params"]["title"] == f"Heat Treatment Cycle - {clone.name}"
+        assert cycle.plot_key not in {r.plot_key for r in source_rows}
+
+    def test_rerun_of_same_simulation_hits(self, db, sample_simulation, solved):
+        solved_again, snapshot = self._run(sample_simulation)
+        assert not solved_again
+        assert snapshot.version == 2
+        assert snapshot.reused_from_id == solved.id
+
+    def test_changed_inputs_miss(self, db, sample_simulation, solved):
+        from app.models import MaterialProperty
+
+        sample_simulation.initial_temperature = 900.0
+        db.session.commit()
+        solved_again, snapshot = self._run(sample_simulation)
+        assert solved_again and snapshot.reused_from_id is None
+        assert snapshot.cache_key != solved.cache_key
+
+        db.session.add(
+            MaterialProperty(
+                steel_grade_id=sample_simulation.steel_grade_id,
+                property_name="density",
+                property_type="constant",
+                units="kg/m3",
+                data=json.dumps({"value": 7850}),
+            )
+        )
+        db.session.commit()
+        solved_again, _ = self._run(sample_simulation)
+        assert solved_again
+
+    def test_phase_model_change_misses(self, db, sample_simulation, solved):
+        from app.models import TTTParameters
+
+        ttt = TTTParameters(steel_grade_id=sample_simulation.steel_grade_id)
+        db.session.add(ttt)
+        db.session.commit()
+        solved_again, snapshot = self._run(sample_simulation)
+        assert solved_again
+
+        ttt.params_version = "changed"
+        db.session.commit()
+        solved_again, _ = self._run(sample_simulation)
+        assert solved_again
+
+    def test_deleted_source_is_dropped(self, db, sample_simulation, solved):
+        from app.models import ResultCacheEntry
+
+        (clone,) = _ready_clones(db, sample_simulation, 1)
+        SimulationResult.query.filter_by(snapshot_id=solved.id).delete()
+        db.session.commit()
+        solved_again, snapshot = self._run(clone)
+        assert solved_again
+        assert db.session.get(ResultCacheEntry, solved.cache_key).snapshot_id == snapshot.id
+
+    def test_evict(self, db):
+        from datetime import datetime, timedelta
+
+        from app.models import ResultCacheEntry
+        from app.services.result_cache import evict
+
+        now = datetime.utcnow()
+        for i, age in enumerate([0, 1, 2, 40]):
+            db.session.add(
+                ResultCacheEntry(
+                    key=f"{i:064d}", snapshot_id=i, last_used_at=now - timedelta(days=age)
+                )
+            )
+        db.session.commit()
+        assert evict(max_age_days=30, max_entries=2) == 2
+        assert {e.key for e in ResultCacheEntry.query} == {f"{0:064d}", f"{1:064d}"}
+
+    def test_stats(self, db, sample_simulation, solved, admin_client):
+        from app.services.result_cache import cache_stats
+
+        self._run(sample_simulation)
+        stats = cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        assert (stats["entries"], stats["entry_hits"]) == (1, 1)
+
+        rv = admin_client.get("/admin/")
+        assert b"Result cache" in rv.data
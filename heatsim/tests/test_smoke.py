@@ -33,12 +33,29 @@ EXPECTED_BLUEPRINTS = (
 )
 
 
-def test_app_factory_returns_app():
-    """create_app() returns a Flask instance for each known config."""
+def test_app_factory_returns_app(monkeypatch):
+    """create_app() returns a Flask instance for each known config.
+
+    Non-testing configs would open the instance databases and start the
+    job queue supervisor; both are redirected here so the test session
+    never shares files or workers with a running app.
+    """
+    from app.services import job_queue
+    from config import config
+
+    for config_name in ("development", "default"):
+        monkeypatch.setattr(config[config_name], "SQLALCHEMY_DATABASE_URI", "sqlite:///:memory:")
+        monkeypatch.setattr(config[config_name], "SQLALCHEMY_BINDS", {"materials": "sqlite://"})
+    started = []
+    monkeypatch.setattr(job_queue, "start_worker", started.append)
+
     for config_name in ("development", "testing", "default"):
         instance = create_app(config_name)
         assert instance is not None
         assert instance.name
+        assert "instance" not in str(instance.config["SQLALCHEMY_BINDS"]["materials"])
+    # Every app was handed to the patched supervisor start, none to the real one
+    assert len(started) == 3
 
 
 def test_app_has_expected_blueprints(app):
@@ -9,6 +9,7 @@ from app.models.ttt_parameters import (
     B_MODEL_GAUSSIAN,
     JMAKParameters,
     MartensiteParameters,
+    TTTCurve,
     TTTParameters,
 )
 
@@ -365,3 +366,322 @@ class TestPhasePredictor:
             curves = predictor.get_ttt_curves()
             assert curves is not None
             assert len(curves) > 0
+
+    def test_predict_phases_field_matches_scalar(self, app, grade_with_ttt):
+        import numpy as np
+
+        with app.app_context():
+            from app.services.phase_transformation import PhasePredictor
+
+            predictor = PhasePredictor(grade_with_ttt)
+            times = np.linspace(0, 400, 200)
+            tau = np.linspace(200.0, 2.0, 9)
+            temps = 20.0 + 830.0 * np.exp(-times[:, None] / tau[None, :])
+            field = predictor.predict_phases_field(times, temps)
+            for j in range(temps.shape[1]):
+                scalar = predictor.predict_phases(times, temps[:, j]).to_dict()
+                for phase, value in scalar.items():
+                    assert field[phase][j] == pytest.approx(value, abs=1e-6)
+            # Slow center forms diffusional phases, fast surface martensite
+            assert field["martensite"][-1] > field["martensite"][0]
+
+    def test_hardness_profile_with_jmak_grade(self, app, grade_with_ttt):
+        import numpy as np
+
+        with app.app_context():
+            from app.services.hardness_predictor import predict_hardness_profile
+            from app.services.phase_transformation import PhasePredictor
+
+            predictor = PhasePredictor(grade_with_ttt)
+            times = np.linspace(0, 400, 200)
+            tau = np.linspace(200.0, 2.0, 9)
+            temps = 20.0 + 830.0 * np.exp(-times[:, None] / tau[None, :])
+            positions = np.linspace(0.0, 0.025, 9)
+            result = predict_hardness_profile(
+                grade_with_ttt.composition, temps, times, predictor, positions=positions
+            )
+            profile = result.profile
+            assert len(profile.hardness_hv) == 9
+            assert profile.hardness_hv[-1] >= profile.hardness_hv[0]
+            total = sum(profile.phase_fractions.values())
+            np.testing.assert_allclose(total, 1.0, rtol=1e-6)
+
+
+class TestPhaseModelCache:
+    def test_predictors_share_compiled_models(self, app, grade_with_ttt):
+        with app.app_context():
+            from app.services.phase_transformation import PhasePredictor
+
+            first = PhasePredictor(grade_with_ttt)
+            second = PhasePredictor(grade_with_ttt)
+            assert first.is_available and second.is_available
+            assert first._jmak_models is second._jmak_models
+            assert set(first._jmak_models) == {"pearlite", "bainite"}
+
+    def test_cached_models_skip_jmak_query(self, app, grade_with_ttt, monkeypatch):
+        with app.app_context():
+            from app.services.phase_transformation import PhasePredictor, phase_models
+
+            assert PhasePredictor(grade_with_ttt).is_available
+
+            def fail(ttt_params):
+                raise AssertionError("models rebuilt")
+
+            monkeypatch.setattr(phase_models, "build_phase_models", fail)
+            assert PhasePredictor(grade_with_ttt).is_available
+
+    def test_backfill_params_versions(self, app, grade_with_ttt, db):
+        from app.models.ttt_parameters import backfill_params_versions
+        from app.services.phase_transformation import PhasePredictor
+
+        with db.engines["materials"].connect() as conn:
+            conn.execute(db.text("UPDATE ttt_parameters SET params_version = NULL"))
+            assert backfill_params_versions(conn) == 1
+            conn.commit()
+            assert backfill_params_versions(conn) == 0
+
+        db.session.expire_all()
+        ttt = TTTParameters.query.filter_by(steel_grade_id=grade_with_ttt.id).one()
+        assert len(ttt.params_version) == 32
+        # With a token the compiled models are cached again
+        first, second = PhasePredictor(grade_with_ttt), PhasePredictor(grade_with_ttt)
+        first._load()
+        second._load()
+        assert first._jmak_models is second._jmak_models
+
+    def test_jmak_edit_invalidates_models(self, logged_in_client, grade_with_ttt, db):
+        from app.models.material_changelog import MaterialChangeLog
+        from app.services.phase_transformation import PhasePredictor
+
+        def models(grade):
+            predictor = PhasePredictor(grade)
+            predictor._load()
+            return predictor
+
+        assert models(grade_with_ttt)._jmak_models["pearlite"].n == 1.5
+        old_version = (
+            TTTParameters.query.filter_by(steel_grade_id=grade_with_ttt.id).one().params_version
+        )
+
+        resp = logged_in_client.post(
+            f"/ttt-cct/grade/{grade_with_ttt.id}/jmak/pearlite",
+            data={
+                "phase": "pearlite",
+                "n_value": 2.0,
+                "b_model_type": "gaussian",
+                "b_max": 0.001,
+                "t_nose": 650,
+                "sigma": 60,
+                "nose_temperature": 650,
+                "nose_time": 3.0,
+                "temp_range_min": 400,
+                "temp_range_max": 727,
+                "submit": "Save",
+            },
+        )
+        assert resp.status_code == 302
+
+        db.session.expire_all()
+        ttt = TTTParameters.query.filter_by(steel_grade_id=grade_with_ttt.id).one()
+        assert ttt.params_version != old_version
+        assert models(grade_with_ttt)._jmak_models["pearlite"].n == 2.0
+        entry = MaterialChangeLog.query.filter_by(
+            entity_type="jmak_parameters", field_name="n_value"
+        ).one()
+        assert entry.steel_grade_id == grade_with_ttt.id
+
+    def test_martensite_edit_invalidates_models(self, logged_in_client, grade_with_ttt, db):
+        from app.services.phase_transformation import PhasePredictor
+
+        before = PhasePredictor(grade_with_ttt)
+        before._load()
+        assert before._martensite_model.ms == 320
+        logged_in_client.post(
+            f"/ttt-cct/grade/{grade_with_ttt.id}/martensite",
+            data={"ms": 330, "mf": 130, "alpha_m": 0.015, "submit": "Save"},
+        )
+        db.session.expire_all()
+        after = PhasePredictor(grade_with_ttt)
+        after._load()
+        assert after._martensite_model.ms == 330
+
+
+class TestDiagramCache:
+    def test_generated_curves_are_stored(self, app, grade_with_ttt, monkeypatch):
+        with app.app_context():
+            from app.services.phase_transformation import PhasePredictor, diagram_cache
+
+            curves = PhasePredictor(grade_with_ttt).get_cct_curves()
+            ttt = TTTParameters.query.filter_by(steel_grade_id=grade_with_ttt.id).one()
+            rows = TTTCurve.query.filter_by(ttt_parameters_id=ttt.id, curve_type="CCT").all()
+            assert rows and all(row.params_key for row in rows)
+
+            def fail(models, curve_type):
+                raise AssertionError("diagram regenerated")
+
+            monkeypatch.setattr(diagram_cache, "generate_diagram", fail)
+            assert PhasePredictor(grade_with_ttt).get_cct_curves() == curves
+
+    def test_unstored_lookup_leaves_no_rows(self, app, grade_with_ttt):
+        with app.app_context():
+            from app.services.phase_transformation import PhasePredictor
+
+            assert PhasePredictor(grade_with_ttt).get_ttt_curves(store=False)
+            assert TTTCurve.query.count() == 0
+
+    def test_parameter_change_regenerates(self, logged_in_client, grade_with_ttt, db):
+        from app.services.phase_transformation import PhasePredictor
+
+        before = PhasePredictor(grade_with_ttt).get_ttt_curves()
+        logged_in_client.post(
+            f"/ttt-cct/grade/{grade_with_ttt.id}/jmak/pearlite",
+            data={
+                "phase": "pearlite",
+                "n_value": 2.0,
+                "b_model_type": "gaussian",
+                "b_max": 0.001,
+                "t_nose": 650,
+                "sigma": 60,
+                "nose_temperature": 650,
+                "nose_time": 3.0,
+                "temp_range_min": 400,
+                "temp_range_max": 727,
+                "submit": "Save",
+            },
+        )
+        db.session.expire_all()
+        after = PhasePredictor(grade_with_ttt).get_ttt_curves()
+        assert after["pearlite"]["start"] != before["pearlite"]["start"]
+
+    def test_auto_generate_warms_diagrams(self, logged_in_client, grade_with_comp, db):
+        logged_in_client.post(f"/ttt-cct/grade/{grade_with_comp.id}/auto-generate")
+        ttt = TTTParameters.query.filter_by(steel_grade_id=grade_with_comp.id).one()
+        curve_types = {row.curve_type for row in ttt.cached_curves}
+        assert curve_types == {"TTT", "CCT"}
+
+
+CCT_CSV = "cooling_rate,start_temperature\n0.5,650\n2,600\n10,550\n50,500\n"
+
+
+class TestCalibrationJob:
+    @pytest.fixture(autouse=True)
+    def _queue_stopped(self):
+        """Jobs stay queued: stop job queue workers an earlier app may have started."""
+        from app.services import job_queue
+
+        job_queue.stop_worker()
+        if job_queue._supervisor_thread is not None:
+            job_queue._supervisor_thread.join(timeout=30)
+            assert not job_queue._supervisor_thread.is_alive()
+
+    def _upload(self, client, grade_id, csv_text=CCT_CSV):
+        import io
+
+        return client.post(
+            f"/ttt-cct/grade/{grade_id}/calibrate",
+            data={
+                "csv_file": (io.BytesIO(csv_text.encode()), "cct.csv"),
+                "test_type": "continuous_cooling",
+                "phase": "bainite",
+                "submit": "Upload & Calibrate",
+            },
+            content_type="multipart/form-data",
+        )
+
+    def test_cct_upload_queues_job(self, logged_in_client, grade_with_ttt):
+        from app.models.ttt_parameters import CalibrationJob
+
+        resp = self._upload(logged_in_client, grade_with_ttt.id)
+        job = CalibrationJob.query.one()
+        assert resp.status_code == 302
+        assert resp.headers["Location"].endswith(f"/ttt-cct/calibration-job/{job.id}")
+        assert job.status == "queued"
+        assert job.phase == "bainite"
+        assert len(job.data_points_list) == 4
+
+    def test_cct_upload_without_start_temperature(self, logged_in_client, grade_with_ttt):
+        from app.models.ttt_parameters import CalibrationJob
+
+        self._upload(logged_in_client, grade_with_ttt.id, "cooling_rate\n1\n2\n3\n")
+        assert CalibrationJob.query.count() == 0
+
+    def test_run_calibration_updates_jmak(self, app, logged_in_client, grade_with_ttt, db):
+        from app.models.ttt_parameters import CalibrationJob
+        from app.services.calibration_runner import run_calibration
+
+        self._upload(logged_in_client, grade_with_ttt.id)
+        job = CalibrationJob.query.one()
+        app.config["CALIBRATION_PATIENCE"] = 5
+        run_calibration(job.id)
+
+        db.session.expire_all()
+        job = db.session.get(CalibrationJob, job.id)
+        assert job.status == "completed"
+        assert job.progress_percent == 100.0
+        ttt = job.ttt_parameters
+        assert ttt.data_source == "calibrated"
+        jmak = ttt.jmak_parameters.filter_by(phase="bainite").one()
+        assert jmak.n_value == pytest.approx(job.result_dict["n_value"])
+        assert {row.curve_type for row in ttt.cached_curves} == {"TTT", "CCT"}
+
+        resp = logged_in_client.get(f"/ttt-cct/calibration-job/{job.id}")
+        assert resp.status_code == 200
+        assert b"Completed" in resp.data
+
+    def test_run_calibration_with_workers_in_daemon(
+        self, app, logged_in_client, grade_with_ttt, db, monkeypatch
+    ):
+        """Configured workers are used inside daemonic job worker processes."""
+        import multiprocessing
+
+        from app.models.ttt_parameters import CalibrationJob
+        from app.services.calibration_runner import run_calibration
+        from app.services.phase_transformation import parameter_calibration
+
+        calls = []
+        calibrate = parameter_calibration.calibrate_from_cct
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs["workers"])
+            return calibrate(*args, **kwargs)
+
+        monkeypatch.setattr(parameter_calibration, "calibrate_from_cct", spy)
+        monkeypatch.setattr(multiprocessing.current_process(), "daemon", True, raising=False)
+        self._upload(logged_in_client, grade_with_ttt.id)
+        job = CalibrationJob.query.one()
+        app.config["CALIBRATION_PATIENCE"] = 5
+        app.config["CALIBRATION_WORKERS"] = 3
+        run_calibration(job.id)
+
+        db.session.expire_all()
+        assert calls == [3]
+        assert db.session.get(CalibrationJob, job.id).status == "completed"
+
+    def test_run_calibration_failure(self, logged_in_client, grade_with_ttt, db, monkeypatch):
+        from app.models.ttt_parameters import CalibrationJob
+        from app.services import calibration_runner
+        from app.services.phase_transformation import parameter_calibration
+
+        def fail(*args, **kwargs):
+            raise ValueError("bad data")
+
+        monkeypatch.setattr(parameter_calibration, "calibrate_from_cct", fail)
+        self._upload(logged_in_client, grade_with_ttt.id)
+        job = CalibrationJob.query.one()
+        with pytest.raises(ValueError):
+            calibration_runner.run_calibration(job.id)
+
+        db.session.expire_all()
+        job = db.session.get(CalibrationJob, job.id)
+        assert job.status == "failed"
+        assert job.error_message == "bad data"
+
+    def test_status_json(self, logged_in_client, grade_with_ttt):
+        from app.models.ttt_parameters import CalibrationJob
+
+        self._upload(logged_in_client, grade_with_ttt.id)
+        job = CalibrationJob.query.one()
+        data = logged_in_client.get(f"/ttt-cct/calibration-job/{job.id}/status").get_json()
+        assert data["status"] == "queued"
+        assert data["queue_position"] == 1
+        assert data["result"] == {}
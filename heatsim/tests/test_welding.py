@@ -296,6 +296,18 @@ class TestHAZ:
         rv = logged_in_client.get(f"/welding/{proj.id}/haz", follow_redirects=True)
         assert rv.status_code == 200
 
+    def test_map_json(self, logged_in_client, sample_weld_project):
+        rv = logged_in_client.get(
+            f"/welding/{sample_weld_project.id}/haz/map?heat_input=1.5&preheat=100"
+        )
+        assert rv.status_code == 200
+        data = rv.get_json()
+        assert len(data["peak_temperatures"]) == len(data["z_mm"])
+        assert len(data["zones"][0]) == len(data["y_mm"])
+        # Surface at the weld line is fused, the far edge is base metal
+        assert data["zones"][0][0] == 4
+        assert data["zones"][0][-1] == 0
+
 
 class TestPreheat:
     def test_renders(self, logged_in_client, sample_weld_project, sample_steel_grade, db):
@@ -379,6 +391,18 @@ class TestGoldakMultipassQueue:
         db.session.refresh(sample_weld_project)
         assert sample_weld_project.status == "queued"
         assert sample_weld_project.progress_message.startswith("goldak:coarse:")
+        assert sample_weld_project.progress_message.endswith(":false")
+
+    def test_post_encodes_temperature_dependent(self, logged_in_client, sample_weld_project, db):
+        """Temperature-dependent mode is appended to the queued config."""
+        rv = logged_in_client.post(
+            f"/welding/{sample_weld_project.id}/goldak/multipass",
+            data={"grid_resolution": "coarse", "temperature_dependent": "y", "csrf_token": ""},
+            follow_redirects=False,
+        )
+        assert rv.status_code == 302
+        db.session.refresh(sample_weld_project)
+        assert sample_weld_project.progress_message == "goldak:coarse:false:true"
 
     def test_get_shows_stored_result(self, logged_in_client, sample_weld_project, db):
         """GET loads stored WeldResult when available."""